@@ -0,0 +1,64 @@
+"""Benchmark: candidate mining throughput and memory vs. an exact Counter.
+
+Usage: python benchmarks/bench_candidates.py [--sentences N]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections import Counter
+
+from mcp_youtube_intelligence.core.candidates import CandidateMiner, extract_candidates
+from mcp_youtube_intelligence.core.entities import known_terms
+
+_WORDS = "market chips demand supply quarter growth rates price guidance outlook".split()
+_KO = "시장 수요 공급 분기 성장 금리 가격 전망 실적 발표".split()
+
+
+def _corpus(n_sentences: int, n_names: int = 20000) -> list[str]:
+    rng = random.Random(0)
+    # Zipf-ish name popularity: a few names dominate, a long tail appears once or twice
+    names = [f"Zx{i:05d} Labs" for i in range(n_names)]
+    weights = [1 / (i + 1) for i in range(n_names)]
+    picks = rng.choices(names, weights=weights, k=n_sentences)
+    return [
+        f"{name} {' '.join(rng.sample(_WORDS, 4))}. {' '.join(rng.sample(_KO, 3))}입니다"
+        for name in picks
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sentences", type=int, default=200_000)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    docs = _corpus(args.sentences)
+    known = known_terms()
+
+    t0 = time.perf_counter()
+    miner = CandidateMiner()
+    for doc in docs:
+        miner.add_text(doc, known)
+    sketch_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    exact: Counter = Counter()
+    for doc in docs:
+        exact.update(extract_candidates(doc, known))
+    exact_time = time.perf_counter() - t0
+
+    top = miner.top(args.top, min_count=1)
+    truth = [p for p, _ in exact.most_common(len(top) * 3)]
+    hits = sum(1 for c in top if c["phrase"] in truth)
+    errors = [c["count"] - exact[c["phrase"]] for c in top]
+
+    print(f"sentences: {len(docs):,}  distinct phrases: {len(exact):,}")
+    print(f"count-min sketch + top-k: {sketch_time:6.2f} s  state {len(miner.to_bytes()) / 2**20:.2f} MiB")
+    print(f"exact Counter:            {exact_time:6.2f} s  {len(exact):,} keys held in memory")
+    print(f"top-{len(top)} agreement with exact counts: {hits}/{len(top)}, max overcount {max(errors, default=0)}")
+
+
+if __name__ == "__main__":
+    main()
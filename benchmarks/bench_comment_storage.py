@@ -0,0 +1,92 @@
+"""Benchmark: bulk comment inserts and per-video reads on SQLite.
+
+Compares the previous one-INSERT-per-comment loop with the batched
+``executemany`` in ``save_comments``, then times top-comment and sentiment
+aggregate reads served by the (video_id, like_count DESC) index.
+
+Usage: python benchmarks/bench_comment_storage.py [--comments N] [--videos N]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+from mcp_youtube_intelligence.storage.sqlite import SQLiteStorage
+
+_SENTIMENTS = ("positive", "negative", "neutral")
+
+
+def _comments(n: int, videos: int, seed: int = 0) -> dict[str, list[dict]]:
+    rng = random.Random(seed)
+    by_video: dict[str, list[dict]] = {f"v{i}": [] for i in range(videos)}
+    for i in range(n):
+        by_video[f"v{i % videos}"].append({
+            "comment_id": f"c{i}",
+            "author": f"user{rng.randrange(5000)}",
+            "text": "comment text " * rng.randint(1, 20),
+            "like_count": rng.randrange(10000),
+            "sentiment": rng.choice(_SENTIMENTS),
+            "is_noise": rng.random() < 0.1,
+        })
+    return by_video
+
+
+async def _legacy_save(storage: SQLiteStorage, video_id: str, comments: list[dict]) -> None:
+    """The previous implementation: one execute per comment, then commit."""
+    for c in comments:
+        await storage.db.execute(
+            "INSERT OR IGNORE INTO comments (video_id, comment_id, author, text, like_count) VALUES (?, ?, ?, ?, ?)",
+            (video_id, c.get("comment_id", ""), c.get("author", ""), c.get("text", ""), c.get("like_count", 0)),
+        )
+    await storage.db.commit()
+
+
+async def _insert(save, by_video: dict[str, list[dict]], tmpdir: str, name: str) -> tuple[float, SQLiteStorage]:
+    storage = SQLiteStorage(os.path.join(tmpdir, name))
+    await storage.initialize()
+    t0 = time.perf_counter()
+    for video_id, comments in by_video.items():
+        await save(storage, video_id, comments)
+    return time.perf_counter() - t0, storage
+
+
+async def _run(n: int, videos: int) -> None:
+    by_video = _comments(n, videos)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        legacy, old = await _insert(_legacy_save, by_video, tmpdir, "legacy.db")
+        await old.close()
+        bulk, storage = await _insert(
+            lambda s, v, c: s.save_comments(v, c), by_video, tmpdir, "bulk.db",
+        )
+        print(f"insert {n} comments ({videos} videos)")
+        print(f"  per-row execute : {legacy:8.3f} s")
+        print(f"  executemany     : {bulk:8.3f} s  ({legacy / bulk:.1f}x)")
+
+        ids = list(by_video)
+        t0 = time.perf_counter()
+        for video_id in ids:
+            await storage.get_comments(video_id, limit=20)
+        top = (time.perf_counter() - t0) / len(ids)
+        t0 = time.perf_counter()
+        for video_id in ids:
+            await storage.count_comment_sentiments(video_id)
+        agg = (time.perf_counter() - t0) / len(ids)
+        print(f"  top 20 by likes : {top * 1000:8.3f} ms/video")
+        print(f"  sentiment counts: {agg * 1000:8.3f} ms/video")
+        await storage.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--comments", type=int, default=100_000)
+    parser.add_argument("--videos", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(_run(args.comments, args.videos))
+
+
+if __name__ == "__main__":
+    main()
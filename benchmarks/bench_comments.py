@@ -0,0 +1,89 @@
+"""Benchmark: comment sentiment via the lexicon automaton vs per-keyword substring checks.
+
+Usage: python benchmarks/bench_comments.py [--repeat N]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+
+from mcp_youtube_intelligence.core import comments
+from mcp_youtube_intelligence.core.comments import (
+    _NEGATIVE_KW, _POSITIVE_KW, _analyze_sentiment, _count_emoji_sentiment,
+)
+
+_EN_NEGATION_RE = re.compile(
+    r"\b(not|no|never|don'?t|doesn'?t|didn'?t|isn'?t|aren'?t|wasn'?t|can'?t|won'?t|hardly|barely)\s+",
+    re.IGNORECASE,
+)
+_KR_NEGATION_RE = re.compile(r"(안\s|못\s|않|없)")
+
+_FILLER = (
+    "the video was about memory chips and the new fab this quarter i think "
+    "오늘 영상 잘 봤습니다 반도체 이야기 다음 편도 기다릴게요 설명이 "
+).split()
+
+
+def _legacy_sentiment(text: str) -> str:
+    """The previous implementation: substring test per keyword, rescanned per negation."""
+    lower = text.lower()
+    pos = sum(1 for kw in _POSITIVE_KW if kw in lower)
+    neg = sum(1 for kw in _NEGATIVE_KW if kw in lower)
+    negated = 0
+    for regex, width in ((_EN_NEGATION_RE, 30), (_KR_NEGATION_RE, 15)):
+        for m in regex.finditer(lower):
+            after = lower[m.end():m.end() + width]
+            if any(kw in after for kw in _POSITIVE_KW):
+                negated += 1
+    pos = max(0, pos - negated)
+    neg += negated
+    emoji_pos, emoji_neg = _count_emoji_sentiment(text)
+    pos_score = pos + emoji_pos * 0.5
+    neg_score = neg + emoji_neg * 0.5
+    if pos_score > neg_score and pos_score >= 0.5:
+        return "positive"
+    elif neg_score > pos_score and neg_score >= 0.5:
+        return "negative"
+    return "neutral"
+
+
+def _comments(n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    lexicon = sorted(_POSITIVE_KW | _NEGATIVE_KW) + list(comments._EN_NEGATIONS) + ["안", "못", "🔥", "👎"]
+    out = []
+    for _ in range(n):
+        words = [rng.choice(_FILLER) for _ in range(rng.randint(5, 60))]
+        for _ in range(rng.randint(0, 4)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(lexicon))
+        out.append(" ".join(words))
+    return out
+
+
+def _best(fn, items: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'comments':>10} {'legacy (s)':>12} {'automaton (s)':>14} {'speedup':>8}")
+    for n in (1000, 10000):
+        items = _comments(n)
+        assert [_legacy_sentiment(c) for c in items] == [_analyze_sentiment(c) for c in items]
+        legacy = _best(_legacy_sentiment, items, args.repeat)
+        new = _best(_analyze_sentiment, items, args.repeat)
+        print(f"{n:>10} {legacy:>12.4f} {new:>14.4f} {legacy / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark: report analysis stages with and without a shared Document.
+
+Runs the extractive summary, marker/keyword-shift segmentation and TextTiling
+over one long transcript, once letting every stage split and tokenize the text
+itself and once passing a single Document built for the transcript.
+
+Usage: python benchmarks/bench_document.py [--sentences N]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from bench_segmenter import _transcript
+
+from mcp_youtube_intelligence.core.document import Document
+from mcp_youtube_intelligence.core.segmenter import segment_topics
+from mcp_youtube_intelligence.core.summarizer import extractive_summary
+
+
+def _stages(text: str, doc: Document | None) -> None:
+    extractive_summary(text, doc=doc)
+    segment_topics(text, method="markers", doc=doc)
+    segment_topics(text, method="texttiling", doc=doc)
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sentences", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = _transcript(args.sentences)
+    separate = _best(lambda: _stages(text, None), args.repeat)
+    shared = _best(lambda: _stages(text, Document(text)), args.repeat)
+
+    print(f"chars: {len(text):,}")
+    print(f"per-stage tokenizing: {separate * 1000:10.1f} ms")
+    print(f"shared Document:      {shared * 1000:10.1f} ms  ({separate / shared:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark: near-duplicate collapse via MinHash/LSH vs pairwise shingle Jaccard.
+
+The pairwise baseline compares each comment with every cluster
+representative kept so far (quadratic in distinct comments); LSH checks
+only the representatives sharing a band bucket.
+
+Usage: python benchmarks/bench_duplicates.py [--repeat N]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from mcp_youtube_intelligence.core import duplicates
+from mcp_youtube_intelligence.core.duplicates import collapse
+
+_WORDS = (
+    "memory chip fab node yield wafer price demand supply quarter guidance margin "
+    "반도체 영상 설명 감사 다음 기대 시장 전망 gpu hbm packaging server cloud"
+).split()
+_SPAM = [
+    "Check out my channel for free crypto giveaways, link in bio",
+    "구독하고 이벤트 참여하세요 프로필 링크 확인",
+    "I made $5000 this week from home, ask me how",
+]
+
+
+def _comments(n: int, spam_share: float = 0.3, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        if rng.random() < spam_share:
+            base = list(rng.choice(_SPAM))
+            for _ in range(rng.randint(0, 3)):
+                base.insert(rng.randrange(len(base) + 1), rng.choice("!. 🔥"))
+            text = "".join(base)
+        else:
+            text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(8, 30)))
+        out.append({"comment_id": str(i), "text": text})
+    return out
+
+
+def _pairwise(comments: list[dict]) -> list[dict]:
+    """Greedy clustering with exact shingle Jaccard against every representative."""
+    kept: list[tuple[set[str], dict]] = []
+    for c in comments:
+        sh = duplicates._shingles(c["text"])
+        for rep_sh, rep in kept:
+            if sh and len(sh & rep_sh) / len(sh | rep_sh) >= duplicates.THRESHOLD:
+                rep["duplicates"] += 1
+                break
+        else:
+            kept.append((sh, {**c, "duplicates": 0}))
+    return [rep for _, rep in kept]
+
+
+def _best(fn, items: list[dict], repeat: int) -> tuple[float, list[dict]]:
+    best, result = float("inf"), []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(items)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'comments':>10} {'pairwise (s)':>13} {'lsh (s)':>9} {'speedup':>8} {'kept pw/lsh':>12}")
+    for n in (1000, 2000, 4000):
+        items = _comments(n)
+        legacy, exact = _best(_pairwise, items, args.repeat)
+        new, approx = _best(collapse, items, args.repeat)
+        print(f"{n:>10} {legacy:>13.3f} {new:>9.3f} {legacy / new:>7.1f}x {len(exact):>6}/{len(approx):<5}")
+
+
+if __name__ == "__main__":
+    main()
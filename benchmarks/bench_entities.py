@@ -0,0 +1,67 @@
+"""Benchmark: compiled Aho-Corasick entity matcher vs per-keyword regex loop.
+
+Usage: python benchmarks/bench_entities.py [--repeat N]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import time
+
+from mcp_youtube_intelligence.core import entities
+from mcp_youtube_intelligence.core.entities import DEFAULT_ENTITY_DICT, extract_entities
+
+_SAMPLE = (
+    "오늘은 엔비디아와 삼성전자 실적을 보겠습니다. 연준이 금리를 동결했고 나스닥은 상승했습니다. "
+    "NVIDIA's new GPU beats AMD, and OpenAI released GPT-4o for machine learning workloads. "
+    "We deployed the model with Python, Docker and Kubernetes on AWS while Bitcoin rallied. "
+    "반도체 업황과 환율, 인플레이션 이야기도 나눠 보겠습니다. Tesla and Apple moved the S&P 500. "
+)
+
+
+def _legacy_extract(text: str) -> list[dict]:
+    """The previous implementation: one compiled regex per keyword per call."""
+    sorted_keywords = sorted(DEFAULT_ENTITY_DICT.keys(), key=len, reverse=True)
+    matched: set[int] = set()
+    counts: dict[str, int] = {}
+    for keyword in sorted_keywords:
+        etype, ename = DEFAULT_ENTITY_DICT[keyword]
+        escaped = re.escape(keyword)
+        if entities._is_korean_keyword(keyword):
+            pattern = re.compile(escaped)
+        else:
+            pattern = re.compile(r"\b" + escaped + r"\b", re.IGNORECASE)
+        for m in pattern.finditer(text):
+            span = set(range(m.start(), m.end()))
+            if span & matched:
+                continue
+            matched |= span
+            key = f"{etype}:{ename}"
+            counts[key] = counts.get(key, 0) + 1
+    return [{"key": k, "count": v} for k, v in counts.items()]
+
+
+def _time(fn, text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'chars':>10} {'legacy (s)':>12} {'automaton (s)':>14} {'speedup':>8}")
+    for copies in (10, 100, 1000):
+        text = _SAMPLE * copies
+        legacy = _time(_legacy_extract, text, args.repeat)
+        new = _time(extract_entities, text, args.repeat)
+        print(f"{len(text):>10} {legacy:>12.4f} {new:>14.4f} {legacy / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
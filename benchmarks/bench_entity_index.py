@@ -0,0 +1,75 @@
+"""Benchmark: entity_mentions queries over a synthetic 100k-video corpus.
+
+Usage: python benchmarks/bench_entity_index.py [--videos N]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+from mcp_youtube_intelligence.core.entities import DEFAULT_ENTITY_DICT
+from mcp_youtube_intelligence.storage.sqlite import SQLiteStorage
+
+
+async def _seed(storage: SQLiteStorage, n_videos: int) -> None:
+    names = sorted({name for _, name in DEFAULT_ENTITY_DICT.values()})
+    rng = random.Random(0)
+    video_rows = []
+    mention_rows = []
+    for i in range(n_videos):
+        vid = f"v{i:07d}"
+        date = f"2026-{rng.randint(1, 10):02d}-{rng.randint(1, 28):02d}T00:00:00+00:00"
+        channel = f"UC{rng.randint(0, 499):04d}"
+        video_rows.append((vid, channel, date, f"title {i}"))
+        for name in rng.sample(names, 12):
+            mention_rows.append((name, "x", vid, rng.randint(1, 20), 0, channel, date, date))
+    await storage.db.executemany(
+        "INSERT INTO videos (video_id, channel_id, published_at, title) VALUES (?, ?, ?, ?)", video_rows,
+    )
+    await storage.db.executemany(
+        "INSERT INTO entity_mentions (entity, entity_type, video_id, mention_count, first_offset, "
+        "channel_id, published_at, indexed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        mention_rows,
+    )
+    await storage.db.commit()
+    await storage.db.execute("ANALYZE")
+
+
+async def _time(label: str, coro_fn, repeat: int = 5) -> None:
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        count = len(await coro_fn())
+        best = min(best, time.perf_counter() - t0)
+    print(f"{label:<45} {best * 1000:>8.2f} ms  ({count} rows)")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--videos", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = SQLiteStorage(os.path.join(tmpdir, "bench.db"))
+        await storage.initialize()
+        t0 = time.perf_counter()
+        await _seed(storage, args.videos)
+        print(f"seeded {args.videos} videos in {time.perf_counter() - t0:.1f}s")
+
+        await _time("single entity", lambda: storage.find_videos_by_entities(["NVIDIA"]))
+        await _time("two entities", lambda: storage.find_videos_by_entities(["NVIDIA", "Interest Rate"]))
+        await _time("two entities, this month", lambda: storage.find_videos_by_entities(
+            ["NVIDIA", "Interest Rate"], since="2026-10-01"))
+        await _time("two entities, one channel", lambda: storage.find_videos_by_entities(
+            ["NVIDIA", "Interest Rate"], channel_id="UC0042"))
+        await _time("video -> entities", lambda: storage.get_video_entities("v0050000"))
+        await storage.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""Benchmark: batched yt-dlp metadata fetching vs one process per video.
+
+Network time is taken out of the comparison by a stand-in binary that pays
+yt-dlp's real startup cost (interpreter plus ``import yt_dlp``) and then
+prints one canned ``--dump-json`` line per URL, so the table shows the
+per-process overhead the batch saves.
+
+Usage: python benchmarks/bench_metadata_batch.py [--repeat N]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from mcp_youtube_intelligence.core.collector import get_video_metadata, get_video_metadata_batch
+
+_STAND_IN = """#!{python}
+import json, sys
+import yt_dlp  # noqa: F401  (startup cost of the real binary)
+for url in sys.argv[1:]:
+    if url.startswith("http"):
+        vid = url.rsplit("=", 1)[-1]
+        print(json.dumps({{"id": vid, "title": "Video " + vid, "upload_date": "20260101", "duration": 600}}), flush=True)
+"""
+
+
+def _best(fn, repeat: int) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        binary = os.path.join(tmpdir, "yt-dlp")
+        with open(binary, "w") as f:
+            f.write(_STAND_IN.format(python=sys.executable))
+        os.chmod(binary, 0o755)
+
+        print(f"{'videos':>8} {'per-video (s)':>14} {'batch (s)':>10} {'speedup':>8}")
+        for n in (5, 20, 50):
+            ids = [f"vid{i:08d}" for i in range(n)]
+            legacy, single = _best(lambda: {v: get_video_metadata(v, yt_dlp=binary) for v in ids}, args.repeat)
+            new, batch = _best(lambda: get_video_metadata_batch(ids, yt_dlp=binary), args.repeat)
+            assert single == batch
+            print(f"{n:>8} {legacy:>14.3f} {new:>10.3f} {legacy / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
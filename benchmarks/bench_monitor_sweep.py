@@ -0,0 +1,102 @@
+"""Benchmark: checking every subscription one by one vs the concurrent sweep.
+
+A local HTTP server answers each channel feed after a fixed latency,
+standing in for YouTube's RSS endpoint. The baseline runs
+``monitor_channel(action="check")`` per channel (blocking feedparser
+fetch); the sweep fetches feeds concurrently over one shared client.
+
+Usage: python benchmarks/bench_monitor_sweep.py [--channels N] [--latency S] [--concurrency N]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import http.server
+import os
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+from mcp_youtube_intelligence.core import monitor
+from mcp_youtube_intelligence.storage.sqlite import SQLiteStorage
+
+_FEED = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" xmlns="http://www.w3.org/2005/Atom">'
+    "{entries}</feed>"
+)
+_ENTRY = "<entry><yt:videoId>{cid}-{i}</yt:videoId><title>Video {i}</title><published>2026-01-01T00:00:00+00:00</published></entry>"
+
+
+def _serve(latency: float) -> http.server.ThreadingHTTPServer:
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            cid = parse_qs(urlsplit(self.path).query)["channel_id"][0]
+            time.sleep(latency)
+            body = _FEED.format(entries="".join(_ENTRY.format(cid=cid, i=i) for i in range(15))).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _storage(path: str, channels: int) -> SQLiteStorage:
+    storage = SQLiteStorage(path)
+    await storage.initialize()
+    for i in range(channels):
+        await storage.upsert_channel({"channel_id": f"UC{i:04d}", "channel_name": f"Channel {i}", "enabled": 1})
+    return storage
+
+
+async def _sequential(storage: SQLiteStorage) -> float:
+    t0 = time.perf_counter()
+    for ch in await storage.list_channels():
+        await monitor.check_channel_new_videos(ch["channel_id"], storage)
+    return time.perf_counter() - t0
+
+
+async def _run(args) -> None:
+    server = _serve(args.latency)
+    url = f"http://127.0.0.1:{server.server_address[1]}/feeds/videos.xml?channel_id={{channel_id}}"
+    no_metadata = lambda ids, yt_dlp: {vid: {"error": "skipped"} for vid in ids}  # noqa: E731
+    with tempfile.TemporaryDirectory() as tmpdir, \
+            patch.object(monitor, "FEED_URL", url), \
+            patch.object(monitor.collector, "get_video_metadata_batch", no_metadata):
+        legacy_storage = await _storage(os.path.join(tmpdir, "seq.db"), args.channels)
+        legacy = await _sequential(legacy_storage)
+        await legacy_storage.close()
+
+        sweep_storage = await _storage(os.path.join(tmpdir, "sweep.db"), args.channels)
+        result = await monitor.sweep_channels(sweep_storage, concurrency=args.concurrency)
+        await sweep_storage.close()
+    server.shutdown()
+
+    per_channel = sorted(c["seconds"] for c in result["channels"])
+    client = "httpx" if monitor._httpx() else "threads"
+    print(f"{'channels':>9} {'sequential (s)':>15} {'sweep (s)':>10} {'speedup':>8} {'p50 channel (s)':>16} {'client':>8}")
+    print(
+        f"{args.channels:>9} {legacy:>15.2f} {result['duration_seconds']:>10.2f} "
+        f"{legacy / result['duration_seconds']:>7.1f}x {per_channel[len(per_channel) // 2]:>16.3f} {client:>8}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--channels", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--concurrency", type=int, default=monitor.DEFAULT_SWEEP_CONCURRENCY)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
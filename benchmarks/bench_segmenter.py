@@ -0,0 +1,87 @@
+"""Benchmark: keyword-shift split scoring on a long marker-less transcript.
+
+Compares the incremental sweep in ``_split_scores`` against rebuilding the
+left/right Counters for every split point (the previous implementation).
+
+Usage: python benchmarks/bench_segmenter.py [--sentences N]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections import Counter
+
+from mcp_youtube_intelligence.core.segmenter import (
+    _cosine,
+    _split_scores,
+    _word_bag,
+    segment_topics,
+)
+from mcp_youtube_intelligence.core.sentences import split_sentences
+
+_TOPICS = [
+    "semiconductor chips wafer foundry memory packaging yield",
+    "interest rates inflation federal reserve bonds treasury yields",
+    "electric vehicles battery charging lithium range factory",
+    "streaming subscribers content studio licensing churn",
+    "반도체 메모리 파운드리 수율 패키징 웨이퍼",
+    "금리 물가 채권 국채 연준 인플레이션",
+]
+
+
+def _transcript(n_sentences: int) -> str:
+    rng = random.Random(0)
+    sentences = []
+    for i in range(n_sentences):
+        topic = _TOPICS[(i * len(_TOPICS)) // n_sentences].split()
+        words = rng.sample(topic, 4) + rng.sample("really think market people going about".split(), 3)
+        rng.shuffle(words)
+        sentences.append(" ".join(words) + ".")
+    return " ".join(sentences)
+
+
+def _legacy_scores(bags: list[Counter]) -> list[float]:
+    scores = []
+    for i in range(1, len(bags)):
+        left = Counter()
+        for b in bags[:i]:
+            left.update(b)
+        right = Counter()
+        for b in bags[i:]:
+            right.update(b)
+        scores.append(_cosine(left, right))
+    return scores
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sentences", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = _transcript(args.sentences)
+    bags = [_word_bag(s) for s in split_sentences(text)]
+
+    assert _split_scores(bags) == _legacy_scores(bags)
+    legacy = _best(lambda: _legacy_scores(bags), 1)
+    sweep = _best(lambda: _split_scores(bags), args.repeat)
+    total = _best(lambda: segment_topics(text), args.repeat)
+
+    print(f"sentences: {len(bags):,}  chars: {len(text):,}")
+    print(f"rebuild per split:  {legacy * 1000:10.1f} ms")
+    print(f"incremental sweep:  {sweep * 1000:10.1f} ms  ({legacy / sweep:.0f}x)")
+    print(f"segment_topics:     {total * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
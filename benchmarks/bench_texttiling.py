@@ -0,0 +1,52 @@
+"""Benchmark: TextTiling segmentation vs. the keyword-shift fallback.
+
+Usage: python benchmarks/bench_texttiling.py [--sentences N]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from bench_segmenter import _transcript
+
+from mcp_youtube_intelligence.core import texttiling
+from mcp_youtube_intelligence.core.segmenter import segment_topics
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sentences", type=int, default=6000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = _transcript(args.sentences)
+    ids, _ = texttiling.tokenize(text)
+    print(f"sentences: {args.sentences:,}  chars: {len(text):,}  tokens: {len(ids):,}")
+
+    timings = {
+        "tokenize": lambda: texttiling.tokenize(text),
+        "gap scores (python)": lambda: texttiling.gap_scores(ids, use_numpy=False),
+    }
+    if texttiling._np is not None:
+        timings["gap scores (numpy)"] = lambda: texttiling.gap_scores(ids, use_numpy=True)
+    timings["segment_topics(texttiling)"] = lambda: segment_topics(text, method="texttiling")
+    timings["segment_topics(markers)"] = lambda: segment_topics(text)
+    for label, fn in timings.items():
+        print(f"{label:<28} {_best(fn, args.repeat) * 1000:10.1f} ms")
+
+    segments = segment_topics(text, method="texttiling")
+    confident = sum(1 for s in segments[1:] if s["confidence"] >= 0.5)
+    print(f"texttiling segments: {len(segments)}  (boundaries with confidence >= 0.5: {confident})")
+
+
+if __name__ == "__main__":
+    main()
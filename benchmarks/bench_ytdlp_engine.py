@@ -0,0 +1,79 @@
+"""Benchmark: yt-dlp calls through the binary vs the in-process engine.
+
+A local HTTP server hands out a small direct media file, so each call does
+the same real (loopback) extraction and the difference is the per-process
+startup and extractor loading the engine avoids.
+
+Usage: python benchmarks/bench_ytdlp_engine.py [--calls N] [--yt-dlp PATH]
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import http.server
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+
+from mcp_youtube_intelligence.core import ytdlp_engine
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _serve(directory: str) -> tuple[http.server.ThreadingHTTPServer, str]:
+    handler = functools.partial(_QuietHandler, directory=directory)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def _subprocess_call(yt_dlp: str, url: str) -> dict:
+    proc = subprocess.run([yt_dlp, "--dump-json", "--skip-download", url], capture_output=True, text=True, timeout=60)
+    return json.loads(proc.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=10)
+    parser.add_argument("--yt-dlp", default="yt-dlp")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for i in range(args.calls):
+            with open(os.path.join(tmpdir, f"clip{i}.mp4"), "wb") as f:
+                f.write(os.urandom(2048))
+        server, base = _serve(tmpdir)
+        urls = [f"{base}/clip{i}.mp4" for i in range(args.calls)]
+        try:
+            t0 = time.perf_counter()
+            legacy = [_subprocess_call(args.yt_dlp, u) for u in urls]
+            legacy_time = time.perf_counter() - t0
+
+            ytdlp_engine.configure("inprocess")
+            t0 = time.perf_counter()
+            first = ytdlp_engine.extract(urls[0], ("--skip-download",))
+            cold = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            warm = [ytdlp_engine.extract(u, ("--skip-download",)) for u in urls[1:]]
+            warm_time = time.perf_counter() - t0
+        finally:
+            server.shutdown()
+
+    assert [(r["id"], r["url"]) for r in legacy] == [(r["id"], r["url"]) for r in [first, *warm]]
+    per_legacy = legacy_time / args.calls
+    per_warm = warm_time / max(1, args.calls - 1)
+    print(f"{'backend':>22} {'total (s)':>10} {'per call (ms)':>14}")
+    print(f"{'subprocess':>22} {legacy_time:>10.3f} {per_legacy * 1000:>14.1f}")
+    print(f"{'inprocess (first)':>22} {cold:>10.3f} {cold * 1000:>14.1f}")
+    print(f"{'inprocess (reused)':>22} {warm_time:>10.3f} {per_warm * 1000:>14.1f}")
+    print(f"per-call saving: {(per_legacy - per_warm) * 1000:.0f} ms ({per_legacy / per_warm:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
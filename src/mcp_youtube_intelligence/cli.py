@@ -38,14 +38,31 @@ def extract_playlist_id(url_or_id: str) -> str:
 async def _get_storage_and_config():
     """Create config and storage for CLI use."""
     from .config import Config
+    from .core import youtube_api, ytdlp_engine
     from .storage.sqlite import SQLiteStorage as SqliteStorage
 
     config = Config.from_env()
+    ytdlp_engine.configure(config.ytdlp_backend, config.ytdlp_workers)
+    youtube_api.configure(config.youtube_api_key)
     storage = SqliteStorage(config.sqlite_path)
     await storage.initialize()
     return config, storage
 
 
+async def _close_storage(storage) -> None:
+    """Close CLI storage once background counter refreshes have been saved.
+
+    asyncio.run would otherwise cancel them, after waiting for their yt-dlp
+    threads, and the fetched counters would be lost.
+    """
+    from .core import metadata_cache
+
+    try:
+        await metadata_cache.wait_for_refreshes()
+    finally:
+        await storage.close()
+
+
 def _print_result(data: Any, as_json: bool = False, output_file: str | None = None):
     """Print result in human-readable or JSON format."""
     if as_json:
@@ -97,7 +114,7 @@ async def cmd_transcript(args):
         result = await get_transcript(video_id, mode=args.mode, llm_provider=provider, config=config, storage=storage)
         _print_result(result, as_json=args.json, output_file=args.output)
     finally:
-        await storage.close()
+        await _close_storage(storage)
 
 
 async def cmd_search(args):
@@ -114,7 +131,7 @@ async def cmd_search(args):
         )
         _print_result(result, as_json=args.json)
     finally:
-        await storage.close()
+        await _close_storage(storage)
 
 
 async def cmd_video(args):
@@ -125,7 +142,7 @@ async def cmd_video(args):
         result = await get_video(video_id, config=config, storage=storage)
         _print_result(result, as_json=args.json)
     finally:
-        await storage.close()
+        await _close_storage(storage)
 
 
 async def cmd_comments(args):
@@ -139,12 +156,13 @@ async def cmd_comments(args):
             sort=args.sort,
             sentiment=args.sentiment,
             filter_noise=not args.no_filter,
+            sync=args.sync,
             config=config,
             storage=storage,
         )
         _print_result(result, as_json=args.json)
     finally:
-        await storage.close()
+        await _close_storage(storage)
 
 
 async def cmd_monitor(args):
@@ -160,12 +178,14 @@ async def cmd_monitor(args):
             result = await monitor_channel(args.channel, action="check", config=config, storage=storage)
         elif args.monitor_action == "list":
             result = await monitor_channel("", action="list", config=config, storage=storage)
+        elif args.monitor_action == "sweep":
+            result = await monitor_channel("", action="sweep", concurrency=args.concurrency, config=config, storage=storage)
         else:
             print(f"Error: Unknown monitor action '{args.monitor_action}'", file=sys.stderr)
             sys.exit(1)
         _print_result(result, as_json=args.json)
     finally:
-        await storage.close()
+        await _close_storage(storage)
 
 
 async def cmd_entities(args):
@@ -173,10 +193,64 @@ async def cmd_entities(args):
     config, storage = await _get_storage_and_config()
     try:
         video_id = extract_video_id(args.url_or_id)
-        result = await extract_entities_tool(video_id, config=config, storage=storage)
+        result = await extract_entities_tool(
+            video_id, mode=args.mode, entity=args.entity, config=config, storage=storage,
+        )
         _print_result(result, as_json=args.json)
     finally:
-        await storage.close()
+        await _close_storage(storage)
+
+
+async def cmd_entity_search(args):
+    from .tools import find_videos_by_entity
+    config, storage = await _get_storage_and_config()
+    try:
+        result = await find_videos_by_entity(
+            args.entities,
+            since=args.since,
+            until=args.until,
+            channel_id=args.channel,
+            limit=args.max,
+            config=config,
+            storage=storage,
+        )
+        _print_result(result, as_json=args.json)
+    finally:
+        await _close_storage(storage)
+
+
+async def cmd_entities_reload(args):
+    from .tools import reload_entity_dictionaries
+    config, storage = await _get_storage_and_config()
+    try:
+        result = await reload_entity_dictionaries(args.force, config=config, storage=storage)
+        _print_result(result, as_json=args.json)
+    finally:
+        await _close_storage(storage)
+
+
+async def cmd_entity_candidates(args):
+    from .tools import mine_entity_candidates
+    config, storage = await _get_storage_and_config()
+    try:
+        result = await mine_entity_candidates(
+            args.max, args.min_count, args.reset, config=config, storage=storage,
+        )
+        _print_result(result, as_json=args.json)
+    finally:
+        await _close_storage(storage)
+
+
+async def cmd_entity_promote(args):
+    from .tools import promote_entity_candidate
+    config, storage = await _get_storage_and_config()
+    try:
+        result = await promote_entity_candidate(
+            args.keyword, args.type, args.name, config=config, storage=storage,
+        )
+        _print_result(result, as_json=args.json)
+    finally:
+        await _close_storage(storage)
 
 
 async def cmd_segments(args):
@@ -184,10 +258,12 @@ async def cmd_segments(args):
     config, storage = await _get_storage_and_config()
     try:
         video_id = extract_video_id(args.url_or_id)
-        result = await segment_topics(video_id, config=config, storage=storage)
+        result = await segment_topics(
+            video_id, args.method, args.level, args.max_segments, config=config, storage=storage,
+        )
         _print_result(result, as_json=args.json)
     finally:
-        await storage.close()
+        await _close_storage(storage)
 
 
 async def cmd_search_transcripts(args):
@@ -197,7 +273,7 @@ async def cmd_search_transcripts(args):
         result = await search_transcripts(args.query, config=config, storage=storage)
         _print_result(result, as_json=args.json)
     finally:
-        await storage.close()
+        await _close_storage(storage)
 
 
 async def cmd_playlist(args):
@@ -208,7 +284,7 @@ async def cmd_playlist(args):
         result = await get_playlist_tool(playlist_id, max_videos=args.max, config=config, storage=storage)
         _print_result(result, as_json=args.json)
     finally:
-        await storage.close()
+        await _close_storage(storage)
 
 
 async def cmd_report(args):
@@ -233,7 +309,7 @@ async def cmd_report(args):
         else:
             print(md)
     finally:
-        await storage.close()
+        await _close_storage(storage)
 
 
 async def cmd_batch(args):
@@ -244,7 +320,7 @@ async def cmd_batch(args):
         result = await batch_get_transcripts(video_ids, mode=args.mode, config=config, storage=storage)
         _print_result(result, as_json=args.json)
     finally:
-        await storage.close()
+        await _close_storage(storage)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -259,7 +335,7 @@ def build_parser() -> argparse.ArgumentParser:
     # transcript
     p = subparsers.add_parser("transcript", help="Extract video transcript")
     p.add_argument("url_or_id", help="YouTube URL or video ID")
-    p.add_argument("--mode", choices=["summary", "full", "chunks"], default="summary")
+    p.add_argument("--mode", choices=["summary", "full", "chunks", "incremental"], default="summary")
     p.add_argument("--chunk", type=int, help="Specific chunk number (with --mode chunks)")
     p.add_argument("--output", "-o", help="Save output to file")
     p.add_argument("--provider", choices=["auto", "openai", "anthropic", "google", "ollama", "vllm", "lmstudio"], default=None,
@@ -283,6 +359,8 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--sort", choices=["top", "newest"], default="top")
     p.add_argument("--sentiment", choices=["all", "positive", "negative"], default="all")
     p.add_argument("--no-filter", action="store_true", help="Don't filter spam/noise")
+    p.add_argument("--sync", action="store_true",
+                   help="Fetch only comments newer than the last sync, then show stored top comments")
 
     # monitor
     p = subparsers.add_parser("monitor", help="Monitor YouTube channels")
@@ -292,14 +370,50 @@ def build_parser() -> argparse.ArgumentParser:
     ps = monitor_sub.add_parser("check", help="Check for new videos")
     ps.add_argument("--channel", help="Channel ID to check")
     monitor_sub.add_parser("list", help="List monitored channels")
+    ps = monitor_sub.add_parser("sweep", help="Check all monitored channels concurrently")
+    ps.add_argument("--concurrency", type=int, default=None,
+                    help="Channels checked at once (default: MYI_MONITOR_CONCURRENCY)")
 
     # entities
     p = subparsers.add_parser("entities", help="Extract entities from transcript")
     p.add_argument("url_or_id", help="YouTube URL or video ID")
+    p.add_argument("--mode", choices=["counts", "timeline"], default="counts",
+                   help="timeline: when each entity is mentioned")
+    p.add_argument("--entity", help="Timeline for a single entity")
+
+    # entity-search
+    p = subparsers.add_parser("entity-search", help="Find stored videos mentioning all given entities")
+    p.add_argument("entities", nargs="+", help="Entity keywords or names (e.g. NVIDIA 금리)")
+    p.add_argument("--since", help="Published on/after (YYYY-MM-DD)")
+    p.add_argument("--until", help="Published before (YYYY-MM-DD)")
+    p.add_argument("--channel", help="Filter by channel ID")
+    p.add_argument("--max", type=int, default=20, help="Max results (default: 20)")
+
+    # entities-reload
+    p = subparsers.add_parser("entities-reload", help="Recompile custom entity dictionaries")
+    p.add_argument("--force", action="store_true", help="Rebuild even if dictionary files are unchanged")
+
+    # entity-candidates
+    p = subparsers.add_parser("entity-candidates", help="Mine stored transcripts for unknown entity names")
+    p.add_argument("--max", type=int, default=20, help="Max candidates (default: 20)")
+    p.add_argument("--min-count", type=int, default=3, help="Minimum occurrences (default: 3)")
+    p.add_argument("--reset", action="store_true", help="Discard counts and re-mine all transcripts")
+
+    # entity-promote
+    p = subparsers.add_parser("entity-promote", help="Add a candidate to the custom entity dictionary")
+    p.add_argument("keyword", help="Phrase as it appears in transcripts")
+    p.add_argument("--type", required=True, help="Entity type (company, person, technology, ...)")
+    p.add_argument("--name", help="Canonical name (default: keyword)")
 
     # segments
     p = subparsers.add_parser("segments", help="Segment transcript into topics")
     p.add_argument("url_or_id", help="YouTube URL or video ID")
+    p.add_argument("--method", choices=["auto", "chapters", "markers", "texttiling", "hierarchical"], default="auto",
+                   help="auto: video chapters if known, else markers; "
+                        "texttiling: split on vocabulary shifts, with boundary confidence; "
+                        "hierarchical: topic tree (chapters > subtopics)")
+    p.add_argument("--level", type=int, help="hierarchical: return one tree level (1 = coarsest)")
+    p.add_argument("--max-segments", type=int, help="hierarchical: return this many segments")
 
     # search-transcripts
     p = subparsers.add_parser("search-transcripts", help="Search stored transcripts")
@@ -334,6 +448,10 @@ _COMMAND_MAP = {
     "comments": cmd_comments,
     "monitor": cmd_monitor,
     "entities": cmd_entities,
+    "entity-search": cmd_entity_search,
+    "entities-reload": cmd_entities_reload,
+    "entity-candidates": cmd_entity_candidates,
+    "entity-promote": cmd_entity_promote,
     "segments": cmd_segments,
     "search-transcripts": cmd_search_transcripts,
     "playlist": cmd_playlist,
@@ -18,9 +18,13 @@ class Config:
     # Paths
     data_dir: str = ""
     transcript_dir: str = ""
+    entity_dict_dir: str = ""  # *.tsv / *.json entity dictionaries
 
     # yt-dlp
     yt_dlp_path: str = "yt-dlp"
+    # "subprocess" (run the yt_dlp_path binary) or "inprocess" (yt_dlp package on a thread pool)
+    ytdlp_backend: str = "subprocess"
+    ytdlp_workers: int = 4
 
     # LLM Provider selection: "openai" | "anthropic" | "google" | "ollama" | "vllm" | "lmstudio" | "auto"
     llm_provider: str = "auto"
@@ -54,6 +58,12 @@ class Config:
 
     # Limits
     max_comments: int = 20
+    # Comment sync: hours between like-count refreshes of stored top comments
+    comment_likes_refresh_hours: float = 24.0
+    # Metadata cache: hours before stored view/like/comment counts are refreshed in the background
+    metadata_counters_ttl_hours: float = 1.0
+    # Channel sweep: channels checked concurrently by monitor_channel(action="sweep")
+    monitor_concurrency: int = 16
     max_transcript_chars: int = 500_000
 
     @classmethod
@@ -66,7 +76,10 @@ class Config:
             postgres_dsn=os.getenv("MYI_POSTGRES_DSN", ""),
             data_dir=data_dir,
             transcript_dir=os.getenv("MYI_TRANSCRIPT_DIR", str(Path(data_dir) / "transcripts")),
+            entity_dict_dir=os.getenv("MYI_ENTITY_DICT_DIR", str(Path(data_dir) / "entities")),
             yt_dlp_path=os.getenv("MYI_YT_DLP", "yt-dlp"),
+            ytdlp_backend=os.getenv("MYI_YTDLP_BACKEND", "subprocess"),
+            ytdlp_workers=int(os.getenv("MYI_YTDLP_WORKERS", "4")),
             youtube_api_key=os.getenv("MYI_YOUTUBE_API_KEY", ""),
             llm_provider=os.getenv("MYI_LLM_PROVIDER", "auto"),
             openai_api_key=os.getenv("OPENAI_API_KEY", ""),
@@ -82,9 +95,13 @@ class Config:
             lmstudio_base_url=os.getenv("MYI_LMSTUDIO_BASE_URL", "http://localhost:1234"),
             lmstudio_model=os.getenv("MYI_LMSTUDIO_MODEL", ""),
             max_comments=int(os.getenv("MYI_MAX_COMMENTS", "20")),
+            comment_likes_refresh_hours=float(os.getenv("MYI_COMMENT_LIKES_REFRESH_HOURS", "24")),
+            metadata_counters_ttl_hours=float(os.getenv("MYI_METADATA_COUNTERS_TTL_HOURS", "1")),
+            monitor_concurrency=int(os.getenv("MYI_MONITOR_CONCURRENCY", "16")),
             max_transcript_chars=int(os.getenv("MYI_MAX_TRANSCRIPT_CHARS", "500000")),
         )
         # Ensure directories exist
         Path(cfg.data_dir).mkdir(parents=True, exist_ok=True)
         Path(cfg.transcript_dir).mkdir(parents=True, exist_ok=True)
+        Path(cfg.entity_dict_dir).mkdir(parents=True, exist_ok=True)
         return cfg
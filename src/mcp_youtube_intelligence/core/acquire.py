@@ -0,0 +1,122 @@
+"""Combined acquisition of metadata, subtitles and comments for one video.
+
+Fetching each of these separately runs yt-dlp (and extracts the watch
+page) once per kind. :func:`acquire_video` asks one yt-dlp run for all of
+them: the info dict carries the metadata, the subtitle tracks are written
+to a temporary directory, and comments are streamed from the same
+extraction (see ``comments.extract_with_comments``) so comment paging
+still stops once enough are kept. Callers use it when they need more than
+one of the three.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from . import collector, comments, transcript, youtube_api, ytdlp_engine
+
+logger = logging.getLogger(__name__)
+
+
+def metadata_needs_extraction(record: Optional[dict]) -> bool:
+    """True when metadata for a stored *record* (or None) would cost a page extraction.
+
+    Metadata already stored, or available from the Data API, does not.
+    """
+    return not youtube_api.active() and not (record and record.get("metadata_at"))
+
+
+def _extract(video_id: str, args: list[str], tmpdir: str, yt_dlp: str, timeout: float) -> Optional[dict]:
+    """Run yt-dlp once and return its info dict (None if it produced none)."""
+    url = f"https://www.youtube.com/watch?v={video_id}"
+    if ytdlp_engine.active():
+        try:
+            return ytdlp_engine.extract(url, args, timeout=timeout)
+        except Exception as e:
+            # Subtitle files may still have been written (e.g. 429 on some langs)
+            logger.warning("yt-dlp failed for %s: %s", video_id, e)
+            return None
+    try:
+        proc = subprocess.run([yt_dlp, *args, url], capture_output=True, text=True, timeout=timeout)
+        if proc.returncode != 0:
+            logger.warning("yt-dlp exited with code %d for %s: %s", proc.returncode, video_id, proc.stderr[:300])
+    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+        logger.warning("yt-dlp unavailable or timed out for %s: %s", video_id, e)
+        return None
+    info_files = list(Path(tmpdir).glob("*.info.json"))
+    if not info_files:
+        return None
+    try:
+        return json.loads(info_files[0].read_text(encoding="utf-8"))
+    except ValueError as e:
+        logger.warning("Unreadable yt-dlp info JSON for %s: %s", video_id, e)
+        return None
+
+
+def acquire_video(
+    video_id: str,
+    max_comments: int = 0,
+    sort: str = "top",
+    filter_noise: bool = True,
+    yt_dlp: str = "yt-dlp",
+    timeout: float = 180,
+) -> dict:
+    """Metadata, best subtitle track and (optionally) comments from one yt-dlp run.
+
+    Args:
+        video_id: YouTube video ID.
+        max_comments: Comments to return, filtered as by
+            ``comments.fetch_comments``; 0 skips comment extraction. Needs
+            the yt_dlp package; without it no comments are extracted.
+        sort: Comment order, "top" or "newest".
+        filter_noise: Drop noise and collapse near-duplicate comments.
+        yt_dlp: Path to yt-dlp binary.
+        timeout: Seconds allowed for the yt-dlp run.
+
+    Returns:
+        Dict with ``metadata`` (``collector.get_video_metadata`` shape, or
+        None), ``transcript`` (``transcript.fetch_transcript`` shape; falls
+        back to youtube-transcript-api when no subtitle file was written) and
+        ``comments`` (list, or None when not requested or not extracted).
+        *timeout* does not apply to in-process comment streaming.
+    """
+    kept = None
+    with tempfile.TemporaryDirectory(prefix="myi_acquire_") as tmpdir:
+        output = f"{tmpdir}/%(id)s.%(ext)s"
+        if max_comments and comments.streaming_available():
+            info, kept = comments.extract_with_comments(
+                video_id,
+                {
+                    "remote_components": ["ejs:github"],
+                    "writesubtitles": True, "writeautomaticsub": True,
+                    "subtitleslangs": transcript.YTDLP_SUB_LANGS.split(","),
+                    "outtmpl": {"default": output},
+                },
+                max_comments, sort, filter_noise,
+            )
+        else:
+            args = [
+                "--remote-components", "ejs:github",
+                "--skip-download", "--write-info-json",
+                "--write-sub", "--write-auto-sub",
+                "--sub-langs", transcript.YTDLP_SUB_LANGS,
+                "-o", output,
+            ]
+            info = _extract(video_id, args, tmpdir, yt_dlp, timeout)
+        tr = transcript.read_subtitle_files(video_id, tmpdir)
+
+    if tr.get("best"):
+        tr["error"] = None
+    else:
+        tr = transcript.fetch_transcript(video_id, ytdlp_fallback=False)
+
+    return {
+        "video_id": video_id,
+        "metadata": collector._to_metadata(video_id, info) if info else None,
+        "transcript": tr,
+        "comments": kept if info else None,
+    }
@@ -0,0 +1,165 @@
+"""Aho-Corasick multi-pattern matcher.
+
+Compiles a set of literal patterns into one automaton so a text can be
+scanned for all of them in a single linear pass, instead of one regex
+``finditer`` per pattern. Callers apply their own case folding and boundary
+rules on top of the raw matches.
+"""
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from collections import deque
+from typing import Iterable, Iterator
+
+# Serialized layout: header of four uint32 counts, then int32 arrays
+# (little-endian): lengths, edge_offsets, edge_chars, edge_targets, fail,
+# out_offsets, out_ids.
+_HEADER = struct.Struct("<4I")
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton over literal string patterns.
+
+    Pattern ids are the positions of the patterns in the input iterable.
+    Empty patterns are ignored.
+    """
+
+    __slots__ = ("lengths", "_goto", "_fail", "_out")
+
+    def __init__(self, patterns: Iterable[str]):
+        self.lengths: list[int] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Pattern ids ending at each state (including via fail links), longest first
+        self._out: list[tuple[int, ...]] = [()]
+
+        own: list[list[int]] = [[]]
+        for pid, pattern in enumerate(patterns):
+            self.lengths.append(len(pattern))
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                    own.append([])
+                state = nxt
+            own[state].append(pid)
+
+        # Breadth-first pass: fail links and merged outputs
+        queue: deque[int] = deque()
+        for nxt in self._goto[0].values():
+            queue.append(nxt)
+            self._out[nxt] = tuple(own[nxt])
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = tuple(own[nxt]) + self._out[self._fail[nxt]]
+
+    @property
+    def state_count(self) -> int:
+        return len(self._goto)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the compiled automaton into a flat binary blob."""
+        edge_offsets = array("i", [0])
+        edge_chars = array("i")
+        edge_targets = array("i")
+        out_offsets = array("i", [0])
+        out_ids = array("i")
+        for goto, out in zip(self._goto, self._out):
+            for ch, nxt in goto.items():
+                edge_chars.append(ord(ch))
+                edge_targets.append(nxt)
+            edge_offsets.append(len(edge_chars))
+            out_ids.extend(out)
+            out_offsets.append(len(out_ids))
+        arrays = [
+            array("i", self.lengths), edge_offsets, edge_chars, edge_targets,
+            array("i", self._fail), out_offsets, out_ids,
+        ]
+        header = _HEADER.pack(
+            len(self.lengths), len(self._goto), len(edge_chars), len(out_ids),
+        )
+        if sys.byteorder != "little":
+            for arr in arrays:
+                arr.byteswap()
+        return header + b"".join(arr.tobytes() for arr in arrays)
+
+    @classmethod
+    def from_bytes(cls, buf: bytes | memoryview) -> AhoCorasick:
+        """Rebuild an automaton from :meth:`to_bytes` output without recompiling."""
+        n_patterns, n_states, n_edges, n_out = _HEADER.unpack_from(buf, 0)
+        offset = _HEADER.size
+
+        def take(count: int) -> array:
+            nonlocal offset
+            arr = array("i")
+            arr.frombytes(bytes(buf[offset:offset + count * arr.itemsize]))
+            if sys.byteorder != "little":
+                arr.byteswap()
+            offset += count * arr.itemsize
+            return arr
+
+        lengths = take(n_patterns)
+        edge_offsets = take(n_states + 1)
+        edge_chars = take(n_edges)
+        edge_targets = take(n_edges)
+        fail = take(n_states)
+        out_offsets = take(n_states + 1)
+        out_ids = take(n_out)
+
+        self = cls.__new__(cls)
+        self.lengths = lengths.tolist()
+        self._fail = fail.tolist()
+        chars = [chr(c) for c in edge_chars]
+        targets = edge_targets.tolist()
+        self._goto = [
+            dict(zip(chars[edge_offsets[s]:edge_offsets[s + 1]], targets[edge_offsets[s]:edge_offsets[s + 1]]))
+            for s in range(n_states)
+        ]
+        ids = out_ids.tolist()
+        self._out = [tuple(ids[out_offsets[s]:out_offsets[s + 1]]) for s in range(n_states)]
+        return self
+
+    @staticmethod
+    def serialized_size(buf: bytes | memoryview) -> int:
+        """Number of bytes occupied by a serialized automaton at the start of *buf*."""
+        n_patterns, n_states, n_edges, n_out = _HEADER.unpack_from(buf, 0)
+        ints = n_patterns + 2 * (n_states + 1) + 2 * n_edges + n_states + n_out
+        return _HEADER.size + ints * 4
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """Yield every (start, end, pattern_id) occurrence, ordered by end offset.
+
+        Overlapping occurrences are all reported; at equal end offsets the
+        longest pattern comes first.
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        lengths = self.lengths
+        state = 0
+        for i, ch in enumerate(text):
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt or 0
+            if out[state]:
+                end = i + 1
+                for pid in out[state]:
+                    yield end - lengths[pid], end, pid
@@ -0,0 +1,334 @@
+"""Unknown-entity candidate mining.
+
+Streams stored transcripts through a count-min sketch to find frequent
+phrases the entity dictionary does not know yet: capitalized English n-grams
+("Jensen Huang", "Blackwell") and Korean noun-like tokens with particles
+stripped ("블랙웰"). Memory is bounded by the sketch size and the top-k
+heap, not by the number of distinct phrases, so the whole corpus can be
+mined incrementally.
+"""
+from __future__ import annotations
+
+import hashlib
+import heapq
+import re
+import struct
+import sys
+from array import array
+from typing import Iterable, Optional
+
+from .entities import _get_matcher, _is_korean_keyword, known_terms
+from .segmenter import _EN_STOP, _KO_STOP
+
+# Sketch geometry: 4 rows x 64Ki uint32 counters = 1 MiB
+SKETCH_WIDTH = 1 << 16
+SKETCH_DEPTH = 4
+# Number of heavy hitters tracked by the miner
+TOP_K = 500
+# Longest English n-gram counted
+_MAX_NGRAM = 3
+
+_SKETCH_HEADER = struct.Struct("<2IQ")
+_MAX_COUNT = 0xFFFFFFFF
+
+
+# ---------------------------------------------------------------------------
+# Count-min sketch and top-k heap
+# ---------------------------------------------------------------------------
+
+class CountMinSketch:
+    """Count-min sketch with conservative update.
+
+    Estimates never undercount; the overcount is bounded by roughly
+    ``total * e / width`` with probability ``1 - exp(-depth)``. Hashing uses
+    BLAKE2b so serialized sketches stay valid across processes.
+    """
+
+    __slots__ = ("width", "depth", "total", "_rows", "_unpack")
+
+    def __init__(self, width: int = SKETCH_WIDTH, depth: int = SKETCH_DEPTH):
+        if width <= 0 or not 1 <= depth <= 16:
+            raise ValueError("width must be positive and depth between 1 and 16")
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._rows = [array("I", bytes(4 * width)) for _ in range(depth)]
+        self._unpack = struct.Struct(f"<{depth}I").unpack
+
+    def _indexes(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=4 * self.depth).digest()
+        width = self.width
+        return [h % width for h in self._unpack(digest)]
+
+    def add(self, key: str, count: int = 1) -> int:
+        """Count *key* and return its new estimate."""
+        idx = self._indexes(key)
+        rows = self._rows
+        estimate = min(min(rows[r][i] for r, i in enumerate(idx)) + count, _MAX_COUNT)
+        # Conservative update: only raise counters that are below the new estimate
+        for r, i in enumerate(idx):
+            if rows[r][i] < estimate:
+                rows[r][i] = estimate
+        self.total += count
+        return estimate
+
+    def estimate(self, key: str) -> int:
+        rows = self._rows
+        return min(rows[r][i] for r, i in enumerate(self._indexes(key)))
+
+    def to_bytes(self) -> bytes:
+        rows = self._rows
+        if sys.byteorder != "little":
+            rows = [array("I", r) for r in rows]
+            for r in rows:
+                r.byteswap()
+        return _SKETCH_HEADER.pack(self.width, self.depth, self.total) + b"".join(r.tobytes() for r in rows)
+
+    @classmethod
+    def from_bytes(cls, buf: bytes | memoryview) -> CountMinSketch:
+        width, depth, total = _SKETCH_HEADER.unpack_from(buf, 0)
+        self = cls.__new__(cls)
+        self.width = width
+        self.depth = depth
+        self.total = total
+        self._unpack = struct.Struct(f"<{depth}I").unpack
+        self._rows = []
+        offset = _SKETCH_HEADER.size
+        for _ in range(depth):
+            row = array("I")
+            row.frombytes(bytes(buf[offset:offset + 4 * width]))
+            if sys.byteorder != "little":
+                row.byteswap()
+            self._rows.append(row)
+            offset += 4 * width
+        return self
+
+    @staticmethod
+    def serialized_size(buf: bytes | memoryview) -> int:
+        width, depth, _ = _SKETCH_HEADER.unpack_from(buf, 0)
+        return _SKETCH_HEADER.size + 4 * width * depth
+
+
+class TopK:
+    """The *k* keys with the highest counts seen so far.
+
+    A min-heap with lazy invalidation: raising a tracked key's count pushes
+    a new heap entry and leaves the old one to be discarded when it surfaces.
+    """
+
+    __slots__ = ("k", "_counts", "_heap")
+
+    def __init__(self, k: int = TOP_K):
+        self.k = k
+        self._counts: dict[str, int] = {}
+        self._heap: list[tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._counts
+
+    def _min(self) -> tuple[int, str]:
+        heap = self._heap
+        while heap[0][0] != self._counts.get(heap[0][1]):
+            heapq.heappop(heap)
+        return heap[0]
+
+    def offer(self, key: str, count: int) -> None:
+        """Record that *key* has (estimated) *count*."""
+        counts = self._counts
+        if key not in counts:
+            if len(counts) >= self.k:
+                low, low_key = self._min()
+                if count <= low:
+                    return
+                heapq.heappop(self._heap)
+                del counts[low_key]
+        elif counts[key] == count:
+            return
+        counts[key] = count
+        heapq.heappush(self._heap, (count, key))
+        if len(self._heap) > 4 * self.k:
+            # Drop stale entries
+            self._heap = [(c, k) for k, c in counts.items()]
+            heapq.heapify(self._heap)
+
+    def items(self) -> list[tuple[str, int]]:
+        """Tracked (key, count) pairs, highest count first."""
+        return sorted(self._counts.items(), key=lambda kv: (-kv[1], kv[0]))
+
+
+# ---------------------------------------------------------------------------
+# Candidate phrases
+# ---------------------------------------------------------------------------
+
+# Runs of capitalized words ("Jensen Huang", "OpenAI", "GB200"), across single spaces
+_CAP_RUN_RE = re.compile(r"\b[A-Z][A-Za-z0-9&\-]*(?: [A-Z][A-Za-z0-9&\-]*)*")
+_HANGUL_RE = re.compile(r"[가-힣]{2,}")
+
+# Sentence-initial and conversational words that are capitalized but never entities
+_EN_COMMON_CAPS = frozenset(
+    "yes yeah okay ok well now here there let let's thanks thank hi hello hey right "
+    "today tomorrow yesterday like actually basically really because however "
+    "monday tuesday wednesday thursday friday saturday sunday".split()
+)
+
+# Particles stripped from the end of Korean tokens, longest first
+_KO_PARTICLES = tuple(sorted(
+    "은 는 이 가 을 를 의 에 와 과 도 만 로 으로 에서 에게 께서 한테 까지 부터 보다 처럼 "
+    "이랑 랑 이나 나 이라는 라는 이라고 라고 이죠 이고 이며 이다 입니다 에서는 에는 으로는 로는 "
+    "과의 와의 에서의 들이 들은 들을 들의 들".split(),
+    key=len, reverse=True,
+))
+
+# Verbal/adjectival endings: tokens ending like this are not noun-like
+_KO_PREDICATE_ENDINGS = (
+    "니다", "어요", "아요", "해요", "세요", "네요", "는데", "지만", "니까", "하고", "해서",
+    "하는", "했다", "한다", "된다", "있는", "없는", "같은", "였다", "면서", "거든요", "잖아요",
+    "려고", "다고", "는지", "겠다", "했고", "하면", "하게", "되는", "었는데", "습니다",
+    "됐고", "되고", "있고", "없고", "였고", "됐다", "봤다", "죠",
+)
+
+# Frequent Korean words that are not names (time, deixis, fillers)
+_KO_COMMON = frozenset(
+    "오늘 내일 어제 지금 이번 다음 여기 저기 거기 우리 저희 여러분 정말 진짜 그냥 이제 다시 아주 "
+    "너무 계속 사실 이렇게 그렇게 어떻게 이런 그런 저런 어떤 무슨 모든 여기서 거의 조금 많이 가장".split()
+)
+
+
+def _strip_particle(token: str) -> str:
+    for particle in _KO_PARTICLES:
+        if token.endswith(particle) and len(token) - len(particle) >= 2:
+            return token[:-len(particle)]
+    return token
+
+
+def _english_candidates(text: str) -> Iterable[str]:
+    for m in _CAP_RUN_RE.finditer(text):
+        words = m.group().split(" ")
+        lowered = [w.lower().strip("-") for w in words]
+        n_words = len(words)
+        for i in range(n_words):
+            if lowered[i] in _EN_STOP or lowered[i] in _EN_COMMON_CAPS:
+                continue
+            for j in range(i + 1, min(i + _MAX_NGRAM, n_words) + 1):
+                last = lowered[j - 1]
+                if last in _EN_STOP or last in _EN_COMMON_CAPS:
+                    continue
+                phrase = " ".join(words[i:j]).strip("-")
+                if len(phrase) >= 2:
+                    yield phrase
+
+
+def _korean_candidates(text: str) -> Iterable[str]:
+    for m in _HANGUL_RE.finditer(text):
+        token = m.group()
+        if token.endswith(_KO_PREDICATE_ENDINGS):
+            continue
+        token = _strip_particle(token)
+        if len(token) >= 2 and token not in _KO_STOP and token not in _KO_COMMON:
+            yield token
+
+
+def extract_candidates(text: str, known: Optional[frozenset[str]] = None) -> list[str]:
+    """Candidate entity phrases in *text* that are not known dictionary terms.
+
+    Spans the entity matcher already recognizes are cut out first, so parts
+    of known names ("Jensen" of "Jensen Huang") are not counted. *known* is a
+    set of ASCII-lowercased keywords/names (defaults to the active entity
+    dictionary). Repeated phrases are returned once per occurrence.
+    """
+    if not text:
+        return []
+    if known is None:
+        known = known_terms()
+    pieces = []
+    pos = 0
+    for start, end, _ in _get_matcher(None).find(text):
+        pieces.append(text[pos:start])
+        pos = end
+    pieces.append(text[pos:])
+    text = "\n".join(pieces)
+    found = [p for p in _english_candidates(text) if p.lower() not in known]
+    found.extend(t for t in _korean_candidates(text) if t not in known)
+    return found
+
+
+# ---------------------------------------------------------------------------
+# Miner
+# ---------------------------------------------------------------------------
+
+class CandidateMiner:
+    """Count-min sketch + top-k heap over candidate phrases."""
+
+    __slots__ = ("sketch", "top_k", "documents")
+
+    def __init__(self, width: int = SKETCH_WIDTH, depth: int = SKETCH_DEPTH, k: int = TOP_K):
+        self.sketch = CountMinSketch(width, depth)
+        self.top_k = TopK(k)
+        self.documents = 0
+
+    def add_text(self, text: str, known: Optional[frozenset[str]] = None) -> int:
+        """Count the candidates in one document; returns how many were counted."""
+        sketch = self.sketch
+        offer = self.top_k.offer
+        phrases = extract_candidates(text, known)
+        for phrase in phrases:
+            offer(phrase, sketch.add(phrase))
+        self.documents += 1
+        return len(phrases)
+
+    def add_texts(self, texts: Iterable[str]) -> int:
+        known = known_terms()
+        return sum(self.add_text(t, known) for t in texts if t)
+
+    def top(self, n: int = 20, min_count: int = 2) -> list[dict]:
+        """Top *n* candidates, excluding terms the dictionary has learned since counting
+        and phrases that never occur outside a longer candidate."""
+        known = known_terms()
+        items = self.top_k.items()
+        # Words of tracked multi-word phrases, to drop parts that only occur inside them
+        longer = [(f" {p} ", c) for p, c in items if " " in p]
+        result = []
+        for phrase, count in items:
+            if count < min_count:
+                break
+            if phrase.lower() in known:
+                continue
+            padded = f" {phrase} "
+            if any(c >= count and padded in lp and lp != padded for lp, c in longer):
+                continue
+            result.append({
+                "phrase": phrase,
+                "count": count,
+                "script": "ko" if _is_korean_keyword(phrase) else "en",
+            })
+            if len(result) >= n:
+                break
+        return result
+
+    def to_bytes(self) -> bytes:
+        top = "\n".join(f"{c}\t{p}" for p, c in self.top_k.items()).encode("utf-8")
+        return (
+            struct.pack("<QI", self.documents, self.top_k.k)
+            + self.sketch.to_bytes()
+            + struct.pack("<I", len(top)) + top
+        )
+
+    @classmethod
+    def from_bytes(cls, buf: bytes | memoryview) -> CandidateMiner:
+        buf = memoryview(buf)
+        documents, k = struct.unpack_from("<QI", buf, 0)
+        offset = struct.calcsize("<QI")
+        self = cls.__new__(cls)
+        self.documents = documents
+        self.sketch = CountMinSketch.from_bytes(buf[offset:])
+        offset += CountMinSketch.serialized_size(buf[offset:])
+        (top_len,) = struct.unpack_from("<I", buf, offset)
+        offset += 4
+        self.top_k = TopK(k)
+        for line in bytes(buf[offset:offset + top_len]).decode("utf-8").splitlines():
+            count, phrase = line.split("\t", 1)
+            self.top_k.offer(phrase, int(count))
+        return self
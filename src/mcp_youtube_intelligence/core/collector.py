@@ -1,14 +1,25 @@
-"""Video metadata collection via yt-dlp."""
+"""Video metadata collection via yt-dlp (or the Data API when a key is set)."""
 from __future__ import annotations
 
 import json
 import logging
+import re
 import subprocess
+import threading
+from concurrent.futures import TimeoutError as FuturesTimeoutError, as_completed
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterator, Optional
+
+from . import youtube_api, ytdlp_engine
 
 logger = logging.getLogger(__name__)
 
+# Videos passed to one yt-dlp process by get_video_metadata_batch
+METADATA_BATCH_SIZE = 100
+
+# "ERROR: [youtube] <id>: <reason>" as printed by yt-dlp --ignore-errors
+_YTDLP_ERROR_RE = re.compile(r"^ERROR: \[[^\]]+\] ([\w-]+): (.*)$")
+
 
 def resolve_channel_url(channel_ref: str) -> str:
     """Normalize a channel reference (URL, @handle, or ID) to a URL."""
@@ -24,29 +35,100 @@ def resolve_channel_url(channel_ref: str) -> str:
 def get_channel_info(channel_ref: str, yt_dlp: str = "yt-dlp") -> dict:
     """Resolve channel ID and name from any reference."""
     url = resolve_channel_url(channel_ref)
-    try:
-        result = subprocess.run(
-            [yt_dlp, "--print", "channel_id", "--print", "channel",
-             "--playlist-items", "1", url],
-            capture_output=True, text=True, timeout=30,
-        )
-        lines = result.stdout.strip().split("\n")
-        if len(lines) >= 2:
-            return {
-                "channel_id": lines[0].strip(),
-                "channel_name": lines[1].strip(),
-                "channel_url": f"https://www.youtube.com/channel/{lines[0].strip()}",
-            }
-    except Exception as e:
-        logger.warning("Failed to resolve channel %s: %s", channel_ref, e)
+    if ytdlp_engine.active():
+        try:
+            info = ytdlp_engine.extract(url, ("--flat-playlist", "--playlist-items", "1"), timeout=30)
+            if info.get("channel_id"):
+                return {
+                    "channel_id": info["channel_id"],
+                    "channel_name": info.get("channel") or info.get("uploader") or info["channel_id"],
+                    "channel_url": f"https://www.youtube.com/channel/{info['channel_id']}",
+                }
+        except Exception as e:
+            logger.warning("Failed to resolve channel %s: %s", channel_ref, e)
+    else:
+        try:
+            result = subprocess.run(
+                [yt_dlp, "--print", "channel_id", "--print", "channel",
+                 "--playlist-items", "1", url],
+                capture_output=True, text=True, timeout=30,
+            )
+            lines = result.stdout.strip().split("\n")
+            if len(lines) >= 2:
+                return {
+                    "channel_id": lines[0].strip(),
+                    "channel_name": lines[1].strip(),
+                    "channel_url": f"https://www.youtube.com/channel/{lines[0].strip()}",
+                }
+        except Exception as e:
+            logger.warning("Failed to resolve channel %s: %s", channel_ref, e)
 
     cid = channel_ref.split("/")[-1]
     return {"channel_id": cid, "channel_name": cid, "channel_url": f"https://www.youtube.com/channel/{cid}"}
 
 
+def _parse_chapters(raw: Optional[list], duration: Optional[float] = None) -> Optional[list[dict]]:
+    """Normalize yt-dlp ``chapters`` to [{title, start, end}] in seconds, or None."""
+    if not raw:
+        return None
+    chapters = []
+    for i, ch in enumerate(raw):
+        start = ch.get("start_time")
+        if start is None:
+            continue
+        end = ch.get("end_time")
+        if end is None:
+            end = raw[i + 1].get("start_time") if i + 1 < len(raw) else duration
+        chapters.append({
+            "title": (ch.get("title") or f"Chapter {i + 1}").strip(),
+            "start": float(start),
+            "end": float(end) if end is not None else None,
+        })
+    return chapters or None
+
+
+def _to_metadata(video_id: str, data: dict) -> dict:
+    """Normalize a yt-dlp info dict to the stored video metadata fields."""
+    upload_date = data.get("upload_date", "")
+    published_at = None
+    if upload_date:
+        try:
+            published_at = datetime.strptime(upload_date, "%Y%m%d").replace(tzinfo=timezone.utc).isoformat()
+        except ValueError:
+            pass
+    return {
+        "video_id": video_id,
+        "title": data.get("title", ""),
+        "description": data.get("description", ""),
+        "channel_id": data.get("channel_id", ""),
+        "channel_name": data.get("channel", data.get("uploader", "")),
+        "published_at": published_at,
+        "duration_seconds": data.get("duration"),
+        "view_count": data.get("view_count"),
+        "like_count": data.get("like_count"),
+        "comment_count": data.get("comment_count"),
+        "is_live": data.get("is_live", False),
+        "was_live": data.get("was_live", False),
+        "thumbnail_url": data.get("thumbnail"),
+        "chapters": _parse_chapters(data.get("chapters"), data.get("duration")),
+    }
+
+
 def get_video_metadata(video_id: str, yt_dlp: str = "yt-dlp") -> Optional[dict]:
-    """Fetch video metadata via yt-dlp --dump-json."""
+    """Fetch video metadata via yt-dlp --dump-json.
+
+    With a Data API key configured, ``videos.list`` is tried first.
+    """
+    if youtube_api.active():
+        metas = youtube_api.get_video_metadata_batch([video_id])
+        if metas is not None:
+            return metas[video_id] if "error" not in metas[video_id] else None
+        logger.warning("YouTube API unavailable; using yt-dlp for %s", video_id)
     try:
+        if ytdlp_engine.active():
+            return _to_metadata(video_id, ytdlp_engine.extract(
+                f"https://www.youtube.com/watch?v={video_id}", ("--skip-download",), timeout=30,
+            ))
         result = subprocess.run(
             [yt_dlp, "--dump-json", "--skip-download",
              f"https://www.youtube.com/watch?v={video_id}"],
@@ -55,29 +137,111 @@ def get_video_metadata(video_id: str, yt_dlp: str = "yt-dlp") -> Optional[dict]:
         if result.returncode != 0:
             logger.error("yt-dlp failed for %s: %s", video_id, result.stderr[:200])
             return None
-        data = json.loads(result.stdout)
-        upload_date = data.get("upload_date", "")
-        published_at = None
-        if upload_date:
-            try:
-                published_at = datetime.strptime(upload_date, "%Y%m%d").replace(tzinfo=timezone.utc).isoformat()
-            except ValueError:
-                pass
-        return {
-            "video_id": video_id,
-            "title": data.get("title", ""),
-            "description": data.get("description", ""),
-            "channel_id": data.get("channel_id", ""),
-            "channel_name": data.get("channel", data.get("uploader", "")),
-            "published_at": published_at,
-            "duration_seconds": data.get("duration"),
-            "view_count": data.get("view_count"),
-            "like_count": data.get("like_count"),
-            "comment_count": data.get("comment_count"),
-            "is_live": data.get("is_live", False),
-            "was_live": data.get("was_live", False),
-            "thumbnail_url": data.get("thumbnail"),
-        }
+        return _to_metadata(video_id, json.loads(result.stdout))
     except Exception as e:
         logger.error("Metadata error for %s: %s", video_id, e)
         return None
+
+
+def iter_video_metadata(
+    video_ids: list[str], yt_dlp: str = "yt-dlp", timeout: float = 30.0,
+) -> Iterator[tuple[str, Optional[dict], Optional[str]]]:
+    """Stream metadata for many videos from one yt-dlp process.
+
+    Yields ``(video_id, metadata, None)`` as each JSON line is printed and
+    ``(video_id, None, error)`` for videos yt-dlp reported or never printed.
+    The process is killed after *timeout* seconds per video. With the
+    in-process engine the videos are extracted concurrently on its pool.
+    """
+    pending = dict.fromkeys(video_ids)
+    if not pending:
+        return
+    if ytdlp_engine.active():
+        yield from _iter_video_metadata_inprocess(list(pending), timeout)
+        return
+    cmd = [yt_dlp, "--dump-json", "--skip-download", "--ignore-errors", "--no-warnings"]
+    cmd += [f"https://www.youtube.com/watch?v={vid}" for vid in pending]
+    try:
+        # stderr is merged so error lines arrive in order without a second pipe to drain
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    except Exception as e:
+        logger.error("yt-dlp batch failed to start: %s", e)
+        for vid in pending:
+            yield vid, None, str(e)
+        return
+
+    timer = threading.Timer(timeout * len(pending), proc.kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            if line.startswith("{"):
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                vid = data.get("id")
+                if vid in pending:
+                    del pending[vid]
+                    yield vid, _to_metadata(vid, data), None
+                continue
+            m = _YTDLP_ERROR_RE.match(line.rstrip())
+            if m and m.group(1) in pending:
+                del pending[m.group(1)]
+                yield m.group(1), None, m.group(2)
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        proc.stdout.close()
+    for vid in pending:
+        yield vid, None, "no metadata returned"
+
+
+def _iter_video_metadata_inprocess(
+    video_ids: list[str], timeout: float,
+) -> Iterator[tuple[str, Optional[dict], Optional[str]]]:
+    """iter_video_metadata on the engine's pool, yielding in completion order."""
+    futures = {
+        ytdlp_engine.submit(f"https://www.youtube.com/watch?v={vid}", ("--skip-download",)): vid
+        for vid in video_ids
+    }
+    done = set()
+    try:
+        for fut in as_completed(futures, timeout=timeout * len(futures)):
+            vid = futures[fut]
+            done.add(vid)
+            try:
+                yield vid, _to_metadata(vid, fut.result()), None
+            except Exception as e:
+                yield vid, None, str(e)
+    except FuturesTimeoutError:
+        for fut, vid in futures.items():
+            if vid not in done:
+                fut.cancel()
+                yield vid, None, "timed out"
+
+
+def get_video_metadata_batch(
+    video_ids: list[str], yt_dlp: str = "yt-dlp", batch_size: int = METADATA_BATCH_SIZE,
+) -> dict[str, dict]:
+    """Fetch metadata for many videos with one yt-dlp process per *batch_size* ids.
+
+    Returns {video_id: metadata} with ``{"error": reason}`` for videos that
+    could not be fetched, in the order of *video_ids*. With a Data API key
+    configured, ``videos.list`` (50 ids per call) is used instead, falling
+    back to yt-dlp if the API fails.
+    """
+    ids = list(dict.fromkeys(video_ids))
+    if youtube_api.active() and ids:
+        metas = youtube_api.get_video_metadata_batch(ids)
+        if metas is not None:
+            return metas
+        logger.warning("YouTube API unavailable; using yt-dlp for %d videos", len(ids))
+    results: dict[str, dict] = {}
+    for i in range(0, len(ids), batch_size):
+        for vid, meta, error in iter_video_metadata(ids[i:i + batch_size], yt_dlp=yt_dlp):
+            if error is not None:
+                logger.warning("yt-dlp metadata failed for %s: %s", vid, error)
+            results[vid] = meta if meta is not None else {"error": error}
+    return {vid: results[vid] for vid in ids}
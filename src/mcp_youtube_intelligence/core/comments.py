@@ -6,9 +6,15 @@ import logging
 import re
 import subprocess
 import tempfile
+from bisect import bisect_left
 from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+from . import duplicates, ytdlp_engine
+from .automaton import AhoCorasick
 
 logger = logging.getLogger(__name__)
 
@@ -85,33 +91,98 @@ def _count_emoji_sentiment(text: str) -> tuple[int, int]:
     return pos, neg
 
 
-# Negation patterns that flip positive → negative
-_EN_NEGATION_RE = re.compile(
-    r"\b(not|no|never|don'?t|doesn'?t|didn'?t|isn'?t|aren'?t|wasn'?t|can'?t|won'?t|hardly|barely)\s+",
-    re.IGNORECASE,
+# Negation words that flip a following positive keyword to negative, and how
+# many chars after them the keyword may end
+_EN_NEGATIONS = (
+    "not", "no", "never", "hardly", "barely",
+    *(w + t for w in ("don", "doesn", "didn", "isn", "aren", "wasn", "can", "won") for t in ("'t", "t")),
 )
-_KR_NEGATION_RE = re.compile(r"(안\s|못\s|않|없)")
+_EN_NEGATION_WINDOW = 30
+# 안/못 only as separate words; 않/없 anywhere
+_KR_NEGATIONS = {"안": True, "못": True, "않": False, "없": False}
+_KR_NEGATION_WINDOW = 15
 
+# Lexicon entry kinds
+_POS, _NEG, _EN_NEG, _KR_NEG, _POS_EMOJI, _NEG_EMOJI = range(6)
 
-def _count_negated_positives(text: str) -> int:
-    """Count positive keywords that are preceded by negation words."""
+
+def _compile_lexicon() -> tuple[AhoCorasick, list[int]]:
+    """One automaton over keywords, negation words and emoji; returns (automaton, kind per pattern id)."""
+    entries: list[tuple[str, int]] = []
+    entries += [(kw, _POS) for kw in sorted(_POSITIVE_KW)]
+    entries += [(kw, _NEG) for kw in sorted(_NEGATIVE_KW)]
+    entries += [(w, _EN_NEG) for w in _EN_NEGATIONS]
+    entries += [(w, _KR_NEG) for w in _KR_NEGATIONS]
+    entries += [(ch, _POS_EMOJI) for ch in sorted(_POSITIVE_EMOJI)]
+    entries += [(ch, _NEG_EMOJI) for ch in sorted(_NEGATIVE_EMOJI)]
+    return AhoCorasick(p for p, _ in entries), [k for _, k in entries]
+
+
+_LEXICON, _LEXICON_KINDS = _compile_lexicon()
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _scan_sentiment(text: str) -> tuple[int, int, int, int, int]:
+    """Single lexicon pass over *text*.
+
+    Returns (distinct positive keywords, distinct negative keywords,
+    negated positives, positive emoji, negative emoji). A negation counts
+    once if any positive keyword lies entirely inside its window.
+    """
     lower = text.lower()
-    count = 0
-    # English negation + positive keyword
-    for m in _EN_NEGATION_RE.finditer(lower):
-        after = lower[m.end():m.end() + 30]
-        for kw in _POSITIVE_KW:
-            if kw in after:
-                count += 1
-                break
-    # Korean negation + positive keyword
-    for m in _KR_NEGATION_RE.finditer(lower):
-        after = lower[m.end():m.end() + 15]
-        for kw in _POSITIVE_KW:
-            if kw in after:
-                count += 1
-                break
-    return count
+    n = len(lower)
+    kinds = _LEXICON_KINDS
+    pos_ids: set[int] = set()
+    neg_ids: set[int] = set()
+    positives: list[tuple[int, int]] = []
+    windows: list[tuple[int, int]] = []
+    emoji_pos = emoji_neg = 0
+    for start, end, pid in _LEXICON.iter_matches(lower):
+        kind = kinds[pid]
+        if kind == _POS:
+            pos_ids.add(pid)
+            positives.append((start, end))
+        elif kind == _NEG:
+            neg_ids.add(pid)
+        elif kind == _EN_NEG:
+            # Whole word followed by whitespace; the window opens after the whitespace
+            if (start and _is_word_char(lower[start - 1])) or end >= n or not lower[end].isspace():
+                continue
+            while end < n and lower[end].isspace():
+                end += 1
+            windows.append((end, _EN_NEGATION_WINDOW))
+        elif kind == _KR_NEG:
+            if _KR_NEGATIONS[lower[start]]:
+                if end >= n or not lower[end].isspace():
+                    continue
+                end += 1
+            windows.append((end, _KR_NEGATION_WINDOW))
+        elif kind == _POS_EMOJI:
+            emoji_pos += 1
+        else:
+            emoji_neg += 1
+
+    negated = 0
+    if windows and positives:
+        # Earliest keyword end among keywords starting at or after each position
+        positives.sort()
+        starts = [s for s, _ in positives]
+        min_end = [e for _, e in positives]
+        for i in range(len(min_end) - 2, -1, -1):
+            min_end[i] = min(min_end[i], min_end[i + 1])
+        for ws, width in windows:
+            i = bisect_left(starts, ws)
+            if i < len(starts) and min_end[i] <= ws + width:
+                negated += 1
+    return len(pos_ids), len(neg_ids), negated, emoji_pos, emoji_neg
+
+
+def _count_negated_positives(text: str) -> int:
+    """Count negation words followed closely by a positive keyword."""
+    return _scan_sentiment(text)[2]
 
 
 def _analyze_sentiment(text: str) -> str:
@@ -119,19 +190,13 @@ def _analyze_sentiment(text: str) -> str:
 
     Returns "positive", "negative", or "neutral".
     """
-    lower = text.lower()
-
-    # Keyword scores
-    pos = sum(1 for kw in _POSITIVE_KW if kw in lower)
-    neg = sum(1 for kw in _NEGATIVE_KW if kw in lower)
+    pos, neg, negated, emoji_pos, emoji_neg = _scan_sentiment(text)
 
     # Negated positives flip to negative
-    negated = _count_negated_positives(text)
     pos = max(0, pos - negated)
     neg += negated
 
     # Emoji scores (each emoji counts as 0.5 keyword match)
-    emoji_pos, emoji_neg = _count_emoji_sentiment(text)
     pos_score = pos + emoji_pos * 0.5
     neg_score = neg + emoji_neg * 0.5
 
@@ -143,6 +208,172 @@ def _analyze_sentiment(text: str) -> str:
     return "neutral"
 
 
+def comment_sentiment(comment: dict) -> str:
+    """The comment's stored sentiment label, or one analyzed from its text."""
+    return comment.get("sentiment") or _analyze_sentiment(comment.get("text") or "")
+
+
+@lru_cache(maxsize=1)
+def _ytdlp_api():
+    """The yt_dlp package, imported on first use (slow to import); None if unavailable."""
+    try:
+        import yt_dlp
+    except ImportError:  # only the yt-dlp binary is required
+        return None
+    return yt_dlp
+
+
+def streaming_available() -> bool:
+    """True when comments can be streamed in-process (the yt_dlp package is importable)."""
+    return _ytdlp_api() is not None
+
+
+def _stream_comments(
+    video_id: str,
+    sort_arg: str,
+    fetch_count: int,
+    on_comment: Callable[[dict], bool],
+    ydl_opts: Optional[dict] = None,
+) -> dict:
+    """Extract comments in-process, handing each raw comment to *on_comment* as it arrives.
+
+    yt-dlp's YouTube extractor produces comments from a generator that pages
+    through the comment API; it is wrapped on this extractor instance so no
+    further pages are requested once *on_comment* returns True. A failing
+    comment page ends the stream instead of the extraction. Comments are
+    not kept in the info dict.
+
+    *ydl_opts* are added to the extraction options; the video is then
+    processed (with ``skip_download``) so files they ask for, such as
+    subtitles, are written. Returns the info dict.
+    """
+    opts = {
+        "quiet": True,
+        "no_warnings": True,
+        "skip_download": True,
+        "getcomments": True,
+        "socket_timeout": 30,
+        "extractor_args": {"youtube": {"comment_sort": [sort_arg], "max_comments": [str(fetch_count)]}},
+        **(ydl_opts or {}),
+    }
+    with _ytdlp_api().YoutubeDL(opts) as ydl:
+        ie = ydl.get_info_extractor("Youtube")
+        pages = ie._get_comments
+
+        def streamed(*args, **kwargs):
+            try:
+                for raw in pages(*args, **kwargs):
+                    if on_comment(raw):
+                        return
+            except Exception as e:
+                logger.debug("Comment stream error for %s: %s", video_id, e)
+            yield from ()
+
+        ie._get_comments = streamed
+        return ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=ydl_opts is not None)
+
+
+def _read_comments(video_id: str, sort_arg: str, fetch_count: int, yt_dlp: str) -> list[dict]:
+    """Run yt-dlp and read all comments from its info JSON (the engine's info dict when active)."""
+    extractor_args = f"youtube:comment_sort={sort_arg};max_comments={fetch_count}"
+    if ytdlp_engine.active():
+        info = ytdlp_engine.extract(
+            f"https://www.youtube.com/watch?v={video_id}",
+            ("--write-comments", "--extractor-args", extractor_args, "--skip-download"),
+            timeout=90,
+        )
+        return info.get("comments") or []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        subprocess.run(
+            [yt_dlp, "--write-comments",
+             "--extractor-args", extractor_args,
+             "--skip-download", "--write-info-json",
+             "-o", f"{tmpdir}/%(id)s.%(ext)s",
+             f"https://www.youtube.com/watch?v={video_id}"],
+            capture_output=True, text=True, timeout=90,
+        )
+        info_files = list(Path(tmpdir).glob("*.info.json"))
+        if not info_files:
+            return []
+        data = json.loads(info_files[0].read_text())
+        return data.get("comments") or []
+
+
+def comment_fetch_args(max_comments: int, sort: str = "top", filter_noise: bool = True) -> tuple[str, int]:
+    """yt-dlp comment sort key and raw comment count for a :func:`fetch_comments` request."""
+    sort_arg = "new" if sort == "newest" else "top"
+    return sort_arg, max_comments * 3 if filter_noise else max_comments
+
+
+def _comment_filter(
+    max_comments: int,
+    sentiment: str,
+    filter_noise: bool,
+    stop_at: Optional[Callable[[dict], bool]] = None,
+) -> tuple[list[dict], Callable[[dict], bool]]:
+    """The list kept comments are appended to, and the function that filters raw ones into it."""
+    comments: list[dict] = []
+    index = duplicates.DuplicateIndex()
+
+    def accept(c: dict) -> bool:
+        """Filter and label one raw comment; True once enough are collected."""
+        if stop_at is not None and stop_at(c):
+            return True
+        text = c.get("text", "")
+        noise = _is_noise(text)
+        if filter_noise and noise:
+            return False
+        sent = _analyze_sentiment(text)
+        if sentiment != "all" and sent != sentiment:
+            return False
+        if filter_noise:
+            sig = duplicates.signature(text)
+            rep = index.add(len(comments), sig) if sig is not None else None
+            if rep is not None:
+                comments[rep]["duplicates"] += 1
+                return False
+        comments.append({
+            "comment_id": c.get("id", ""),
+            "author": c.get("author", ""),
+            "text": text,
+            "like_count": c.get("like_count", 0),
+            "sentiment": sent,
+            "is_noise": noise,
+            "timestamp": c.get("timestamp"),
+            "duplicates": 0,
+        })
+        return len(comments) >= max_comments
+
+    return comments, accept
+
+
+def extract_with_comments(
+    video_id: str,
+    ydl_opts: dict,
+    max_comments: int = 30,
+    sort: str = "top",
+    filter_noise: bool = True,
+) -> tuple[Optional[dict], list[dict]]:
+    """One in-process yt-dlp extraction that also streams comments.
+
+    Comments are filtered as by :func:`fetch_comments`, and no further
+    comment pages are requested once *max_comments* pass. *ydl_opts* are
+    added to the extraction options, e.g. to write subtitle files from the
+    same page extraction. Needs the yt_dlp package
+    (:func:`streaming_available`).
+
+    Returns (info dict, or None if the extraction failed; comments).
+    """
+    sort_arg, fetch_count = comment_fetch_args(max_comments, sort, filter_noise)
+    comments, accept = _comment_filter(max_comments, "all", filter_noise)
+    try:
+        info = _stream_comments(video_id, sort_arg, fetch_count, accept, ydl_opts)
+    except Exception as e:
+        logger.warning("yt-dlp failed for %s: %s", video_id, e)
+        return None, comments
+    return info, comments
+
+
 def fetch_comments(
     video_id: str,
     max_comments: int = 30,
@@ -150,6 +381,8 @@ def fetch_comments(
     sentiment: str = "all",
     filter_noise: bool = True,
     yt_dlp: str = "yt-dlp",
+    stream: bool = True,
+    stop_at: Optional[Callable[[dict], bool]] = None,
 ) -> list[dict]:
     """Fetch comments for a video using yt-dlp.
 
@@ -158,81 +391,244 @@ def fetch_comments(
         max_comments: Maximum number of comments to fetch.
         sort: "top" (like-sorted, default) or "newest".
         sentiment: Filter by sentiment — "all", "positive", "negative".
-        filter_noise: If True, remove short/spam/emoji-only comments.
+        filter_noise: If True, remove short/spam/emoji-only comments and
+            collapse near-duplicates into the first copy seen.
         yt_dlp: Path to yt-dlp binary.
+        stream: Filter comments as yt-dlp extracts them (in-process) and stop
+            once *max_comments* pass; falls back to the binary when the
+            yt_dlp package is not importable.
+        stop_at: Called with each raw yt-dlp comment before filtering; the
+            fetch ends (without that comment) once it returns True.
 
     Returns:
-        List of comment dicts with keys: comment_id, author, text, like_count, sentiment.
+        List of comment dicts with keys: comment_id, author, text, like_count,
+        sentiment, is_noise, timestamp, duplicates (near-duplicate copies
+        collapsed into the comment).
     """
-    sort_arg = "new" if sort == "newest" else "top"
-    fetch_count = max_comments * 3 if filter_noise else max_comments
+    sort_arg, fetch_count = comment_fetch_args(max_comments, sort, filter_noise)
+    comments, accept = _comment_filter(max_comments, sentiment, filter_noise, stop_at)
 
-    comments: list[dict] = []
     try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            subprocess.run(
-                [yt_dlp, "--write-comments",
-                 "--extractor-args", f"youtube:comment_sort={sort_arg};max_comments={fetch_count}",
-                 "--skip-download", "--write-info-json",
-                 "-o", f"{tmpdir}/%(id)s.%(ext)s",
-                 f"https://www.youtube.com/watch?v={video_id}"],
-                capture_output=True, text=True, timeout=90,
-            )
-            info_files = list(Path(tmpdir).glob("*.info.json"))
-            if info_files:
-                data = json.loads(info_files[0].read_text())
-                for c in data.get("comments") or []:
-                    text = c.get("text", "")
-                    if filter_noise and _is_noise(text):
-                        continue
-                    sent = _analyze_sentiment(text)
-                    if sentiment != "all" and sent != sentiment:
-                        continue
-                    comments.append({
-                        "comment_id": c.get("id", ""),
-                        "author": c.get("author", ""),
-                        "text": text,
-                        "like_count": c.get("like_count", 0),
-                        "sentiment": sent,
-                    })
-                    if len(comments) >= max_comments:
-                        break
+        if stream and streaming_available():
+            _stream_comments(video_id, sort_arg, fetch_count, accept)
+        else:
+            for c in _read_comments(video_id, sort_arg, fetch_count, yt_dlp):
+                if accept(c):
+                    break
     except Exception as e:
         logger.debug("Comment fetch error for %s: %s", video_id, e)
     return comments
 
 
+_KEYWORD_RE = re.compile(r"[\w가-힣]{2,}")
+_KEYWORD_STOPWORDS = frozenset(("the", "is", "it", "to", "and", "of", "in", "that", "this", "for", "are", "was"))
+
+
+def _count_keywords(comments: list[dict]) -> Counter[str]:
+    word_counter: Counter[str] = Counter()
+    for c in comments:
+        word_counter.update(w.lower() for w in _KEYWORD_RE.findall(c.get("text", "")))
+    for stop in _KEYWORD_STOPWORDS:
+        word_counter.pop(stop, None)
+    return word_counter
+
+
+def _sentiment_ratio(counts: dict[str, int], total: int) -> dict[str, float]:
+    return {label: round(counts.get(label, 0) / total, 3) for label in ("positive", "negative", "neutral")}
+
+
 def summarize_comments(comments: list[dict], top_n: int = 5) -> dict:
     """Return a compact summary of comments with sentiment stats and keywords."""
     if not comments:
-        return {"count": 0, "top_comments": [], "sentiment_ratio": {}, "top_keywords": []}
+        return {"count": 0, "top_comments": [], "sentiment_ratio": {}, "top_keywords": [], "duplicate_clusters": []}
 
-    sentiments = [c.get("sentiment", _analyze_sentiment(c.get("text", ""))) for c in comments]
+    # Stored and freshly fetched comments carry their label; others are analyzed here
+    sentiments = [comment_sentiment(c) for c in comments]
+    labels = {id(c): s for c, s in zip(comments, sentiments)}
     total = len(sentiments)
-    ratio = {
-        "positive": round(sentiments.count("positive") / total, 3),
-        "negative": round(sentiments.count("negative") / total, 3),
-        "neutral": round(sentiments.count("neutral") / total, 3),
-    }
+    ratio = _sentiment_ratio(Counter(sentiments), total)
 
     sorted_c = sorted(comments, key=lambda c: c.get("like_count", 0), reverse=True)
     top = sorted_c[:top_n]
 
-    word_counter: Counter[str] = Counter()
-    for c in comments:
-        words = re.findall(r"[\w가-힣]{2,}", c.get("text", ""))
-        word_counter.update(w.lower() for w in words)
-    for stop in ("the", "is", "it", "to", "and", "of", "in", "that", "this", "for", "are", "was"):
-        word_counter.pop(stop, None)
-    top_keywords = [{"word": w, "count": cnt} for w, cnt in word_counter.most_common(15)]
+    top_keywords = [{"word": w, "count": cnt} for w, cnt in _count_keywords(comments).most_common(15)]
+    clusters = sorted((c for c in comments if c.get("duplicates")), key=lambda c: c["duplicates"], reverse=True)
 
     return {
         "count": total,
         "sentiment_ratio": ratio,
         "top_comments": [
             {"author": c.get("author", ""), "text": c.get("text", "")[:200],
-             "likes": c.get("like_count", 0), "sentiment": c.get("sentiment", "neutral")}
+             "likes": c.get("like_count", 0), "sentiment": labels[id(c)]}
             for c in top
         ],
         "top_keywords": top_keywords,
+        "duplicate_clusters": [
+            {"author": c.get("author", ""), "text": c.get("text", "")[:200], "count": 1 + c["duplicates"]}
+            for c in clusters[:5]
+        ],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Materialized stats
+# ---------------------------------------------------------------------------
+
+def comment_stats_delta(comments: list[dict]) -> dict:
+    """Stats contribution of newly stored comments (noise excluded), for storage.update_comment_stats."""
+    counted = [c for c in comments if not c.get("is_noise")]
+    sentiments = Counter(comment_sentiment(c) for c in counted)
+    return {
+        "count": len(counted),
+        "sentiments": dict(sentiments),
+        "keywords": dict(_count_keywords(counted)),
+        "top": [{"comment_id": c.get("comment_id", ""), "like_count": c.get("like_count") or 0} for c in counted],
+    }
+
+
+async def store_comments(video_id: str, comments: list[dict], storage) -> list[dict]:
+    """Save comments and fold the new ones into the video's comment stats.
+
+    Unlabelled comments are analyzed before saving. New comments are checked
+    against the video's near-duplicate index; copies of an existing cluster
+    are flagged as noise and left out of the stats. A video stored before it
+    had stats is counted in full on its first update. Returns the newly
+    stored comments.
+    """
+    comments = [
+        c if c.get("sentiment") else {**c, "sentiment": comment_sentiment(c)}
+        for c in comments
+    ]
+    new = await storage.save_comments(video_id, comments)
+    if not new:
+        return new
+    dups = await duplicates.index_comments(video_id, new, storage)
+    counted = [c for c in new if c.get("comment_id", "") not in dups]
+    if await storage.get_comment_stats(video_id, top_n=0, keyword_limit=0) is None:
+        stored = len(await storage.get_comment_ids(video_id))
+        if stored > len(new):
+            counted = await storage.get_comments(video_id, limit=stored)
+    await storage.update_comment_stats(video_id, comment_stats_delta(counted))
+    return new
+
+
+async def stored_summary(video_id: str, storage, top_n: int = 5) -> Optional[dict]:
+    """summarize_comments output for all stored comments of a video, read from its stats.
+
+    Returns None when no stats have been recorded for the video.
+    """
+    stats = await storage.get_comment_stats(video_id, top_n=top_n)
+    if stats is None:
+        return None
+    total = stats["count"]
+    return {
+        "count": total,
+        "sentiment_ratio": _sentiment_ratio(stats["sentiments"], total) if total else {},
+        "top_comments": [
+            {"author": c.get("author", ""), "text": (c.get("text") or "")[:200],
+             "likes": c.get("like_count", 0), "sentiment": c.get("sentiment") or "neutral"}
+            for c in stats["top_comments"]
+        ],
+        "top_keywords": stats["keywords"],
+        "duplicate_clusters": [
+            {"author": c.get("author") or "", "text": (c.get("text") or "")[:200], "count": c["count"]}
+            for c in await storage.get_comment_clusters(video_id)
+        ],
+        "updated_at": stats["updated_at"],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Incremental sync
+# ---------------------------------------------------------------------------
+
+# yt-dlp derives comment timestamps from relative dates ("2 days ago"), so
+# they are only compared with this much slack
+_SYNC_TIMESTAMP_SLACK = 86400
+
+
+def _is_top_level(c: dict) -> bool:
+    return c.get("parent", "root") == "root" and not c.get("is_pinned")
+
+
+def _likes_due(refreshed_at: Optional[str], hours: float) -> bool:
+    if not refreshed_at:
+        return True
+    try:
+        last = datetime.fromisoformat(refreshed_at)
+    except ValueError:
+        return True
+    return datetime.now(timezone.utc) - last >= timedelta(hours=hours)
+
+
+async def sync_comments(
+    video_id: str,
+    storage,
+    max_new: int = 500,
+    filter_noise: bool = True,
+    yt_dlp: str = "yt-dlp",
+    likes_refresh_hours: float = 24.0,
+    likes_top_n: int = 50,
+) -> dict:
+    """Store only the comments posted since the last sync of *video_id*.
+
+    Comments are fetched newest first and the fetch stops at the first
+    top-level, unpinned comment that is already stored (or that is clearly
+    older than the stored high-water mark, if that comment was deleted). The
+    newest comment seen becomes the new high-water mark.
+
+    Like counts change slowly and are not part of the newest-first pass: at
+    most every *likes_refresh_hours* the top *likes_top_n* comments are
+    fetched and their stored like counts updated.
+
+    Returns {video_id, new_comments, likes_refreshed, newest_comment_id}.
+    """
+    state = await storage.get_comment_sync(video_id) or {}
+    known = await storage.get_comment_ids(video_id)
+    mark = state.get("newest_timestamp")
+    newest: dict = {}
+
+    def reached_stored(c: dict) -> bool:
+        if not _is_top_level(c):
+            return False
+        if not newest:
+            newest.update(c)
+        if c.get("id") in known:
+            return True
+        ts = c.get("timestamp")
+        return mark is not None and ts is not None and ts < mark - _SYNC_TIMESTAMP_SLACK
+
+    new = fetch_comments(
+        video_id, max_comments=max_new, sort="newest", filter_noise=filter_noise,
+        yt_dlp=yt_dlp, stop_at=reached_stored,
+    )
+    # A pinned comment leads the list whatever its age
+    new = [c for c in new if c["comment_id"] not in known]
+    if new:
+        await store_comments(video_id, new, storage)
+
+    now = datetime.now(timezone.utc).isoformat()
+    update: dict = {"synced_at": now}
+    if newest:
+        update["newest_comment_id"] = newest.get("id")
+        update["newest_timestamp"] = newest.get("timestamp")
+
+    likes_refreshed = _likes_due(state.get("likes_refreshed_at"), likes_refresh_hours)
+    if likes_refreshed:
+        top = fetch_comments(
+            video_id, max_comments=likes_top_n, sort="top", filter_noise=filter_noise, yt_dlp=yt_dlp,
+        )
+        if top:
+            await store_comments(video_id, top, storage)
+            await storage.update_comment_likes(
+                video_id, {c["comment_id"]: c.get("like_count") or 0 for c in top},
+            )
+        update["likes_refreshed_at"] = now
+
+    await storage.save_comment_sync(video_id, update)
+    return {
+        "video_id": video_id,
+        "new_comments": len(new),
+        "likes_refreshed": likes_refreshed,
+        "newest_comment_id": update.get("newest_comment_id", state.get("newest_comment_id")),
     }
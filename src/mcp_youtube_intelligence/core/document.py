@@ -0,0 +1,199 @@
+"""Shared per-transcript document model.
+
+A :class:`Document` wraps one cleaned transcript and computes, on first use,
+everything the analysis stages need: sentence spans, an interned token-id
+array with char offsets, per-sentence token ranges and per-vocabulary masks.
+The summarizer, segmenter and TextTiling read from it instead of running
+their own tokenizers, so a report tokenizes the transcript once.
+
+Two token views are derived from a single regex pass:
+
+- *words*: ``[a-zA-Z가-힣\\d]+`` runs, lowercased (the summarizer's terms);
+- *content tokens*: ``[가-힣]{2,}|[a-zA-Z]{3,}`` runs without stopwords (the
+  segmenter's and TextTiling's tokens). These always lie inside a word, so
+  they are derived once per vocabulary entry rather than per occurrence.
+
+Documents are cached per video id (see :func:`for_video`).
+"""
+from __future__ import annotations
+
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from functools import cached_property
+from typing import Optional, Sequence
+
+from .segmenter import _EN_STOP, _KO_STOP
+from .sentences import sentence_spans
+from .summarizer import _STOPWORDS
+
+_WORD_RE = re.compile(r"[a-zA-Z가-힣\d]+")
+_CONTENT_RE = re.compile(r"[가-힣]{2,}|[a-zA-Z]{3,}")
+
+# Documents kept by for_video (most recently used last)
+_CACHE_MAX = 32
+_cache: OrderedDict[str, Document] = OrderedDict()
+
+
+class Document:
+    """Sentences and interned tokens of one cleaned transcript, computed lazily.
+
+    *timed_segments* only refine sentence reconstruction (caption pauses);
+    *spans* may be given if sentence offsets were computed elsewhere.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        timed_segments: Optional[Sequence[dict]] = None,
+        spans: Optional[list[tuple[int, int]]] = None,
+    ):
+        self.text = text
+        self.timed_segments = timed_segments
+        if spans is not None:
+            self.__dict__["spans"] = spans
+        # word -> id; ids of content tokens share this vocabulary
+        self.vocab: dict[str, int] = {}
+        self.words: list[str] = []
+
+    def _intern(self, word: str) -> int:
+        tid = self.vocab.get(word)
+        if tid is None:
+            tid = self.vocab[word] = len(self.words)
+            self.words.append(word)
+        return tid
+
+    # -- sentences ---------------------------------------------------------
+
+    @cached_property
+    def spans(self) -> list[tuple[int, int]]:
+        """Sentence (start, end) char offsets (see core/sentences.py)."""
+        return sentence_spans(self.text, self.timed_segments)
+
+    @cached_property
+    def sentences(self) -> list[str]:
+        return [self.text[s:e] for s, e in self.spans]
+
+    @property
+    def sentence_starts(self) -> list[int]:
+        return [s for s, _ in self.spans]
+
+    # -- words -------------------------------------------------------------
+
+    @cached_property
+    def _words(self) -> tuple[array, array]:
+        ids = array("i")
+        offsets = array("i")
+        intern = self._intern
+        for m in _WORD_RE.finditer(self.text):
+            ids.append(intern(m.group().lower()))
+            offsets.append(m.start())
+        return ids, offsets
+
+    @property
+    def token_ids(self) -> array:
+        """Word ids in text order."""
+        return self._words[0]
+
+    @property
+    def token_offsets(self) -> array:
+        """Char offset of each word in :attr:`token_ids`."""
+        return self._words[1]
+
+    @cached_property
+    def term_mask(self) -> bytearray:
+        """Per word id: 1 if the summarizer scores it (longer than one char, not a stopword)."""
+        self._words  # tokenize first so the vocabulary is complete
+        return bytearray(len(w) > 1 and w not in _STOPWORDS for w in self.words)
+
+    @cached_property
+    def sentence_token_spans(self) -> list[tuple[int, int]]:
+        """(first, last + 1) indices into :attr:`token_ids` for each sentence."""
+        return self._token_ranges(self.token_offsets)
+
+    def sentence_terms(self, i: int) -> list[int]:
+        """Ids of the summarizer terms in sentence *i*, in order."""
+        lo, hi = self.sentence_token_spans[i]
+        mask = self.term_mask
+        return [t for t in self.token_ids[lo:hi] if mask[t]]
+
+    # -- content tokens ----------------------------------------------------
+
+    @cached_property
+    def _content(self) -> tuple[array, array]:
+        word_ids, word_offsets = self._words
+        # Content tokens inside each distinct word, as (id, offset in word)
+        parts: list[tuple[tuple[int, int], ...]] = []
+        for w in list(self.words):
+            parts.append(tuple(
+                (self._intern(m.group()), m.start())
+                for m in _CONTENT_RE.finditer(w)
+                if m.group() not in _EN_STOP and m.group() not in _KO_STOP
+            ))
+        ids = array("i")
+        offsets = array("i")
+        for wid, pos in zip(word_ids, word_offsets):
+            for cid, off in parts[wid]:
+                ids.append(cid)
+                offsets.append(pos + off)
+        return ids, offsets
+
+    @property
+    def content_ids(self) -> array:
+        """Content token ids (stopwords removed) in text order."""
+        return self._content[0]
+
+    @property
+    def content_offsets(self) -> array:
+        return self._content[1]
+
+    @cached_property
+    def sentence_content_spans(self) -> list[tuple[int, int]]:
+        """(first, last + 1) indices into :attr:`content_ids` for each sentence."""
+        return self._token_ranges(self.content_offsets)
+
+    def sentence_bags(self) -> list[Counter]:
+        """Content-token counts of each sentence."""
+        ids = self.content_ids
+        return [Counter(ids[lo:hi]) for lo, hi in self.sentence_content_spans]
+
+    def keywords(self, start: int = 0, end: Optional[int] = None, top_n: int = 3) -> list[str]:
+        """Most frequent content tokens in ``text[start:end]`` (ties by first appearance)."""
+        offsets = self.content_offsets
+        lo = bisect_left(offsets, start)
+        hi = len(offsets) if end is None else bisect_left(offsets, end)
+        counts = Counter(self.content_ids[lo:hi])
+        return [self.words[t] for t, _ in counts.most_common(top_n)]
+
+    # -- helpers -----------------------------------------------------------
+
+    def _token_ranges(self, offsets: array) -> list[tuple[int, int]]:
+        ranges = []
+        for s, e in self.spans:
+            ranges.append((bisect_left(offsets, s), bisect_left(offsets, e)))
+        return ranges
+
+
+def for_video(
+    video_id: str, text: str, timed_segments: Optional[Sequence[dict]] = None,
+) -> Document:
+    """Cached :class:`Document` for *video_id*.
+
+    Rebuilt if the text changed, or if timed segments are now available for
+    a document built without them.
+    """
+    doc = _cache.get(video_id)
+    if (
+        doc is not None
+        and (doc.text is text or doc.text == text)
+        and (doc.timed_segments or not timed_segments)
+    ):
+        _cache.move_to_end(video_id)
+        return doc
+    doc = Document(text, timed_segments)
+    _cache[video_id] = doc
+    _cache.move_to_end(video_id)
+    while len(_cache) > _CACHE_MAX:
+        _cache.popitem(last=False)
+    return doc
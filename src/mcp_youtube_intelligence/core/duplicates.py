@@ -0,0 +1,187 @@
+"""Near-duplicate comment detection with MinHash and LSH banding.
+
+Copy-paste floods and coordinated spam arrive as many slightly different
+copies of one text. Each comment gets a MinHash signature over its
+character shingles (one-permutation hashing: every shingle is hashed once
+into one of ``NUM_HASHES`` bins, empty bins are filled from their right
+neighbour), the signature is cut into ``BANDS`` bands, and comments sharing
+a band bucket with a cluster representative are verified against it. Only
+representatives are indexed, so a batch costs one signature and ``BANDS``
+lookups per comment regardless of how large the clusters grow.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import struct
+from typing import Hashable, Iterable, Optional
+
+NUM_HASHES = 64
+BANDS = 16
+ROWS = NUM_HASHES // BANDS
+# Characters per shingle
+SHINGLE = 4
+# Estimated Jaccard similarity at which a comment joins a cluster
+THRESHOLD = 0.7
+
+_EMPTY = 1 << 64
+# Bin values are below 2**58; densified bins add a multiple of this per step
+_OFFSET = 1 << 58
+_SIGNATURE = struct.Struct(f"<{NUM_HASHES}Q")
+_BAND = struct.Struct(f"<{ROWS}Q")
+_BUCKET_BITS = 56
+
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+# ---------------------------------------------------------------------------
+# Signatures
+# ---------------------------------------------------------------------------
+
+def _normalize(text: str) -> str:
+    return _NON_WORD_RE.sub(" ", text.lower()).strip()
+
+
+def _shingles(text: str) -> set[str]:
+    norm = _normalize(text)
+    if len(norm) <= SHINGLE:
+        return {norm} if norm else set()
+    return {norm[i:i + SHINGLE] for i in range(len(norm) - SHINGLE + 1)}
+
+
+def signature(text: str) -> Optional[tuple[int, ...]]:
+    """MinHash signature of *text*, or None if it has no word characters."""
+    bins = [_EMPTY] * NUM_HASHES
+    for sh in _shingles(text):
+        h = int.from_bytes(hashlib.blake2b(sh.encode("utf-8"), digest_size=8).digest(), "little")
+        b, v = h % NUM_HASHES, h // NUM_HASHES
+        if v < bins[b]:
+            bins[b] = v
+    first = next((i for i, v in enumerate(bins) if v != _EMPTY), None)
+    if first is None:
+        return None
+    # Rotation densification: an empty bin takes the next filled bin to its
+    # right (circularly), offset by the distance
+    out = list(bins)
+    nxt = first + NUM_HASHES
+    for i in range(NUM_HASHES - 1, -1, -1):
+        if bins[i] != _EMPTY:
+            nxt = i
+        else:
+            out[i] = bins[nxt % NUM_HASHES] + (nxt - i) * _OFFSET
+    return tuple(out)
+
+
+def similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+    return sum(x == y for x, y in zip(a, b)) / NUM_HASHES
+
+
+def band_keys(sig: tuple[int, ...]) -> list[int]:
+    """One LSH bucket key per band; the band number is kept in the top bits."""
+    keys = []
+    for band in range(BANDS):
+        digest = hashlib.blake2b(_BAND.pack(*sig[band * ROWS:(band + 1) * ROWS]), digest_size=7).digest()
+        keys.append((band << _BUCKET_BITS) | int.from_bytes(digest, "little"))
+    return keys
+
+
+def to_bytes(sig: tuple[int, ...]) -> bytes:
+    return _SIGNATURE.pack(*sig)
+
+
+def from_bytes(buf: bytes) -> tuple[int, ...]:
+    return _SIGNATURE.unpack(buf)
+
+
+# ---------------------------------------------------------------------------
+# LSH index
+# ---------------------------------------------------------------------------
+
+class DuplicateIndex:
+    """Cluster representatives bucketed by band key."""
+
+    __slots__ = ("threshold", "buckets", "_signatures")
+
+    def __init__(self, threshold: float = THRESHOLD):
+        self.threshold = threshold
+        self.buckets: dict[int, Hashable] = {}
+        self._signatures: dict[Hashable, tuple[int, ...]] = {}
+
+    def load(self, bucket: int, key: Hashable, sig: tuple[int, ...]) -> None:
+        """Register an existing representative under one of its buckets."""
+        self.buckets.setdefault(bucket, key)
+        self._signatures[key] = sig
+
+    def add(self, key: Hashable, sig: tuple[int, ...], keys: Optional[list[int]] = None) -> Optional[Hashable]:
+        """Return the representative *sig* duplicates, or index *key* as a new one and return None."""
+        keys = band_keys(sig) if keys is None else keys
+        for bucket in keys:
+            rep = self.buckets.get(bucket)
+            if rep is not None and rep != key and similarity(sig, self._signatures[rep]) >= self.threshold:
+                return rep
+        self._signatures[key] = sig
+        for bucket in keys:
+            self.buckets.setdefault(bucket, key)
+        return None
+
+
+def collapse(comments: Iterable[dict], threshold: float = THRESHOLD) -> list[dict]:
+    """Keep the first comment of each near-duplicate cluster.
+
+    Representatives are returned in input order as copies carrying
+    ``duplicates``: the number of comments collapsed into them.
+    """
+    index = DuplicateIndex(threshold)
+    kept: list[dict] = []
+    for c in comments:
+        sig = signature(c.get("text") or "")
+        rep = index.add(len(kept), sig) if sig is not None else None
+        if rep is not None:
+            kept[rep]["duplicates"] += 1
+        else:
+            kept.append({**c, "duplicates": c.get("duplicates", 0)})
+    return kept
+
+
+# ---------------------------------------------------------------------------
+# Persisted index
+# ---------------------------------------------------------------------------
+
+async def index_comments(video_id: str, comments: list[dict], storage, threshold: float = THRESHOLD) -> dict[str, str]:
+    """Check newly stored comments against a video's persisted buckets.
+
+    Only the buckets of the new signatures are read. New representatives
+    are added to the buckets; the others are saved as members of the
+    cluster they matched (and flagged as noise). Returns {comment_id:
+    representative_id} for the new comments that are near-duplicates.
+    """
+    sigs = []
+    for c in comments:
+        sig = signature(c.get("text") or "")
+        if sig is not None:
+            sigs.append((c, sig, band_keys(sig)))
+    if not sigs:
+        return {}
+
+    index = DuplicateIndex(threshold)
+    existing = await storage.get_comment_buckets(video_id, sorted({k for _, _, keys in sigs for k in keys}))
+    for bucket, (rep, buf) in existing.items():
+        index.load(bucket, rep, from_bytes(buf))
+
+    rows = []
+    dups: dict[str, str] = {}
+    for c, sig, keys in sigs:
+        cid = c.get("comment_id", "")
+        rep = index.add(cid, sig, keys)
+        if rep is not None:
+            dups[cid] = rep
+        rows.append({
+            "comment_id": cid,
+            "signature": to_bytes(sig),
+            "representative": rep or cid,
+            "copies": 1 + (c.get("duplicates") or 0),
+        })
+    new_buckets = {k: rep for k, rep in index.buckets.items() if k not in existing}
+    await storage.save_comment_signatures(video_id, rows, new_buckets)
+    return dups
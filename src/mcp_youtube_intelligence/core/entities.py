@@ -2,13 +2,27 @@
 
 Provides a comprehensive dictionary covering global tech companies, AI/ML terms,
 programming languages, crypto, finance, people, and more. Case-insensitive
-matching with word-boundary support for English entities.
+matching with word-boundary support for English entities, via a matcher that
+is compiled once and scans the text in a single pass.
 """
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import mmap
+import os
 import re
+import struct
+import tempfile
+from bisect import bisect_right
+from pathlib import Path
 from typing import Optional
 
+from .automaton import AhoCorasick
+
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Entity dictionaries by category
 # Each entry: keyword -> (entity_type, canonical_name)
@@ -307,18 +321,299 @@ def _is_korean_keyword(kw: str) -> bool:
     return bool(re.search(r"[가-힣]", kw)) and not re.search(r"[a-zA-Z]", kw)
 
 
-def _build_pattern(keyword: str) -> re.Pattern:
-    """Build a regex pattern for a keyword.
-    
-    - Korean-only keywords: substring match (case-sensitive)
-    - English/mixed keywords: word-boundary match (case-insensitive)
+# ASCII-only case folding keeps offsets in the folded text identical to the original
+_ASCII_FOLD = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same notion of a word character as the ``\\w`` regex class."""
+    return ch.isalnum() or ch == "_"
+
+
+def _at_boundary(text: str, pos: int) -> bool:
+    """True if *pos* is a word boundary in *text* (``\\b`` semantics)."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+class EntityMatcher:
+    """Entity dictionary compiled into a single Aho-Corasick automaton.
+
+    - Korean-only keywords: substring match
+    - English/mixed keywords: ASCII case-insensitive, word-boundary match
+    - Overlaps resolved leftmost-longest, non-overlapping
+    """
+
+    def __init__(self, entity_dict: dict[str, tuple[str, str]]):
+        self.keywords: list[str] = []
+        self.entries: list[tuple[str, str]] = []
+        self.needs_boundary: list[bool] = []
+        slots: dict[str, int] = {}
+        for keyword, entry in entity_dict.items():
+            folded = keyword.translate(_ASCII_FOLD)
+            if not folded:
+                continue
+            # Case variants of one keyword ("langchain"/"LangChain") match the
+            # same text; the last one in dictionary order wins, so dictionary
+            # files merged later override built-in entries.
+            if folded in slots:
+                i = slots[folded]
+                self.keywords[i] = keyword
+                self.entries[i] = entry
+                self.needs_boundary[i] = not _is_korean_keyword(keyword)
+                continue
+            slots[folded] = len(self.keywords)
+            self.keywords.append(keyword)
+            self.entries.append(entry)
+            self.needs_boundary.append(not _is_korean_keyword(keyword))
+        self._automaton = AhoCorasick(k.translate(_ASCII_FOLD) for k in self.keywords)
+
+    def as_dict(self) -> dict[str, tuple[str, str]]:
+        """Return the (deduplicated) keyword dictionary this matcher was compiled from."""
+        return dict(zip(self.keywords, self.entries))
+
+    def to_bytes(self) -> bytes:
+        meta = json.dumps(
+            {"keywords": self.keywords, "entries": self.entries, "needs_boundary": self.needs_boundary},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        return struct.pack("<I", len(meta)) + meta + self._automaton.to_bytes()
+
+    @classmethod
+    def from_bytes(cls, buf: bytes | memoryview) -> EntityMatcher:
+        (meta_len,) = struct.unpack_from("<I", buf, 0)
+        meta = json.loads(bytes(buf[4:4 + meta_len]).decode("utf-8"))
+        self = cls.__new__(cls)
+        self.keywords = meta["keywords"]
+        self.entries = [tuple(e) for e in meta["entries"]]
+        self.needs_boundary = meta["needs_boundary"]
+        self._automaton = AhoCorasick.from_bytes(buf[4 + meta_len:])
+        return self
+
+    def find(self, text: str) -> list[tuple[int, int, int]]:
+        """Return non-overlapping (start, end, keyword_index) matches in text order."""
+        if not text:
+            return []
+        folded = text.translate(_ASCII_FOLD)
+        needs_boundary = self.needs_boundary
+        candidates = [
+            (start, end, kid)
+            for start, end, kid in self._automaton.iter_matches(folded)
+            if not needs_boundary[kid] or (_at_boundary(text, start) and _at_boundary(text, end))
+        ]
+        # Leftmost-longest: earliest start wins, longer keyword breaks ties
+        candidates.sort(key=lambda c: (c[0], c[0] - c[1]))
+        matches: list[tuple[int, int, int]] = []
+        last_end = 0
+        for start, end, kid in candidates:
+            if start >= last_end:
+                matches.append((start, end, kid))
+                last_end = end
+        return matches
+
+
+_DEFAULT_MATCHER = EntityMatcher(DEFAULT_ENTITY_DICT)
+# Matcher used by extract_entities: the default one, or one loaded from dictionary files
+_active_matcher: EntityMatcher = _DEFAULT_MATCHER
+_EXTRA_MATCHERS: dict[tuple, EntityMatcher] = {}
+_EXTRA_MATCHERS_MAX = 8
+
+
+def _get_matcher(extra_dict: Optional[dict[str, tuple[str, str]]]) -> EntityMatcher:
+    """Return the compiled matcher for the active dictionary merged with *extra_dict*."""
+    if not extra_dict:
+        return _active_matcher
+    key = tuple(sorted(extra_dict.items()))
+    matcher = _EXTRA_MATCHERS.get(key)
+    if matcher is None:
+        if len(_EXTRA_MATCHERS) >= _EXTRA_MATCHERS_MAX:
+            _EXTRA_MATCHERS.pop(next(iter(_EXTRA_MATCHERS)))
+        matcher = EntityMatcher({**_active_matcher.as_dict(), **extra_dict})
+        _EXTRA_MATCHERS[key] = matcher
+    return matcher
+
+
+def _set_active_matcher(matcher: EntityMatcher) -> None:
+    global _active_matcher, _known_terms
+    _active_matcher = matcher
+    _known_terms = None
+    _EXTRA_MATCHERS.clear()
+
+
+_known_terms: Optional[frozenset[str]] = None
+
+
+def known_terms() -> frozenset[str]:
+    """ASCII-lowercased keywords and canonical names of the active dictionary."""
+    global _known_terms
+    if _known_terms is None:
+        terms = {k.translate(_ASCII_FOLD) for k in _active_matcher.keywords}
+        terms.update(ename.translate(_ASCII_FOLD) for _, ename in _active_matcher.entries)
+        _known_terms = frozenset(terms)
+    return _known_terms
+
+
+# ---------------------------------------------------------------------------
+# External dictionaries (TSV / JSON files) and the compiled matcher artifact
+# ---------------------------------------------------------------------------
+
+ARTIFACT_NAME = ".matcher.bin"
+# Dictionary file that promoted entries are appended to
+CUSTOM_DICT_NAME = "custom.tsv"
+_ARTIFACT_MAGIC = b"MYIENT01"
+# Bump when EntityMatcher/AhoCorasick serialization or matching rules change
+_ARTIFACT_VERSION = "2"
+
+# Directories already loaded in this process (ensure_dictionaries is a no-op for them)
+_loaded_dirs: set[str] = set()
+
+
+def load_entity_dict_file(path: str | Path) -> dict[str, tuple[str, str]]:
+    """Read one dictionary file.
+
+    - ``.tsv``: ``keyword<TAB>type<TAB>canonical_name`` per line; ``#`` comments
+      and blank lines are skipped, a missing canonical name defaults to the keyword.
+    - ``.json``: ``{"keyword": ["type", "name"]}`` or a list of
+      ``{"keyword": ..., "type": ..., "name": ...}`` objects.
+    """
+    path = Path(path)
+    result: dict[str, tuple[str, str]] = {}
+    if path.suffix == ".tsv":
+        for line in path.read_text(encoding="utf-8").splitlines():
+            if not line.strip() or line.startswith("#"):
+                continue
+            parts = [p.strip() for p in line.split("\t")]
+            if len(parts) < 2 or not parts[0]:
+                logger.warning("Skipping malformed dictionary line in %s: %r", path.name, line)
+                continue
+            name = parts[2] if len(parts) > 2 and parts[2] else parts[0]
+            result[parts[0]] = (parts[1], name)
+    elif path.suffix == ".json":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(data, dict):
+            for keyword, (etype, ename) in data.items():
+                result[keyword] = (etype, ename)
+        else:
+            for item in data:
+                result[item["keyword"]] = (item["type"], item.get("name") or item["keyword"])
+    return result
+
+
+def _dictionary_files(dict_dir: str | Path) -> list[Path]:
+    d = Path(dict_dir)
+    if not d.is_dir():
+        return []
+    return sorted(p for p in d.iterdir() if p.suffix in (".tsv", ".json") and p.is_file())
+
+
+def _source_hash(files: list[Path]) -> bytes:
+    """Hash of everything the compiled matcher depends on."""
+    h = hashlib.sha256()
+    h.update(_ARTIFACT_VERSION.encode())
+    h.update(repr(list(DEFAULT_ENTITY_DICT.items())).encode("utf-8"))
+    for f in files:
+        h.update(f.name.encode("utf-8") + b"\0")
+        h.update(f.read_bytes())
+    return h.digest()
+
+
+def _write_artifact(path: Path, matcher: EntityMatcher, source_hash: bytes) -> None:
+    """Write the artifact atomically so concurrent readers never see a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".matcher-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_ARTIFACT_MAGIC + source_hash + matcher.to_bytes())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _read_artifact(path: Path, source_hash: bytes) -> Optional[EntityMatcher]:
+    """Map the artifact read-only and load it if it was built from *source_hash*."""
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header_len = len(_ARTIFACT_MAGIC) + len(source_hash)
+            if mm[:len(_ARTIFACT_MAGIC)] != _ARTIFACT_MAGIC or mm[len(_ARTIFACT_MAGIC):header_len] != source_hash:
+                return None
+            with memoryview(mm) as view:
+                return EntityMatcher.from_bytes(view[header_len:])
+    except (OSError, ValueError, struct.error) as e:
+        logger.warning("Ignoring unreadable entity matcher artifact %s: %s", path, e)
+        return None
+
+
+def load_dictionaries(dict_dir: str | Path, force_rebuild: bool = False) -> dict:
+    """Load dictionary files from *dict_dir* and activate the merged matcher.
+
+    Files are merged over DEFAULT_ENTITY_DICT in file-name order. The compiled
+    matcher is cached in ``<dict_dir>/.matcher.bin`` and only rebuilt when the
+    sources (or the built-in dictionary) change; the artifact is replaced
+    atomically and never modified in place, so worker processes can share it.
+
+    Returns a status dict: files, keyword_count, source_hash, rebuilt, artifact.
+    """
+    dict_dir = Path(dict_dir)
+    files = _dictionary_files(dict_dir)
+    source_hash = _source_hash(files)
+    artifact = dict_dir / ARTIFACT_NAME
+
+    matcher = None
+    if not force_rebuild and artifact.exists():
+        matcher = _read_artifact(artifact, source_hash)
+    rebuilt = matcher is None
+    if matcher is None:
+        merged = dict(DEFAULT_ENTITY_DICT)
+        for f in files:
+            merged.update(load_entity_dict_file(f))
+        matcher = EntityMatcher(merged)
+        if dict_dir.is_dir():
+            try:
+                _write_artifact(artifact, matcher, source_hash)
+            except OSError as e:
+                logger.warning("Could not write entity matcher artifact %s: %s", artifact, e)
+
+    _set_active_matcher(matcher)
+    _loaded_dirs.add(str(dict_dir))
+    logger.info("Entity dictionaries loaded: %d keywords from %d files (rebuilt=%s)",
+                len(matcher.keywords), len(files), rebuilt)
+    return {
+        "files": [f.name for f in files],
+        "keyword_count": len(matcher.keywords),
+        "source_hash": source_hash.hex(),
+        "rebuilt": rebuilt,
+        "artifact": str(artifact),
+    }
+
+
+def add_dictionary_entry(
+    dict_dir: str | Path, keyword: str, entity_type: str, name: Optional[str] = None,
+) -> Path:
+    """Append one entry to ``<dict_dir>/custom.tsv`` (created if missing).
+
+    Call load_dictionaries afterwards to activate it.
     """
-    escaped = re.escape(keyword)
-    if _is_korean_keyword(keyword):
-        return re.compile(escaped)
-    else:
-        # Word boundary matching, case-insensitive
-        return re.compile(r"\b" + escaped + r"\b", re.IGNORECASE)
+    keyword = keyword.strip()
+    entity_type = entity_type.strip()
+    name = (name or keyword).strip()
+    for value in (keyword, entity_type, name):
+        if not value or "\t" in value or "\n" in value:
+            raise ValueError(f"Invalid dictionary field: {value!r}")
+    path = Path(dict_dir) / CUSTOM_DICT_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    new_file = not path.exists()
+    with open(path, "a", encoding="utf-8") as f:
+        if new_file:
+            f.write("# keyword\ttype\tcanonical_name\n")
+        f.write(f"{keyword}\t{entity_type}\t{name}\n")
+    return path
+
+
+def ensure_dictionaries(dict_dir: str | Path) -> None:
+    """Load *dict_dir* once per process; later calls are free. Use load_dictionaries to reload."""
+    if dict_dir and str(Path(dict_dir)) not in _loaded_dirs:
+        load_dictionaries(dict_dir)
 
 
 def extract_entities(
@@ -332,35 +627,24 @@ def extract_entities(
     - Word-boundary matching to prevent partial matches
     - Synonym grouping (multiple keywords → one canonical entity)
 
-    Returns list of dicts: {type, name, keyword, count}.
+    Returns list of dicts: {type, name, keyword, count, first_offset}.
     """
-    entity_dict = {**DEFAULT_ENTITY_DICT}
-    if extra_dict:
-        entity_dict.update(extra_dict)
+    matcher = _get_matcher(extra_dict)
 
-    # Sort keywords by length descending for longest-match-first
-    sorted_keywords = sorted(entity_dict.keys(), key=len, reverse=True)
-
-    # Track which character positions have been matched
-    matched_positions: set[int] = set()
     # canonical_key -> count
     counts: dict[str, int] = {}
     # canonical_key -> first keyword that matched
     first_keyword: dict[str, str] = {}
+    # canonical_key -> char offset of the first mention
+    first_offset: dict[str, int] = {}
 
-    for keyword in sorted_keywords:
-        etype, ename = entity_dict[keyword]
+    for start, _, kid in matcher.find(text):
+        etype, ename = matcher.entries[kid]
         canon_key = f"{etype}:{ename}"
-        pattern = _build_pattern(keyword)
-
-        for m in pattern.finditer(text):
-            span = set(range(m.start(), m.end()))
-            if span & matched_positions:
-                continue
-            matched_positions |= span
-            counts[canon_key] = counts.get(canon_key, 0) + 1
-            if canon_key not in first_keyword:
-                first_keyword[canon_key] = keyword
+        counts[canon_key] = counts.get(canon_key, 0) + 1
+        if canon_key not in first_keyword:
+            first_keyword[canon_key] = matcher.keywords[kid]
+            first_offset[canon_key] = start
 
     found: list[dict] = []
     for canon_key, count in counts.items():
@@ -370,7 +654,73 @@ def extract_entities(
             "name": ename,
             "keyword": first_keyword[canon_key],
             "count": count,
+            "first_offset": first_offset[canon_key],
         })
 
     found.sort(key=lambda x: x["count"], reverse=True)
     return found
+
+
+def entity_timeline(
+    timed_segments: list[dict],
+    extra_dict: Optional[dict[str, tuple[str, str]]] = None,
+) -> list[dict]:
+    """Locate entity mentions in time using the transcript's timed segments.
+
+    The segment texts are joined and scanned with one matcher pass; each
+    match offset is mapped to its segment's start time by binary search over
+    the precomputed segment offsets.
+
+    Returns list of dicts sorted by count: {type, name, count, timestamps,
+    histogram}, where *timestamps* are mention times in seconds and
+    *histogram* is a sparse per-minute list of {minute, count}.
+    """
+    if not timed_segments:
+        return []
+    matcher = _get_matcher(extra_dict)
+
+    offsets: list[int] = []
+    starts: list[float] = []
+    parts: list[str] = []
+    pos = 0
+    for seg in timed_segments:
+        seg_text = seg.get("text", "")
+        offsets.append(pos)
+        starts.append(float(seg.get("start", 0.0)))
+        parts.append(seg_text)
+        pos += len(seg_text) + 1
+    text = " ".join(parts)
+
+    timelines: dict[tuple[str, str], dict] = {}
+    for start, _, kid in matcher.find(text):
+        etype, ename = matcher.entries[kid]
+        t = starts[bisect_right(offsets, start) - 1]
+        entry = timelines.get((etype, ename))
+        if entry is None:
+            entry = timelines[(etype, ename)] = {
+                "type": etype, "name": ename, "count": 0, "timestamps": [], "_buckets": {},
+            }
+        entry["count"] += 1
+        entry["timestamps"].append(round(t, 1))
+        minute = int(t // 60)
+        entry["_buckets"][minute] = entry["_buckets"].get(minute, 0) + 1
+
+    found = []
+    for entry in timelines.values():
+        buckets = entry.pop("_buckets")
+        entry["histogram"] = [{"minute": m, "count": c} for m, c in sorted(buckets.items())]
+        found.append(entry)
+    found.sort(key=lambda x: x["count"], reverse=True)
+    return found
+
+
+def resolve_entity_name(term: str) -> str:
+    """Map a user-supplied keyword or canonical name to the canonical entity name.
+
+    "금리" → "Interest Rate", "nvidia" → "NVIDIA". Unknown terms are returned unchanged.
+    """
+    folded = term.strip().translate(_ASCII_FOLD)
+    for keyword, (_, ename) in zip(_active_matcher.keywords, _active_matcher.entries):
+        if keyword.translate(_ASCII_FOLD) == folded or ename.translate(_ASCII_FOLD) == folded:
+            return ename
+    return term.strip()
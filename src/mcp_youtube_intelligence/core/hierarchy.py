@@ -0,0 +1,278 @@
+"""Hierarchical topic segmentation from one bottom-up merge pass.
+
+The transcript's sentences are grouped into blocks of at least BLOCK_TOKENS
+content tokens (the shared :class:`~.document.Document` tokens). Adjacent
+blocks are then merged bottom-up, always joining the neighbouring pair that
+is cheapest to merge, until one segment remains. The order in which
+boundaries disappear is the whole tree: cutting it into *k* segments keeps
+the last ``k - 1`` boundaries merged, so every level (and any
+``max_segments``) is read from the same merge order, and finer levels always
+nest inside coarser ones.
+
+The merge cost is ``(1 - cosine) * n_a * n_b / (n_a + n_b)`` for blocks of
+*n* tokens, a Ward-style weighting that merges small pieces before large
+topics. Word bags are merged small-into-large and neighbour dot products are
+updated incrementally, so the pass is O(n log n) in the number of blocks.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+from collections import Counter
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from .segmenter import _locate_segments
+
+if TYPE_CHECKING:
+    from .document import Document
+
+# Minimum content tokens per leaf block
+BLOCK_TOKENS = 40
+# Content tokens per top-level segment when no count is requested
+TOP_LEVEL_TOKENS = 600
+MIN_TOP_SEGMENTS = 2
+MAX_TOP_SEGMENTS = 8
+# Each level splits its parent into about this many children
+BRANCHING = 3
+DEFAULT_LEVELS = 3
+
+
+# ---------------------------------------------------------------------------
+# Merge order
+# ---------------------------------------------------------------------------
+
+def _dot(a: Counter, b: Counter) -> int:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(c * b[t] for t, c in a.items() if t in b)
+
+
+def merge_order(bags: Sequence[Counter]) -> list[tuple[int, float]]:
+    """Boundaries between adjacent *bags* in the order they are merged away.
+
+    A boundary is the index of the bag right after it (1..n-1). Returns
+    (boundary, cosine similarity of the two sides when merged) for all
+    ``n - 1`` boundaries.
+    """
+    n = len(bags)
+    bag: list[Optional[Counter]] = [Counter(b) for b in bags]
+    size = [sum(b.values()) for b in bags]
+    norm2 = [sum(c * c for c in b.values()) for b in bags]
+    # Clusters are identified by their first bag; linked to their neighbours
+    nxt = list(range(1, n + 1))
+    prv = list(range(-1, n - 1))
+    dot_right = [_dot(bag[i], bag[i + 1]) for i in range(n - 1)] + [0]
+    stamp = [0] * (n + 1)
+
+    def similarity(a: int, b: int) -> float:
+        if not norm2[a] or not norm2[b]:
+            return 0.0
+        return dot_right[a] / (math.sqrt(norm2[a]) * math.sqrt(norm2[b]))
+
+    def entry(a: int, b: int) -> tuple[float, int, int]:
+        weight = size[a] * size[b] / (size[a] + size[b]) if size[a] + size[b] else 0.0
+        return ((1.0 - similarity(a, b)) * weight, b, stamp[b])
+
+    heap = [entry(i, i + 1) for i in range(n - 1)]
+    heapq.heapify(heap)
+    order: list[tuple[int, float]] = []
+    while heap:
+        _, b, st = heapq.heappop(heap)
+        if st != stamp[b]:
+            continue
+        stamp[b] = -1
+        a, r = prv[b], nxt[b]
+        left = prv[a]
+        order.append((b, similarity(a, b)))
+
+        # Dot products of the merged cluster with its new neighbours
+        dot_l = dot_right[left] + _dot(bag[left], bag[b]) if left >= 0 else 0
+        dot_r = _dot(bag[a], bag[r]) + dot_right[b] if r < n else 0
+        if len(bag[a]) < len(bag[b]):
+            bag[a], bag[b] = bag[b], bag[a]
+        bag[a].update(bag[b])
+        bag[b] = None
+        norm2[a] += norm2[b] + 2 * dot_right[a]
+        size[a] += size[b]
+        nxt[a] = r
+        if r < n:
+            prv[r] = a
+            dot_right[a] = dot_r
+            stamp[r] += 1
+            heapq.heappush(heap, entry(a, r))
+        if left >= 0:
+            dot_right[left] = dot_l
+            stamp[a] += 1
+            heapq.heappush(heap, entry(left, a))
+    return order
+
+
+# ---------------------------------------------------------------------------
+# Tree
+# ---------------------------------------------------------------------------
+
+class TopicTree:
+    """Merge tree over the sentence blocks of one transcript.
+
+    ``cut(k)`` returns the k-segment segmentation; cuts for larger *k* refine
+    those for smaller *k*.
+    """
+
+    def __init__(self, text: str, doc: Optional[Document] = None, block_tokens: int = BLOCK_TOKENS):
+        if doc is None or doc.text != text:
+            from .document import Document
+
+            doc = Document(text)
+        self.text = text
+        self.doc = doc
+        self.blocks = self._blocks(block_tokens)
+        self.tokens = len(doc.content_ids)
+        bags = [Counter(doc.content_ids[lo:hi]) for _, lo, hi in self.blocks]
+        order = merge_order(bags)
+        # Boundaries from last merged (coarsest) to first merged
+        self.splits = [b for b, _ in reversed(order)]
+        self.similarity = dict(order)
+
+    def _blocks(self, block_tokens: int) -> list[tuple[int, int, int]]:
+        """(char start, first, last + 1 content token) of each block, in order."""
+        doc = self.doc
+        blocks: list[tuple[int, int, int]] = []
+        start = lo = None
+        for (s, _), (t_lo, t_hi) in zip(doc.spans, doc.sentence_content_spans):
+            if start is None:
+                start, lo = s, t_lo
+            if t_hi - lo >= block_tokens:
+                blocks.append((start, lo, t_hi))
+                start = None
+        if start is not None:
+            hi = len(doc.content_ids)
+            if blocks:
+                # A short remainder joins the previous block
+                prev_start, prev_lo, _ = blocks.pop()
+                blocks.append((prev_start, prev_lo, hi))
+            else:
+                blocks.append((start, lo, hi))
+        return blocks
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    def cut(self, n_segments: int) -> list[tuple[int, int, Optional[float]]]:
+        """(char start, char end, confidence) of *n_segments* segments (fewer if too short).
+
+        *confidence* of a segment is one minus the similarity across the
+        boundary opening it (None for the first segment).
+        """
+        if not self.blocks:
+            return []
+        k = max(1, min(n_segments, len(self.blocks)))
+        bounds = sorted(self.splits[:k - 1])
+        starts = [0] + [self.blocks[b][0] for b in bounds]
+        ends = starts[1:] + [len(self.text)]
+        confidences = [None] + [round(1.0 - self.similarity[b], 3) for b in bounds]
+        return list(zip(starts, ends, confidences))
+
+    def level_sizes(self, levels: int = DEFAULT_LEVELS, top: Optional[int] = None) -> list[int]:
+        """Segment count of each level, coarsest first; stops when a level adds nothing."""
+        if top is None:
+            top = round(self.tokens / TOP_LEVEL_TOKENS)
+            top = min(MAX_TOP_SEGMENTS, max(MIN_TOP_SEGMENTS, top))
+        sizes: list[int] = []
+        k = top
+        for _ in range(max(1, levels)):
+            k = min(k, len(self.blocks))
+            if sizes and k <= sizes[-1]:
+                break
+            sizes.append(max(1, k))
+            k *= BRANCHING
+        return sizes
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def _node(tree: TopicTree, start: int, end: int, confidence: Optional[float]) -> dict:
+    text = tree.text[start:end].strip()
+    return {
+        "text": text,
+        "char_count": len(text),
+        "topic": ", ".join(tree.doc.keywords(start, end)),
+        "confidence": confidence,
+        "char_start": start,
+        "char_end": end,
+    }
+
+
+def segment_level(
+    text: str,
+    level: Optional[int] = None,
+    max_segments: Optional[int] = None,
+    doc: Optional[Document] = None,
+) -> list[dict]:
+    """Flat segments at one granularity of the tree.
+
+    *max_segments* asks for that many segments directly; otherwise *level*
+    (1 = coarsest, the default) picks a level as in :func:`topic_tree`.
+    Returns list of dicts: segment, text, char_count, topic, confidence,
+    char_start, char_end.
+    """
+    tree = TopicTree(text, doc)
+    if max_segments:
+        k = max_segments
+    else:
+        sizes = tree.level_sizes(levels=max(1, level or 1))
+        k = sizes[-1] if sizes else 1
+    return [
+        {"segment": i, **_node(tree, start, end, conf)}
+        for i, (start, end, conf) in enumerate(tree.cut(k))
+    ]
+
+
+def topic_tree(
+    text: str,
+    levels: int = DEFAULT_LEVELS,
+    max_segments: Optional[int] = None,
+    timed_segments: Optional[list[dict]] = None,
+    doc: Optional[Document] = None,
+) -> list[dict]:
+    """Nested topic segments, *levels* deep, from a single merge pass.
+
+    The top level has *max_segments* segments, or about one per
+    TOP_LEVEL_TOKENS content tokens (MIN_TOP_SEGMENTS..MAX_TOP_SEGMENTS);
+    each further level splits its parents about BRANCHING ways.
+
+    Returns the top-level nodes. Each node has id ("2.1" is the first child
+    of the second top-level segment), level, text, char_count, topic,
+    confidence, char_start, char_end and children; with *timed_segments*
+    also start and end times in seconds.
+    """
+    if not text or not text.strip():
+        return []
+    tree = TopicTree(text, doc)
+    sizes = tree.level_sizes(levels, top=max_segments)
+    all_nodes: list[dict] = []
+    roots: list[dict] = []
+    parents: list[dict] = []
+    for depth, k in enumerate(sizes, start=1):
+        current: list[dict] = []
+        p = 0
+        for start, end, conf in tree.cut(k):
+            node = _node(tree, start, end, conf)
+            if depth == 1:
+                node["id"] = str(len(roots) + 1)
+                roots.append(node)
+            else:
+                while parents[p]["char_end"] <= start:
+                    p += 1
+                parent = parents[p]
+                node["id"] = f"{parent['id']}.{len(parent['children']) + 1}"
+                parent["children"].append(node)
+            node["level"] = depth
+            node["children"] = []
+            current.append(node)
+        all_nodes.extend(current)
+        parents = current
+    if timed_segments:
+        _locate_segments(all_nodes, text, timed_segments)
+    return roots
@@ -0,0 +1,100 @@
+"""Tiered video metadata cache on top of the stored video records.
+
+Metadata splits into fields that do not change once a video is published
+(title, channel, duration, publish date, ...) and counters that keep moving
+(views, likes, comments, live state). Immutable fields are fetched once
+and served from storage from then on. Counters are served as stored too,
+but once older than the TTL a background refresh is started; the caller
+gets the stale values immediately and the next call sees the new ones.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from . import collector
+
+logger = logging.getLogger(__name__)
+
+IMMUTABLE_FIELDS = (
+    "title", "description", "channel_id", "channel_name", "published_at",
+    "duration_seconds", "thumbnail_url", "chapters",
+)
+VOLATILE_FIELDS = ("view_count", "like_count", "comment_count", "is_live", "was_live")
+
+DEFAULT_COUNTERS_TTL_HOURS = 1.0
+
+# Counter refreshes in flight, one per video
+_refreshing: dict[str, asyncio.Task] = {}
+
+
+def stamp(meta: dict, now: Optional[str] = None) -> dict:
+    """*meta* (collector output) with the fetch times stored alongside it."""
+    now = now or datetime.now(timezone.utc).isoformat()
+    return {**meta, "metadata_at": now, "counters_at": now}
+
+
+def _is_stale(counters_at: Optional[str], ttl_hours: float) -> bool:
+    if not counters_at:
+        return True
+    try:
+        last = datetime.fromisoformat(counters_at)
+    except ValueError:
+        return True
+    return datetime.now(timezone.utc) - last >= timedelta(hours=ttl_hours)
+
+
+def _view(video_id: str, record: dict) -> dict:
+    return {"video_id": video_id, **{k: record.get(k) for k in IMMUTABLE_FIELDS + VOLATILE_FIELDS}}
+
+
+async def _refresh_counters(video_id: str, storage, yt_dlp: str) -> None:
+    try:
+        meta = await asyncio.to_thread(collector.get_video_metadata, video_id, yt_dlp=yt_dlp)
+        if meta:
+            update = {k: meta[k] for k in VOLATILE_FIELDS if meta.get(k) is not None}
+            update["counters_at"] = datetime.now(timezone.utc).isoformat()
+            await storage.upsert_video({"video_id": video_id, **update})
+    except Exception as e:
+        logger.warning("Counter refresh failed for %s: %s", video_id, e)
+    finally:
+        _refreshing.pop(video_id, None)
+
+
+def _schedule_refresh(video_id: str, storage, yt_dlp: str) -> None:
+    if video_id not in _refreshing:
+        _refreshing[video_id] = asyncio.get_running_loop().create_task(
+            _refresh_counters(video_id, storage, yt_dlp),
+        )
+
+
+async def wait_for_refreshes() -> None:
+    """Wait for the counter refreshes started so far."""
+    while _refreshing:
+        await asyncio.gather(*list(_refreshing.values()), return_exceptions=True)
+
+
+async def get_metadata(
+    video_id: str,
+    storage,
+    yt_dlp: str = "yt-dlp",
+    counters_ttl_hours: float = DEFAULT_COUNTERS_TTL_HOURS,
+) -> Optional[dict]:
+    """Video metadata, fetched only when the stored record lacks it.
+
+    Stale counters are returned as stored while a background task fetches
+    fresh ones. Returns None if the metadata cannot be fetched.
+    """
+    record = await storage.get_video(video_id)
+    if record and record.get("metadata_at"):
+        if _is_stale(record.get("counters_at"), counters_ttl_hours):
+            _schedule_refresh(video_id, storage, yt_dlp)
+        return _view(video_id, record)
+
+    meta = await asyncio.to_thread(collector.get_video_metadata, video_id, yt_dlp=yt_dlp)
+    if not meta:
+        return None
+    await storage.upsert_video(stamp(meta))
+    return meta
@@ -4,14 +4,44 @@ from __future__ import annotations
 import asyncio
 import logging
 import subprocess
+import time
+import urllib.request
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import AsyncIterator, Awaitable, Callable, Optional
 
 import feedparser
 
+from . import collector, metadata_cache, ytdlp_engine
+
 logger = logging.getLogger(__name__)
 
+FEED_URL = "https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+# Channels checked at once by sweep_channels
+DEFAULT_SWEEP_CONCURRENCY = 16
+
 _RSS_MAX_RETRIES = 2
 _RSS_RETRY_DELAY = 1.0  # seconds
+_FEED_TIMEOUT = 30.0  # seconds
+
+
+def _feed_videos(feed) -> list[dict]:
+    """Videos listed in a parsed feed; raises if the feed could not be parsed."""
+    if feed.bozo and not feed.entries:
+        raise RuntimeError(f"RSS parse error: {feed.bozo_exception}")
+    videos = []
+    for entry in feed.entries:
+        vid = entry.get("yt_videoid", "")
+        if not vid:
+            continue
+        videos.append({
+            "video_id": vid,
+            "title": entry.get("title", ""),
+            "published": entry.get("published", ""),
+            "link": entry.get("link", f"https://www.youtube.com/watch?v={vid}"),
+        })
+    return videos
 
 
 def fetch_channel_feed(channel_id: str) -> list[dict]:
@@ -19,30 +49,16 @@ def fetch_channel_feed(channel_id: str) -> list[dict]:
     
     Retries once on failure, then falls back to yt-dlp.
     """
-    feed_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+    feed_url = FEED_URL.format(channel_id=channel_id)
 
     last_error: Exception | None = None
     for attempt in range(_RSS_MAX_RETRIES):
         try:
-            feed = feedparser.parse(feed_url)
-            if feed.bozo and not feed.entries:
-                raise RuntimeError(f"RSS parse error: {feed.bozo_exception}")
-            videos = []
-            for entry in feed.entries:
-                vid = entry.get("yt_videoid", "")
-                if not vid:
-                    continue
-                videos.append({
-                    "video_id": vid,
-                    "title": entry.get("title", ""),
-                    "published": entry.get("published", ""),
-                    "link": entry.get("link", f"https://www.youtube.com/watch?v={vid}"),
-                })
+            videos = _feed_videos(feedparser.parse(feed_url))
             if videos:
                 return videos
             # Empty feed — might be a transient issue, retry
             if attempt < _RSS_MAX_RETRIES - 1:
-                import time
                 time.sleep(_RSS_RETRY_DELAY)
                 continue
             # Still empty after retries — try fallback
@@ -51,7 +67,6 @@ def fetch_channel_feed(channel_id: str) -> list[dict]:
             last_error = e
             logger.warning("RSS fetch attempt %d failed for %s: %s", attempt + 1, channel_id, e)
             if attempt < _RSS_MAX_RETRIES - 1:
-                import time
                 time.sleep(_RSS_RETRY_DELAY)
 
     # Fallback to yt-dlp
@@ -63,6 +78,19 @@ def _fetch_channel_ytdlp(channel_id: str, max_videos: int = 5) -> list[dict]:
     """Fallback: fetch recent videos using yt-dlp flat-playlist."""
     try:
         url = f"https://www.youtube.com/channel/{channel_id}/videos"
+        if ytdlp_engine.active():
+            info = ytdlp_engine.extract(url, ("--flat-playlist", "--playlist-items", f"1:{max_videos}"), timeout=60)
+            videos = [
+                {
+                    "video_id": e.get("id", ""),
+                    "title": e.get("title", ""),
+                    "published": "",
+                    "link": f"https://www.youtube.com/watch?v={e.get('id', '')}",
+                }
+                for e in info.get("entries") or []
+            ]
+            logger.info("yt-dlp fallback fetched %d videos for %s", len(videos), channel_id)
+            return videos
         result = subprocess.run(
             [
                 "yt-dlp", "--flat-playlist",
@@ -96,21 +124,153 @@ def _fetch_channel_ytdlp(channel_id: str, max_videos: int = 5) -> list[dict]:
         return []
 
 
-async def check_channel_new_videos(channel_id: str, storage) -> list[dict]:
-    """Check RSS feed for videos not yet in storage. Returns list of new video dicts."""
-    feed_videos = fetch_channel_feed(channel_id)
+# ---------------------------------------------------------------------------
+# Async feed fetching
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _httpx():
+    """The httpx package, or None if not installed."""
+    try:
+        import httpx
+    except ImportError:
+        return None
+    return httpx
+
+
+def _get_blocking(url: str) -> bytes:
+    with urllib.request.urlopen(url, timeout=_FEED_TIMEOUT) as resp:
+        return resp.read()
+
+
+@asynccontextmanager
+async def _feed_client(max_connections: int) -> AsyncIterator[Callable[[str], Awaitable[bytes]]]:
+    """Yield an async ``get(url) -> body`` shared by a sweep.
+
+    Uses one pooled ``httpx.AsyncClient`` when httpx is installed, otherwise
+    blocking urllib requests on worker threads.
+    """
+    httpx = _httpx()
+    if httpx is None:
+        async def get(url: str) -> bytes:
+            return await asyncio.to_thread(_get_blocking, url)
+
+        yield get
+        return
+
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    async with httpx.AsyncClient(limits=limits, timeout=_FEED_TIMEOUT, follow_redirects=True) as client:
+        async def get(url: str) -> bytes:
+            resp = await client.get(url)
+            resp.raise_for_status()
+            return resp.content
+
+        yield get
+
+
+async def fetch_channel_feed_async(channel_id: str, get: Callable[[str], Awaitable[bytes]]) -> list[dict]:
+    """:func:`fetch_channel_feed` over the async *get* of a sweep's client."""
+    feed_url = FEED_URL.format(channel_id=channel_id)
+    for attempt in range(_RSS_MAX_RETRIES):
+        try:
+            body = await get(feed_url)
+            # Parsing is CPU-bound; keep it off the loop so other feeds stay in flight
+            videos = _feed_videos(await asyncio.to_thread(feedparser.parse, body))
+            if videos:
+                return videos
+        except Exception as e:
+            logger.warning("RSS fetch attempt %d failed for %s: %s", attempt + 1, channel_id, e)
+        if attempt < _RSS_MAX_RETRIES - 1:
+            await asyncio.sleep(_RSS_RETRY_DELAY)
+
+    logger.info("RSS failed for %s, falling back to yt-dlp", channel_id)
+    return await asyncio.to_thread(_fetch_channel_ytdlp, channel_id)
+
+
+# ---------------------------------------------------------------------------
+# Checks
+# ---------------------------------------------------------------------------
+
+async def check_channel_new_videos(
+    channel_id: str, storage, yt_dlp: str = "yt-dlp", feed_videos: Optional[list[dict]] = None,
+) -> list[dict]:
+    """Check RSS feed for videos not yet in storage. Returns list of new video dicts.
+
+    New videos are stored as pending with their full metadata, fetched for
+    all of them by one yt-dlp process; videos it fails on keep the feed's
+    title and date. *feed_videos* skips fetching the feed.
+    """
+    if feed_videos is None:
+        feed_videos = fetch_channel_feed(channel_id)
     new_videos = []
     for v in feed_videos:
         existing = await storage.get_video(v["video_id"])
         if existing is None:
-            await storage.upsert_video({
-                "video_id": v["video_id"],
-                "channel_id": channel_id,
-                "title": v["title"],
-                "published_at": v["published"],
-                "status": "pending",
-            })
             new_videos.append(v)
+
+    metas = {}
+    if new_videos:
+        metas = await asyncio.to_thread(
+            collector.get_video_metadata_batch, [v["video_id"] for v in new_videos], yt_dlp=yt_dlp,
+        )
+    for v in new_videos:
+        record = {
+            "video_id": v["video_id"],
+            "channel_id": channel_id,
+            "title": v["title"],
+            "published_at": v["published"],
+        }
+        meta = metas.get(v["video_id"]) or {}
+        if "error" not in meta:
+            record.update({k: val for k, val in metadata_cache.stamp(meta).items() if val is not None})
+        await storage.upsert_video({**record, "status": "pending"})
     await storage.update_channel_checked(channel_id)
     logger.info("Channel %s: %d new videos", channel_id, len(new_videos))
     return new_videos
+
+
+async def sweep_channels(
+    storage, yt_dlp: str = "yt-dlp", concurrency: int = DEFAULT_SWEEP_CONCURRENCY,
+) -> dict:
+    """Check every enabled channel for new videos, *concurrency* channels at a time.
+
+    Feeds are fetched over one shared async HTTP client. A failing channel
+    is reported in its own entry and does not stop the sweep.
+
+    Returns a dict with channels_checked, new_video_count, errors,
+    duration_seconds and ``channels``: per channel its channel_id,
+    channel_name, new_videos (or error) and seconds taken.
+    """
+    concurrency = max(1, concurrency)
+    channels = await storage.list_channels()
+    sem = asyncio.Semaphore(concurrency)
+    started = time.perf_counter()
+
+    async with _feed_client(concurrency) as get:
+        async def check(ch: dict) -> dict:
+            async with sem:
+                t0 = time.perf_counter()
+                entry = {"channel_id": ch["channel_id"], "channel_name": ch.get("channel_name")}
+                try:
+                    feed = await fetch_channel_feed_async(ch["channel_id"], get)
+                    entry["new_videos"] = await check_channel_new_videos(
+                        ch["channel_id"], storage, yt_dlp=yt_dlp, feed_videos=feed,
+                    )
+                except Exception as e:
+                    logger.warning("Sweep failed for channel %s: %s", ch["channel_id"], e)
+                    entry["error"] = str(e)
+                entry["seconds"] = round(time.perf_counter() - t0, 3)
+                return entry
+
+        results = await asyncio.gather(*(check(ch) for ch in channels))
+
+    duration = time.perf_counter() - started
+    logger.info("Swept %d channels in %.1fs", len(results), duration)
+    return {
+        "channels_checked": len(results),
+        "new_video_count": sum(len(r.get("new_videos", ())) for r in results),
+        "errors": sum("error" in r for r in results),
+        "concurrency": concurrency,
+        "duration_seconds": round(duration, 3),
+        "channels": list(results),
+    }
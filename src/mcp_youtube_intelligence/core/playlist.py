@@ -5,6 +5,8 @@ import json
 import logging
 import subprocess
 
+from . import ytdlp_engine
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,41 +24,47 @@ async def get_playlist(
     url = f"https://www.youtube.com/playlist?list={playlist_id}"
     logger.info("Fetching playlist %s (max %d)", playlist_id, max_videos)
 
-    try:
-        proc = subprocess.run(
-            [
-                yt_dlp,
-                "--flat-playlist",
-                "--dump-json",
-                "--playlist-end", str(max_videos),
-                url,
-            ],
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
-    except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
-        logger.error("yt-dlp playlist failed: %s", exc)
-        return {"error": str(exc)}
+    args = ["--flat-playlist", "--playlist-end", str(max_videos)]
+    if ytdlp_engine.active():
+        try:
+            info = ytdlp_engine.extract(url, args, timeout=120)
+        except Exception as exc:
+            logger.error("yt-dlp playlist failed: %s", exc)
+            return {"error": str(exc)}
+        entries = info.get("entries") or []
+        playlist_title = info.get("title", "")
+    else:
+        try:
+            proc = subprocess.run(
+                [yt_dlp, "--dump-json", *args, url],
+                capture_output=True,
+                text=True,
+                timeout=120,
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
+            logger.error("yt-dlp playlist failed: %s", exc)
+            return {"error": str(exc)}
 
-    if proc.returncode != 0:
-        logger.error("yt-dlp playlist stderr: %s", proc.stderr[:500])
-        return {"error": f"yt-dlp exited with {proc.returncode}"}
+        if proc.returncode != 0:
+            logger.error("yt-dlp playlist stderr: %s", proc.stderr[:500])
+            return {"error": f"yt-dlp exited with {proc.returncode}"}
 
-    videos: list[dict] = []
-    playlist_title = ""
-    for line in proc.stdout.strip().splitlines():
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if not playlist_title:
-            playlist_title = entry.get("playlist_title", "")
-        videos.append({
+        entries = []
+        for line in proc.stdout.strip().splitlines():
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        playlist_title = entries[0].get("playlist_title", "") if entries else ""
+
+    videos = [
+        {
             "video_id": entry.get("id", ""),
             "title": entry.get("title", ""),
             "duration": entry.get("duration"),
-        })
+        }
+        for entry in entries
+    ]
 
     return {
         "playlist_id": playlist_id,
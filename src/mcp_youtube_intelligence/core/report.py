@@ -1,11 +1,12 @@
 """Structured report generation from video analysis."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Optional
 
 from ..config import Config
-from . import collector, comments, entities, segmenter, summarizer, transcript
+from . import acquire, collector, comments, document, entities, metadata_cache, segmenter, summarizer, transcript
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +38,16 @@ def _estimate_segment_times(
     if not n:
         return []
 
+    # Chapter segments carry their own times
+    if all(seg.get("start") is not None for seg in segments):
+        times = []
+        for i, seg in enumerate(segments):
+            end = seg.get("end")
+            if end is None:
+                end = segments[i + 1]["start"] if i + 1 < n else total_duration
+            times.append((_format_timestamp(seg["start"]), _format_timestamp(end) if end is not None else ""))
+        return times
+
     # If we have timed transcript segments, use char offsets to estimate
     if timed_segments and total_duration:
         total_chars = sum(s.get("char_count", len(s.get("text", ""))) for s in segments)
@@ -95,6 +106,7 @@ async def generate_report(
     config: Optional[Config] = None,
     include_comments: bool = True,
     llm_provider: Optional[str] = None,
+    storage=None,
 ) -> str:
     """Generate a structured markdown report for a YouTube video.
 
@@ -103,21 +115,48 @@ async def generate_report(
         config: Config for LLM access. If None, uses extractive summarization.
         include_comments: Whether to include comment analysis.
         llm_provider: LLM provider override for summarization.
+        storage: If given, metadata comes from its metadata cache (or is
+            stored there after the combined yt-dlp acquisition), topic
+            segments are read from / saved to its persisted segmentation
+            instead of always being recomputed, and
+            fetched comments are stored with the viewer reactions read from
+            the video's comment stats.
 
     Returns:
         Markdown report string.
     """
     yt_dlp = config.yt_dlp_path if config else "yt-dlp"
-
-    # 1. Metadata
-    meta = collector.get_video_metadata(video_id, yt_dlp=yt_dlp)
+    max_c = config.max_comments if config else 30
+
+    # 1. Acquisition: metadata, transcript and comments from one yt-dlp run
+    # (comments streamed, so paging stops once enough are kept), unless only
+    # the transcript is needed
+    record = await storage.get_video(video_id) if storage is not None else None
+    acquired = None
+    if include_comments or acquire.metadata_needs_extraction(record):
+        acquired = await asyncio.to_thread(
+            acquire.acquire_video, video_id, max_comments=max_c if include_comments else 0, yt_dlp=yt_dlp,
+        )
+
+    # 2. Metadata
+    if acquired and acquired["metadata"] and not (record and record.get("metadata_at")):
+        meta = acquired["metadata"]
+        if storage is not None:
+            await storage.upsert_video(metadata_cache.stamp(meta))
+    elif storage is not None:
+        meta = await metadata_cache.get_metadata(
+            video_id, storage, yt_dlp=yt_dlp,
+            counters_ttl_hours=config.metadata_counters_ttl_hours if config else metadata_cache.DEFAULT_COUNTERS_TTL_HOURS,
+        )
+    else:
+        meta = collector.get_video_metadata(video_id, yt_dlp=yt_dlp)
     title = meta.get("title", video_id) if meta else video_id
     channel = meta.get("channel_name", "N/A") if meta else "N/A"
     duration_sec = meta.get("duration_seconds") if meta else None
     duration_str = _format_duration(duration_sec)
 
-    # 2. Transcript
-    tr = transcript.fetch_transcript(video_id)
+    # 3. Transcript
+    tr = acquired["transcript"] if acquired else transcript.fetch_transcript(video_id)
     text = transcript.clean_transcript(tr.get("best", ""))
     lang = tr.get("lang", "N/A") or "N/A"
     timed_segs = tr.get("timed_segments", [])
@@ -125,28 +164,45 @@ async def generate_report(
     if not text:
         return f"# ⚠️ Report Generation Failed: {title}\n\nCould not retrieve transcript."
 
-    # 3. Summary (async)
+    # 4. Summary (async)
+    doc = document.for_video(video_id, text, timed_segs)
     if config:
-        summary = await summarizer.summarize(text, config=config, provider=llm_provider)
+        summary = await summarizer.summarize(text, config=config, provider=llm_provider, doc=doc)
     else:
         summary = transcript.summarize_extractive(text)
 
-    # 4. Topic segments
-    segments = segmenter.segment_topics(text)
+    # 5. Topic segments
+    chapters = meta.get("chapters") if meta else None
+    if storage is not None:
+        segments, _ = await segmenter.cached_segment_topics(
+            video_id, text, storage, chapters=chapters, timed_segments=timed_segs, doc=doc,
+        )
+    else:
+        segments = segmenter.segment_topics(text, chapters=chapters, timed_segments=timed_segs, doc=doc)
     times = _estimate_segment_times(segments, timed_segs, duration_sec)
 
-    # 5. Entities
+    # 6. Entities
+    if config and config.entity_dict_dir:
+        entities.ensure_dictionaries(config.entity_dict_dir)
     entity_list = entities.extract_entities(text)
     grouped = _group_entities(entity_list)
 
-    # 6. Comments (optional, failure-tolerant)
+    # 7. Comments (optional, failure-tolerant)
     comment_section = ""
     if include_comments:
         try:
-            max_c = config.max_comments if config else 30
-            raw_comments = comments.fetch_comments(video_id, max_comments=max_c, yt_dlp=yt_dlp)
+            raw_comments = acquired["comments"] if acquired else None
+            if raw_comments is None:
+                # Not extracted with the rest (no yt_dlp package, or the run failed)
+                raw_comments = comments.fetch_comments(video_id, max_comments=max_c, yt_dlp=yt_dlp)
             if raw_comments:
-                cs = comments.summarize_comments(raw_comments)
+                cs = None
+                if storage is not None:
+                    # Served from the stats of every comment stored for the video
+                    await comments.store_comments(video_id, raw_comments, storage)
+                    cs = await comments.stored_summary(video_id, storage)
+                if cs is None:
+                    cs = comments.summarize_comments(raw_comments)
                 ratio = cs.get("sentiment_ratio", {})
                 pos = int(ratio.get("positive", 0) * 100)
                 neg = int(ratio.get("negative", 0) * 100)
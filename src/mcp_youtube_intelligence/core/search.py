@@ -7,6 +7,8 @@ import subprocess
 from typing import Optional
 from urllib.parse import urlencode
 
+from . import ytdlp_engine
+
 logger = logging.getLogger(__name__)
 
 
@@ -107,27 +109,31 @@ def _search_ytdlp(query: str, *, max_results: int, yt_dlp: str) -> list[dict]:
     search_url = f"ytsearch{max_results}:{query}"
     logger.info("yt-dlp fallback search: %s", search_url)
 
-    try:
-        proc = subprocess.run(
-            [yt_dlp, "--flat-playlist", "--dump-json", search_url],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-    except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
-        logger.error("yt-dlp search failed: %s", exc)
-        return [{"error": str(exc)}]
-
-    if proc.returncode != 0:
-        logger.error("yt-dlp search stderr: %s", proc.stderr[:500])
-        return [{"error": f"yt-dlp exited with {proc.returncode}"}]
+    if ytdlp_engine.active():
+        try:
+            entries = ytdlp_engine.extract(search_url, ("--flat-playlist",), timeout=60).get("entries") or []
+        except Exception as exc:
+            logger.error("yt-dlp search failed: %s", exc)
+            return [{"error": str(exc)}]
+    else:
+        try:
+            proc = subprocess.run(
+                [yt_dlp, "--flat-playlist", "--dump-json", search_url],
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
+            logger.error("yt-dlp search failed: %s", exc)
+            return [{"error": str(exc)}]
+
+        if proc.returncode != 0:
+            logger.error("yt-dlp search stderr: %s", proc.stderr[:500])
+            return [{"error": f"yt-dlp exited with {proc.returncode}"}]
+        entries = _json_lines(proc.stdout)
 
     results: list[dict] = []
-    for line in proc.stdout.strip().splitlines():
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            continue
+    for entry in entries:
         results.append({
             "video_id": entry.get("id", ""),
             "title": entry.get("title", ""),
@@ -137,3 +143,13 @@ def _search_ytdlp(query: str, *, max_results: int, yt_dlp: str) -> list[dict]:
             "thumbnail": entry.get("thumbnail", ""),
         })
     return results
+
+
+def _json_lines(stdout: str) -> list[dict]:
+    entries = []
+    for line in stdout.strip().splitlines():
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return entries
@@ -1,9 +1,19 @@
 """Topic segmentation for transcripts."""
 from __future__ import annotations
 
+import hashlib
+import json
 import math
 import re
+from bisect import bisect_left, bisect_right
 from collections import Counter
+from typing import TYPE_CHECKING, Optional
+
+from .sentences import segment_offsets, sentence_spans
+from .transcript import clean_transcript
+
+if TYPE_CHECKING:
+    from .document import Document
 
 # Minimum segment size in characters — smaller segments merge into previous
 # Note: Korean text is denser (~2-3x info per char vs English), so keep this modest
@@ -92,17 +102,15 @@ def _cosine(a: Counter, b: Counter) -> float:
     return dot / (na * nb)
 
 
-def _split_sentences(text: str) -> list[str]:
-    """Split on common sentence-ending punctuation."""
-    parts = re.split(r'(?<=[.!?。])\s+', text)
-    return [p for p in parts if p.strip()]
+def _fallback_split(text: str, doc: Optional[Document] = None) -> list[tuple[int, int, str]]:
+    """Split long marker-less text by keyword shift + length heuristic.
 
-
-def _fallback_split(text: str) -> list[str]:
-    """Split long marker-less text by keyword shift + length heuristic."""
-    sentences = _split_sentences(text)
+    Returns (start, end, text) triples; start/end are char offsets into *text*.
+    """
+    spans = doc.spans if doc is not None else sentence_spans(text)
+    sentences = [text[s:e] for s, e in spans]
     if len(sentences) <= 2:
-        return [text.strip()]
+        return [(0, len(text), text.strip())]
 
     # Build windows of ~_TARGET_WORDS_PER_SEGMENT words, split where cosine
     # similarity between adjacent windows drops.
@@ -134,34 +142,71 @@ def _fallback_split(text: str) -> list[str]:
 
     # Refine: try to find better split points using keyword similarity
     if len(segments) >= 2:
-        segments = _refine_splits_by_keywords(text, sentences, len(segments))
+        bags = doc.sentence_bags() if doc is not None else None
+        return _refine_splits_by_keywords(text, spans, len(segments), bags)
+
+    if segments:
+        return [(spans[0][0], spans[-1][1], segments[0])]
+    return [(0, len(text), text.strip())]
+
+
+def _split_scores(bags: list[Counter]) -> list[float]:
+    """Cosine similarity of bags[:i] vs bags[i:] for every split point i in 1..n-1.
 
-    return segments if segments else [text.strip()]
+    One sweep moves each sentence's bag from the right vector to the left one
+    and updates the dot product and squared norms incrementally (exact integer
+    arithmetic), so the scores equal ``_cosine`` on the rebuilt halves at
+    O(n * sentence vocab) instead of O(n^2 * vocab).
+    """
+    left: Counter = Counter()
+    right: Counter = Counter()
+    for b in bags:
+        right.update(b)
+    dot = 0
+    nl2 = 0
+    nr2 = sum(v * v for v in right.values())
+
+    scores: list[float] = []
+    for b in bags[:-1]:
+        for term, c in b.items():
+            l = left[term]
+            r = right[term]
+            dot += (l + c) * (r - c) - l * r
+            nl2 += (2 * l + c) * c
+            nr2 += (c - 2 * r) * c
+            left[term] = l + c
+            right[term] = r - c
+        if nl2 == 0 or nr2 == 0:
+            scores.append(0.0)
+        else:
+            scores.append(dot / (math.sqrt(nl2) * math.sqrt(nr2)))
+    return scores
 
 
-def _refine_splits_by_keywords(text: str, sentences: list[str], n_segments: int) -> list[str]:
-    """Given target number of segments, find best split points by keyword shift."""
-    if n_segments <= 1 or len(sentences) <= n_segments:
-        return [text.strip()]
+def _refine_splits_by_keywords(
+    text: str,
+    spans: list[tuple[int, int]],
+    n_segments: int,
+    bags: Optional[list[Counter]] = None,
+) -> list[tuple[int, int, str]]:
+    """Given target number of segments, find best split points by keyword shift.
 
+    *spans* are the sentence offsets; *bags* their word bags, if precomputed.
+    """
+    if n_segments <= 1 or len(spans) <= n_segments:
+        return [(0, len(text), text.strip())]
+
+    sentences = [text[s:e] for s, e in spans]
     # Compute cumulative word bags per sentence
-    bags = [_word_bag(s) for s in sentences]
+    if bags is None:
+        bags = [_word_bag(s) for s in sentences]
 
     # We need (n_segments - 1) split points. Use greedy: find the point with
     # lowest cosine similarity between left and right halves.
     n_splits = n_segments - 1
     split_indices: list[int] = []
 
-    # Score each possible split point
-    scores: list[float] = []
-    for i in range(1, len(sentences)):
-        left = Counter()
-        for b in bags[:i]:
-            left.update(b)
-        right = Counter()
-        for b in bags[i:]:
-            right.update(b)
-        scores.append(_cosine(left, right))
+    scores = _split_scores(bags)
 
     # Pick n_splits points with lowest similarity (biggest topic change)
     # but enforce minimum distance between splits
@@ -177,21 +222,18 @@ def _refine_splits_by_keywords(text: str, sentences: list[str], n_segments: int)
                 break
 
     if not split_indices:
-        return [text.strip()]
+        return [(0, len(text), text.strip())]
 
     split_indices.sort()
 
     # Build segments
-    result: list[str] = []
+    result: list[tuple[int, int, str]] = []
     prev = 0
-    for si in split_indices:
+    for si in split_indices + [len(sentences)]:
         seg = " ".join(sentences[prev:si]).strip()
         if seg:
-            result.append(seg)
+            result.append((spans[prev][0], spans[si - 1][1], seg))
         prev = si
-    tail = " ".join(sentences[prev:]).strip()
-    if tail:
-        result.append(tail)
 
     return result
 
@@ -200,67 +242,296 @@ def _refine_splits_by_keywords(text: str, sentences: list[str], n_segments: int)
 # Public API
 # ---------------------------------------------------------------------------
 
-def segment_topics(text: str) -> list[dict]:
-    """Split transcript text into topic segments.
+SEGMENT_METHODS = ("auto", "chapters", "markers", "texttiling", "hierarchical")
+
+# Bump when segmentation output changes so persisted segments are recomputed
+SEGMENTER_VERSION = 2
+
+
+def segment_by_chapters(chapters: list[dict], timed_segments: list[dict]) -> list[dict]:
+    """Slice a timed transcript into the video's chapters.
 
-    Strategy:
-    1. Try marker-based splitting (explicit topic transitions).
-    2. If no markers found and text is long, fall back to length + keyword-shift.
-    3. Merge segments smaller than MIN_SEGMENT_CHARS into the previous one.
-    4. Attach top-3 keyword labels to each segment.
+    Each timed segment goes to the chapter containing its start time (found
+    by binary search over chapter starts); the segment is labelled with the
+    chapter title. Chapters without transcript text are skipped.
 
-    Returns list of dicts: segment, text, char_count, topic.
+    Returns list of dicts: segment, text, char_count, topic, chapter, start, end.
     """
+    if not chapters or not timed_segments:
+        return []
+    chapters = sorted(chapters, key=lambda c: c["start"])
+    starts = [c["start"] for c in chapters]
+    parts: list[list[str]] = [[] for _ in chapters]
+    for seg in timed_segments:
+        idx = max(0, bisect_right(starts, float(seg.get("start", 0.0))) - 1)
+        parts[idx].append(seg.get("text", ""))
+
+    result: list[dict] = []
+    for ch, texts in zip(chapters, parts):
+        chunk = clean_transcript(" ".join(texts))
+        if not chunk:
+            continue
+        result.append({
+            "segment": len(result),
+            "text": chunk,
+            "char_count": len(chunk),
+            "topic": ch["title"],
+            "chapter": ch["title"],
+            "start": ch["start"],
+            "end": ch.get("end"),
+        })
+    return result
+
+
+def segment_topics(
+    text: str,
+    method: str = "auto",
+    chapters: Optional[list[dict]] = None,
+    timed_segments: Optional[list[dict]] = None,
+    doc: Optional[Document] = None,
+    level: Optional[int] = None,
+    max_segments: Optional[int] = None,
+) -> list[dict]:
+    """Split transcript text into topic segments.
+
+    Methods:
+    - "auto" (default): creator-defined *chapters* when given together with
+      *timed_segments*, otherwise "markers".
+    - "chapters": same as auto, but only meaningful with chapters.
+    - "markers":
+      1. Try marker-based splitting (explicit topic transitions).
+      2. If no markers found and text is long, fall back to length + keyword-shift.
+      3. Merge segments smaller than MIN_SEGMENT_CHARS into the previous one.
+      4. Attach top-3 keyword labels to each segment.
+    - "texttiling": boundaries where lexical cohesion between sliding windows
+      dips (see core/texttiling.py); adds each boundary's confidence to the
+      segment it opens.
+    - "hierarchical": one level of the bottom-up topic tree (see
+      core/hierarchy.py): *max_segments* segments, or level *level*
+      (1 = coarsest, default); adds each boundary's confidence.
+
+    *doc* is the transcript's shared :class:`~.document.Document`; when given
+    (and built from *text*), its sentences and tokens are used instead of
+    re-tokenizing.
+
+    Returns list of dicts: segment, text, char_count, topic, char_start,
+    char_end (offsets into *text*) (+ confidence for texttiling and
+    hierarchical; chapter for chapters). With *timed_segments*, every
+    segment also gets start and end times in seconds.
+    """
+    if method not in SEGMENT_METHODS:
+        raise ValueError(f"Unknown segmentation method: {method!r} (expected one of {SEGMENT_METHODS})")
+    if method == "hierarchical":
+        from .hierarchy import segment_level
+
+        if doc is not None and doc.text != text:
+            doc = None
+        segments = segment_level(text, level, max_segments, doc) if text.strip() else []
+    else:
+        segments = _segment(text, method, chapters, timed_segments, doc)
+    if segments and text and timed_segments:
+        _locate_segments(segments, text, timed_segments)
+    return segments
+
+
+def _segment(
+    text: str,
+    method: str,
+    chapters: Optional[list[dict]],
+    timed_segments: Optional[list[dict]],
+    doc: Optional[Document],
+) -> list[dict]:
+    if method in ("auto", "chapters") and chapters and timed_segments:
+        by_chapter = segment_by_chapters(chapters, timed_segments)
+        if by_chapter:
+            return by_chapter
     if not text or not text.strip():
         return []
+    if doc is not None and doc.text != text:
+        doc = None
+
+    def keywords(start: int, end: int, seg_text: str) -> str:
+        if doc is not None:
+            return ", ".join(doc.keywords(start, end))
+        return ", ".join(_extract_keywords(seg_text))
+
+    if method == "texttiling":
+        return _segment_texttiling(text, doc, keywords)
 
     matches = list(_COMBINED_RE.finditer(text))
 
+    # (start, end, text) of each raw segment
+    raw_segments: list[tuple[int, int, str]] = []
     if not matches:
         # Fallback: length + keyword-based splitting for long texts
         word_count = len(text.split())
         if word_count > _TARGET_WORDS_PER_SEGMENT:
-            raw_segments = _fallback_split(text)
-        else:
-            t = text.strip()
-            keywords = _extract_keywords(t)
-            topic = ", ".join(keywords) if keywords else ""
-            return [{"segment": 0, "text": t, "char_count": len(t), "topic": topic}]
+            raw_segments = _fallback_split(text, doc)
     else:
         # Marker-based splitting
-        raw_segments: list[str] = []
-
         before = text[:matches[0].start()].strip()
         if before:
-            raw_segments.append(before)
+            raw_segments.append((0, matches[0].start(), before))
 
         for i, m in enumerate(matches):
             start = m.start()
             end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
             chunk = text[start:end].strip()
             if chunk:
-                raw_segments.append(chunk)
+                raw_segments.append((start, end, chunk))
 
-        if not raw_segments:
-            t = text.strip()
-            keywords = _extract_keywords(t)
-            topic = ", ".join(keywords) if keywords else ""
-            return [{"segment": 0, "text": t, "char_count": len(t), "topic": topic}]
+    if not raw_segments:
+        t = text.strip()
+        return [{
+            "segment": 0, "text": t, "char_count": len(t), "topic": keywords(0, len(text), t),
+            "char_start": 0, "char_end": len(text),
+        }]
 
     # Merge small segments
-    merged: list[str] = [raw_segments[0]]
-    for seg in raw_segments[1:]:
+    merged: list[tuple[int, int, str]] = [raw_segments[0]]
+    for start, end, seg in raw_segments[1:]:
         if len(seg) < MIN_SEGMENT_CHARS and merged:
-            merged[-1] = merged[-1] + " " + seg
+            merged[-1] = (merged[-1][0], end, merged[-1][2] + " " + seg)
         else:
-            merged.append(seg)
+            merged.append((start, end, seg))
 
     return [
         {
             "segment": i,
             "text": s,
             "char_count": len(s),
-            "topic": ", ".join(_extract_keywords(s)),
+            "topic": keywords(start, end, s),
+            "char_start": start,
+            "char_end": end,
+        }
+        for i, (start, end, s) in enumerate(merged)
+    ]
+
+
+def _segment_texttiling(text: str, doc: Optional[Document], keywords) -> list[dict]:
+    from .texttiling import segment_text
+
+    return [
+        {
+            "segment": i,
+            "text": seg["text"],
+            "char_count": len(seg["text"]),
+            "topic": keywords(seg["start"], seg["end"], seg["text"]),
+            "confidence": seg["confidence"],
+            "char_start": seg["start"],
+            "char_end": seg["end"],
         }
-        for i, s in enumerate(merged)
+        for i, seg in enumerate(segment_text(text, doc=doc))
     ]
+
+
+def _locate_segments(segments: list[dict], text: str, timed_segments: list[dict]) -> None:
+    """Fill in missing times (from char offsets) or char offsets (from chapter times).
+
+    Caption segments are located in *text* once; a segment starts at the
+    time of the last caption starting at or before its first char and ends
+    when the first caption at or after its end begins.
+    """
+    located = [
+        (off, float(seg.get("start") or 0.0))
+        for off, seg in zip(segment_offsets(text, timed_segments), timed_segments)
+        if off is not None
+    ]
+    if not located:
+        return
+    offsets = [o for o, _ in located]
+    times = [t for _, t in located]
+    last = timed_segments[-1]
+    last_end = float(last.get("start") or 0.0) + float(last.get("duration") or 0.0)
+
+    for seg in segments:
+        if seg.get("start") is None:
+            i = max(0, bisect_right(offsets, seg["char_start"]) - 1)
+            j = bisect_left(offsets, seg["char_end"])
+            seg["start"] = times[i]
+            seg["end"] = times[j] if j < len(times) else last_end
+        if seg.get("char_start") is None:
+            i = bisect_left(times, seg["start"])
+            seg["char_start"] = offsets[i] if i < len(offsets) else len(text)
+    # Chapters run up to the next one
+    for seg, nxt in zip(segments, segments[1:] + [None]):
+        if seg.get("char_end") is None:
+            seg["char_end"] = nxt["char_start"] if nxt else len(text)
+
+
+# ---------------------------------------------------------------------------
+# Persisted segments
+# ---------------------------------------------------------------------------
+
+# Optional segment keys and the topic_segments columns holding them
+_OPTIONAL_COLUMNS = (
+    ("chapter", "chapter"), ("confidence", "confidence"), ("start", "start_time"), ("end", "end_time"),
+)
+
+
+def source_hash(text: str, chapters: Optional[list[dict]] = None, timed: bool = False) -> str:
+    """Hash of the inputs a stored segmentation was computed from.
+
+    Covers the transcript, the chapters and whether caption timings were
+    given (segments computed without them carry no start/end times).
+    """
+    h = hashlib.blake2b(text.encode("utf-8"), digest_size=16)
+    if chapters:
+        h.update(json.dumps(chapters, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    if timed:
+        h.update(b"\0timed")
+    return h.hexdigest()
+
+
+async def cached_segment_topics(
+    video_id: str,
+    text: str,
+    storage,
+    method: str = "auto",
+    chapters: Optional[list[dict]] = None,
+    timed_segments: Optional[list[dict]] = None,
+    doc: Optional[Document] = None,
+    level: Optional[int] = None,
+    max_segments: Optional[int] = None,
+) -> tuple[list[dict], bool]:
+    """:func:`segment_topics` backed by the storage's topic_segments table.
+
+    Stored segments are reused when they were computed from the same
+    transcript, chapters and timings by the current SEGMENTER_VERSION;
+    otherwise the transcript is segmented and the result stored.
+
+    Hierarchical segmentations are stored per granularity, under
+    ``hierarchical:max=<n>`` or ``hierarchical:level=<n>``.
+
+    Returns (segments, cached).
+    """
+    digest = source_hash(text, chapters, timed=bool(timed_segments))
+    key = method
+    if method == "hierarchical":
+        key = f"hierarchical:max={max_segments}" if max_segments else f"hierarchical:level={level or 1}"
+    rows = await storage.get_topic_segments(video_id, key)
+    if rows and rows[0]["transcript_hash"] == digest and rows[0]["version"] == SEGMENTER_VERSION:
+        segments = []
+        for row in rows:
+            seg = {
+                "segment": row["segment"],
+                "text": row["text"] or "",
+                "char_count": len(row["text"] or ""),
+                "topic": row["topic"] or "",
+                "char_start": row["char_start"],
+                "char_end": row["char_end"],
+            }
+            for name, col in _OPTIONAL_COLUMNS:
+                if row[col] is not None:
+                    seg[name] = row[col]
+            if method in ("texttiling", "hierarchical"):
+                seg.setdefault("confidence", None)
+            segments.append(seg)
+        return segments, True
+
+    segments = segment_topics(
+        text, method=method, chapters=chapters, timed_segments=timed_segments, doc=doc,
+        level=level, max_segments=max_segments,
+    )
+    await storage.save_topic_segments(video_id, key, digest, SEGMENTER_VERSION, segments)
+    return segments, False
@@ -0,0 +1,183 @@
+"""Sentence reconstruction for unpunctuated transcripts.
+
+Manual captions carry their own punctuation, but auto-generated tracks
+(``ko_auto`` in particular) often have none, so a punctuation splitter sees
+the whole transcript as one sentence. Overlong spans are re-split here using
+two other signals:
+
+- pauses between caption segments (from ``timed_segments``), and
+- Korean sentence-final endings (합니다, 했어요, 있죠, ...).
+
+Spans that still exceed MAX_SENTENCE_CHARS are cut at the last space before
+the limit. The result is a list of (start, end) char offsets into the text,
+which callers compute once and pass to the summarizer and segmenter.
+"""
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from statistics import median
+from typing import Optional, Sequence
+
+from .transcript import clean_transcript
+
+# Punctuated sentences longer than this are re-split with pauses and endings
+LONG_SENTENCE_CHARS = 160
+# Hard cap on a reconstructed sentence
+MAX_SENTENCE_CHARS = 300
+# Silence (seconds) between caption segments that ends a sentence
+PAUSE_SECONDS = 0.8
+
+_PUNCT_GAP_RE = re.compile(r"(?<=[.!?。])\s+")
+_TERMINATED_RE = re.compile(r"[.!?。]\s*$")
+# Korean sentence-final endings at the end of a word. Bare 다/요 are left out
+# (바다, 필요, 중요) in favour of the endings that precede them.
+_KO_FINAL_RE = re.compile(
+    r"(?:니다|니까|[았었였했됐겠]다|[는한된]다|[있없같]다|이다"
+    r"|[아어여해에예세네군까지데래대게걸나]요|죠)(?=\s)"
+)
+# Leading chars of a caption segment used to locate it in the cleaned text
+_PROBE_CHARS = 24
+# How far past the previous segment a segment's text is searched for
+_SEARCH_SLACK = 200
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+def pause_gaps(timed_segments: Sequence[dict]) -> list[float]:
+    """Estimated silence in seconds before each segment after the first.
+
+    The gap is the time between one segment's end and the next one's start.
+    Auto-caption tracks often report overlapping durations (rolling two-line
+    display), so the gap is also estimated from the onset interval minus the
+    time the segment's text takes at the track's median speaking rate; the
+    larger of the two is used.
+    """
+    n = len(timed_segments)
+    if n < 2:
+        return []
+    starts = [float(s.get("start") or 0.0) for s in timed_segments]
+    lengths = [len(s.get("text") or "") for s in timed_segments]
+    rates = [
+        lengths[i] / (starts[i + 1] - starts[i])
+        for i in range(n - 1)
+        if starts[i + 1] > starts[i] and lengths[i]
+    ]
+    rate = median(rates) if rates else 0.0
+
+    gaps: list[float] = []
+    for i in range(n - 1):
+        interval = starts[i + 1] - starts[i]
+        duration = timed_segments[i].get("duration")
+        gap = interval - float(duration) if duration is not None else 0.0
+        if rate:
+            gap = max(gap, interval - lengths[i] / rate)
+        gaps.append(gap)
+    return gaps
+
+
+def segment_offsets(text: str, timed_segments: Sequence[dict]) -> list[Optional[int]]:
+    """Char offset in *text* where each caption segment starts, or None.
+
+    *text* is the cleaned transcript built from the segments, so segments
+    are located in order with a bounded forward search; segments removed by
+    cleaning (noise tags, duplicates) map to None.
+    """
+    offsets: list[Optional[int]] = []
+    cursor = 0
+    # Length of segments not found since the last hit, to widen the window
+    missed = 0
+    for seg in timed_segments:
+        cleaned = clean_transcript(seg.get("text") or "")
+        probe = cleaned[:_PROBE_CHARS]
+        pos = text.find(probe, cursor, cursor + missed + len(probe) + _SEARCH_SLACK) if probe else -1
+        if pos == -1:
+            offsets.append(None)
+            missed += len(cleaned) + 1
+            continue
+        offsets.append(pos)
+        cursor = pos + len(probe)
+        missed = 0
+    return offsets
+
+
+def pause_breaks(text: str, timed_segments: Sequence[dict], min_pause: float = PAUSE_SECONDS) -> list[int]:
+    """Sorted offsets in *text* of segment starts preceded by a pause of at least *min_pause*."""
+    gaps = pause_gaps(timed_segments)
+    offsets = segment_offsets(text, timed_segments)
+    return [
+        offsets[i + 1]
+        for i, gap in enumerate(gaps)
+        if gap >= min_pause and offsets[i + 1] is not None
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Sentence spans
+# ---------------------------------------------------------------------------
+
+def _strip_span(text: str, start: int, end: int) -> Optional[tuple[int, int]]:
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return (start, end) if end > start else None
+
+
+def _resplit(text: str, start: int, end: int, breaks: list[int]) -> list[tuple[int, int]]:
+    """Cut text[start:end] at pauses and Korean endings, then cap the length."""
+    cuts = {b for b in breaks[bisect_left(breaks, start + 1):bisect_left(breaks, end)]}
+    for m in _KO_FINAL_RE.finditer(text, start, end):
+        cuts.add(m.end())
+
+    spans: list[tuple[int, int]] = []
+    for cut in sorted(cuts) + [end]:
+        # Enforce the hard cap inside each piece
+        while cut - start > MAX_SENTENCE_CHARS:
+            limit = start + MAX_SENTENCE_CHARS
+            space = text.rfind(" ", start + 1, limit)
+            spans.append((start, space if space > start else limit))
+            start = spans[-1][1]
+        spans.append((start, cut))
+        start = cut
+    return spans
+
+
+def sentence_spans(text: str, timed_segments: Optional[Sequence[dict]] = None) -> list[tuple[int, int]]:
+    """Sentence (start, end) char offsets in *text*, whitespace-trimmed, in order.
+
+    Text is split at sentence-ending punctuation first. Spans longer than
+    LONG_SENTENCE_CHARS or without closing punctuation (typically the whole
+    of an unpunctuated auto-caption track) are re-split at caption pauses
+    when *timed_segments* are given, and at Korean sentence-final endings.
+    """
+    if not text:
+        return []
+    punct: list[tuple[int, int]] = []
+    start = 0
+    for m in _PUNCT_GAP_RE.finditer(text):
+        punct.append((start, m.start()))
+        start = m.end()
+    punct.append((start, len(text)))
+
+    breaks: Optional[list[int]] = None
+    spans: list[tuple[int, int]] = []
+    for s, e in punct:
+        if e - s > LONG_SENTENCE_CHARS or not _TERMINATED_RE.search(text, s, e):
+            if breaks is None:
+                breaks = pause_breaks(text, timed_segments) if timed_segments else []
+            pieces = _resplit(text, s, e, breaks)
+        else:
+            pieces = [(s, e)]
+        for ps, pe in pieces:
+            span = _strip_span(text, ps, pe)
+            if span:
+                spans.append(span)
+    return spans
+
+
+def split_sentences(text: str, timed_segments: Optional[Sequence[dict]] = None) -> list[str]:
+    """Sentences of *text* (see :func:`sentence_spans`)."""
+    return [text[s:e] for s, e in sentence_spans(text, timed_segments)]
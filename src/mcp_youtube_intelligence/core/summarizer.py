@@ -5,9 +5,13 @@ import logging
 import math
 import re
 from collections import Counter
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from ..config import Config
+from .sentences import split_sentences
+
+if TYPE_CHECKING:
+    from .document import Document
 
 logger = logging.getLogger(__name__)
 
@@ -58,8 +62,7 @@ def _clean_music_symbols(text: str) -> str:
 
 
 def _split_sentences(text: str) -> list[str]:
-    parts = _SENTENCE_SPLIT_RE.split(text)
-    return [p.strip() for p in parts if p and p.strip()]
+    return split_sentences(text)
 
 
 def _tokenize(text: str) -> list[str]:
@@ -67,25 +70,30 @@ def _tokenize(text: str) -> list[str]:
     return [w.lower() for w in re.findall(r"[a-zA-Z가-힣\d]+", text) if len(w) > 1]
 
 
-def _compute_tfidf_scores(sentences: list[str]) -> list[float]:
-    """Compute TF-IDF-like score for each sentence."""
+def _sentence_terms(sentences: list[str]) -> list[list[str]]:
+    """Scored terms of each sentence: tokens minus stopwords."""
+    return [[t for t in _tokenize(s) if t not in _STOPWORDS] for s in sentences]
+
+
+def _compute_tfidf_scores(sentences: list[str], terms: Optional[list[list]] = None) -> list[float]:
+    """Compute TF-IDF-like score for each sentence.
+
+    *terms* are the sentences' precomputed terms (words or interned ids).
+    """
     n = len(sentences)
     if n == 0:
         return []
+    if terms is None:
+        terms = _sentence_terms(sentences)
 
     # Document frequency: how many sentences contain each word
     doc_freq: Counter = Counter()
-    sent_tokens = []
-    for s in sentences:
-        tokens = _tokenize(s)
-        unique = set(tokens) - _STOPWORDS
-        sent_tokens.append(tokens)
-        for w in unique:
+    for filtered in terms:
+        for w in set(filtered):
             doc_freq[w] += 1
 
     scores = []
-    for tokens in sent_tokens:
-        filtered = [t for t in tokens if t not in _STOPWORDS]
+    for filtered in terms:
         if not filtered:
             scores.append(0.0)
             continue
@@ -99,10 +107,8 @@ def _compute_tfidf_scores(sentences: list[str]) -> list[float]:
     return scores
 
 
-def _similarity(a: str, b: str) -> float:
-    """Simple Jaccard similarity between two sentences."""
-    ta = set(_tokenize(a)) - _STOPWORDS
-    tb = set(_tokenize(b)) - _STOPWORDS
+def _similarity(ta: set, tb: set) -> float:
+    """Simple Jaccard similarity between two sentences' term sets."""
     if not ta or not tb:
         return 0.0
     return len(ta & tb) / len(ta | tb)
@@ -121,26 +127,50 @@ def _adaptive_max_chars(text_len: int) -> int:
     return max(200, int(text_len * ratio))
 
 
-def extractive_summary(text: str, max_sentences: int = 7, max_chars: int = 0) -> str:
+def extractive_summary(
+    text: str,
+    max_sentences: int = 7,
+    max_chars: int = 0,
+    doc: Optional[Document] = None,
+) -> str:
+    """Extractive summary of *text*.
+
+    *doc* is the transcript's shared :class:`~.document.Document`; its
+    sentences and terms are used unless symbol cleanup changed the text.
+    """
     if not text:
         return ""
     # Clean music symbols first
-    text = _clean_music_symbols(text)
-    if not text:
+    cleaned = _clean_music_symbols(text)
+    if not cleaned:
         return ""
+    if doc is not None and cleaned != doc.text:
+        doc = None
+    text = cleaned
     if max_chars <= 0:
         max_chars = _adaptive_max_chars(len(text))
-    sentences = _split_sentences(text)
-    sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+    if doc is not None:
+        keep = [i for i, s in enumerate(doc.sentences) if len(s) > 20]
+        sentences = [doc.sentences[i] for i in keep]
+        terms = [doc.sentence_terms(i) for i in keep]
+    else:
+        sentences = _split_sentences(text)
+        sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+        terms = None
     if not sentences:
         return text[:max_chars]
-    return _ranked_summary(sentences, max_sentences, max_chars)
+    return _ranked_summary(sentences, max_sentences, max_chars, terms)
 
 
-def _ranked_summary(sentences: list[str], max_sentences: int, max_chars: int) -> str:
+def _ranked_summary(
+    sentences: list[str], max_sentences: int, max_chars: int, terms: Optional[list[list]] = None,
+) -> str:
     """Score sentences by TF-IDF + position + keyword bonuses, deduplicate, and select top ones."""
     n = len(sentences)
-    tfidf_scores = _compute_tfidf_scores(sentences)
+    if terms is None:
+        terms = _sentence_terms(sentences)
+    term_sets = [set(t) for t in terms]
+    tfidf_scores = _compute_tfidf_scores(sentences, terms)
 
     scored: list[tuple[float, int, str]] = []
     for i, s in enumerate(sentences):
@@ -179,8 +209,8 @@ def _ranked_summary(sentences: list[str], max_sentences: int, max_chars: int) ->
             break
         # Check similarity with already selected
         is_dup = False
-        for _, _, existing in selected:
-            if _similarity(sent, existing) > 0.5:
+        for _, other, _ in selected:
+            if _similarity(term_sets[idx], term_sets[other]) > 0.5:
                 is_dup = True
                 break
         if not is_dup:
@@ -406,10 +436,12 @@ async def summarize(
     *,
     config: Optional[Config] = None,
     provider: Optional[str] = None,
+    doc: Optional[Document] = None,
 ) -> str:
     """Summarize text. Uses LLM if available, otherwise extractive.
 
     Supports both legacy (api_key, model) and new (config) calling conventions.
+    *doc* is the transcript's shared Document, used by the extractive fallback.
     """
     if config:
         result = await llm_summary(text, config, provider_override=provider)
@@ -418,7 +450,119 @@ async def summarize(
     elif api_key:
         # Legacy path
         try:
-            return await _openai_summary(text, api_key, model) or extractive_summary(text)
+            return await _openai_summary(text, api_key, model) or extractive_summary(text, doc=doc)
         except Exception as e:
             logger.warning("LLM summary failed: %s", e)
-    return extractive_summary(text)
+    return extractive_summary(text, doc=doc)
+
+
+# ── Incremental summarization (live streams / growing transcripts) ──
+
+# Tails shorter than this are held back until the next poll
+_MIN_INCREMENT_CHARS = 400
+# Auto-captions may have no punctuation at all; past this size the tail is
+# summarized even without a sentence boundary.
+_MAX_UNTERMINATED_CHARS = 4000
+# Oldest partial summaries are rolled up once the list grows past this
+_MAX_PARTIALS = 8
+# Chars before the processed offset used to re-anchor a re-cleaned transcript
+_ANCHOR_CHARS = 64
+
+
+def new_incremental_state() -> dict:
+    """Return an empty rolling state for :func:`summarize_incremental`."""
+    return {"offset": 0, "anchor": "", "partials": [], "summary": "", "increments": 0}
+
+
+def _last_sentence_end(text: str) -> int:
+    """Return the index just past the last complete sentence in *text* (0 if none)."""
+    end = 0
+    for m in _SENTENCE_SPLIT_RE.finditer(text):
+        end = m.end()
+    return end
+
+
+def _resolve_offset(text: str, state: dict) -> int:
+    """Validate the stored offset against *text*, re-anchoring if the prefix moved."""
+    offset = state.get("offset", 0)
+    anchor = state.get("anchor", "")
+    if not offset or not anchor:
+        return 0 if offset > len(text) else offset
+    if text[max(0, offset - len(anchor)):offset] == anchor:
+        return offset
+    idx = text.find(anchor)
+    if idx == -1:
+        return 0
+    return idx + len(anchor)
+
+
+async def _summarize_increment(text: str, config: Optional[Config], provider: Optional[str]) -> str:
+    if provider == "extractive" or config is None:
+        return extractive_summary(text)
+    return await summarize(text, config=config, provider=provider)
+
+
+async def summarize_incremental(
+    text: str,
+    state: Optional[dict] = None,
+    *,
+    config: Optional[Config] = None,
+    provider: Optional[str] = None,
+    final: bool = False,
+) -> dict:
+    """Summarize only the unseen tail of a growing transcript.
+
+    *state* is the dict returned by the previous call (or None to start).
+    Only ``text[state["offset"]:]`` is summarized, cut at the last complete
+    sentence so a half-spoken sentence waits for the next poll. The new partial
+    summary is appended and the running summary is rebuilt from the (bounded)
+    list of partials, so each poll costs O(new text) rather than O(transcript).
+
+    *provider* selects the per-increment backend: an LLM provider name,
+    "auto"/None (LLM if configured, else extractive) or "extractive".
+    Pass *final* once the stream has ended to flush the trailing fragment.
+
+    Returns the new state dict: offset, anchor, partials, summary, increments,
+    plus ``new_chars`` processed by this call.
+    """
+    state = {**new_incremental_state(), **(state or {})}
+    state["partials"] = list(state["partials"])
+    offset = _resolve_offset(text, state)
+    if offset != state["offset"]:
+        logger.info("Transcript prefix changed, re-anchored offset %d -> %d", state["offset"], offset)
+        if offset == 0:
+            state = new_incremental_state()
+
+    tail = text[offset:]
+    cut = len(tail) if final else _last_sentence_end(tail)
+    if not cut and len(tail) >= _MAX_UNTERMINATED_CHARS:
+        cut = len(tail)
+    if cut < _MIN_INCREMENT_CHARS and not (final and tail.strip()):
+        state["offset"] = offset
+        state["new_chars"] = 0
+        return state
+
+    chunk = tail[:cut].strip()
+    partials: list[str] = state["partials"]
+    partials.append(await _summarize_increment(chunk, config, provider))
+
+    # Roll the two oldest partials into one so the merge input stays bounded
+    while len(partials) > _MAX_PARTIALS:
+        merged = await _summarize_increment(" ".join(partials[:2]), config, provider)
+        partials[:2] = [merged]
+
+    if len(partials) == 1:
+        summary = partials[0]
+    else:
+        summary = await _summarize_increment(" ".join(partials), config, provider)
+
+    new_offset = offset + cut
+    state.update({
+        "offset": new_offset,
+        "anchor": text[max(0, new_offset - _ANCHOR_CHARS):new_offset],
+        "partials": partials,
+        "summary": summary,
+        "increments": state["increments"] + 1,
+        "new_chars": cut,
+    })
+    return state
@@ -0,0 +1,328 @@
+"""TextTiling-style topic boundary detection.
+
+Tokens are interned to integer ids and grouped into pseudo-sentences of *w*
+tokens. For every gap between pseudo-sentences the cosine similarity of the
+*k* units on each side is computed, and gaps whose similarity dips well below
+the surrounding peaks (high *depth score*) become topic boundaries.
+
+Gap scores are computed in a single sliding sweep with exact integer dot
+products and norms, in pure Python or vectorized with NumPy when it is
+installed; both paths return identical scores.
+"""
+from __future__ import annotations
+
+import math
+import re
+from bisect import bisect_left
+from collections import Counter
+from statistics import mean, pstdev
+from typing import TYPE_CHECKING, Optional, Sequence
+
+try:
+    import numpy as _np
+except ImportError:  # optional: pip install mcp-youtube-intelligence[numpy]
+    _np = None
+
+from .segmenter import _EN_STOP, _KO_STOP
+
+if TYPE_CHECKING:
+    from .document import Document
+
+# Tokens per pseudo-sentence and pseudo-sentences per comparison block
+DEFAULT_W = 20
+DEFAULT_K = 6
+# Valleys shallower than this are never boundaries, whatever the document's spread
+MIN_DEPTH = 0.1
+
+_TOKEN_RE = re.compile(r"[가-힣]{2,}|[a-zA-Z]{3,}")
+_SENTENCE_GAP_RE = re.compile(r"(?<=[.!?。])\s+")
+
+
+# ---------------------------------------------------------------------------
+# Tokens
+# ---------------------------------------------------------------------------
+
+def tokenize(text: str, vocab: Optional[dict[str, int]] = None) -> tuple[list[int], list[int]]:
+    """Content tokens of *text* as (token ids, char offsets).
+
+    Same tokens as the segmenter's word bags; ids are assigned in *vocab*
+    (a fresh one if not given) in order of first appearance.
+    """
+    if vocab is None:
+        vocab = {}
+    ids: list[int] = []
+    offsets: list[int] = []
+    for m in _TOKEN_RE.finditer(text):
+        tok = m.group().lower()
+        if tok in _EN_STOP or tok in _KO_STOP:
+            continue
+        tid = vocab.get(tok)
+        if tid is None:
+            tid = vocab[tok] = len(vocab)
+        ids.append(tid)
+        offsets.append(m.start())
+    return ids, offsets
+
+
+# ---------------------------------------------------------------------------
+# Gap scores
+# ---------------------------------------------------------------------------
+
+def gap_scores(
+    token_ids: Sequence[int], w: int = DEFAULT_W, k: int = DEFAULT_K, use_numpy: Optional[bool] = None,
+) -> list[float]:
+    """Block similarity at each gap between pseudo-sentences.
+
+    Entry ``g - 1`` compares units ``[g-k, g)`` with ``[g, g+k)`` (truncated
+    at the ends). NumPy is used when available unless *use_numpy* is False.
+    """
+    if w < 1 or k < 1:
+        raise ValueError("w and k must be positive")
+    if len(token_ids) <= w:
+        return []
+    if use_numpy is None:
+        use_numpy = _np is not None
+    if use_numpy:
+        if _np is None:
+            raise ImportError("numpy is not installed")
+        return _gap_scores_numpy(token_ids, w, k)
+    return _gap_scores_python(token_ids, w, k)
+
+
+def _gap_scores_python(token_ids: Sequence[int], w: int, k: int) -> list[float]:
+    units = [Counter(token_ids[i:i + w]) for i in range(0, len(token_ids), w)]
+    n_units = len(units)
+    left: Counter = Counter()
+    right: Counter = Counter()
+    dot = nl2 = nr2 = 0
+
+    # Each helper adds (sign=1) or removes (sign=-1) a unit on one side and
+    # updates the dot product and that side's squared norm exactly.
+    def add_left(unit: Counter, sign: int) -> None:
+        nonlocal dot, nl2
+        for t, c in unit.items():
+            c *= sign
+            x = left[t]
+            dot += c * right[t]
+            nl2 += (2 * x + c) * c
+            left[t] = x + c
+
+    def add_right(unit: Counter, sign: int) -> None:
+        nonlocal dot, nr2
+        for t, c in unit.items():
+            c *= sign
+            x = right[t]
+            dot += c * left[t]
+            nr2 += (2 * x + c) * c
+            right[t] = x + c
+
+    add_left(units[0], 1)
+    for u in units[1:1 + k]:
+        add_right(u, 1)
+
+    scores: list[float] = []
+    for g in range(1, n_units):
+        if nl2 == 0 or nr2 == 0:
+            scores.append(0.0)
+        else:
+            scores.append(dot / (math.sqrt(nl2) * math.sqrt(nr2)))
+        if g + 1 == n_units:
+            break
+        # Slide by one unit: g crosses the gap, g-k drops out, g+k comes in
+        add_right(units[g], -1)
+        add_left(units[g], 1)
+        if g - k >= 0:
+            add_left(units[g - k], -1)
+        if g + k < n_units:
+            add_right(units[g + k], 1)
+    return scores
+
+
+def _gap_scores_numpy(token_ids: Sequence[int], w: int, k: int) -> list[float]:
+    np = _np
+    ids = np.asarray(token_ids, dtype=np.int64)
+    n_units = -(-len(ids) // w)
+    # Sparse (token, unit) counts, sorted by token then unit
+    keys, counts = np.unique(ids * n_units + np.arange(len(ids)) // w, return_counts=True)
+    unit = keys % n_units
+    counts = counts.astype(np.int64)
+
+    # band[d][a] = dot product of units a and a+d, for d < 2k
+    band = np.zeros((2 * k, n_units), dtype=np.int64)
+    np.add.at(band[0], unit, counts * counts)
+    for d in range(1, min(2 * k, n_units)):
+        j = np.searchsorted(keys, keys + d)
+        valid = (unit + d < n_units) & (j < len(keys))
+        j = np.where(valid, j, 0)
+        hit = valid & (keys[j] == keys + d)
+        np.add.at(band[d], unit[hit], counts[hit] * counts[j[hit]])
+    prefix = np.zeros((2 * k, n_units + 1), dtype=np.int64)
+    np.cumsum(band, axis=1, out=prefix[:, 1:])
+
+    g = np.arange(1, n_units, dtype=np.int64)
+
+    def band_sum(d: int, lo, hi):
+        """Sum of band[d][a] for a in [lo, hi] (inclusive, clipped)."""
+        lo = np.clip(lo, 0, n_units)
+        hi = np.clip(hi + 1, 0, n_units)
+        return np.where(hi > lo, prefix[d][hi] - prefix[d][lo], 0)
+
+    dot = np.zeros(len(g), dtype=np.int64)
+    for d in range(1, 2 * k):
+        dot += band_sum(d, g - min(k, d), np.minimum(g - 1, g + k - 1 - d))
+    nl2 = band_sum(0, g - k, g - 1)
+    nr2 = band_sum(0, g, g + k - 1)
+    for d in range(1, k):
+        nl2 += 2 * band_sum(d, g - k, g - 1 - d)
+        nr2 += 2 * band_sum(d, g, g + k - 1 - d)
+
+    zero = (nl2 == 0) | (nr2 == 0)
+    denom = np.sqrt(nl2.astype(np.float64)) * np.sqrt(nr2.astype(np.float64))
+    scores = np.where(zero, 0.0, dot / np.where(zero, 1.0, denom))
+    return scores.tolist()
+
+
+# ---------------------------------------------------------------------------
+# Depth scores and boundaries
+# ---------------------------------------------------------------------------
+
+def depth_scores(scores: Sequence[float]) -> list[float]:
+    """TextTiling depth of each gap: climb to the nearest peak on either side.
+
+    Peaks are found with one pass in each direction instead of climbing
+    from every gap.
+    """
+    n = len(scores)
+    left_peak = list(scores)
+    for i in range(1, n):
+        if scores[i - 1] > scores[i]:
+            left_peak[i] = left_peak[i - 1]
+    right_peak = list(scores)
+    for i in range(n - 2, -1, -1):
+        if scores[i + 1] > scores[i]:
+            right_peak[i] = right_peak[i + 1]
+    return [left_peak[i] + right_peak[i] - 2 * scores[i] for i in range(n)]
+
+
+def smooth_scores(scores: Sequence[float], radius: int = 1) -> list[float]:
+    """Moving average over ``2 * radius + 1`` gaps (truncated at the ends), in O(n)."""
+    if radius <= 0 or not scores:
+        return list(scores)
+    prefix = [0.0]
+    for x in scores:
+        prefix.append(prefix[-1] + x)
+    n = len(scores)
+    out = []
+    for i in range(n):
+        lo, hi = max(0, i - radius), min(n, i + radius + 1)
+        out.append((prefix[hi] - prefix[lo]) / (hi - lo))
+    return out
+
+
+def find_boundaries(
+    token_ids: Sequence[int],
+    w: int = DEFAULT_W,
+    k: int = DEFAULT_K,
+    threshold: Optional[float] = None,
+    use_numpy: Optional[bool] = None,
+) -> list[dict]:
+    """Topic boundaries as {unit, token, similarity, depth, confidence}, in text order.
+
+    Gap scores are smoothed once, then every valley (local depth maximum)
+    deeper than *threshold* becomes a candidate; by default the threshold is
+    the mean valley depth plus a quarter standard deviation (Hearst's
+    ``mean - stdev / 2`` cutoff over all gaps keeps nearly every valley on
+    long transcripts), and at least MIN_DEPTH. Candidates closer than *k* units to a deeper one
+    are dropped. *token* is the index of the first token after the gap;
+    *confidence* is the depth clipped to [0, 1] (a depth of 1 means the
+    similarity fell by a total of 1.0 from the peaks on both sides).
+    """
+    raw = gap_scores(token_ids, w, k, use_numpy)
+    if len(raw) < 3:
+        return []
+    scores = smooth_scores(raw)
+    depths = depth_scores(scores)
+    last = len(depths) - 1
+    valleys = [
+        i for i, d in enumerate(depths)
+        if d > 0 and (i == 0 or d >= depths[i - 1]) and (i == last or d >= depths[i + 1])
+    ]
+    if not valleys:
+        return []
+    if threshold is None:
+        valley_depths = [depths[i] for i in valleys]
+        threshold = max(mean(valley_depths) + pstdev(valley_depths) / 4, MIN_DEPTH)
+    chosen: list[int] = []
+    for i in sorted(valleys, key=lambda i: -depths[i]):
+        if depths[i] >= threshold and all(abs(i - c) >= k for c in chosen):
+            chosen.append(i)
+    return [
+        {
+            "unit": i + 1,
+            "token": (i + 1) * w,
+            "similarity": round(raw[i], 4),
+            "depth": round(depths[i], 4),
+            "confidence": round(min(1.0, depths[i]), 3),
+        }
+        for i in sorted(chosen)
+    ]
+
+
+def segment_text(
+    text: str,
+    w: int = DEFAULT_W,
+    k: int = DEFAULT_K,
+    threshold: Optional[float] = None,
+    use_numpy: Optional[bool] = None,
+    doc: Optional[Document] = None,
+) -> list[dict]:
+    """Split *text* at TextTiling boundaries.
+
+    Boundaries are moved to the nearest sentence start within the gap's
+    neighbouring pseudo-sentences, or to the preceding whitespace otherwise.
+    With the transcript's shared *doc*, its content tokens and sentence
+    starts are used; otherwise the text is tokenized here and sentences start
+    after sentence-ending punctuation.
+
+    Returns list of dicts: text, start, end (char offsets into *text*),
+    confidence and depth of the boundary opening the segment (None for the
+    first segment).
+    """
+    if doc is not None:
+        ids, offsets = doc.content_ids, doc.content_offsets
+        sentence_starts = doc.sentence_starts
+    else:
+        ids, offsets = tokenize(text)
+        sentence_starts = [m.end() for m in _SENTENCE_GAP_RE.finditer(text)]
+    boundaries = find_boundaries(ids, w, k, threshold, use_numpy)
+
+    cuts: list[tuple[int, dict]] = []
+    for b in boundaries:
+        pos = offsets[b["token"]]
+        lo = offsets[max(0, b["token"] - w)]
+        hi = offsets[min(len(offsets) - 1, b["token"] + w - 1)]
+        j = bisect_left(sentence_starts, pos)
+        near = [s for s in sentence_starts[max(0, j - 1):j + 1] if lo < s <= hi]
+        if near:
+            pos = min(near, key=lambda s: abs(s - pos))
+        else:
+            pos = text.rfind(" ", 0, pos) + 1 or pos
+        if not cuts or pos > cuts[-1][0]:
+            cuts.append((pos, b))
+
+    segments: list[dict] = []
+    start = 0
+    opening: Optional[dict] = None
+    for pos, b in cuts + [(len(text), None)]:
+        chunk = text[start:pos]
+        if chunk.strip():
+            segments.append({
+                "text": chunk.strip(),
+                "start": start,
+                "end": pos,
+                "confidence": opening["confidence"] if opening else None,
+                "depth": opening["depth"] if opening else None,
+            })
+        start = pos
+        opening = b
+    return segments
@@ -9,6 +9,8 @@ import tempfile
 from pathlib import Path
 from typing import Optional
 
+from . import ytdlp_engine
+
 logger = logging.getLogger(__name__)
 
 # Noise patterns to strip from transcripts
@@ -53,6 +55,8 @@ def clean_transcript(text: str) -> str:
 
 # Language fallback priority order
 LANG_FALLBACK_ORDER = ["ko", "en", "ja", "zh", "de", "fr", "es", "pt"]
+# Subtitle languages requested from yt-dlp
+YTDLP_SUB_LANGS = "ko,en,ja,zh-Hans,zh-Hant,de,fr,es,pt"
 
 
 def _parse_vtt(text: str) -> list[dict]:
@@ -109,31 +113,47 @@ def _parse_srt(text: str) -> list[dict]:
 
 
 def _fetch_via_ytdlp(video_id: str) -> dict:
-    """Fallback: fetch transcript via yt-dlp subprocess."""
+    """Fallback: fetch transcript via yt-dlp (subprocess or in-process engine)."""
     result: dict = {
         "auto_ko": None, "auto_en": None, "manual": None,
         "best": None, "lang": None, "timed_segments": [],
     }
     tmpdir = tempfile.mkdtemp(prefix="myi_ytdlp_")
     url = f"https://www.youtube.com/watch?v={video_id}"
-    cmd = [
-        "yt-dlp",
+    args = [
         "--remote-components", "ejs:github",
         "--write-sub", "--write-auto-sub",
-        "--sub-langs", "ko,en,ja,zh-Hans,zh-Hant,de,fr,es,pt",
+        "--sub-langs", YTDLP_SUB_LANGS,
         "--skip-download",
         "-o", f"{tmpdir}/%(id)s",
-        url,
     ]
-    try:
-        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        if proc.returncode != 0:
-            # yt-dlp may return non-zero but still produce subtitle files (e.g. 429 on some langs)
-            logger.warning("yt-dlp exited with code %d for %s: %s", proc.returncode, video_id, proc.stderr[:300])
-    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-        logger.warning("yt-dlp unavailable or timed out for %s: %s", video_id, e)
-        return result
+    if ytdlp_engine.active():
+        try:
+            ytdlp_engine.extract(url, args, timeout=120)
+        except Exception as e:
+            # Subtitle files may still have been written (e.g. 429 on some langs)
+            logger.warning("yt-dlp failed for %s: %s", video_id, e)
+    else:
+        try:
+            proc = subprocess.run(["yt-dlp", *args, url], capture_output=True, text=True, timeout=120)
+            if proc.returncode != 0:
+                # yt-dlp may return non-zero but still produce subtitle files (e.g. 429 on some langs)
+                logger.warning("yt-dlp exited with code %d for %s: %s", proc.returncode, video_id, proc.stderr[:300])
+        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+            logger.warning("yt-dlp unavailable or timed out for %s: %s", video_id, e)
+            return result
+    return read_subtitle_files(video_id, tmpdir)
 
+
+def read_subtitle_files(video_id: str, tmpdir: str) -> dict:
+    """Pick the best subtitle track among the files yt-dlp wrote to *tmpdir*.
+
+    Returns the same keys as :func:`_fetch_via_ytdlp`.
+    """
+    result: dict = {
+        "auto_ko": None, "auto_en": None, "manual": None,
+        "best": None, "lang": None, "timed_segments": [],
+    }
     # Find subtitle files
     sub_files = glob.glob(f"{tmpdir}/{video_id}*.vtt") + glob.glob(f"{tmpdir}/{video_id}*.srt")
     if not sub_files:
@@ -272,12 +292,13 @@ def _select_best_from_list(transcript_list) -> dict:
     return result
 
 
-def fetch_transcript(video_id: str) -> dict:
+def fetch_transcript(video_id: str, ytdlp_fallback: bool = True) -> dict:
     """Fetch transcript with multilingual fallback + yt-dlp fallback.
 
     Strategy:
     1. Try youtube-transcript-api (fast, structured)
-    2. On failure (IP blocked, etc.) → fallback to yt-dlp subprocess
+    2. On failure (IP blocked, etc.) → fallback to yt-dlp subprocess,
+       unless *ytdlp_fallback* is False (the caller already ran yt-dlp)
     3. Language priority: ko → en → ja → zh → de → fr → es → pt → any
 
     Returns dict with keys:
@@ -304,6 +325,11 @@ def fetch_transcript(video_id: str) -> dict:
         logger.warning("youtube-transcript-api failed for %s (%s: %s), trying yt-dlp fallback", video_id, err_type, e)
         result["error"] = f"youtube-transcript-api: {err_type}: {e}"
 
+    if not ytdlp_fallback:
+        if not result.get("error"):
+            result["error"] = "No transcript found via youtube-transcript-api"
+        return result
+
     # --- Attempt 2: yt-dlp fallback ---
     try:
         ytdlp_result = _fetch_via_ytdlp(video_id)
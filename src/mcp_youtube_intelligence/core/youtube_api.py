@@ -0,0 +1,249 @@
+"""Video metadata via the YouTube Data API v3 ``videos.list`` endpoint.
+
+When an API key is configured, :mod:`collector` takes metadata from here
+instead of yt-dlp: one ``videos.list`` call returns up to 50 videos and
+costs one quota unit, where yt-dlp needs a page extraction per video.
+Requests go over a small pool of keep-alive ``http.client`` connections,
+and every request is counted against the day's quota (see
+:func:`quota_usage`).
+"""
+from __future__ import annotations
+
+import http.client
+import json
+import logging
+import queue
+import re
+import threading
+from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import urlencode, urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://www.googleapis.com/youtube/v3"
+# Maximum ids per videos.list call
+BATCH_SIZE = 50
+DEFAULT_POOL_SIZE = 4
+# Quota units charged per call, by endpoint
+QUOTA_COSTS = {"videos.list": 1}
+
+_PARTS = "snippet,contentDetails,statistics,liveStreamingDetails"
+_DURATION_RE = re.compile(r"^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?$")
+# "0:00 Intro", "1:02:03 - Q&A", "(12:30) Outro"
+_CHAPTER_LINE_RE = re.compile(r"^\s*[\[(]?((?:\d+:)?\d{1,2}:\d{2})[\])]?\s*[-–—:|]?\s*(.+?)\s*$")
+
+_api_key = ""
+_base_url = DEFAULT_BASE_URL
+_pool: Optional[_ConnectionPool] = None
+_quota_lock = threading.Lock()
+_quota: dict = {"date": "", "units": 0, "requests": {}}
+
+
+# ---------------------------------------------------------------------------
+# Configuration and quota
+# ---------------------------------------------------------------------------
+
+def configure(api_key: str = "", base_url: str = DEFAULT_BASE_URL, pool_size: int = DEFAULT_POOL_SIZE) -> None:
+    """Set the API key (empty disables the API path) and endpoint."""
+    global _api_key, _base_url, _pool
+    if _pool is not None:
+        _pool.close()
+    _api_key = api_key
+    _base_url = base_url.rstrip("/")
+    _pool = _ConnectionPool(_base_url, pool_size) if api_key else None
+
+
+def active() -> bool:
+    """True when metadata should come from the Data API."""
+    return bool(_api_key)
+
+
+def _charge(endpoint: str) -> None:
+    today = datetime.now(timezone.utc).date().isoformat()
+    with _quota_lock:
+        if _quota["date"] != today:
+            _quota.update(date=today, units=0, requests={})
+        _quota["units"] += QUOTA_COSTS.get(endpoint, 1)
+        _quota["requests"][endpoint] = _quota["requests"].get(endpoint, 0) + 1
+
+
+def quota_usage() -> dict:
+    """Quota units and request counts spent today (UTC) by this process."""
+    with _quota_lock:
+        return {"date": _quota["date"], "units": _quota["units"], "requests": dict(_quota["requests"])}
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+class _ConnectionPool:
+    """Keep-alive connections to one host, reused across requests and threads."""
+
+    def __init__(self, base_url: str, size: int):
+        parts = urlsplit(base_url)
+        self._cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._host = parts.netloc
+        self.path = parts.path
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=max(1, size))
+
+    def get(self, path: str, timeout: float) -> tuple[int, bytes]:
+        """GET *path*, retrying once on a fresh connection if a reused one was closed."""
+        for attempt in range(2):
+            try:
+                conn = self._idle.get_nowait()
+                reused = True
+            except queue.Empty:
+                conn = self._cls(self._host, timeout=timeout)
+                reused = False
+            try:
+                conn.request("GET", path, headers={"Accept-Encoding": "identity"})
+                resp = conn.getresponse()
+                body = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionError, http.client.BadStatusLine):
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                try:
+                    self._idle.put_nowait(conn)
+                except queue.Full:
+                    conn.close()
+            return resp.status, body
+        raise ConnectionError("connection closed")  # pragma: no cover
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def _call(endpoint: str, params: dict, timeout: float = 30.0) -> Optional[dict]:
+    """Call ``<resource>.list`` and return the decoded body, or None on failure."""
+    pool = _pool
+    if pool is None:
+        return None
+    resource = endpoint.split(".")[0]
+    path = f"{pool.path}/{resource}?" + urlencode({**params, "key": _api_key})
+    try:
+        _charge(endpoint)
+        status, body = pool.get(path, timeout)
+    except Exception as e:
+        logger.error("YouTube API %s failed: %s", endpoint, e)
+        return None
+    if status != 200:
+        reason = ""
+        try:
+            errors = json.loads(body).get("error", {}).get("errors") or [{}]
+            reason = errors[0].get("reason", "")
+        except (ValueError, AttributeError):
+            pass
+        logger.error("YouTube API %s returned %s %s", endpoint, status, reason)
+        return None
+    return json.loads(body)
+
+
+# ---------------------------------------------------------------------------
+# videos.list
+# ---------------------------------------------------------------------------
+
+def _parse_duration(value: Optional[str]) -> Optional[int]:
+    """ISO 8601 duration (``PT1H2M3S``) in seconds."""
+    m = _DURATION_RE.match(value or "")
+    if not m or not any(m.groups()):
+        return None
+    days, hours, minutes, seconds = m.groups()
+    return int(int(days or 0) * 86400 + int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(seconds or 0))
+
+
+def _int(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _description_chapters(description: str) -> Optional[list[dict]]:
+    """Chapters from description timestamps, by YouTube's rules.
+
+    The first timestamp must be 0:00 and there must be at least three in
+    ascending order; otherwise the video has no chapters.
+    """
+    raw = []
+    for line in (description or "").splitlines():
+        m = _CHAPTER_LINE_RE.match(line)
+        if not m:
+            continue
+        seconds = 0
+        for part in m.group(1).split(":"):
+            seconds = seconds * 60 + int(part)
+        if raw and seconds <= raw[-1]["start_time"]:
+            continue
+        raw.append({"start_time": seconds, "title": m.group(2)})
+    if len(raw) < 3 or raw[0]["start_time"] != 0:
+        return None
+    return raw
+
+
+def _to_metadata(item: dict) -> dict:
+    """Map a ``videos.list`` item to the fields of ``collector.get_video_metadata``."""
+    from .collector import _parse_chapters
+
+    snippet = item.get("snippet") or {}
+    stats = item.get("statistics") or {}
+    live = item.get("liveStreamingDetails")
+    published_at = None
+    if snippet.get("publishedAt"):
+        try:
+            published_at = datetime.fromisoformat(snippet["publishedAt"].replace("Z", "+00:00")).isoformat()
+        except ValueError:
+            pass
+    thumbs = snippet.get("thumbnails") or {}
+    thumb = next((thumbs[k] for k in ("maxres", "standard", "high", "medium", "default") if k in thumbs), {})
+    duration = _parse_duration((item.get("contentDetails") or {}).get("duration"))
+    broadcast = snippet.get("liveBroadcastContent", "none")
+    return {
+        "video_id": item.get("id", ""),
+        "title": snippet.get("title", ""),
+        "description": snippet.get("description", ""),
+        "channel_id": snippet.get("channelId", ""),
+        "channel_name": snippet.get("channelTitle", ""),
+        "published_at": published_at,
+        "duration_seconds": duration,
+        "view_count": _int(stats.get("viewCount")),
+        "like_count": _int(stats.get("likeCount")),
+        "comment_count": _int(stats.get("commentCount")),
+        "is_live": broadcast == "live",
+        "was_live": bool(live) and broadcast == "none",
+        "thumbnail_url": thumb.get("url"),
+        "chapters": _parse_chapters(_description_chapters(snippet.get("description", "")), duration),
+    }
+
+
+def get_video_metadata_batch(video_ids: list[str]) -> Optional[dict[str, dict]]:
+    """Fetch metadata with one ``videos.list`` call per 50 ids.
+
+    Returns {video_id: metadata} with ``{"error": reason}`` for ids the API
+    did not return (private, deleted or invalid), in the order of
+    *video_ids*; or None if a request failed (quota exhausted, bad key,
+    network), so the caller can fall back to yt-dlp.
+    """
+    ids = list(dict.fromkeys(video_ids))
+    found: dict[str, dict] = {}
+    for i in range(0, len(ids), BATCH_SIZE):
+        chunk = ids[i:i + BATCH_SIZE]
+        data = _call("videos.list", {"part": _PARTS, "id": ",".join(chunk), "maxResults": len(chunk)})
+        if data is None:
+            return None
+        for item in data.get("items", []):
+            found[item.get("id", "")] = _to_metadata(item)
+    return {vid: found.get(vid) or {"error": "Video unavailable"} for vid in ids}
@@ -0,0 +1,157 @@
+"""In-process yt-dlp execution backend.
+
+Every yt-dlp subprocess pays interpreter startup and extractor loading
+before any network work. With the ``inprocess`` backend, callers hand the
+same command-line options they would pass to the binary to :func:`extract`,
+which runs ``yt_dlp.YoutubeDL.extract_info`` on a bounded thread pool and
+returns the info dict that ``--dump-json`` would have printed. Each worker
+thread keeps one ``YoutubeDL`` per option set (a bounded LRU), so extractor
+instances (and their caches) are reused across calls. Output locations
+(``-o``/``-P``) are applied per call and are not part of the option set, so
+callers writing into a fresh temp dir each time still share an instance.
+
+The ``subprocess`` backend (default) leaves callers on their binary path;
+:func:`active` tells them which one to take.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("subprocess", "inprocess")
+DEFAULT_WORKERS = 4
+# YoutubeDL instances kept per worker thread
+MAX_INSTANCES_PER_THREAD = 8
+# Options naming where a call writes files; applied per call, not cached
+_OUTPUT_OPTIONS = frozenset(("-o", "--output", "-P", "--paths"))
+
+_backend = "subprocess"
+_workers = DEFAULT_WORKERS
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+_local = threading.local()
+
+
+@lru_cache(maxsize=1)
+def _api():
+    """The yt_dlp package, imported on first use, or None if unavailable."""
+    try:
+        import yt_dlp
+    except ImportError:
+        return None
+    return yt_dlp
+
+
+def configure(backend: str = "subprocess", max_workers: int = DEFAULT_WORKERS) -> None:
+    """Select the backend used by :func:`active` callers and size the pool."""
+    global _backend, _workers, _pool
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown yt-dlp backend: {backend} (expected one of {', '.join(BACKENDS)})")
+    if backend == "inprocess" and _api() is None:
+        logger.warning("yt_dlp is not importable; using the yt-dlp binary")
+        backend = "subprocess"
+    with _pool_lock:
+        if _pool is not None and (backend != "inprocess" or max_workers != _workers):
+            _pool.shutdown(wait=False)
+            _pool = None
+        _backend = backend
+        _workers = max(1, max_workers)
+
+
+def active() -> bool:
+    """True when yt-dlp calls should go through :func:`extract`."""
+    return _backend == "inprocess"
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=_workers, thread_name_prefix="ytdlp")
+        return _pool
+
+
+@lru_cache(maxsize=64)
+def _options(args: tuple[str, ...]) -> dict:
+    """YoutubeDL params for yt-dlp command-line *args*, with output silenced."""
+    opts = dict(_api().parse_options(list(args)).ydl_opts)
+    # Results are returned to the caller, not printed
+    opts.update(
+        quiet=True, no_warnings=True, noprogress=True,
+        forcejson=False, dump_single_json=False, forceprint={}, print_to_file={},
+    )
+    return opts
+
+
+def _split_output_args(args: tuple[str, ...]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Split *args* into the cacheable option set and the output-location options."""
+    shared: list[str] = []
+    output: list[str] = []
+    it = iter(args)
+    for arg in it:
+        if arg.split("=", 1)[0] in _OUTPUT_OPTIONS:
+            output.append(arg)
+            if "=" not in arg:
+                output.append(next(it, ""))
+        else:
+            shared.append(arg)
+    return tuple(shared), tuple(output)
+
+
+def _ydl(args: tuple[str, ...]):
+    instances = getattr(_local, "instances", None)
+    if instances is None:
+        instances = _local.instances = OrderedDict()
+    ydl = instances.get(args)
+    if ydl is None:
+        ydl = instances[args] = _api().YoutubeDL(dict(_options(args)))
+        ydl._myi_output = ()
+        if len(instances) > MAX_INSTANCES_PER_THREAD:
+            _, evicted = instances.popitem(last=False)
+            try:
+                evicted.close()
+            except Exception:
+                pass
+    else:
+        instances.move_to_end(args)
+    return ydl
+
+
+def _set_output(ydl, args: tuple[str, ...], output: tuple[str, ...]) -> None:
+    """Point *ydl* at the output locations of *output* (the option set's own when empty)."""
+    opts = _options(args)
+    extra = _api().parse_options(list(output)).ydl_opts if output else {}
+    ydl.params["outtmpl"] = {**(opts.get("outtmpl") or {}), **(extra.get("outtmpl") or {})}
+    ydl.params["paths"] = {**(opts.get("paths") or {}), **(extra.get("paths") or {})}
+    ydl._parse_outtmpl()
+    ydl._myi_output = output
+
+
+def _run(url: str, args: tuple[str, ...]) -> dict:
+    shared, output = _split_output_args(args)
+    ydl = _ydl(shared)
+    if ydl._myi_output != output:
+        _set_output(ydl, shared, output)
+    info = ydl.extract_info(url, download=True)
+    return ydl.sanitize_info(info) if info else {}
+
+
+def submit(url: str, args: Sequence[str] = ()) -> Future:
+    """Queue one extraction on the pool; the future resolves to the info dict."""
+    return _get_pool().submit(_run, url, tuple(args))
+
+
+def extract(url: str, args: Sequence[str] = (), timeout: Optional[float] = 120) -> dict:
+    """Run yt-dlp on *url* with command-line *args* and return its info dict.
+
+    Playlists (``--flat-playlist`` included) come back as one dict with an
+    ``entries`` list. Options that write files, such as ``--write-sub``,
+    write them as the binary would. yt-dlp errors propagate.
+    """
+    return submit(url, args).result(timeout=timeout)
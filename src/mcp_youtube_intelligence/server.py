@@ -10,6 +10,7 @@ from mcp.types import TextContent, Tool
 
 from . import tools
 from .config import Config
+from .core import youtube_api, ytdlp_engine
 from .storage.sqlite import SQLiteStorage
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,8 @@ def _get_config() -> Config:
     global _config
     if _config is None:
         _config = Config.from_env()
+        ytdlp_engine.configure(_config.ytdlp_backend, _config.ytdlp_workers)
+        youtube_api.configure(_config.youtube_api_key)
     return _config
 
 
@@ -55,12 +58,12 @@ def create_server() -> Server:
             ),
             Tool(
                 name="get_transcript",
-                description="Get video transcript. mode: 'summary' (default, ~300 tokens), 'full' (saves to file, returns path), 'chunks' (split into segments).",
+                description="Get video transcript. mode: 'summary' (default, ~300 tokens), 'full' (saves to file, returns path), 'chunks' (split into segments), 'incremental' (rolling summary for live/growing transcripts; only new text is summarized).",
                 inputSchema={
                     "type": "object",
                     "properties": {
                         "video_id": {"type": "string", "description": "YouTube video ID"},
-                        "mode": {"type": "string", "enum": ["summary", "full", "chunks"], "default": "summary"},
+                        "mode": {"type": "string", "enum": ["summary", "full", "chunks", "incremental"], "default": "summary"},
                         "llm_provider": {"type": "string", "enum": ["auto", "openai", "anthropic", "google", "ollama", "vllm", "lmstudio"], "description": "LLM provider for summary (default: auto)"},
                     },
                     "required": ["video_id"],
@@ -75,18 +78,20 @@ def create_server() -> Server:
                         "video_id": {"type": "string", "description": "YouTube video ID"},
                         "top_n": {"type": "integer", "default": 10, "description": "Number of top comments"},
                         "summarize": {"type": "boolean", "default": False, "description": "Return summarized view"},
+                        "sync": {"type": "boolean", "default": False, "description": "Fetch only comments newer than the last sync, then return stored top comments"},
                     },
                     "required": ["video_id"],
                 },
             ),
             Tool(
                 name="monitor_channel",
-                description="Monitor a YouTube channel via RSS. action: 'add' (subscribe), 'check' (poll for new videos), 'list' (show subscriptions), 'remove' (unsubscribe).",
+                description="Monitor a YouTube channel via RSS. action: 'add' (subscribe), 'check' (poll for new videos), 'list' (show subscriptions), 'remove' (unsubscribe), 'sweep' (check all subscriptions concurrently; channel_ref ignored).",
                 inputSchema={
                     "type": "object",
                     "properties": {
                         "channel_ref": {"type": "string", "description": "Channel URL, @handle, or ID"},
-                        "action": {"type": "string", "enum": ["add", "check", "list", "remove"], "default": "check"},
+                        "action": {"type": "string", "enum": ["add", "check", "list", "remove", "sweep"], "default": "check"},
+                        "concurrency": {"type": "integer", "description": "Channels checked at once by 'sweep' (default: MYI_MONITOR_CONCURRENCY)"},
                     },
                     "required": ["channel_ref"],
                 },
@@ -105,22 +110,77 @@ def create_server() -> Server:
             ),
             Tool(
                 name="extract_entities",
-                description="Extract structured entities (companies, indices, people, sectors, etc.) from a video transcript.",
+                description="Extract structured entities (companies, indices, people, sectors, etc.) from a video transcript. mode='timeline' returns when each entity is mentioned (timestamps + per-minute histogram).",
                 inputSchema={
                     "type": "object",
                     "properties": {
                         "video_id": {"type": "string", "description": "YouTube video ID"},
+                        "mode": {"type": "string", "enum": ["counts", "timeline"], "default": "counts"},
+                        "entity": {"type": "string", "description": "Timeline mode: only this entity (keyword or name)"},
                     },
                     "required": ["video_id"],
                 },
             ),
+            Tool(
+                name="find_videos_by_entity",
+                description="Find stored videos that mention ALL given entities (e.g. ['NVIDIA', '금리']), with per-entity mention counts. Filter by publish date and channel.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "entities": {"type": "array", "items": {"type": "string"}, "description": "Entity keywords or canonical names"},
+                        "since": {"type": "string", "description": "Published on/after (ISO 8601 date)"},
+                        "until": {"type": "string", "description": "Published before (ISO 8601 date)"},
+                        "channel_id": {"type": "string", "description": "Limit to a channel ID"},
+                        "limit": {"type": "integer", "default": 20},
+                    },
+                    "required": ["entities"],
+                },
+            ),
+            Tool(
+                name="reload_entity_dictionaries",
+                description="Reload custom entity dictionaries (*.tsv / *.json in the entities data dir) without restarting. The compiled matcher is rebuilt only if the files changed.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "force_rebuild": {"type": "boolean", "default": False, "description": "Recompile even if sources are unchanged"},
+                    },
+                },
+            ),
+            Tool(
+                name="mine_entity_candidates",
+                description="Mine stored transcripts (incrementally) for frequent names the entity dictionary does not know yet — capitalized English phrases and Korean nouns. Returns top candidates for review.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "limit": {"type": "integer", "default": 20},
+                        "min_count": {"type": "integer", "default": 3, "description": "Minimum estimated occurrences"},
+                        "reset": {"type": "boolean", "default": False, "description": "Discard counts and re-mine the whole corpus"},
+                    },
+                },
+            ),
+            Tool(
+                name="promote_entity_candidate",
+                description="Add a mined candidate to the custom entity dictionary (custom.tsv) and reload it.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "keyword": {"type": "string", "description": "Phrase as it appears in transcripts"},
+                        "entity_type": {"type": "string", "description": "e.g. company, person, technology, product"},
+                        "name": {"type": "string", "description": "Canonical name (defaults to keyword)"},
+                    },
+                    "required": ["keyword", "entity_type"],
+                },
+            ),
             Tool(
                 name="segment_topics",
-                description="Segment a video transcript into topics based on transition markers.",
+                description="Segment a video transcript into topics. method='auto' (default) uses the creator's chapters when the video has them, else 'markers' (spoken transition markers); 'texttiling' splits where vocabulary shifts between sliding windows and reports a confidence per boundary; 'hierarchical' returns a topic tree (chapters > subtopics), or one flat granularity with level or max_segments.",
                 inputSchema={
                     "type": "object",
                     "properties": {
                         "video_id": {"type": "string", "description": "YouTube video ID"},
+                        "method": {"type": "string", "enum": ["auto", "chapters", "markers", "texttiling", "hierarchical"], "default": "auto"},
+                        "level": {"type": "integer", "description": "hierarchical: tree level to return as a flat list (1 = coarsest)"},
+                        "max_segments": {"type": "integer", "description": "hierarchical: return exactly this many segments (fewer if the transcript is short)"},
                     },
                     "required": ["video_id"],
                 },
@@ -186,16 +246,38 @@ def create_server() -> Server:
                 llm_provider=args.get("llm_provider"), **kwargs
             ),
             "get_comments": lambda args: tools.get_comments(
-                args["video_id"], args.get("top_n", 10), args.get("summarize", False), **kwargs
+                args["video_id"], args.get("top_n", 10), args.get("summarize", False),
+                sync=args.get("sync", False), **kwargs
             ),
             "monitor_channel": lambda args: tools.monitor_channel(
-                args["channel_ref"], args.get("action", "check"), **kwargs
+                args["channel_ref"], args.get("action", "check"), args.get("concurrency"), **kwargs
             ),
             "search_transcripts": lambda args: tools.search_transcripts(
                 args["query"], args.get("limit", 10), **kwargs
             ),
-            "extract_entities": lambda args: tools.extract_entities_tool(args["video_id"], **kwargs),
-            "segment_topics": lambda args: tools.segment_topics(args["video_id"], **kwargs),
+            "extract_entities": lambda args: tools.extract_entities_tool(
+                args["video_id"], args.get("mode", "counts"), args.get("entity"), **kwargs
+            ),
+            "find_videos_by_entity": lambda args: tools.find_videos_by_entity(
+                args["entities"],
+                args.get("since"),
+                args.get("until"),
+                args.get("channel_id"),
+                args.get("limit", 20),
+                **kwargs,
+            ),
+            "reload_entity_dictionaries": lambda args: tools.reload_entity_dictionaries(
+                args.get("force_rebuild", False), **kwargs
+            ),
+            "mine_entity_candidates": lambda args: tools.mine_entity_candidates(
+                args.get("limit", 20), args.get("min_count", 3), args.get("reset", False), **kwargs
+            ),
+            "promote_entity_candidate": lambda args: tools.promote_entity_candidate(
+                args["keyword"], args["entity_type"], args.get("name"), **kwargs
+            ),
+            "segment_topics": lambda args: tools.segment_topics(
+                args["video_id"], args.get("method", "auto"), args.get("level"), args.get("max_segments"), **kwargs
+            ),
             "search_youtube": lambda args: tools.search_youtube_tool(
                 args["query"],
                 args.get("max_results", 10),
@@ -30,6 +30,77 @@ class BaseStorage(ABC):
     async def search_transcripts(self, query: str, limit: int = 10) -> list[dict]:
         ...
 
+    @abstractmethod
+    async def get_summary_state(self, video_id: str) -> Optional[dict]:
+        """Return the rolling incremental-summary state for a video, if any."""
+        ...
+
+    @abstractmethod
+    async def save_summary_state(self, video_id: str, state: dict) -> None:
+        ...
+
+    # --- Entity index ---
+    @abstractmethod
+    async def save_entity_mentions(self, video_id: str, mentions: list[dict]) -> None:
+        """Replace a video's rows in the entity index with *mentions* (extract_entities output)."""
+        ...
+
+    @abstractmethod
+    async def get_video_entities(self, video_id: str) -> list[dict]:
+        ...
+
+    @abstractmethod
+    async def find_videos_by_entities(
+        self,
+        entities: list[str],
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        channel_id: Optional[str] = None,
+        limit: int = 20,
+    ) -> list[dict]:
+        """Videos mentioning all of *entities* (canonical names), newest first."""
+        ...
+
+    @abstractmethod
+    async def get_transcripts_after(self, cursor: int, limit: int = 200) -> list[dict]:
+        """Stored transcripts after *cursor*: {transcript_seq, video_id, transcript_text}.
+
+        Ordered by ``transcript_seq``, assigned when a video first gets a
+        transcript, so rows created earlier without one are not skipped.
+        """
+        ...
+
+    # --- Topic segments ---
+    @abstractmethod
+    async def get_topic_segments(self, video_id: str, method: str) -> list[dict]:
+        """Stored segmentation of a video for *method*, in segment order.
+
+        Rows: segment, char_start, char_end, text, start_time, end_time,
+        topic, chapter, confidence, transcript_hash, version.
+        """
+        ...
+
+    @abstractmethod
+    async def save_topic_segments(
+        self, video_id: str, method: str, transcript_hash: str, version: int, segments: list[dict],
+    ) -> None:
+        """Replace the stored segmentation of a video for *method* (segment_topics output)."""
+        ...
+
+    # --- Miner state ---
+    @abstractmethod
+    async def get_miner_state(self, name: str) -> Optional[dict]:
+        """Return {cursor, state, updated_at} for a corpus miner, if saved."""
+        ...
+
+    @abstractmethod
+    async def save_miner_state(self, name: str, cursor: int, state: bytes) -> None:
+        ...
+
+    @abstractmethod
+    async def delete_miner_state(self, name: str) -> None:
+        ...
+
     # --- Channels ---
     @abstractmethod
     async def get_channel(self, channel_id: str) -> Optional[dict]:
@@ -49,9 +120,69 @@ class BaseStorage(ABC):
 
     # --- Comments ---
     @abstractmethod
-    async def save_comments(self, video_id: str, comments: list[dict]) -> None:
+    async def save_comments(self, video_id: str, comments: list[dict]) -> list[dict]:
+        """Insert comments (fetch_comments output) with their sentiment and noise flag; known ids are kept.
+
+        Returns the comments that were not stored before.
+        """
         ...
 
     @abstractmethod
     async def get_comments(self, video_id: str, limit: int = 20) -> list[dict]:
         ...
+
+    @abstractmethod
+    async def count_comment_sentiments(self, video_id: str, include_noise: bool = False) -> dict[str, int]:
+        """Stored comments of a video per sentiment label (None for unlabelled comments)."""
+        ...
+
+    @abstractmethod
+    async def get_comment_ids(self, video_id: str) -> set[str]:
+        """Ids of the stored comments of a video."""
+        ...
+
+    @abstractmethod
+    async def update_comment_likes(self, video_id: str, likes: dict[str, int]) -> None:
+        """Set like counts of stored comments ({comment_id: like_count}); unknown ids are ignored.
+
+        The top-liked ids in the video's comment stats are re-ranked.
+        """
+        ...
+
+    @abstractmethod
+    async def get_comment_stats(self, video_id: str, top_n: int = 10, keyword_limit: int = 15) -> Optional[dict]:
+        """Return the materialized {count, sentiments, keywords, top_comments, updated_at} of a video, if any."""
+        ...
+
+    @abstractmethod
+    async def update_comment_stats(self, video_id: str, delta: dict) -> None:
+        """Add {count, sentiments, keywords, top} computed over newly saved comments to a video's stats."""
+        ...
+
+    @abstractmethod
+    async def get_comment_buckets(self, video_id: str, buckets: list[int]) -> dict[int, tuple[str, bytes]]:
+        """Map the given LSH bucket keys of a video to (representative comment_id, its signature)."""
+        ...
+
+    @abstractmethod
+    async def save_comment_signatures(self, video_id: str, signatures: list[dict], buckets: dict[int, str]) -> None:
+        """Store {comment_id, signature, representative, copies} rows and new {bucket: comment_id} entries.
+
+        Comments saved with another comment as representative are flagged as noise.
+        """
+        ...
+
+    @abstractmethod
+    async def get_comment_clusters(self, video_id: str, limit: int = 5) -> list[dict]:
+        """Largest near-duplicate clusters of a video: {comment_id, count, author, text} of the representative."""
+        ...
+
+    @abstractmethod
+    async def get_comment_sync(self, video_id: str) -> Optional[dict]:
+        """Return {newest_comment_id, newest_timestamp, synced_at, likes_refreshed_at}, if synced before."""
+        ...
+
+    @abstractmethod
+    async def save_comment_sync(self, video_id: str, state: dict) -> None:
+        """Update the given keys of a video's comment sync state."""
+        ...
@@ -23,9 +23,35 @@ class PostgresStorage(BaseStorage):
     async def get_video(self, video_id: str) -> Optional[dict]: ...
     async def upsert_video(self, data: dict) -> None: ...
     async def search_transcripts(self, query: str, limit: int = 10) -> list[dict]: ...
+    async def get_summary_state(self, video_id: str) -> Optional[dict]: ...
+    async def save_summary_state(self, video_id: str, state: dict) -> None: ...
+    async def save_entity_mentions(self, video_id: str, mentions: list[dict]) -> None: ...
+    async def get_video_entities(self, video_id: str) -> list[dict]: ...
+    async def find_videos_by_entities(
+        self, entities: list[str], since: Optional[str] = None, until: Optional[str] = None,
+        channel_id: Optional[str] = None, limit: int = 20,
+    ) -> list[dict]: ...
+    async def get_transcripts_after(self, cursor: int, limit: int = 200) -> list[dict]: ...
+    async def get_topic_segments(self, video_id: str, method: str) -> list[dict]: ...
+    async def save_topic_segments(
+        self, video_id: str, method: str, transcript_hash: str, version: int, segments: list[dict],
+    ) -> None: ...
+    async def get_miner_state(self, name: str) -> Optional[dict]: ...
+    async def save_miner_state(self, name: str, cursor: int, state: bytes) -> None: ...
+    async def delete_miner_state(self, name: str) -> None: ...
     async def get_channel(self, channel_id: str) -> Optional[dict]: ...
     async def upsert_channel(self, data: dict) -> None: ...
     async def list_channels(self) -> list[dict]: ...
     async def update_channel_checked(self, channel_id: str) -> None: ...
-    async def save_comments(self, video_id: str, comments: list[dict]) -> None: ...
+    async def save_comments(self, video_id: str, comments: list[dict]) -> list[dict]: ...
     async def get_comments(self, video_id: str, limit: int = 20) -> list[dict]: ...
+    async def count_comment_sentiments(self, video_id: str, include_noise: bool = False) -> dict[str, int]: ...
+    async def get_comment_ids(self, video_id: str) -> set[str]: ...
+    async def update_comment_likes(self, video_id: str, likes: dict[str, int]) -> None: ...
+    async def get_comment_stats(self, video_id: str, top_n: int = 10, keyword_limit: int = 15) -> Optional[dict]: ...
+    async def update_comment_stats(self, video_id: str, delta: dict) -> None: ...
+    async def get_comment_buckets(self, video_id: str, buckets: list[int]) -> dict[int, tuple[str, bytes]]: ...
+    async def save_comment_signatures(self, video_id: str, signatures: list[dict], buckets: dict[int, str]) -> None: ...
+    async def get_comment_clusters(self, video_id: str, limit: int = 5) -> list[dict]: ...
+    async def get_comment_sync(self, video_id: str) -> Optional[dict]: ...
+    async def save_comment_sync(self, video_id: str, state: dict) -> None: ...
@@ -40,9 +40,14 @@ CREATE TABLE IF NOT EXISTS videos (
     transcript_text TEXT,
     transcript_lang TEXT,
     transcript_length INTEGER,
+    transcript_seq INTEGER,
+    timed_segments TEXT,
+    chapters TEXT,
     summary TEXT,
     status TEXT DEFAULT 'pending',
     collected_at TEXT,
+    metadata_at TEXT,
+    counters_at TEXT,
     created_at TEXT DEFAULT (datetime('now')),
     updated_at TEXT DEFAULT (datetime('now'))
 );
@@ -54,15 +59,165 @@ CREATE TABLE IF NOT EXISTS comments (
     author TEXT,
     text TEXT,
     like_count INTEGER DEFAULT 0,
+    sentiment TEXT,
+    is_noise INTEGER DEFAULT 0,
     collected_at TEXT DEFAULT (datetime('now'))
 );
 
+CREATE TABLE IF NOT EXISTS summary_states (
+    video_id TEXT PRIMARY KEY,
+    processed_offset INTEGER DEFAULT 0,
+    anchor TEXT,
+    partials TEXT,
+    summary TEXT,
+    increments INTEGER DEFAULT 0,
+    updated_at TEXT
+);
+
+-- Inverted index: entity -> videos (primary key) and video -> entities
+CREATE TABLE IF NOT EXISTS entity_mentions (
+    entity TEXT NOT NULL,
+    entity_type TEXT,
+    video_id TEXT NOT NULL,
+    mention_count INTEGER DEFAULT 0,
+    first_offset INTEGER,
+    channel_id TEXT,
+    published_at TEXT,
+    indexed_at TEXT,
+    PRIMARY KEY (entity, video_id)
+) WITHOUT ROWID;
+
+-- Persisted topic segmentation per (video, method); the primary key is the lookup index
+CREATE TABLE IF NOT EXISTS topic_segments (
+    video_id TEXT NOT NULL,
+    method TEXT NOT NULL,
+    segment INTEGER NOT NULL,
+    char_start INTEGER NOT NULL,
+    char_end INTEGER NOT NULL,
+    text TEXT,
+    start_time REAL,
+    end_time REAL,
+    topic TEXT,
+    chapter TEXT,
+    confidence REAL,
+    transcript_hash TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    created_at TEXT,
+    PRIMARY KEY (video_id, method, segment)
+) WITHOUT ROWID;
+
+-- Per-video comment sync high-water mark (newest comment seen) and like refresh time
+CREATE TABLE IF NOT EXISTS comment_sync (
+    video_id TEXT PRIMARY KEY,
+    newest_comment_id TEXT,
+    newest_timestamp INTEGER,
+    synced_at TEXT,
+    likes_refreshed_at TEXT
+);
+
+-- Materialized comment analytics per video, updated as new comments are saved
+-- (noise excluded); top_comments is a JSON list of [comment_id, like_count]
+CREATE TABLE IF NOT EXISTS comment_stats (
+    video_id TEXT PRIMARY KEY,
+    comment_count INTEGER DEFAULT 0,
+    positive INTEGER DEFAULT 0,
+    negative INTEGER DEFAULT 0,
+    neutral INTEGER DEFAULT 0,
+    top_comments TEXT,
+    updated_at TEXT
+);
+
+-- Keyword counts over a video's comments, for the comment_stats keyword table
+CREATE TABLE IF NOT EXISTS comment_keywords (
+    video_id TEXT NOT NULL,
+    word TEXT NOT NULL,
+    count INTEGER DEFAULT 0,
+    PRIMARY KEY (video_id, word)
+) WITHOUT ROWID;
+
+-- MinHash signature per comment and the near-duplicate cluster it belongs to;
+-- copies counts the comment plus duplicates collapsed into it before saving
+CREATE TABLE IF NOT EXISTS comment_signatures (
+    video_id TEXT NOT NULL,
+    comment_id TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    representative TEXT NOT NULL,
+    copies INTEGER DEFAULT 1,
+    PRIMARY KEY (video_id, comment_id)
+) WITHOUT ROWID;
+
+-- LSH band buckets per video, each pointing at the first cluster representative hashed there
+CREATE TABLE IF NOT EXISTS comment_lsh_buckets (
+    video_id TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    comment_id TEXT NOT NULL,
+    PRIMARY KEY (video_id, bucket)
+) WITHOUT ROWID;
+
+-- Serialized state of corpus-wide miners, with the last videos rowid consumed
+CREATE TABLE IF NOT EXISTS miner_states (
+    name TEXT PRIMARY KEY,
+    cursor INTEGER DEFAULT 0,
+    state BLOB,
+    updated_at TEXT
+);
+
 CREATE INDEX IF NOT EXISTS idx_videos_channel ON videos(channel_id);
 CREATE INDEX IF NOT EXISTS idx_videos_status ON videos(status);
-CREATE INDEX IF NOT EXISTS idx_comments_video ON comments(video_id);
+CREATE INDEX IF NOT EXISTS idx_entity_mentions_video ON entity_mentions(video_id);
+CREATE INDEX IF NOT EXISTS idx_entity_mentions_date ON entity_mentions(entity, published_at);
+CREATE INDEX IF NOT EXISTS idx_comment_keywords_count ON comment_keywords(video_id, count DESC);
+CREATE INDEX IF NOT EXISTS idx_comment_signatures_rep ON comment_signatures(video_id, representative);
 """
 
 
+# Columns added after the initial schema: (table, column, type). Applied to
+# existing databases on initialize(); new databases get them from INIT_SQL.
+_ADDED_COLUMNS = [
+    ("videos", "timed_segments", "TEXT"),
+    ("videos", "chapters", "TEXT"),
+    ("videos", "metadata_at", "TEXT"),
+    ("videos", "counters_at", "TEXT"),
+    ("videos", "transcript_seq", "INTEGER"),
+    ("topic_segments", "text", "TEXT"),
+    ("comments", "sentiment", "TEXT"),
+    ("comments", "is_noise", "INTEGER DEFAULT 0"),
+]
+
+# Run once when the column is added, to fill it in for existing rows
+_BACKFILL_SQL = {
+    # Videos collected in full before the metadata cache: serve their stored
+    # metadata, with counters left stale so they are refreshed in the background
+    ("videos", "metadata_at"): (
+        "UPDATE videos SET metadata_at = COALESCE(collected_at, updated_at) "
+        "WHERE status = 'done' AND title IS NOT NULL"
+    ),
+    # Miner cursors saved before this column were rowids
+    ("videos", "transcript_seq"): (
+        "UPDATE videos SET transcript_seq = rowid WHERE transcript_text IS NOT NULL AND transcript_text != ''"
+    ),
+}
+
+# Indexes on added columns; created after the migration
+_INDEX_SQL = """
+-- Cursor for corpus miners (get_transcripts_after)
+CREATE INDEX IF NOT EXISTS idx_videos_transcript_seq ON videos(transcript_seq);
+-- Orders get_comments by likes (rows are still read from the table for the
+-- text) and answers the per-video sentiment/noise aggregates on its own
+CREATE INDEX IF NOT EXISTS idx_comments_video_likes ON comments(video_id, like_count DESC, sentiment, is_noise);
+DROP INDEX IF EXISTS idx_comments_video;
+"""
+
+# Top-liked comment ids kept in comment_stats
+_STATS_TOP_COMMENTS = 50
+
+# Bound on host parameters per IN (...) query
+_IN_CHUNK = 500
+
+# Video columns holding JSON; encoded on write, decoded on read
+_JSON_VIDEO_COLUMNS = ("timed_segments", "chapters")
+
+
 class SQLiteStorage(BaseStorage):
     """SQLite-based storage."""
 
@@ -74,8 +229,19 @@ class SQLiteStorage(BaseStorage):
         self._db = await aiosqlite.connect(self.db_path)
         self._db.row_factory = aiosqlite.Row
         await self._db.executescript(INIT_SQL)
+        await self._migrate()
+        await self._db.executescript(_INDEX_SQL)
         await self._db.commit()
 
+    async def _migrate(self) -> None:
+        for table, column, col_type in _ADDED_COLUMNS:
+            async with self._db.execute(f"PRAGMA table_info({table})") as cur:
+                existing = {row["name"] async for row in cur}
+            if column not in existing:
+                await self._db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {col_type}")
+                if (table, column) in _BACKFILL_SQL:
+                    await self._db.execute(_BACKFILL_SQL[(table, column)])
+
     async def close(self) -> None:
         if self._db:
             await self._db.close()
@@ -90,12 +256,27 @@ class SQLiteStorage(BaseStorage):
     async def get_video(self, video_id: str) -> Optional[dict]:
         async with self.db.execute("SELECT * FROM videos WHERE video_id = ?", (video_id,)) as cur:
             row = await cur.fetchone()
-            return dict(row) if row else None
+        if not row:
+            return None
+        video = dict(row)
+        for col in _JSON_VIDEO_COLUMNS:
+            if video.get(col):
+                video[col] = json.loads(video[col])
+        return video
 
     async def upsert_video(self, data: dict) -> None:
+        data = dict(data)
+        for col in _JSON_VIDEO_COLUMNS:
+            if data.get(col) is not None and not isinstance(data[col], str):
+                data[col] = json.dumps(data[col], ensure_ascii=False)
         vid = data["video_id"]
         existing = await self.get_video(vid)
         now = datetime.now(timezone.utc).isoformat()
+        if data.get("transcript_text") and not (existing and existing.get("transcript_text")):
+            # First transcript for this video, whether the row is new or not:
+            # queue it for corpus miners
+            async with self.db.execute("SELECT COALESCE(MAX(transcript_seq), 0) + 1 FROM videos") as cur:
+                data["transcript_seq"] = (await cur.fetchone())[0]
         if existing:
             # Update only provided fields
             sets = []
@@ -115,6 +296,14 @@ class SQLiteStorage(BaseStorage):
             cols = ", ".join(data.keys())
             placeholders = ", ".join("?" for _ in data)
             await self.db.execute(f"INSERT INTO videos ({cols}) VALUES ({placeholders})", list(data.values()))
+        # Mentions copy these for the (entity, published_at) index; they may
+        # have been indexed before the metadata was saved
+        mention_cols = [k for k in ("channel_id", "published_at") if k in data]
+        if mention_cols:
+            await self.db.execute(
+                f"UPDATE entity_mentions SET {', '.join(f'{k} = ?' for k in mention_cols)} WHERE video_id = ?",
+                [*(data[k] for k in mention_cols), vid],
+            )
         await self.db.commit()
 
     async def search_transcripts(self, query: str, limit: int = 10) -> list[dict]:
@@ -136,6 +325,181 @@ class SQLiteStorage(BaseStorage):
                 results.append(row_dict)
         return results
 
+    async def get_summary_state(self, video_id: str) -> Optional[dict]:
+        async with self.db.execute("SELECT * FROM summary_states WHERE video_id = ?", (video_id,)) as cur:
+            row = await cur.fetchone()
+        if not row:
+            return None
+        return {
+            "offset": row["processed_offset"],
+            "anchor": row["anchor"] or "",
+            "partials": json.loads(row["partials"] or "[]"),
+            "summary": row["summary"] or "",
+            "increments": row["increments"],
+        }
+
+    async def save_summary_state(self, video_id: str, state: dict) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        await self.db.execute(
+            "INSERT OR REPLACE INTO summary_states "
+            "(video_id, processed_offset, anchor, partials, summary, increments, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                video_id, state.get("offset", 0), state.get("anchor", ""),
+                json.dumps(state.get("partials", []), ensure_ascii=False),
+                state.get("summary", ""), state.get("increments", 0), now,
+            ),
+        )
+        await self.db.commit()
+
+    # --- Entity index ---
+
+    async def save_entity_mentions(self, video_id: str, mentions: list[dict]) -> None:
+        video = await self.get_video(video_id) or {}
+        now = datetime.now(timezone.utc).isoformat()
+        await self.db.execute("DELETE FROM entity_mentions WHERE video_id = ?", (video_id,))
+        await self.db.executemany(
+            "INSERT OR REPLACE INTO entity_mentions "
+            "(entity, entity_type, video_id, mention_count, first_offset, channel_id, published_at, indexed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    m["name"], m.get("type"), video_id, m.get("count", 0), m.get("first_offset"),
+                    video.get("channel_id"), video.get("published_at"), now,
+                )
+                for m in mentions
+            ],
+        )
+        await self.db.commit()
+
+    async def get_video_entities(self, video_id: str) -> list[dict]:
+        async with self.db.execute(
+            "SELECT entity, entity_type, mention_count, first_offset FROM entity_mentions "
+            "WHERE video_id = ? ORDER BY mention_count DESC",
+            (video_id,),
+        ) as cur:
+            return [dict(row) async for row in cur]
+
+    async def find_videos_by_entities(
+        self,
+        entities: list[str],
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        channel_id: Optional[str] = None,
+        limit: int = 20,
+    ) -> list[dict]:
+        if not entities:
+            return []
+        entities = list(dict.fromkeys(entities))
+        # Walk the (entity, published_at) index of the first entity newest-first
+        # and probe the primary key for the others, so LIMIT stops the scan early.
+        where = ["m.entity = ?"]
+        params: list = [entities[0]]
+        for other in entities[1:]:
+            where.append(
+                "EXISTS (SELECT 1 FROM entity_mentions o WHERE o.entity = ? AND o.video_id = m.video_id)"
+            )
+            params.append(other)
+        if since:
+            where.append("m.published_at >= ?")
+            params.append(since)
+        if until:
+            where.append("m.published_at < ?")
+            params.append(until)
+        if channel_id:
+            where.append("m.channel_id = ?")
+            params.append(channel_id)
+        sql = f"""
+            SELECT m.video_id, v.title, v.channel_name, m.channel_id, m.published_at
+            FROM entity_mentions m
+            LEFT JOIN videos v ON v.video_id = m.video_id
+            WHERE {' AND '.join(where)}
+            ORDER BY m.published_at DESC
+            LIMIT ?
+        """
+        params.append(limit)
+        async with self.db.execute(sql, params) as cur:
+            results = [dict(row) async for row in cur]
+        if not results:
+            return results
+
+        by_video = {r["video_id"]: r for r in results}
+        for r in results:
+            r["mentions"] = {}
+            r["total_mentions"] = 0
+        async with self.db.execute(
+            f"SELECT entity, video_id, mention_count FROM entity_mentions "
+            f"WHERE entity IN ({', '.join('?' for _ in entities)}) "
+            f"AND video_id IN ({', '.join('?' for _ in by_video)})",
+            [*entities, *by_video],
+        ) as cur:
+            async for row in cur:
+                r = by_video[row["video_id"]]
+                r["mentions"][row["entity"]] = row["mention_count"]
+                r["total_mentions"] += row["mention_count"]
+        return results
+
+    # --- Topic segments ---
+
+    async def get_topic_segments(self, video_id: str, method: str) -> list[dict]:
+        async with self.db.execute(
+            "SELECT segment, char_start, char_end, text, start_time, end_time, topic, chapter, confidence, "
+            "transcript_hash, version FROM topic_segments WHERE video_id = ? AND method = ? ORDER BY segment",
+            (video_id, method),
+        ) as cur:
+            return [dict(row) async for row in cur]
+
+    async def save_topic_segments(
+        self, video_id: str, method: str, transcript_hash: str, version: int, segments: list[dict],
+    ) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        await self.db.execute(
+            "DELETE FROM topic_segments WHERE video_id = ? AND method = ?", (video_id, method),
+        )
+        await self.db.executemany(
+            "INSERT INTO topic_segments "
+            "(video_id, method, segment, char_start, char_end, text, start_time, end_time, topic, chapter, "
+            "confidence, transcript_hash, version, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    video_id, method, s["segment"], s.get("char_start") or 0, s.get("char_end") or 0,
+                    s.get("text"), s.get("start"), s.get("end"), s.get("topic"), s.get("chapter"), s.get("confidence"),
+                    transcript_hash, version, now,
+                )
+                for s in segments
+            ],
+        )
+        await self.db.commit()
+
+    async def get_transcripts_after(self, cursor: int, limit: int = 200) -> list[dict]:
+        async with self.db.execute(
+            "SELECT transcript_seq, video_id, transcript_text FROM videos "
+            "WHERE transcript_seq > ? AND transcript_text IS NOT NULL AND transcript_text != '' "
+            "ORDER BY transcript_seq LIMIT ?",
+            (cursor, limit),
+        ) as cur:
+            return [dict(row) async for row in cur]
+
+    async def get_miner_state(self, name: str) -> Optional[dict]:
+        async with self.db.execute(
+            "SELECT cursor, state, updated_at FROM miner_states WHERE name = ?", (name,)
+        ) as cur:
+            row = await cur.fetchone()
+        return dict(row) if row else None
+
+    async def save_miner_state(self, name: str, cursor: int, state: bytes) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        await self.db.execute(
+            "INSERT OR REPLACE INTO miner_states (name, cursor, state, updated_at) VALUES (?, ?, ?, ?)",
+            (name, cursor, state, now),
+        )
+        await self.db.commit()
+
+    async def delete_miner_state(self, name: str) -> None:
+        await self.db.execute("DELETE FROM miner_states WHERE name = ?", (name,))
+        await self.db.commit()
+
     # --- Channels ---
 
     async def get_channel(self, channel_id: str) -> Optional[dict]:
@@ -181,21 +545,196 @@ class SQLiteStorage(BaseStorage):
 
     # --- Comments ---
 
-    async def save_comments(self, video_id: str, comments: list[dict]) -> None:
-        for c in comments:
-            await self.db.execute(
-                "INSERT OR IGNORE INTO comments (video_id, comment_id, author, text, like_count) VALUES (?, ?, ?, ?, ?)",
-                (video_id, c.get("comment_id", ""), c.get("author", ""), c.get("text", ""), c.get("like_count", 0)),
-            )
+    async def save_comments(self, video_id: str, comments: list[dict]) -> list[dict]:
+        ids = [c.get("comment_id", "") for c in comments]
+        seen: set[str] = set()
+        for i in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[i:i + _IN_CHUNK]
+            async with self.db.execute(
+                f"SELECT comment_id FROM comments WHERE comment_id IN ({', '.join('?' * len(chunk))})", chunk,
+            ) as cur:
+                seen.update(row["comment_id"] for row in await cur.fetchall())
+        new = []
+        for c, cid in zip(comments, ids):
+            if cid not in seen:
+                seen.add(cid)
+                new.append(c)
+        await self.db.executemany(
+            "INSERT OR IGNORE INTO comments (video_id, comment_id, author, text, like_count, sentiment, is_noise) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    video_id, c.get("comment_id", ""), c.get("author", ""), c.get("text", ""),
+                    c.get("like_count", 0), c.get("sentiment"), int(bool(c.get("is_noise"))),
+                )
+                for c in new
+            ],
+        )
         await self.db.commit()
+        return new
 
     async def get_comments(self, video_id: str, limit: int = 20) -> list[dict]:
+        # idx_comments_video_likes gives the order; each row is read from the table
         async with self.db.execute(
             "SELECT * FROM comments WHERE video_id = ? ORDER BY like_count DESC LIMIT ?",
             (video_id, limit),
         ) as cur:
             return [dict(row) async for row in cur]
 
+    async def count_comment_sentiments(self, video_id: str, include_noise: bool = False) -> dict[str, int]:
+        # Answered from idx_comments_video_likes alone
+        sql = "SELECT sentiment, COUNT(*) AS n FROM comments WHERE video_id = ?"
+        if not include_noise:
+            sql += " AND is_noise = 0"
+        async with self.db.execute(sql + " GROUP BY sentiment", (video_id,)) as cur:
+            return {row["sentiment"]: row["n"] async for row in cur}
+
+    async def get_comment_ids(self, video_id: str) -> set[str]:
+        async with self.db.execute("SELECT comment_id FROM comments WHERE video_id = ?", (video_id,)) as cur:
+            return {row["comment_id"] async for row in cur}
+
+    async def update_comment_likes(self, video_id: str, likes: dict[str, int]) -> None:
+        await self.db.executemany(
+            "UPDATE comments SET like_count = ? WHERE video_id = ? AND comment_id = ?",
+            [(count, video_id, cid) for cid, count in likes.items()],
+        )
+        # Likes can drop as well as rise, so the top list is re-read from the index
+        async with self.db.execute(
+            "SELECT comment_id, like_count FROM comments WHERE video_id = ? AND is_noise = 0 "
+            "ORDER BY like_count DESC LIMIT ?",
+            (video_id, _STATS_TOP_COMMENTS),
+        ) as cur:
+            top = [[row["comment_id"], row["like_count"]] async for row in cur]
+        await self.db.execute(
+            "UPDATE comment_stats SET top_comments = ? WHERE video_id = ?", (json.dumps(top), video_id),
+        )
+        await self.db.commit()
+
+    async def get_comment_stats(self, video_id: str, top_n: int = 10, keyword_limit: int = 15) -> Optional[dict]:
+        async with self.db.execute("SELECT * FROM comment_stats WHERE video_id = ?", (video_id,)) as cur:
+            row = await cur.fetchone()
+        if not row:
+            return None
+        top_ids = [cid for cid, _ in json.loads(row["top_comments"] or "[]")[:top_n]]
+        by_id: dict[str, dict] = {}
+        if top_ids:
+            async with self.db.execute(
+                "SELECT comment_id, author, text, like_count, sentiment FROM comments "
+                f"WHERE comment_id IN ({', '.join('?' * len(top_ids))})",
+                top_ids,
+            ) as cur:
+                by_id = {r["comment_id"]: dict(r) async for r in cur}
+        async with self.db.execute(
+            "SELECT word, count FROM comment_keywords WHERE video_id = ? ORDER BY count DESC LIMIT ?",
+            (video_id, keyword_limit),
+        ) as cur:
+            keywords = [{"word": r["word"], "count": r["count"]} async for r in cur]
+        return {
+            "video_id": video_id,
+            "count": row["comment_count"],
+            "sentiments": {"positive": row["positive"], "negative": row["negative"], "neutral": row["neutral"]},
+            "keywords": keywords,
+            "top_comments": [by_id[cid] for cid in top_ids if cid in by_id],
+            "updated_at": row["updated_at"],
+        }
+
+    async def update_comment_stats(self, video_id: str, delta: dict) -> None:
+        async with self.db.execute("SELECT top_comments FROM comment_stats WHERE video_id = ?", (video_id,)) as cur:
+            row = await cur.fetchone()
+        top = dict(json.loads(row["top_comments"] or "[]")) if row else {}
+        for c in delta.get("top", []):
+            top[c["comment_id"]] = c.get("like_count") or 0
+        ranked = sorted(top.items(), key=lambda kv: kv[1], reverse=True)[:_STATS_TOP_COMMENTS]
+        sentiments = delta.get("sentiments", {})
+        await self.db.execute(
+            """INSERT INTO comment_stats
+               (video_id, comment_count, positive, negative, neutral, top_comments, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(video_id) DO UPDATE SET
+                 comment_count = comment_count + excluded.comment_count,
+                 positive = positive + excluded.positive,
+                 negative = negative + excluded.negative,
+                 neutral = neutral + excluded.neutral,
+                 top_comments = excluded.top_comments,
+                 updated_at = excluded.updated_at""",
+            (
+                video_id, delta.get("count", 0), sentiments.get("positive", 0), sentiments.get("negative", 0),
+                sentiments.get("neutral", 0), json.dumps([list(kv) for kv in ranked]),
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+        await self.db.executemany(
+            "INSERT INTO comment_keywords (video_id, word, count) VALUES (?, ?, ?) "
+            "ON CONFLICT(video_id, word) DO UPDATE SET count = count + excluded.count",
+            [(video_id, word, n) for word, n in delta.get("keywords", {}).items()],
+        )
+        await self.db.commit()
+
+    async def get_comment_buckets(self, video_id: str, buckets: list[int]) -> dict[int, tuple[str, bytes]]:
+        found: dict[int, tuple[str, bytes]] = {}
+        for i in range(0, len(buckets), _IN_CHUNK):
+            chunk = buckets[i:i + _IN_CHUNK]
+            async with self.db.execute(
+                "SELECT b.bucket, b.comment_id, s.signature FROM comment_lsh_buckets b "
+                "JOIN comment_signatures s ON s.video_id = b.video_id AND s.comment_id = b.comment_id "
+                f"WHERE b.video_id = ? AND b.bucket IN ({', '.join('?' * len(chunk))})",
+                [video_id, *chunk],
+            ) as cur:
+                for row in await cur.fetchall():
+                    found[row["bucket"]] = (row["comment_id"], bytes(row["signature"]))
+        return found
+
+    async def save_comment_signatures(self, video_id: str, signatures: list[dict], buckets: dict[int, str]) -> None:
+        await self.db.executemany(
+            "INSERT OR IGNORE INTO comment_signatures (video_id, comment_id, signature, representative, copies) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(video_id, s["comment_id"], s["signature"], s["representative"], s.get("copies", 1)) for s in signatures],
+        )
+        await self.db.executemany(
+            "INSERT OR IGNORE INTO comment_lsh_buckets (video_id, bucket, comment_id) VALUES (?, ?, ?)",
+            [(video_id, bucket, cid) for bucket, cid in buckets.items()],
+        )
+        await self.db.executemany(
+            "UPDATE comments SET is_noise = 1 WHERE video_id = ? AND comment_id = ?",
+            [(video_id, s["comment_id"]) for s in signatures if s["representative"] != s["comment_id"]],
+        )
+        await self.db.commit()
+
+    async def get_comment_clusters(self, video_id: str, limit: int = 5) -> list[dict]:
+        async with self.db.execute(
+            """SELECT s.representative AS comment_id, SUM(s.copies) AS count, c.author, c.text
+               FROM comment_signatures s
+               LEFT JOIN comments c ON c.comment_id = s.representative
+               WHERE s.video_id = ?
+               GROUP BY s.representative
+               HAVING SUM(s.copies) > 1
+               ORDER BY count DESC
+               LIMIT ?""",
+            (video_id, limit),
+        ) as cur:
+            return [dict(row) async for row in cur]
+
+    async def get_comment_sync(self, video_id: str) -> Optional[dict]:
+        async with self.db.execute(
+            "SELECT newest_comment_id, newest_timestamp, synced_at, likes_refreshed_at "
+            "FROM comment_sync WHERE video_id = ?",
+            (video_id,),
+        ) as cur:
+            row = await cur.fetchone()
+        return dict(row) if row else None
+
+    async def save_comment_sync(self, video_id: str, state: dict) -> None:
+        cols = [c for c in ("newest_comment_id", "newest_timestamp", "synced_at", "likes_refreshed_at") if c in state]
+        if not cols:
+            return
+        updates = ", ".join(f"{c} = excluded.{c}" for c in cols)
+        await self.db.execute(
+            f"INSERT INTO comment_sync (video_id, {', '.join(cols)}) VALUES (?{', ?' * len(cols)}) "
+            f"ON CONFLICT(video_id) DO UPDATE SET {updates}",
+            [video_id] + [state[c] for c in cols],
+        )
+        await self.db.commit()
+
 
 def _extract_snippet(text: str, query: str, context_chars: int = 150) -> str:
     """Extract a snippet around the first occurrence of query in text."""
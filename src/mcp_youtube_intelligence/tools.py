@@ -6,30 +6,58 @@ import logging
 from typing import Any
 
 from .config import Config
-from .core import collector, comments, transcript, monitor, segmenter, entities, summarizer, search, playlist, report
+from .core import collector, comments, transcript, monitor, segmenter, entities, summarizer, search, playlist, report, document, hierarchy, metadata_cache, youtube_api, acquire
+from .core.candidates import CandidateMiner
 from .storage.base import BaseStorage
 
 logger = logging.getLogger(__name__)
 
 
 async def get_video(video_id: str, *, config: Config, storage: BaseStorage) -> dict:
-    """Get video metadata + summary (~300 tokens). Collects if not cached."""
+    """Get video metadata + summary (~300 tokens). Collects if not cached.
+
+    Stored metadata is served without calling yt-dlp; view/like/comment
+    counts older than the configured TTL are refreshed in the background.
+    A video with neither metadata nor transcript stored gets both from one
+    yt-dlp run.
+    """
+    import asyncio
+
     # Check cache first
     cached = await storage.get_video(video_id)
-    if cached and cached.get("status") == "done":
-        return _compact_video(cached)
+    tr = None
+    if not (cached and cached.get("status") == "done") and acquire.metadata_needs_extraction(cached):
+        acquired = await asyncio.to_thread(acquire.acquire_video, video_id, yt_dlp=config.yt_dlp_path)
+        meta, tr = acquired["metadata"], acquired["transcript"]
+        if meta:
+            await storage.upsert_video(metadata_cache.stamp(meta))
+    else:
+        meta = await metadata_cache.get_metadata(
+            video_id, storage, yt_dlp=config.yt_dlp_path, counters_ttl_hours=config.metadata_counters_ttl_hours,
+        )
+        if cached and cached.get("status") == "done":
+            return _compact_video({**cached, **(meta or {})})
 
-    # Fetch metadata
-    meta = collector.get_video_metadata(video_id, yt_dlp=config.yt_dlp_path)
     if not meta:
         return {"error": f"Could not fetch metadata for {video_id}"}
+    return await _collect_video(video_id, meta, config=config, storage=storage, tr=tr)
+
+
+async def _collect_video(
+    video_id: str, meta: dict, *, config: Config, storage: BaseStorage, tr: dict | None = None,
+) -> dict:
+    """Transcribe, summarize and store a video whose metadata is already fetched.
 
+    *tr* is a transcript already fetched with the metadata, if any.
+    """
     # Fetch transcript
-    tr = transcript.fetch_transcript(video_id)
+    if tr is None:
+        tr = transcript.fetch_transcript(video_id)
     cleaned = transcript.clean_transcript(tr.get("best", ""))
+    doc = document.for_video(video_id, cleaned, tr.get("timed_segments"))
 
     # Summarize
-    summary = await summarizer.summarize(cleaned, config=config)
+    summary = await summarizer.summarize(cleaned, config=config, doc=doc)
 
     # Save to storage
     await storage.upsert_video({
@@ -38,9 +66,11 @@ async def get_video(video_id: str, *, config: Config, storage: BaseStorage) -> d
         "transcript_text": cleaned,
         "transcript_lang": tr.get("lang"),
         "transcript_length": len(cleaned),
+        "timed_segments": tr.get("timed_segments") or None,
         "summary": summary,
         "status": "done",
     })
+    await _index_entities(video_id, cleaned, config=config, storage=storage)
 
     result = {**meta, "summary": summary, "transcript_length": len(cleaned)}
     # Strip heavy fields
@@ -52,22 +82,31 @@ async def get_transcript(
     video_id: str, mode: str = "summary", llm_provider: str | None = None,
     *, config: Config, storage: BaseStorage,
 ) -> dict:
-    """Get transcript. mode: summary (default), full (file path), chunks (segmented)."""
+    """Get transcript. mode: summary (default), full (file path), chunks (segmented),
+    incremental (rolling summary of a growing/live transcript)."""
+    if mode == "incremental":
+        return await _incremental_summary(video_id, llm_provider, config=config, storage=storage)
+
     cached = await storage.get_video(video_id)
     text = None
+    timed = None
     if cached:
         text = cached.get("transcript_text")
+        timed = cached.get("timed_segments")
 
     if not text:
         tr = transcript.fetch_transcript(video_id)
         text = transcript.clean_transcript(tr.get("best", ""))
+        timed = tr.get("timed_segments")
         if text:
             await storage.upsert_video({
                 "video_id": video_id,
                 "transcript_text": text,
                 "transcript_lang": tr.get("lang"),
                 "transcript_length": len(text),
+                "timed_segments": tr.get("timed_segments") or None,
             })
+            await _index_entities(video_id, text, config=config, storage=storage)
 
     if not text:
         return {"error": f"No transcript available for {video_id}"}
@@ -79,13 +118,54 @@ async def get_transcript(
         chunks = transcript.make_chunks(text)
         return {"video_id": video_id, "mode": "chunks", "chunk_count": len(chunks), "chunks": chunks}
     else:  # summary
-        summary = await summarizer.summarize(text, config=config, provider=llm_provider)
+        doc = document.for_video(video_id, text, timed)
+        summary = await summarizer.summarize(text, config=config, provider=llm_provider, doc=doc)
         return {"video_id": video_id, "mode": "summary", "summary": summary, "char_count": len(text)}
 
 
+async def _incremental_summary(
+    video_id: str, llm_provider: str | None, *, config: Config, storage: BaseStorage,
+) -> dict:
+    """Summarize only the transcript tail added since the last call (live streams)."""
+    # A live transcript keeps growing, so always refetch instead of using the cache
+    tr = transcript.fetch_transcript(video_id)
+    text = transcript.clean_transcript(tr.get("best", ""))
+    if not text:
+        return {"error": f"No transcript available for {video_id}"}
+
+    cached = await storage.get_video(video_id)
+    # Flush the trailing fragment once a stream has ended
+    final = bool(cached and cached.get("was_live") and not cached.get("is_live"))
+    state = await storage.get_summary_state(video_id)
+    state = await summarizer.summarize_incremental(
+        text, state, config=config, provider=llm_provider, final=final,
+    )
+    await storage.save_summary_state(video_id, state)
+    await storage.upsert_video({
+        "video_id": video_id,
+        "transcript_text": text,
+        "transcript_lang": tr.get("lang"),
+        "transcript_length": len(text),
+        "timed_segments": tr.get("timed_segments") or None,
+        "summary": state["summary"],
+    })
+    if state["new_chars"]:
+        await _index_entities(video_id, text, config=config, storage=storage)
+    return {
+        "video_id": video_id,
+        "mode": "incremental",
+        "summary": state["summary"],
+        "char_count": len(text),
+        "processed_chars": state["offset"],
+        "new_chars": state["new_chars"],
+        "increments": state["increments"],
+    }
+
+
 async def get_comments(
     video_id: str, top_n: int = 10, summarize: bool = False,
     sort: str = "top", sentiment: str = "all", filter_noise: bool = True,
+    sync: bool = False,
     *, config: Config, storage: BaseStorage
 ) -> dict:
     """Get top N comments, optionally summarized.
@@ -94,7 +174,14 @@ async def get_comments(
         sort: "top" (likes) or "newest".
         sentiment: "all", "positive", or "negative".
         filter_noise: Remove spam/short/emoji-only comments.
+        sync: Fetch only comments newer than the last sync (and refresh like
+            counts when due), then answer from the stored comments by likes.
     """
+    if sync:
+        return await _synced_comments(
+            video_id, top_n, summarize, sentiment, filter_noise, config=config, storage=storage,
+        )
+
     raw = comments.fetch_comments(
         video_id,
         max_comments=config.max_comments,
@@ -104,7 +191,7 @@ async def get_comments(
         yt_dlp=config.yt_dlp_path,
     )
     if raw:
-        await storage.save_comments(video_id, raw)
+        await comments.store_comments(video_id, raw, storage)
 
     result_comments = raw[:top_n]
 
@@ -119,11 +206,45 @@ async def get_comments(
     return {"video_id": video_id, "count": len(comment_list), "comments": comment_list}
 
 
+async def _synced_comments(
+    video_id: str, top_n: int, summarize: bool, sentiment: str, filter_noise: bool,
+    *, config: Config, storage: BaseStorage
+) -> dict:
+    sync = await comments.sync_comments(
+        video_id, storage, filter_noise=filter_noise, yt_dlp=config.yt_dlp_path,
+        likes_refresh_hours=config.comment_likes_refresh_hours,
+    )
+    if summarize and sentiment == "all":
+        summary = await comments.stored_summary(video_id, storage, top_n=top_n)
+        if summary is not None:
+            return {**summary, **sync}
+    stored = await storage.get_comments(video_id, limit=max(top_n, config.max_comments) * 3)
+    for c in stored:
+        c["sentiment"] = comments.comment_sentiment(c)
+    if sentiment != "all":
+        stored = [c for c in stored if c["sentiment"] == sentiment]
+    result_comments = stored[:top_n]
+
+    if summarize:
+        return {**comments.summarize_comments(result_comments, top_n=top_n), **sync}
+
+    comment_list = [
+        {"author": c.get("author", ""), "text": c.get("text", ""),
+         "likes": c.get("like_count", 0), "sentiment": c["sentiment"]}
+        for c in result_comments
+    ]
+    return {**sync, "count": len(comment_list), "comments": comment_list}
+
+
 async def monitor_channel(
-    channel_ref: str, action: str = "check",
+    channel_ref: str, action: str = "check", concurrency: int | None = None,
     *, config: Config, storage: BaseStorage
 ) -> dict:
-    """Monitor a YouTube channel. action: add, check, list, remove."""
+    """Monitor a YouTube channel. action: add, check, list, remove, sweep.
+
+    ``sweep`` checks every enabled channel (channel_ref is ignored),
+    *concurrency* (default: config) at a time.
+    """
     if action == "add":
         info = collector.get_channel_info(channel_ref, yt_dlp=config.yt_dlp_path)
         await storage.upsert_channel({
@@ -143,13 +264,18 @@ async def monitor_channel(
             channel_id = info["channel_id"]
         else:
             channel_id = ch["channel_id"]
-        new_videos = await monitor.check_channel_new_videos(channel_id, storage)
+        new_videos = await monitor.check_channel_new_videos(channel_id, storage, yt_dlp=config.yt_dlp_path)
         return {"channel_id": channel_id, "new_videos": new_videos}
 
     elif action == "list":
         channels = await storage.list_channels()
         return {"channels": channels}
 
+    elif action == "sweep":
+        return await monitor.sweep_channels(
+            storage, yt_dlp=config.yt_dlp_path, concurrency=concurrency or config.monitor_concurrency,
+        )
+
     elif action == "remove":
         ch = await storage.get_channel(channel_ref)
         if ch:
@@ -169,9 +295,17 @@ async def search_transcripts(
 
 
 async def extract_entities_tool(
-    video_id: str, *, config: Config, storage: BaseStorage
+    video_id: str, mode: str = "counts", entity: str | None = None,
+    *, config: Config, storage: BaseStorage
 ) -> dict:
-    """Extract entities from a video's transcript."""
+    """Extract entities from a video's transcript.
+
+    mode: "counts" (default) or "timeline" (mention timestamps + per-minute
+    histogram per entity, optionally narrowed to one *entity*).
+    """
+    if mode == "timeline":
+        return await _entity_timeline(video_id, entity, config=config, storage=storage)
+
     cached = await storage.get_video(video_id)
     text = cached.get("transcript_text") if cached else None
 
@@ -182,28 +316,222 @@ async def extract_entities_tool(
     if not text:
         return {"error": f"No transcript available for {video_id}"}
 
-    found = entities.extract_entities(text)
+    found = await _index_entities(video_id, text, config=config, storage=storage)
     return {"video_id": video_id, "entity_count": len(found), "entities": found}
 
 
-async def segment_topics(
-    video_id: str, *, config: Config, storage: BaseStorage
+async def _entity_timeline(
+    video_id: str, entity: str | None, *, config: Config, storage: BaseStorage
 ) -> dict:
-    """Segment a video transcript into topics."""
     cached = await storage.get_video(video_id)
-    text = cached.get("transcript_text") if cached else None
+    timed = cached.get("timed_segments") if cached else None
+    if not timed:
+        tr = transcript.fetch_transcript(video_id)
+        timed = tr.get("timed_segments") or []
+        if timed:
+            await storage.upsert_video({"video_id": video_id, "timed_segments": timed})
+    if not timed:
+        return {"error": f"No timed transcript available for {video_id}"}
+
+    entities.ensure_dictionaries(config.entity_dict_dir)
+    timeline = entities.entity_timeline(timed)
+    if entity:
+        wanted = entities.resolve_entity_name(entity)
+        timeline = [e for e in timeline if e["name"] == wanted]
+    return {"video_id": video_id, "mode": "timeline", "entity_count": len(timeline), "entities": timeline}
+
+
+async def _index_entities(
+    video_id: str, text: str, *, config: Config, storage: BaseStorage
+) -> list[dict]:
+    """Extract entities from a transcript and record them in the entity index."""
+    entities.ensure_dictionaries(config.entity_dict_dir)
+    found = entities.extract_entities(text)
+    await storage.save_entity_mentions(video_id, found)
+    return found
 
-    if not text:
+
+async def find_videos_by_entity(
+    entity_names: list[str],
+    since: str | None = None,
+    until: str | None = None,
+    channel_id: str | None = None,
+    limit: int = 20,
+    *,
+    config: Config,
+    storage: BaseStorage,
+) -> dict:
+    """Find stored videos that mention all given entities (keywords or canonical names)."""
+    entities.ensure_dictionaries(config.entity_dict_dir)
+    resolved = [entities.resolve_entity_name(e) for e in entity_names if e.strip()]
+    results = await storage.find_videos_by_entities(
+        resolved, since=since, until=until, channel_id=channel_id, limit=limit,
+    )
+    return {"entities": resolved, "count": len(results), "results": results}
+
+
+async def reload_entity_dictionaries(
+    force_rebuild: bool = False, *, config: Config, storage: BaseStorage
+) -> dict:
+    """Reload entity dictionary files from the data dir without restarting."""
+    return entities.load_dictionaries(config.entity_dict_dir, force_rebuild=force_rebuild)
+
+
+_CANDIDATE_MINER = "entity_candidates"
+
+
+async def mine_entity_candidates(
+    limit: int = 20,
+    min_count: int = 3,
+    reset: bool = False,
+    batch_size: int = 200,
+    *,
+    config: Config,
+    storage: BaseStorage,
+) -> dict:
+    """Count unknown-entity candidates in transcripts stored since the last run
+    and return the most frequent ones for review."""
+    import asyncio
+
+    entities.ensure_dictionaries(config.entity_dict_dir)
+    saved = None
+    if reset:
+        await storage.delete_miner_state(_CANDIDATE_MINER)
+    else:
+        saved = await storage.get_miner_state(_CANDIDATE_MINER)
+    miner = CandidateMiner.from_bytes(saved["state"]) if saved else CandidateMiner()
+    cursor = saved["cursor"] if saved else 0
+
+    scanned = 0
+    while True:
+        rows = await storage.get_transcripts_after(cursor, limit=batch_size)
+        if not rows:
+            break
+        # CPU-bound counting runs off the event loop
+        await asyncio.to_thread(miner.add_texts, [r["transcript_text"] for r in rows])
+        cursor = rows[-1]["transcript_seq"]
+        scanned += len(rows)
+        await storage.save_miner_state(_CANDIDATE_MINER, cursor, miner.to_bytes())
+
+    candidates = miner.top(limit, min_count=min_count)
+    return {
+        "scanned_videos": scanned,
+        "total_videos": miner.documents,
+        "count": len(candidates),
+        "candidates": candidates,
+    }
+
+
+async def promote_entity_candidate(
+    keyword: str,
+    entity_type: str,
+    name: str | None = None,
+    *,
+    config: Config,
+    storage: BaseStorage,
+) -> dict:
+    """Add a mined candidate to the custom entity dictionary and reload the matcher."""
+    try:
+        path = entities.add_dictionary_entry(config.entity_dict_dir, keyword, entity_type, name)
+    except ValueError as e:
+        return {"error": str(e)}
+    status = entities.load_dictionaries(config.entity_dict_dir)
+    return {
+        "promoted": {"keyword": keyword.strip(), "type": entity_type.strip(), "name": (name or keyword).strip()},
+        "file": str(path),
+        "keyword_count": status["keyword_count"],
+    }
+
+
+async def segment_topics(
+    video_id: str,
+    method: str = "auto",
+    level: int | None = None,
+    max_segments: int | None = None,
+    *,
+    config: Config,
+    storage: BaseStorage,
+) -> dict:
+    """Segment a video transcript into topics.
+
+    method: auto (default: the video's chapters when known, else markers),
+    chapters, markers, texttiling, or hierarchical. For hierarchical, *level*
+    or *max_segments* selects one flat granularity; without either the whole
+    topic tree is returned (chapters with nested subtopics).
+    """
+    if method not in segmenter.SEGMENT_METHODS:
+        return {"error": f"Unknown method: {method}"}
+    cached = await storage.get_video(video_id) or {}
+    text = cached.get("transcript_text")
+    timed = cached.get("timed_segments")
+    chapters = cached.get("chapters")
+
+    if method == "chapters" and not chapters and not cached.get("title"):
+        # Chapters come with the metadata; fetch it if this video has none stored
+        meta = collector.get_video_metadata(video_id, yt_dlp=config.yt_dlp_path)
+        if meta:
+            await storage.upsert_video(meta)
+            chapters = meta.get("chapters")
+
+    if not text or (chapters and not timed):
         tr = transcript.fetch_transcript(video_id)
-        text = transcript.clean_transcript(tr.get("best", ""))
+        timed = tr.get("timed_segments") or timed
+        if not text:
+            text = transcript.clean_transcript(tr.get("best", ""))
+        if text:
+            await storage.upsert_video({
+                "video_id": video_id,
+                "transcript_text": text,
+                "transcript_lang": tr.get("lang"),
+                "transcript_length": len(text),
+                "timed_segments": timed or None,
+            })
 
     if not text:
         return {"error": f"No transcript available for {video_id}"}
 
-    segments = segmenter.segment_topics(text)
-    # Return without full text for token efficiency
-    compact = [{"segment": s["segment"], "char_count": s["char_count"], "preview": s["text"][:200]} for s in segments]
-    return {"video_id": video_id, "segment_count": len(compact), "segments": compact}
+    doc = document.for_video(video_id, text, timed)
+    if method == "hierarchical" and level is None and max_segments is None:
+        tree = hierarchy.topic_tree(text, timed_segments=timed, doc=doc)
+        return {
+            "video_id": video_id, "method": method, "segment_count": len(tree),
+            "tree": [_compact_node(n) for n in tree],
+        }
+    segments, cached_result = await segmenter.cached_segment_topics(
+        video_id, text, storage, method=method, chapters=chapters, timed_segments=timed, doc=doc,
+        level=level, max_segments=max_segments,
+    )
+    if segments and "chapter" in segments[0]:
+        used = "chapters"
+    elif method in ("auto", "chapters"):
+        used = "markers"
+    else:
+        used = method
+    # Return without full text for token efficiency; char offsets index the stored transcript
+    compact = []
+    for s in segments:
+        item = {"segment": s["segment"], "char_count": s["char_count"], "preview": s["text"][:200]}
+        for key in ("topic", "chapter", "start", "end", "char_start", "char_end", "confidence"):
+            if s.get(key) is not None:
+                item[key] = s[key]
+        compact.append(item)
+    return {
+        "video_id": video_id, "method": used, "segment_count": len(compact),
+        "cached": cached_result, "segments": compact,
+    }
+
+
+def _compact_node(node: dict) -> dict:
+    """Topic tree node without full text; previews only on leaves."""
+    item = {"id": node["id"], "level": node["level"], "char_count": node["char_count"]}
+    for key in ("topic", "start", "end", "char_start", "char_end", "confidence"):
+        if node.get(key) is not None:
+            item[key] = node[key]
+    if node["children"]:
+        item["children"] = [_compact_node(c) for c in node["children"]]
+    else:
+        item["preview"] = node["text"][:120]
+    return item
 
 
 async def search_youtube_tool(
@@ -247,19 +575,42 @@ async def get_playlist_tool(
 async def batch_get_videos(
     video_ids: list[str], *, config: Config, storage: BaseStorage
 ) -> dict:
-    """Process multiple videos in batch with async parallelization (semaphore=3)."""
+    """Process multiple videos in batch with async parallelization (semaphore=3).
+
+    Metadata for every video without stored metadata is fetched up front by
+    one yt-dlp process (or ``videos.list`` calls of 50 ids when a Data API
+    key is set) instead of one fetch per video.
+    """
     import asyncio
     sem = asyncio.Semaphore(3)
 
+    pending = []
+    for vid in dict.fromkeys(video_ids):
+        cached = await storage.get_video(vid)
+        if not (cached and (cached.get("status") == "done" or cached.get("metadata_at"))):
+            pending.append(vid)
+    metas = {}
+    if pending:
+        fetched = await asyncio.to_thread(collector.get_video_metadata_batch, pending, yt_dlp=config.yt_dlp_path)
+        metas = {vid: m if "error" in m else metadata_cache.stamp(m) for vid, m in fetched.items()}
+
     async def _process(vid: str) -> dict:
         async with sem:
             try:
-                return await get_video(vid, config=config, storage=storage)
+                meta = metas.get(vid)
+                if meta is None:
+                    return await get_video(vid, config=config, storage=storage)
+                if "error" in meta:
+                    return {"video_id": vid, "error": f"Could not fetch metadata for {vid}: {meta['error']}"}
+                return await _collect_video(vid, meta, config=config, storage=storage)
             except Exception as e:
                 return {"video_id": vid, "error": str(e)}
 
     results = await asyncio.gather(*[_process(vid) for vid in video_ids])
-    return {"count": len(results), "results": list(results)}
+    out = {"count": len(results), "results": list(results)}
+    if youtube_api.active():
+        out["api_quota"] = youtube_api.quota_usage()
+    return out
 
 
 async def batch_get_transcripts(
@@ -294,11 +645,12 @@ async def generate_report(
         config=config,
         include_comments=include_comments,
         llm_provider=llm_provider,
+        storage=storage,
     )
     return {"video_id": video_id, "report": md}
 
 
 def _compact_video(data: dict) -> dict:
     """Strip heavy fields from a video record for token efficiency."""
-    exclude = {"transcript_text", "description"}
+    exclude = {"transcript_text", "description", "timed_segments"}
     return {k: v for k, v in data.items() if k not in exclude and v is not None}
@@ -0,0 +1,180 @@
+"""Tests for the combined metadata/subtitle/comment acquisition."""
+from __future__ import annotations
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from mcp_youtube_intelligence.core import acquire
+
+_FAKE_YTDLP = """#!{python}
+import json, sys
+args = sys.argv[1:]
+with open({log!r}, "a") as f:
+    f.write(" ".join(args) + "\\n")
+out = args[args.index("-o") + 1]
+vid = args[-1].rsplit("=", 1)[-1]
+if vid.startswith("bad"):
+    print("ERROR: [youtube] " + vid + ": Video unavailable", file=sys.stderr)
+    sys.exit(1)
+base = out.replace("%(id)s", vid).replace(".%(ext)s", "")
+info = {{"id": vid, "title": "T " + vid, "channel": "Chan", "upload_date": "20260101", "duration": 90,
+        "chapters": [{{"start_time": 0, "title": "Intro"}}, {{"start_time": 30, "title": "Main"}}]}}
+with open(base + ".info.json", "w") as f:
+    json.dump(info, f)
+if not vid.startswith("nosubs"):
+    with open(base + ".en.vtt", "w") as f:
+        f.write("WEBVTT\\n\\n00:00:00.000 --> 00:00:02.000\\nhello there\\n\\n00:00:02.000 --> 00:00:04.000\\ngeneral kenobi\\n")
+"""
+
+
+@pytest.fixture
+def fake_ytdlp(tmp_path):
+    log = str(tmp_path / "calls.log")
+    path = tmp_path / "yt-dlp"
+    path.write_text(_FAKE_YTDLP.format(python=sys.executable, log=log))
+    os.chmod(path, 0o755)
+
+    def calls() -> list[str]:
+        if not os.path.exists(log):
+            return []
+        with open(log) as f:
+            return f.read().splitlines()
+
+    return str(path), calls
+
+
+_RAW_COMMENTS = [
+    {"id": "c1", "text": "Great explanation of the topic, thanks", "author": "a", "like_count": 5},
+    {"id": "c2", "text": "Great explanation of the topic, thanks!", "author": "b", "like_count": 1},
+    {"id": "c3", "text": "Could you cover memory packaging next time", "author": "c", "like_count": 2},
+    {"id": "c4", "text": "Never reached: paging stops before this", "author": "d", "like_count": 0},
+]
+
+
+class _FakeExtractor:
+    def __init__(self):
+        self.pulled = 0
+
+    def _get_comments(self, ytcfg, video_id, contents, webpage):
+        for c in _RAW_COMMENTS:
+            self.pulled += 1
+            yield c
+
+
+def _fake_api(ie):
+    """yt_dlp stand-in: one extraction that writes the subtitle file and runs the comment generator."""
+    class YoutubeDL:
+        runs = []
+
+        def __init__(self, opts):
+            self.opts = opts
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def get_info_extractor(self, key):
+            return ie
+
+        def extract_info(self, url, download=True):
+            YoutubeDL.runs.append((url, download, self.opts))
+            vid = url.rsplit("=", 1)[-1]
+            list(ie._get_comments({}, vid, [], ""))
+            base = self.opts["outtmpl"]["default"].replace("%(id)s", vid).replace(".%(ext)s", "")
+            with open(base + ".en.vtt", "w") as f:
+                f.write("WEBVTT\n\n00:00:00.000 --> 00:00:02.000\nhello there\n\n"
+                        "00:00:02.000 --> 00:00:04.000\ngeneral kenobi\n")
+            return {"id": vid, "title": "T " + vid, "channel": "Chan", "upload_date": "20260101", "duration": 90,
+                    "chapters": [{"start_time": 0, "title": "Intro"}, {"start_time": 30, "title": "Main"}]}
+
+    return type("yt_dlp", (), {"YoutubeDL": YoutubeDL})
+
+
+class TestAcquireVideo:
+    def test_one_run_returns_all_three(self, fake_ytdlp):
+        binary, calls = fake_ytdlp
+        ie = _FakeExtractor()
+        api = _fake_api(ie)
+        with patch.object(acquire.comments, "_ytdlp_api", lambda: api):
+            result = acquire.acquire_video("v1", max_comments=2, yt_dlp=binary)
+        # One in-process extraction, processed so the subtitle files are written
+        assert len(api.YoutubeDL.runs) == 1 and not calls()
+        _, download, opts = api.YoutubeDL.runs[0]
+        assert download and opts["skip_download"] and opts["getcomments"] and opts["writeautomaticsub"]
+        meta = result["metadata"]
+        assert meta["title"] == "T v1"
+        assert meta["chapters"][1] == {"title": "Main", "start": 30.0, "end": 90.0}
+        tr = result["transcript"]
+        assert tr["best"] == "hello there general kenobi"
+        assert tr["lang"] == "en_ytdlp"
+        assert tr["timed_segments"][1]["start"] == 2.0
+        assert tr["error"] is None
+        # Filtered as fetch_comments does: the near-duplicate is collapsed
+        assert [c["comment_id"] for c in result["comments"]] == ["c1", "c3"]
+        assert result["comments"][0]["duplicates"] == 1
+        assert result["comments"][0]["sentiment"]
+        # Comment paging stopped once two were kept
+        assert ie.pulled == 3
+
+    def test_comments_skipped_by_default(self, fake_ytdlp):
+        binary, calls = fake_ytdlp
+        result = acquire.acquire_video("v1", yt_dlp=binary)
+        assert result["comments"] is None
+        assert result["metadata"]["title"] == "T v1"
+        assert len(calls()) == 1 and "--write-comments" not in calls()[0]
+
+    def test_no_comments_without_yt_dlp_package(self, fake_ytdlp):
+        binary, calls = fake_ytdlp
+        with patch.object(acquire.comments, "_ytdlp_api", lambda: None):
+            result = acquire.acquire_video("v1", max_comments=5, yt_dlp=binary)
+        assert result["comments"] is None
+        assert result["transcript"]["best"] == "hello there general kenobi"
+        assert len(calls()) == 1
+
+    def test_missing_subtitles_fall_back_to_transcript_api(self, fake_ytdlp):
+        binary, calls = fake_ytdlp
+        api_result = {"best": "from api", "lang": "ko_manual", "timed_segments": [], "error": None}
+        with patch.object(acquire.transcript, "fetch_transcript", return_value=api_result) as fetch:
+            result = acquire.acquire_video("nosubs1", yt_dlp=binary)
+        fetch.assert_called_once_with("nosubs1", ytdlp_fallback=False)
+        assert result["transcript"]["best"] == "from api"
+        assert result["metadata"]["title"] == "T nosubs1"
+        assert len(calls()) == 1
+
+    def test_failed_extraction(self, fake_ytdlp):
+        binary, _ = fake_ytdlp
+        with patch.object(acquire.transcript, "fetch_transcript", return_value={"best": None}):
+            result = acquire.acquire_video("bad1", yt_dlp=binary)
+        assert result["metadata"] is None
+        assert result["comments"] is None
+
+
+class TestMetadataNeedsExtraction:
+    def test_stored_metadata(self):
+        assert acquire.metadata_needs_extraction(None)
+        assert acquire.metadata_needs_extraction({"video_id": "v1"})
+        assert not acquire.metadata_needs_extraction({"video_id": "v1", "metadata_at": "2026-01-01T00:00:00+00:00"})
+
+    def test_data_api_key(self):
+        with patch.object(acquire.youtube_api, "active", return_value=True):
+            assert not acquire.metadata_needs_extraction(None)
+
+
+class TestEngineBackend:
+    def test_calls_share_one_cached_option_set(self):
+        with patch.object(acquire.ytdlp_engine, "active", return_value=True), \
+                patch.object(acquire.ytdlp_engine, "extract", return_value={"id": "v1", "title": "T"}) as extract, \
+                patch.object(acquire.transcript, "fetch_transcript", return_value={"best": None}):
+            acquire.acquire_video("v1")
+            acquire.acquire_video("v2")
+        (_, first), _ = extract.call_args_list[0]
+        (_, second), _ = extract.call_args_list[1]
+        # Each call writes to its own temp dir, which is not part of the instance cache key
+        assert first != second
+        assert acquire.ytdlp_engine._split_output_args(tuple(first))[0] == \
+            acquire.ytdlp_engine._split_output_args(tuple(second))[0]
@@ -0,0 +1,36 @@
+"""Tests for the Aho-Corasick matcher."""
+from mcp_youtube_intelligence.core.automaton import AhoCorasick
+
+
+class TestAhoCorasick:
+    def test_finds_all_occurrences(self):
+        ac = AhoCorasick(["he", "she", "his", "hers"])
+        found = {(s, e, pid) for s, e, pid in ac.iter_matches("ushers")}
+        assert found == {(1, 4, 1), (2, 4, 0), (2, 6, 3)}
+
+    def test_longest_first_at_same_end(self):
+        ac = AhoCorasick(["b", "ab", "cab"])
+        matches = list(ac.iter_matches("cab"))
+        assert [pid for _, _, pid in matches] == [2, 1, 0]
+
+    def test_korean_patterns(self):
+        ac = AhoCorasick(["삼성", "삼성전자"])
+        matches = list(ac.iter_matches("삼성전자와 삼성"))
+        assert (0, 2, 0) in matches
+        assert (0, 4, 1) in matches
+        assert (6, 8, 0) in matches
+
+    def test_empty_pattern_ignored(self):
+        ac = AhoCorasick(["", "a"])
+        assert list(ac.iter_matches("a")) == [(0, 1, 1)]
+
+    def test_no_match(self):
+        ac = AhoCorasick(["xyz"])
+        assert list(ac.iter_matches("abcxy")) == []
+
+    def test_serialization_roundtrip(self):
+        ac = AhoCorasick(["he", "she", "his", "hers", "삼성"])
+        restored = AhoCorasick.from_bytes(ac.to_bytes())
+        text = "ushers 삼성 this"
+        assert list(restored.iter_matches(text)) == list(ac.iter_matches(text))
+        assert AhoCorasick.serialized_size(ac.to_bytes()) == len(ac.to_bytes())
@@ -0,0 +1,107 @@
+"""Tests for unknown-entity candidate mining."""
+import random
+
+import pytest
+
+from mcp_youtube_intelligence.core.candidates import (
+    CandidateMiner,
+    CountMinSketch,
+    TopK,
+    extract_candidates,
+)
+
+
+class TestCountMinSketch:
+    def test_never_undercounts(self):
+        sketch = CountMinSketch(width=64, depth=3)
+        rng = random.Random(0)
+        truth: dict[str, int] = {}
+        for _ in range(2000):
+            key = f"k{rng.randint(0, 300)}"
+            truth[key] = truth.get(key, 0) + 1
+            sketch.add(key)
+        assert all(sketch.estimate(k) >= c for k, c in truth.items())
+        assert sketch.total == 2000
+
+    def test_exact_when_sparse(self):
+        sketch = CountMinSketch()
+        for _ in range(5):
+            sketch.add("Blackwell")
+        sketch.add("Rubin", 3)
+        assert sketch.estimate("Blackwell") == 5
+        assert sketch.estimate("Rubin") == 3
+        assert sketch.estimate("unseen") == 0
+
+    def test_roundtrip(self):
+        sketch = CountMinSketch(width=128, depth=2)
+        sketch.add("a", 4)
+        restored = CountMinSketch.from_bytes(sketch.to_bytes())
+        assert restored.estimate("a") == 4
+        assert restored.total == 4
+        assert CountMinSketch.serialized_size(sketch.to_bytes()) == len(sketch.to_bytes())
+
+    def test_invalid_geometry(self):
+        with pytest.raises(ValueError):
+            CountMinSketch(width=0)
+
+
+class TestTopK:
+    def test_keeps_heaviest(self):
+        top = TopK(k=3)
+        counts = {"a": 0, "b": 0, "c": 0, "d": 0, "e": 0}
+        stream = ["a"] * 10 + ["b"] * 8 + ["c"] * 1 + ["d"] * 6 + ["e"] * 2
+        random.Random(1).shuffle(stream)
+        for key in stream:
+            counts[key] += 1
+            top.offer(key, counts[key])
+        assert [k for k, _ in top.items()] == ["a", "b", "d"]
+        assert len(top) == 3
+
+
+class TestExtractCandidates:
+    def test_english_ngrams(self):
+        found = extract_candidates("We visited Zorblax Widgets and Zorblax Widgets Co today.")
+        assert "Zorblax Widgets" in found
+        assert "Zorblax Widgets Co" in found
+        assert "We" not in found
+
+    def test_known_entities_excluded(self):
+        found = extract_candidates("Jensen Huang said NVIDIA will ship Blackwell")
+        assert "Blackwell" in found
+        assert not {"Jensen", "Huang", "Jensen Huang", "NVIDIA"} & set(found)
+
+    def test_korean_particles_stripped(self):
+        found = extract_candidates("블랙웰이 나왔고 블랙웰은 엔비디아의 신제품입니다")
+        assert found.count("블랙웰") == 2
+        assert "엔비디아" not in found
+        assert "신제품입니다" not in found
+
+    def test_empty(self):
+        assert extract_candidates("") == []
+
+
+class TestCandidateMiner:
+    def test_top_candidates(self):
+        miner = CandidateMiner(width=1024, depth=4, k=50)
+        miner.add_texts(["Blackwell chips and 블랙웰 수요"] * 4 + ["Rubin is next"])
+        top = miner.top(10, min_count=2)
+        phrases = [c["phrase"] for c in top]
+        assert phrases[:2] == ["Blackwell", "블랙웰"]
+        assert "Rubin" not in phrases
+        assert top[1]["script"] == "ko"
+        assert miner.documents == 5
+
+    def test_subphrases_folded_into_longer_candidate(self):
+        miner = CandidateMiner(width=1024, depth=4, k=50)
+        miner.add_texts(["Zorblax Widgets launched"] * 3 + ["Zorblax alone"])
+        phrases = {c["phrase"]: c["count"] for c in miner.top(10, min_count=1)}
+        assert phrases == {"Zorblax Widgets": 3, "Zorblax": 4}
+
+    def test_roundtrip(self):
+        miner = CandidateMiner(width=256, depth=2, k=10)
+        miner.add_texts(["Zorblax Widgets rocks"] * 3)
+        restored = CandidateMiner.from_bytes(miner.to_bytes())
+        assert restored.top() == miner.top()
+        assert restored.documents == 3
+        restored.add_text("Zorblax Widgets")
+        assert restored.top(1)[0]["count"] == 4
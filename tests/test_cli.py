@@ -99,9 +99,47 @@ class TestArgparse:
         args = self.parser.parse_args(["entities", "dQw4w9WgXcQ"])
         assert args.command == "entities"
 
+    def test_entities_timeline(self):
+        args = self.parser.parse_args(["entities", "dQw4w9WgXcQ", "--mode", "timeline", "--entity", "NVIDIA"])
+        assert args.mode == "timeline"
+        assert args.entity == "NVIDIA"
+
+    def test_entity_search(self):
+        args = self.parser.parse_args(["entity-search", "NVIDIA", "금리", "--since", "2026-10-01"])
+        assert args.command == "entity-search"
+        assert args.entities == ["NVIDIA", "금리"]
+        assert args.since == "2026-10-01"
+
+    def test_entities_reload(self):
+        args = self.parser.parse_args(["entities-reload", "--force"])
+        assert args.command == "entities-reload"
+        assert args.force is True
+
+    def test_entity_candidates(self):
+        args = self.parser.parse_args(["entity-candidates", "--max", "5", "--min-count", "2", "--reset"])
+        assert args.command == "entity-candidates"
+        assert (args.max, args.min_count, args.reset) == (5, 2, True)
+
+    def test_entity_promote(self):
+        args = self.parser.parse_args(["entity-promote", "Blackwell", "--type", "technology"])
+        assert args.keyword == "Blackwell"
+        assert args.type == "technology"
+        assert args.name is None
+
     def test_segments(self):
         args = self.parser.parse_args(["segments", "dQw4w9WgXcQ"])
         assert args.command == "segments"
+        assert args.method == "auto"
+
+    def test_segments_texttiling(self):
+        args = self.parser.parse_args(["segments", "dQw4w9WgXcQ", "--method", "texttiling"])
+        assert args.method == "texttiling"
+
+    def test_segments_hierarchical(self):
+        args = self.parser.parse_args(["segments", "dQw4w9WgXcQ", "--method", "hierarchical", "--max-segments", "5"])
+        assert args.method == "hierarchical"
+        assert args.max_segments == 5
+        assert args.level is None
 
     def test_search_transcripts(self):
         args = self.parser.parse_args(["search-transcripts", "machine learning"])
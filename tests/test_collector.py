@@ -0,0 +1,103 @@
+"""Tests for core.collector module."""
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+from mcp_youtube_intelligence.core.collector import _parse_chapters, get_video_metadata
+
+
+def _dump(**extra) -> str:
+    data = {
+        "id": "vid1",
+        "title": "Title",
+        "channel_id": "UC1",
+        "channel": "Channel",
+        "upload_date": "20260101",
+        "duration": 600,
+    }
+    data.update(extra)
+    return json.dumps(data)
+
+
+@patch("mcp_youtube_intelligence.core.collector.subprocess.run")
+def test_metadata_includes_chapters(mock_run):
+    mock_run.return_value = MagicMock(returncode=0, stderr="", stdout=_dump(chapters=[
+        {"start_time": 0.0, "end_time": 95.0, "title": "Intro"},
+        {"start_time": 95.0, "end_time": 600.0, "title": "Earnings"},
+    ]))
+    meta = get_video_metadata("vid1")
+    assert meta["chapters"] == [
+        {"title": "Intro", "start": 0.0, "end": 95.0},
+        {"title": "Earnings", "start": 95.0, "end": 600.0},
+    ]
+    assert meta["published_at"].startswith("2026-01-01")
+
+
+@patch("mcp_youtube_intelligence.core.collector.subprocess.run")
+def test_metadata_without_chapters(mock_run):
+    mock_run.return_value = MagicMock(returncode=0, stderr="", stdout=_dump(chapters=None))
+    assert get_video_metadata("vid1")["chapters"] is None
+
+
+def test_parse_chapters_fills_missing_end():
+    chapters = _parse_chapters(
+        [{"start_time": 0, "title": "A"}, {"start_time": 30, "title": " B "}], duration=90,
+    )
+    assert chapters == [
+        {"title": "A", "start": 0.0, "end": 30.0},
+        {"title": "B", "start": 30.0, "end": 90.0},
+    ]
+
+
+_FAKE_YTDLP = """#!{python}
+import json, sys
+urls = [a for a in sys.argv[1:] if a.startswith("http")]
+with open({log!r}, "a") as f:
+    f.write(str(len(urls)) + "\\n")
+for url in urls:
+    vid = url.rsplit("=", 1)[-1]
+    if vid.startswith("bad"):
+        print("ERROR: [youtube] " + vid + ": Video unavailable", flush=True)
+    elif not vid.startswith("silent"):
+        print(json.dumps({{"id": vid, "title": "T " + vid, "upload_date": "20260101", "duration": 60}}), flush=True)
+"""
+
+
+def _fake_ytdlp(tmp_path) -> tuple[str, str]:
+    import os
+    import sys
+    log = str(tmp_path / "calls.log")
+    path = tmp_path / "yt-dlp"
+    path.write_text(_FAKE_YTDLP.format(python=sys.executable, log=log))
+    os.chmod(path, 0o755)
+    return str(path), log
+
+
+def test_metadata_batch_one_process_per_batch(tmp_path):
+    from mcp_youtube_intelligence.core.collector import get_video_metadata_batch
+    binary, log = _fake_ytdlp(tmp_path)
+    ids = ["v1", "bad1", "v2", "silent1", "v1", "v3"]
+    result = get_video_metadata_batch(ids, yt_dlp=binary, batch_size=3)
+    assert list(result) == ["v1", "bad1", "v2", "silent1", "v3"]
+    assert result["v1"]["title"] == "T v1"
+    assert result["v3"]["published_at"].startswith("2026-01-01")
+    assert result["bad1"] == {"error": "Video unavailable"}
+    assert result["silent1"] == {"error": "no metadata returned"}
+    with open(log) as f:
+        assert f.read().split() == ["3", "2"]
+
+
+def test_metadata_batch_streams_results(tmp_path):
+    from mcp_youtube_intelligence.core.collector import iter_video_metadata
+    binary, _ = _fake_ytdlp(tmp_path)
+    stream = iter_video_metadata(["v1", "bad1"], yt_dlp=binary)
+    vid, meta, error = next(stream)
+    assert (vid, meta["title"], error) == ("v1", "T v1", None)
+    assert list(stream) == [("bad1", None, "Video unavailable")]
+
+
+def test_metadata_batch_missing_binary():
+    from mcp_youtube_intelligence.core.collector import get_video_metadata_batch
+    result = get_video_metadata_batch(["v1", "v2"], yt_dlp="/nonexistent/yt-dlp")
+    assert set(result) == {"v1", "v2"} and all("error" in r for r in result.values())
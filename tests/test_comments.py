@@ -1,8 +1,12 @@
 """Tests for comment collection and summarization."""
+import hashlib
+
 import pytest
+import pytest_asyncio
 from unittest.mock import patch, MagicMock
 from mcp_youtube_intelligence.core.comments import (
-    fetch_comments, summarize_comments, _analyze_sentiment, _count_emoji_sentiment,
+    fetch_comments, summarize_comments, sync_comments, store_comments, stored_summary, comment_sentiment,
+    _analyze_sentiment, _count_emoji_sentiment, _count_negated_positives,
 )
 
 
@@ -70,6 +74,22 @@ class TestSentimentAnalysis:
         """Pure positive without negation should stay positive."""
         assert _analyze_sentiment("I love this amazing video") == "positive"
 
+    def test_comment_sentiment_prefers_stored_label(self):
+        assert comment_sentiment({"text": "This is awesome", "sentiment": "neutral"}) == "neutral"
+        assert comment_sentiment({"text": "This is awesome"}) == "positive"
+        assert comment_sentiment({}) == "neutral"
+
+    def test_negation_must_be_whole_word(self):
+        assert _count_negated_positives("cannot good") == 0
+        assert _count_negated_positives("piano good") == 0
+        assert _count_negated_positives("Not good, never great") == 2
+
+    def test_negation_window(self):
+        assert _count_negated_positives("not " + "x" * 26 + "good") == 1
+        assert _count_negated_positives("not " + "x" * 27 + "good") == 0
+        assert _count_negated_positives("안 " + "가" * 11 + "좋은") == 1
+        assert _count_negated_positives("안 " + "가" * 14 + "좋은") == 0
+
 
 class TestEmojiSentiment:
     def test_count_positive(self):
@@ -125,14 +145,219 @@ class TestSummarizeComments:
 
 
 class TestFetchComments:
+    @patch("mcp_youtube_intelligence.core.comments._ytdlp_api", lambda: None)
     @patch("mcp_youtube_intelligence.core.comments.subprocess.run")
     def test_fetch_returns_list(self, mock_run):
         mock_run.return_value = MagicMock(returncode=0)
         result = fetch_comments("test_id")
         assert isinstance(result, list)
 
+    @patch("mcp_youtube_intelligence.core.comments._ytdlp_api", lambda: None)
     @patch("mcp_youtube_intelligence.core.comments.subprocess.run")
     def test_fetch_handles_timeout(self, mock_run):
         mock_run.side_effect = Exception("timeout")
         result = fetch_comments("test_id")
         assert result == []
+
+
+class _FakeExtractor:
+    """Stands in for yt-dlp's YouTube extractor: a comment generator counting pulls."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.pulled = 0
+
+    def _get_comments(self, ytcfg, video_id, contents, webpage):
+        for c in self.raw:
+            self.pulled += 1
+            yield c
+
+
+def _fake_ytdlp(extractor):
+    class YoutubeDL:
+        def __init__(self, opts):
+            self.opts = opts
+            YoutubeDL.last = self
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def get_info_extractor(self, key):
+            return extractor
+
+        def extract_info(self, url, download=True):
+            self.kept = list(extractor._get_comments({}, "vid", [], ""))
+            return {"comments": self.kept}
+
+    return MagicMock(YoutubeDL=YoutubeDL)
+
+
+class TestStreamingFetch:
+    RAW = [
+        {"id": str(i), "author": "a", "text": "ok" if i % 2 else f"Great {hashlib.md5(str(i).encode()).hexdigest()}",
+         "like_count": i}
+        for i in range(100)
+    ]
+
+    def test_stops_once_enough_pass_filter(self):
+        ie = _FakeExtractor(self.RAW)
+        api = _fake_ytdlp(ie)
+        with patch("mcp_youtube_intelligence.core.comments._ytdlp_api", lambda: api), \
+                patch("mcp_youtube_intelligence.core.comments.subprocess.run") as mock_run:
+            result = fetch_comments("vid", max_comments=5)
+        assert [c["comment_id"] for c in result] == ["0", "2", "4", "6", "8"]
+        assert all(c["sentiment"] == "positive" for c in result)
+        assert ie.pulled == 9
+        # Comments are consumed inline, not accumulated by yt-dlp
+        assert api.YoutubeDL.last.kept == []
+        mock_run.assert_not_called()
+
+    def test_near_duplicates_collapsed_inline(self):
+        raw = [{"id": str(i), "author": "bot", "text": f"Amazing!! check out my channel for crypto tips {'!' * (i % 3)}"}
+               for i in range(6)]
+        raw.append({"id": "x", "author": "u", "text": "Helpful breakdown of the memory market"})
+        api = _fake_ytdlp(_FakeExtractor(raw))
+        with patch("mcp_youtube_intelligence.core.comments._ytdlp_api", lambda: api):
+            result = fetch_comments("vid", max_comments=5)
+        assert [(c["comment_id"], c["duplicates"]) for c in result] == [("0", 5), ("x", 0)]
+        assert summarize_comments(result)["duplicate_clusters"][0]["count"] == 6
+
+    def test_extractor_args(self):
+        api = _fake_ytdlp(_FakeExtractor([]))
+        with patch("mcp_youtube_intelligence.core.comments._ytdlp_api", lambda: api):
+            fetch_comments("vid", max_comments=10, sort="newest")
+        args = api.YoutubeDL.last.opts["extractor_args"]["youtube"]
+        assert args == {"comment_sort": ["new"], "max_comments": ["30"]}
+
+    def test_sentiment_filter_inline(self):
+        raw = [{"id": "1", "text": "terrible and boring video"}, {"id": "2", "text": "amazing video thanks"}]
+        api = _fake_ytdlp(_FakeExtractor(raw))
+        with patch("mcp_youtube_intelligence.core.comments._ytdlp_api", lambda: api):
+            result = fetch_comments("vid", sentiment="negative")
+        assert [c["comment_id"] for c in result] == ["1"]
+
+    def test_extraction_error_returns_partial(self):
+        def broken(ytcfg, video_id, contents, webpage):
+            yield {"id": "1", "text": "helpful walkthrough here"}
+            raise RuntimeError("network")
+
+        ie = _FakeExtractor([])
+        ie._get_comments = broken
+        api = _fake_ytdlp(ie)
+        with patch("mcp_youtube_intelligence.core.comments._ytdlp_api", lambda: api):
+            result = fetch_comments("vid")
+        assert [c["comment_id"] for c in result] == ["1"]
+
+
+@pytest.mark.asyncio
+class TestCommentSync:
+    @pytest_asyncio.fixture
+    async def storage(self, tmp_path):
+        from mcp_youtube_intelligence.storage.sqlite import SQLiteStorage
+        s = SQLiteStorage(str(tmp_path / "comments.db"))
+        await s.initialize()
+        yield s
+        await s.close()
+
+    @staticmethod
+    def _raw(i: int, ts: int, likes: int = 0, **extra) -> dict:
+        return {"id": f"c{i}", "author": "a", "text": f"helpful comment number {i}", "like_count": likes,
+                "timestamp": ts, "parent": "root", **extra}
+
+    def _fetch(self, newest: list, top: list):
+        """Fake fetch_comments serving *newest* for sort=newest and *top* for sort=top."""
+        calls = []
+
+        def fake(video_id, max_comments=30, sort="top", sentiment="all", filter_noise=True,
+                 yt_dlp="yt-dlp", stream=True, stop_at=None):
+            calls.append(sort)
+            out = []
+            for c in (newest if sort == "newest" else top):
+                if stop_at is not None and stop_at(c):
+                    break
+                out.append({"comment_id": c["id"], "author": c["author"], "text": c["text"],
+                            "like_count": c["like_count"], "sentiment": "positive", "timestamp": c["timestamp"]})
+                if len(out) >= max_comments:
+                    break
+            return out
+
+        return fake, calls
+
+    async def test_second_sync_stops_at_stored_comments(self, storage):
+        first = [self._raw(i, 1000 - i) for i in range(5)]
+        fake, calls = self._fetch(first, [])
+        with patch("mcp_youtube_intelligence.core.comments.fetch_comments", fake):
+            result = await sync_comments("v1", storage)
+        assert result["new_comments"] == 5 and result["newest_comment_id"] == "c0"
+
+        pinned = self._raw(3, 996, is_pinned=True)
+        newer = [pinned, self._raw(10, 2000), self._raw(11, 1999)] + first
+        fake, calls = self._fetch(newer, [])
+        with patch("mcp_youtube_intelligence.core.comments.fetch_comments", fake):
+            result = await sync_comments("v1", storage)
+        # The pinned (stored) comment does not stop the scan; c0 does
+        assert result["new_comments"] == 2
+        assert result["newest_comment_id"] == "c10"
+        assert calls == ["newest"]  # likes were refreshed on the first sync
+        assert await storage.get_comment_ids("v1") == {f"c{i}" for i in (0, 1, 2, 3, 4, 10, 11)}
+
+    async def test_stops_at_old_timestamp_when_mark_deleted(self, storage):
+        await storage.save_comment_sync("v1", {"newest_comment_id": "gone", "newest_timestamp": 10 * 86400,
+                                                "likes_refreshed_at": "2999-01-01T00:00:00+00:00"})
+        raw = [self._raw(1, 11 * 86400), self._raw(2, 10 * 86400), self._raw(3, 8 * 86400)]
+        fake, _ = self._fetch(raw, [])
+        with patch("mcp_youtube_intelligence.core.comments.fetch_comments", fake):
+            result = await sync_comments("v1", storage)
+        assert result["new_comments"] == 2
+
+    async def test_likes_refreshed_when_due(self, storage):
+        await storage.save_comments("v1", [{"comment_id": "c1", "author": "a", "text": "x", "like_count": 1}])
+        await storage.save_comment_sync("v1", {"likes_refreshed_at": "2000-01-01T00:00:00+00:00"})
+        fake, calls = self._fetch([], [self._raw(1, 0, likes=99)])
+        with patch("mcp_youtube_intelligence.core.comments.fetch_comments", fake):
+            result = await sync_comments("v1", storage, likes_refresh_hours=24)
+        assert result["likes_refreshed"] and calls == ["newest", "top"]
+        assert (await storage.get_comments("v1"))[0]["like_count"] == 99
+
+        fake, calls = self._fetch([], [])
+        with patch("mcp_youtube_intelligence.core.comments.fetch_comments", fake):
+            result = await sync_comments("v1", storage, likes_refresh_hours=24)
+        assert not result["likes_refreshed"] and calls == ["newest"]
+
+
+@pytest.mark.asyncio
+class TestCommentStats:
+    @pytest_asyncio.fixture
+    async def storage(self, tmp_path):
+        from mcp_youtube_intelligence.storage.sqlite import SQLiteStorage
+        s = SQLiteStorage(str(tmp_path / "stats.db"))
+        await s.initialize()
+        yield s
+        await s.close()
+
+    async def test_incremental_stats_match_full_summary(self, storage):
+        await store_comments("v1", SAMPLE_COMMENTS[:3], storage)
+        await store_comments("v1", SAMPLE_COMMENTS, storage)  # first three are known
+        summary = await stored_summary("v1", storage, top_n=3)
+        expected = summarize_comments(SAMPLE_COMMENTS, top_n=3)
+        assert summary["count"] == expected["count"]
+        assert summary["sentiment_ratio"] == expected["sentiment_ratio"]
+        assert summary["top_comments"] == expected["top_comments"]
+        assert sorted(k["count"] for k in summary["top_keywords"]) == sorted(k["count"] for k in expected["top_keywords"])
+
+    async def test_noise_not_counted(self, storage):
+        await store_comments("v1", SAMPLE_COMMENTS + [
+            {"comment_id": "n1", "author": "spam", "text": "sub4sub", "like_count": 999, "is_noise": True},
+        ], storage)
+        summary = await stored_summary("v1", storage)
+        assert summary["count"] == len(SAMPLE_COMMENTS)
+        assert summary["top_comments"][0]["author"] == "Charlie"
+
+    async def test_comments_stored_before_stats_are_backfilled(self, storage):
+        await storage.save_comments("v1", SAMPLE_COMMENTS[:4])
+        assert await stored_summary("v1", storage) is None
+        await store_comments("v1", SAMPLE_COMMENTS, storage)
+        assert (await stored_summary("v1", storage))["count"] == len(SAMPLE_COMMENTS)
@@ -0,0 +1,110 @@
+"""Tests for the shared per-transcript Document."""
+import random
+
+from mcp_youtube_intelligence.core import document, texttiling
+from mcp_youtube_intelligence.core.document import Document
+from mcp_youtube_intelligence.core.segmenter import _extract_keywords, _word_bag, segment_topics
+from mcp_youtube_intelligence.core.summarizer import _sentence_terms, extractive_summary
+
+_WORDS = (
+    "memory chip gpt4 AI가 인공지능 반도체 시장 엔비디아 rates bond yields 금리 인상 "
+    "the and 그리고 했습니다 성장했어요 결론 중요한 3.5% inflation x 다음으로"
+).split()
+
+
+def _random_text(n: int, seed: int) -> str:
+    rng = random.Random(seed)
+    toks = []
+    for _ in range(n):
+        toks.append(rng.choice(_WORDS))
+        if rng.random() < 0.08:
+            toks[-1] += rng.choice([".", "!", "?"])
+    return " ".join(toks)
+
+
+class TestDocument:
+    def test_tokens_and_offsets(self):
+        doc = Document("Hello world. Hello 반도체!")
+        assert [doc.words[t] for t in doc.token_ids] == ["hello", "world", "hello", "반도체"]
+        assert list(doc.token_offsets) == [0, 6, 13, 19]
+        assert doc.token_ids[0] == doc.token_ids[2]
+
+    def test_sentence_views_match_stage_tokenizers(self):
+        text = _random_text(600, seed=3)
+        doc = Document(text)
+        words = doc.words
+        assert [[words[t] for t in doc.sentence_terms(i)] for i in range(len(doc.sentences))] == \
+            _sentence_terms(doc.sentences)
+        assert [{words[t]: c for t, c in bag.items()} for bag in doc.sentence_bags()] == \
+            [dict(_word_bag(s)) for s in doc.sentences]
+
+    def test_content_tokens_match_texttiling(self):
+        text = _random_text(800, seed=5)
+        doc = Document(text)
+        ids, offsets = texttiling.tokenize(text)
+        assert list(doc.content_offsets) == offsets
+        assert texttiling.find_boundaries(ids, 5, 3) == texttiling.find_boundaries(doc.content_ids, 5, 3)
+
+    def test_keywords_in_range(self):
+        text = "semiconductor chips chips. interest rates rates rates."
+        doc = Document(text)
+        cut = text.index("interest")
+        assert doc.keywords(0, cut) == _extract_keywords(text[:cut])
+        assert doc.keywords(cut) == ["rates", "interest"]
+
+    def test_lazy(self):
+        doc = Document("one two three.")
+        assert "spans" not in doc.__dict__ and "_words" not in doc.__dict__
+        doc.token_ids
+        assert "_words" in doc.__dict__ and "spans" not in doc.__dict__
+
+    def test_precomputed_spans(self):
+        doc = Document("abc def", spans=[(0, 3), (4, 7)])
+        assert doc.sentences == ["abc", "def"]
+
+
+class TestStagesWithDocument:
+    def test_same_results_as_without(self):
+        for seed in range(20):
+            text = _random_text(200 + seed * 60, seed)
+            doc = Document(text)
+            assert segment_topics(text, method="markers", doc=doc) == segment_topics(text, method="markers")
+            assert extractive_summary(text, doc=doc) == extractive_summary(text)
+
+    def test_document_for_other_text_ignored(self):
+        text = _random_text(700, seed=1)
+        other = Document("unrelated text.")
+        assert segment_topics(text, method="markers", doc=other) == segment_topics(text, method="markers")
+        assert extractive_summary(text, doc=other) == extractive_summary(text)
+
+    def test_texttiling_with_document(self):
+        text = _random_text(1500, seed=2)
+        result = segment_topics(text, method="texttiling", doc=Document(text))
+        assert "".join(s["text"] for s in result).replace(" ", "") == text.replace(" ", "")
+
+
+class TestForVideo:
+    def setup_method(self):
+        document._cache.clear()
+
+    def test_cached_per_video(self):
+        doc = document.for_video("v1", "some text.")
+        assert document.for_video("v1", "some text.") is doc
+        assert document.for_video("v2", "some text.") is not doc
+
+    def test_rebuilt_when_text_changes(self):
+        doc = document.for_video("v1", "some text.")
+        assert document.for_video("v1", "other text.") is not doc
+
+    def test_rebuilt_when_timings_arrive(self):
+        doc = document.for_video("v1", "some text")
+        timed = [{"start": 0.0, "duration": 1.0, "text": "some text"}]
+        rebuilt = document.for_video("v1", "some text", timed)
+        assert rebuilt is not doc and rebuilt.timed_segments == timed
+        assert document.for_video("v1", "some text") is rebuilt
+
+    def test_bounded(self, monkeypatch):
+        monkeypatch.setattr(document, "_CACHE_MAX", 2)
+        for i in range(4):
+            document.for_video(f"v{i}", "text")
+        assert list(document._cache) == ["v2", "v3"]
@@ -0,0 +1,125 @@
+"""Tests for MinHash/LSH near-duplicate comment detection."""
+import random
+
+import pytest
+import pytest_asyncio
+
+from mcp_youtube_intelligence.core import duplicates
+from mcp_youtube_intelligence.core.comments import store_comments, stored_summary
+from mcp_youtube_intelligence.core.duplicates import (
+    DuplicateIndex, band_keys, collapse, from_bytes, index_comments, signature, similarity, to_bytes,
+)
+
+SPAM = "Check out my channel for free crypto giveaways, link in bio!!"
+SPAM_VARIANTS = [
+    SPAM,
+    "check out my channel for FREE crypto giveaway, link in bio",
+    "Check out my channel for free crypto giveaways... link in bio 🔥",
+    "CHECK OUT MY CHANNEL for free crypto giveaways, link in bio!!!",
+]
+DISTINCT = [
+    "The part about memory bandwidth at 12:30 was really insightful",
+    "I disagree with the premise about fab capacity next year",
+    "좋은 영상 감사합니다 반도체 설명이 정말 이해하기 쉬웠어요",
+    "Could you cover the packaging bottleneck in a follow-up?",
+]
+
+
+def _jaccard(a: str, b: str) -> float:
+    sa, sb = duplicates._shingles(a), duplicates._shingles(b)
+    return len(sa & sb) / len(sa | sb)
+
+
+class TestSignature:
+    def test_near_duplicates_similar(self):
+        base = signature(SPAM)
+        for text in SPAM_VARIANTS[1:]:
+            assert similarity(base, signature(text)) >= duplicates.THRESHOLD
+
+    def test_distinct_texts_dissimilar(self):
+        sigs = [signature(t) for t in DISTINCT]
+        for i in range(len(sigs)):
+            for j in range(i + 1, len(sigs)):
+                assert similarity(sigs[i], sigs[j]) < 0.3
+
+    def test_estimate_tracks_jaccard(self):
+        rng = random.Random(3)
+        words = "memory chip fab node yield wafer price demand supply quarter".split()
+        errors = []
+        for _ in range(200):
+            a = " ".join(rng.choice(words) for _ in range(12))
+            b = " ".join(w if rng.random() < 0.7 else rng.choice(words) for w in a.split())
+            errors.append(abs(similarity(signature(a), signature(b)) - _jaccard(a, b)))
+        assert sum(errors) / len(errors) < 0.08
+
+    def test_no_word_characters(self):
+        assert signature("!!! ...") is None
+        assert signature("") is None
+
+    def test_short_text_exact_only(self):
+        assert similarity(signature("wow"), signature("WOW!")) == 1.0
+        assert similarity(signature("wow"), signature("woo")) < duplicates.THRESHOLD
+
+    def test_bytes_roundtrip_and_band_keys(self):
+        sig = signature(SPAM)
+        assert from_bytes(to_bytes(sig)) == sig
+        keys = band_keys(sig)
+        assert len(keys) == duplicates.BANDS
+        assert [k >> 56 for k in keys] == list(range(duplicates.BANDS))
+
+
+class TestCollapse:
+    def test_collapses_cluster_to_first_copy(self):
+        comments = [{"comment_id": str(i), "text": t} for i, t in enumerate(SPAM_VARIANTS + DISTINCT)]
+        kept = collapse(comments)
+        assert [c["comment_id"] for c in kept] == ["0", "4", "5", "6", "7"]
+        assert kept[0]["duplicates"] == 3
+        assert all(c["duplicates"] == 0 for c in kept[1:])
+
+    def test_index_indexes_representatives_only(self):
+        index = DuplicateIndex()
+        assert index.add("a", signature(SPAM)) is None
+        for i, text in enumerate(SPAM_VARIANTS[1:]):
+            assert index.add(f"b{i}", signature(text)) == "a"
+        assert set(index.buckets.values()) == {"a"}
+
+
+@pytest.mark.asyncio
+class TestPersistedIndex:
+    @pytest_asyncio.fixture
+    async def storage(self, tmp_path):
+        from mcp_youtube_intelligence.storage.sqlite import SQLiteStorage
+        s = SQLiteStorage(str(tmp_path / "dups.db"))
+        await s.initialize()
+        yield s
+        await s.close()
+
+    async def test_later_batch_checked_against_stored_buckets(self, storage):
+        first = [{"comment_id": "s0", "text": SPAM}, {"comment_id": "d0", "text": DISTINCT[0]}]
+        await storage.save_comments("v1", first)
+        assert await index_comments("v1", first, storage) == {}
+
+        second = [{"comment_id": f"s{i}", "text": t} for i, t in enumerate(SPAM_VARIANTS[1:], 1)]
+        second.append({"comment_id": "d1", "text": DISTINCT[1]})
+        await storage.save_comments("v1", second)
+        assert await index_comments("v1", second, storage) == {"s1": "s0", "s2": "s0", "s3": "s0"}
+
+        clusters = await storage.get_comment_clusters("v1")
+        assert [(c["comment_id"], c["count"], c["text"]) for c in clusters] == [("s0", 4, SPAM)]
+        flagged = {c["comment_id"] for c in await storage.get_comments("v1", limit=10) if c["is_noise"]}
+        assert flagged == {"s1", "s2", "s3"}
+
+    async def test_flood_does_not_skew_stats(self, storage):
+        flood = [{"comment_id": f"s{i}", "author": "bot", "text": SPAM_VARIANTS[i % 4], "like_count": 0}
+                 for i in range(40)]
+        real = [{"comment_id": f"d{i}", "author": "u", "text": t, "like_count": 5} for i, t in enumerate(DISTINCT)]
+        await store_comments("v1", real + flood[:10], storage)
+        await store_comments("v1", flood[10:], storage)
+        summary = await stored_summary("v1", storage)
+        assert summary["count"] == len(DISTINCT) + 1
+        assert summary["duplicate_clusters"][0]["count"] == 40
+
+    async def test_collapsed_copies_counted(self, storage):
+        kept = collapse([{"comment_id": str(i), "text": t} for i, t in enumerate(SPAM_VARIANTS)])
+        await store_comments("v1", kept, storage)
+        assert (await storage.get_comment_clusters("v1"))[0]["count"] == 4
@@ -1,6 +1,6 @@
 """Tests for entity extraction."""
 import pytest
-from mcp_youtube_intelligence.core.entities import extract_entities, DEFAULT_ENTITY_DICT
+from mcp_youtube_intelligence.core.entities import extract_entities, DEFAULT_ENTITY_DICT, EntityMatcher
 
 
 class TestExtractEntities:
@@ -162,3 +162,164 @@ class TestExtractEntities:
         )
         result = extract_entities(text)
         assert len(result) >= 5  # Should find many entities
+
+
+class TestEntityMatcher:
+    def test_longest_match_wins(self):
+        result = extract_entities("Stable Diffusion is a diffusion model")
+        names = {e["name"]: e["count"] for e in result}
+        assert names["Stable Diffusion"] == 1
+        assert names["Diffusion Model"] == 1
+
+    def test_non_overlapping_offsets(self):
+        matcher = EntityMatcher({"삼성": ("company", "S"), "삼성전자": ("company", "S")})
+        assert matcher.find("삼성전자와 삼성") == [(0, 4, 1), (6, 8, 0)]
+
+    def test_ascii_case_folding_keeps_offsets(self):
+        matcher = EntityMatcher({"NVIDIA": ("company", "NVIDIA")})
+        text = "삼성 vs nViDiA"
+        start, end, _ = matcher.find(text)[0]
+        assert text[start:end] == "nViDiA"
+
+    def test_korean_substring_match(self):
+        result = extract_entities("테슬라는 전기차를 만듭니다")
+        names = [e["name"] for e in result]
+        assert "Tesla" in names
+        assert "Electric Vehicle" in names
+
+    def test_boundary_failure_does_not_block_shorter_match(self):
+        matcher = EntityMatcher({"Meta": ("company", "Meta"), "Metaverse": ("sector", "Metaverse")})
+        # "Metaversely" fails the boundary for "Metaverse"; "Meta" fails too
+        assert matcher.find("Metaversely") == []
+        assert [k for _, _, k in matcher.find("Meta metaverse")] == [0, 1]
+
+    def test_first_offset(self):
+        text = "오늘 테슬라와 애플, 그리고 다시 테슬라"
+        tesla = next(e for e in extract_entities(text) if e["name"] == "Tesla")
+        assert tesla["first_offset"] == text.index("테슬라")
+
+    def test_resolve_entity_name(self):
+        from mcp_youtube_intelligence.core.entities import resolve_entity_name
+        assert resolve_entity_name("금리") == "Interest Rate"
+        assert resolve_entity_name("nvidia") == "NVIDIA"
+        assert resolve_entity_name("Interest Rate") == "Interest Rate"
+        assert resolve_entity_name("Unknown Thing") == "Unknown Thing"
+
+    def test_extra_dict_matcher_is_cached(self):
+        from mcp_youtube_intelligence.core import entities
+        extra = {"커피": ("commodity", "Coffee")}
+        assert entities._get_matcher(extra) is entities._get_matcher(dict(extra))
+
+
+@pytest.fixture
+def restore_matcher():
+    from mcp_youtube_intelligence.core import entities
+    saved = entities._active_matcher
+    yield
+    entities._set_active_matcher(saved)
+    entities._loaded_dirs.clear()
+
+
+@pytest.mark.usefixtures("restore_matcher")
+class TestEntityDictionaries:
+    def test_tsv_and_json_files_loaded(self, tmp_path):
+        from mcp_youtube_intelligence.core.entities import load_dictionaries
+        (tmp_path / "tickers.tsv").write_text(
+            "# keyword\ttype\tname\nPLTR\tticker\tPalantir\n에코프로\tcompany\tEcoPro\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "people.json").write_text('{"Lisa Su": ["person", "Lisa Su"]}', encoding="utf-8")
+        info = load_dictionaries(tmp_path)
+        assert info["files"] == ["people.json", "tickers.tsv"]
+        result = extract_entities("PLTR and 에코프로 rallied after Lisa Su spoke about NVIDIA")
+        names = {e["name"] for e in result}
+        assert {"Palantir", "EcoPro", "Lisa Su", "NVIDIA"} <= names
+
+    def test_file_overrides_builtin_case_variant(self, tmp_path):
+        from mcp_youtube_intelligence.core.entities import load_dictionaries
+        (tmp_path / "custom.tsv").write_text("apple\tperson\tMyOverride\n", encoding="utf-8")
+        load_dictionaries(tmp_path)
+        result = extract_entities("Apple and apple")
+        assert [(e["type"], e["name"], e["count"]) for e in result] == [("person", "MyOverride", 2)]
+
+    def test_artifact_reused_until_sources_change(self, tmp_path):
+        from mcp_youtube_intelligence.core.entities import load_dictionaries, ARTIFACT_NAME
+        src = tmp_path / "custom.tsv"
+        src.write_text("커피\tcommodity\tCoffee\n", encoding="utf-8")
+        assert load_dictionaries(tmp_path)["rebuilt"] is True
+        assert (tmp_path / ARTIFACT_NAME).exists()
+        assert load_dictionaries(tmp_path)["rebuilt"] is False
+        assert "Coffee" in {e["name"] for e in extract_entities("커피 가격")}
+
+        src.write_text("커피\tcommodity\tCoffee\n코코아\tcommodity\tCocoa\n", encoding="utf-8")
+        assert load_dictionaries(tmp_path)["rebuilt"] is True
+        assert "Cocoa" in {e["name"] for e in extract_entities("코코아 가격")}
+
+    def test_corrupt_artifact_is_rebuilt(self, tmp_path):
+        from mcp_youtube_intelligence.core.entities import load_dictionaries, ARTIFACT_NAME
+        load_dictionaries(tmp_path)
+        (tmp_path / ARTIFACT_NAME).write_bytes(b"garbage")
+        assert load_dictionaries(tmp_path)["rebuilt"] is True
+
+    def test_loaded_matcher_matches_compiled(self, tmp_path):
+        from mcp_youtube_intelligence.core.entities import load_dictionaries
+        text = "Stable Diffusion과 삼성전자, nvidia, S&P 500 and the Fed"
+        expected = extract_entities(text)
+        load_dictionaries(tmp_path)
+        load_dictionaries(tmp_path)  # second load comes from the artifact
+        assert extract_entities(text) == expected
+
+    def test_add_dictionary_entry(self, tmp_path):
+        from mcp_youtube_intelligence.core import entities
+        path = entities.add_dictionary_entry(tmp_path, "Blackwell", "technology")
+        entities.add_dictionary_entry(tmp_path, "블랙웰", "technology", "Blackwell")
+        assert path.name == entities.CUSTOM_DICT_NAME
+        entities.load_dictionaries(tmp_path)
+        assert "blackwell" in entities.known_terms()
+        result = extract_entities("Blackwell 그리고 블랙웰")
+        assert [(e["name"], e["count"]) for e in result] == [("Blackwell", 2)]
+
+    def test_add_dictionary_entry_rejects_tabs(self, tmp_path):
+        from mcp_youtube_intelligence.core import entities
+        with pytest.raises(ValueError):
+            entities.add_dictionary_entry(tmp_path, "a\tb", "company")
+
+    def test_ensure_loads_once(self, tmp_path):
+        from mcp_youtube_intelligence.core import entities
+        (tmp_path / "a.tsv").write_text("커피\tcommodity\tCoffee\n", encoding="utf-8")
+        entities.ensure_dictionaries(tmp_path)
+        (tmp_path / "a.tsv").write_text("녹차\tcommodity\tTea\n", encoding="utf-8")
+        entities.ensure_dictionaries(tmp_path)
+        assert "Tea" not in {e["name"] for e in extract_entities("녹차")}
+
+
+class TestEntityTimeline:
+    SEGMENTS = [
+        {"start": 0.0, "duration": 4.0, "text": "오늘은 테슬라 이야기입니다"},
+        {"start": 4.0, "duration": 5.0, "text": "NVIDIA earnings were strong"},
+        {"start": 65.5, "duration": 5.0, "text": "다시 테슬라로 돌아와서"},
+        {"start": 130.0, "duration": 3.0, "text": "Tesla and nvidia again"},
+    ]
+
+    def test_timestamps_from_segments(self):
+        from mcp_youtube_intelligence.core.entities import entity_timeline
+        timeline = {e["name"]: e for e in entity_timeline(self.SEGMENTS)}
+        assert timeline["Tesla"]["timestamps"] == [0.0, 65.5, 130.0]
+        assert timeline["NVIDIA"]["timestamps"] == [4.0, 130.0]
+        assert timeline["Tesla"]["count"] == 3
+
+    def test_per_minute_histogram(self):
+        from mcp_youtube_intelligence.core.entities import entity_timeline
+        tesla = next(e for e in entity_timeline(self.SEGMENTS) if e["name"] == "Tesla")
+        assert tesla["histogram"] == [{"minute": 0, "count": 1}, {"minute": 1, "count": 1}, {"minute": 2, "count": 1}]
+
+    def test_match_does_not_span_segments_incorrectly(self):
+        from mcp_youtube_intelligence.core.entities import entity_timeline
+        segments = [{"start": 0.0, "text": "Elon"}, {"start": 10.0, "text": "Musk said"}]
+        timeline = entity_timeline(segments)
+        musk = next(e for e in timeline if e["name"] == "Elon Musk")
+        assert musk["timestamps"] == [0.0]
+
+    def test_empty(self):
+        from mcp_youtube_intelligence.core.entities import entity_timeline
+        assert entity_timeline([]) == []
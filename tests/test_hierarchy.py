@@ -0,0 +1,171 @@
+"""Tests for hierarchical topic segmentation."""
+import math
+import random
+from collections import Counter
+
+import pytest
+import pytest_asyncio
+
+from mcp_youtube_intelligence.core import hierarchy
+from mcp_youtube_intelligence.core.segmenter import cached_segment_topics, segment_topics
+
+# Four topics, each with three subtopics emphasising two of its words
+_TOPICS = [
+    "memory chip wafer foundry lithography yield",
+    "mortgage rates bond treasury inflation yields",
+    "football league goal striker coach season",
+    "recipe garlic onion pasta sauce oven",
+]
+
+
+def _nested_text(sentences_per_sub: int = 30, seed: int = 0) -> tuple[str, list[int], list[int]]:
+    """Returns (text, offsets where topics change, offsets where subtopics change)."""
+    rng = random.Random(seed)
+    parts, topics, subs, pos = [], [], [], 0
+    for t, topic in enumerate(_TOPICS):
+        words = topic.split()
+        for sub in range(3):
+            if sub:
+                subs.append(pos)
+            elif t:
+                topics.append(pos)
+            pool = words[sub * 2:sub * 2 + 2] * 3 + words
+            for _ in range(sentences_per_sub):
+                sentence = " ".join(rng.choice(pool) for _ in range(10)) + "."
+                parts.append(sentence)
+                pos += len(sentence) + 1
+    return " ".join(parts), topics, subs
+
+
+def _near(found: list[int], expected: list[int], slack: int = hierarchy.BLOCK_TOKENS * 8) -> bool:
+    """Boundaries are found at block granularity: within one block of the truth."""
+    return len(found) == len(expected) and all(abs(f - e) <= slack for f, e in zip(found, expected))
+
+
+def _naive_merge_order(bags):
+    """Reference: rebuild every adjacent pair's cost from scratch after each merge."""
+    clusters = [(i, Counter(b)) for i, b in enumerate(bags)]
+    order = []
+    while len(clusters) > 1:
+        best = None
+        for j in range(len(clusters) - 1):
+            a, b = clusters[j][1], clusters[j + 1][1]
+            na, nb = sum(a.values()), sum(b.values())
+            dot = sum(c * b[t] for t, c in a.items())
+            norms = math.sqrt(sum(c * c for c in a.values())) * math.sqrt(sum(c * c for c in b.values()))
+            sim = dot / norms if norms else 0.0
+            cost = (1 - sim) * na * nb / (na + nb) if na + nb else 0.0
+            if best is None or (cost, clusters[j + 1][0]) < best[0]:
+                best = ((cost, clusters[j + 1][0]), j, sim)
+        (_, boundary), j, sim = best
+        order.append((boundary, sim))
+        clusters[j:j + 2] = [(clusters[j][0], clusters[j][1] + clusters[j + 1][1])]
+    return order
+
+
+class TestMergeOrder:
+    def test_matches_naive_agglomeration(self):
+        rng = random.Random(7)
+        for _ in range(20):
+            bags = [Counter(rng.choices(range(12), k=rng.randint(1, 15))) for _ in range(rng.randint(2, 25))]
+            fast = hierarchy.merge_order(bags)
+            naive = _naive_merge_order(bags)
+            assert [b for b, _ in fast] == [b for b, _ in naive]
+            assert all(abs(x - y) < 1e-9 for (_, x), (_, y) in zip(fast, naive))
+
+    def test_every_boundary_once(self):
+        bags = [Counter({i % 3: 2}) for i in range(10)]
+        assert sorted(b for b, _ in hierarchy.merge_order(bags)) == list(range(1, 10))
+
+    def test_single_bag(self):
+        assert hierarchy.merge_order([Counter("ab")]) == []
+
+
+class TestTopicTree:
+    def test_cuts_are_nested(self):
+        text, _, _ = _nested_text()
+        tree = hierarchy.TopicTree(text)
+        previous: set[int] = set()
+        for k in range(1, len(tree) + 1):
+            starts = {s for s, _, _ in tree.cut(k)}
+            assert len(starts) == k
+            assert previous <= starts
+            previous = starts
+
+    def test_cuts_cover_text(self):
+        text, _, _ = _nested_text()
+        cut = hierarchy.TopicTree(text).cut(5)
+        assert cut[0][0] == 0 and cut[-1][1] == len(text)
+        assert all(a[1] == b[0] for a, b in zip(cut, cut[1:]))
+
+    def test_max_segments_finds_topics(self):
+        text, topics, _ = _nested_text()
+        result = segment_topics(text, method="hierarchical", max_segments=4)
+        assert _near([s["char_start"] for s in result[1:]], topics)
+        assert result[0]["confidence"] is None
+        assert all(s["confidence"] > 0.5 for s in result[1:])
+
+    def test_finer_level_finds_subtopics(self):
+        text, topics, subs = _nested_text()
+        result = segment_topics(text, method="hierarchical", max_segments=12)
+        assert _near([s["char_start"] for s in result[1:]], sorted(topics + subs))
+
+    def test_level_sizes(self):
+        text, _, _ = _nested_text()
+        tree = hierarchy.TopicTree(text)
+        assert tree.level_sizes(3, top=2) == [2, 6, 18]
+        assert tree.level_sizes(5, top=len(tree) - 1) == [len(tree) - 1, len(tree)]
+
+    def test_short_text(self):
+        result = segment_topics("Just one short sentence.", method="hierarchical", max_segments=3)
+        assert len(result) == 1
+        assert result[0]["text"] == "Just one short sentence."
+
+
+class TestNestedOutput:
+    def test_children_inside_parents(self):
+        text, topics, _ = _nested_text()
+        roots = hierarchy.topic_tree(text, levels=2, max_segments=4)
+        assert [r["id"] for r in roots] == ["1", "2", "3", "4"]
+        assert _near([r["char_start"] for r in roots[1:]], topics)
+        for root in roots:
+            assert root["level"] == 1
+            kids = root["children"]
+            assert kids[0]["char_start"] == root["char_start"]
+            assert kids[-1]["char_end"] == root["char_end"]
+            assert kids[0]["id"] == root["id"] + ".1"
+            assert all(k["level"] == 2 and not k["children"] for k in kids)
+
+    def test_times_from_timed_segments(self):
+        text, _, _ = _nested_text(sentences_per_sub=10)
+        sentences = text.split(". ")
+        timed = [{"start": 2.0 * i, "duration": 2.0, "text": s} for i, s in enumerate(sentences)]
+        roots = hierarchy.topic_tree(text, levels=2, timed_segments=timed)
+        assert roots[0]["start"] == 0.0
+        for root in roots:
+            assert root["children"][0]["start"] == root["start"]
+            assert root["end"] > root["start"]
+
+    def test_empty(self):
+        assert hierarchy.topic_tree("   ") == []
+
+
+@pytest.mark.asyncio
+class TestPersistedLevels:
+    @pytest_asyncio.fixture
+    async def storage(self, tmp_path):
+        from mcp_youtube_intelligence.storage.sqlite import SQLiteStorage
+        s = SQLiteStorage(str(tmp_path / "tree.db"))
+        await s.initialize()
+        yield s
+        await s.close()
+
+    async def test_granularities_stored_separately(self, storage):
+        text, _, _ = _nested_text()
+        four, cached = await cached_segment_topics("v1", text, storage, method="hierarchical", max_segments=4)
+        assert not cached and len(four) == 4
+        twelve, cached = await cached_segment_topics("v1", text, storage, method="hierarchical", max_segments=12)
+        assert not cached and len(twelve) == 12
+        again, cached = await cached_segment_topics("v1", text, storage, method="hierarchical", max_segments=4)
+        assert cached and again == four
+        assert await storage.get_topic_segments("v1", "hierarchical:max=4")
@@ -0,0 +1,130 @@
+"""Tests for the tiered video metadata cache."""
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+from mcp_youtube_intelligence.core import metadata_cache
+from mcp_youtube_intelligence.storage.sqlite import SQLiteStorage
+
+
+@pytest_asyncio.fixture
+async def storage():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        s = SQLiteStorage(os.path.join(tmpdir, "test.db"))
+        await s.initialize()
+        yield s
+        await s.close()
+
+
+def _meta(views=100, title="Title"):
+    return {
+        "video_id": "v1", "title": title, "description": "desc", "channel_id": "UC1",
+        "channel_name": "Chan", "published_at": "20240101", "duration_seconds": 600,
+        "view_count": views, "like_count": 10, "comment_count": 5, "thumbnail_url": None,
+        "chapters": [{"title": "Intro", "start_time": 0}], "is_live": False, "was_live": False,
+    }
+
+
+@pytest.mark.asyncio
+class TestGetMetadata:
+    async def test_first_call_fetches_and_stores(self, storage):
+        with patch.object(metadata_cache.collector, "get_video_metadata", return_value=_meta()) as fetch:
+            meta = await metadata_cache.get_metadata("v1", storage)
+        assert meta["title"] == "Title"
+        fetch.assert_called_once()
+        record = await storage.get_video("v1")
+        assert record["metadata_at"] and record["counters_at"]
+        assert record["chapters"] == [{"title": "Intro", "start_time": 0}]
+
+    async def test_fresh_record_is_served_without_fetching(self, storage):
+        await storage.upsert_video(metadata_cache.stamp(_meta()))
+        with patch.object(metadata_cache.collector, "get_video_metadata") as fetch:
+            meta = await metadata_cache.get_metadata("v1", storage)
+            await metadata_cache.wait_for_refreshes()
+        fetch.assert_not_called()
+        assert meta["view_count"] == 100
+        assert meta["duration_seconds"] == 600
+
+    async def test_stale_counters_served_then_refreshed(self, storage):
+        old = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+        await storage.upsert_video(metadata_cache.stamp(_meta(), now=old))
+        fresh = _meta(views=999, title="Renamed upstream")
+        with patch.object(metadata_cache.collector, "get_video_metadata", return_value=fresh) as fetch:
+            meta = await metadata_cache.get_metadata("v1", storage, counters_ttl_hours=1)
+            assert meta["view_count"] == 100
+            await metadata_cache.wait_for_refreshes()
+        fetch.assert_called_once()
+        record = await storage.get_video("v1")
+        assert record["view_count"] == 999
+        assert record["counters_at"] > old
+        # Immutable fields keep their first-fetched values
+        assert record["title"] == "Title"
+        assert record["metadata_at"] == old
+
+    async def test_concurrent_stale_reads_share_one_refresh(self, storage):
+        old = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+        await storage.upsert_video(metadata_cache.stamp(_meta(), now=old))
+        with patch.object(metadata_cache.collector, "get_video_metadata", return_value=_meta(views=5)) as fetch:
+            for _ in range(3):
+                await metadata_cache.get_metadata("v1", storage, counters_ttl_hours=1)
+            await metadata_cache.wait_for_refreshes()
+        fetch.assert_called_once()
+
+    async def test_failed_refresh_keeps_stored_counters(self, storage):
+        old = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+        await storage.upsert_video(metadata_cache.stamp(_meta(), now=old))
+        with patch.object(metadata_cache.collector, "get_video_metadata", return_value=None):
+            await metadata_cache.get_metadata("v1", storage, counters_ttl_hours=1)
+            await metadata_cache.wait_for_refreshes()
+        record = await storage.get_video("v1")
+        assert record["view_count"] == 100
+        assert record["counters_at"] == old
+
+    async def test_unavailable_video_returns_none(self, storage):
+        with patch.object(metadata_cache.collector, "get_video_metadata", return_value=None):
+            assert await metadata_cache.get_metadata("v1", storage) is None
+        assert await storage.get_video("v1") is None
+
+    async def test_rows_collected_before_the_cache_are_served(self, storage):
+        import aiosqlite
+        await storage.upsert_video({**_meta(), "status": "done", "collected_at": "2025-01-01T00:00:00+00:00"})
+        await storage.close()
+        async with aiosqlite.connect(storage.db_path) as db:
+            await db.execute("ALTER TABLE videos DROP COLUMN metadata_at")
+            await db.execute("ALTER TABLE videos DROP COLUMN counters_at")
+            await db.commit()
+        await storage.initialize()
+        with patch.object(metadata_cache.collector, "get_video_metadata", return_value=_meta(views=999)) as fetch:
+            meta = await metadata_cache.get_metadata("v1", storage)
+            # Stored metadata served at once; counters refreshed in the background
+            assert meta["view_count"] == 100
+            await metadata_cache.wait_for_refreshes()
+        fetch.assert_called_once()
+        assert (await storage.get_video("v1"))["view_count"] == 999
+
+
+@pytest.mark.asyncio
+class TestCliShutdown:
+    async def test_close_waits_for_counter_refresh(self, storage):
+        import asyncio
+        import time
+        from mcp_youtube_intelligence.cli import _close_storage
+
+        old = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+        await storage.upsert_video(metadata_cache.stamp(_meta(), now=old))
+
+        def slow_fetch(video_id, yt_dlp):
+            time.sleep(0.2)
+            return _meta(views=999)
+
+        with patch.object(metadata_cache.collector, "get_video_metadata", slow_fetch):
+            await metadata_cache.get_metadata("v1", storage, counters_ttl_hours=1)
+            await _close_storage(storage)
+        await storage.initialize()
+        assert (await storage.get_video("v1"))["view_count"] == 999
+        assert not metadata_cache._refreshing
+        assert asyncio.all_tasks() == {asyncio.current_task()}
@@ -61,3 +61,148 @@ class TestFetchChannelYtdlp:
         mock_run.side_effect = Exception("timeout")
         result = _fetch_channel_ytdlp("UCtest")
         assert result == []
+
+
+@pytest.mark.asyncio
+class TestCheckChannelNewVideos:
+    async def test_new_videos_stored_with_batch_metadata(self, tmp_path):
+        from mcp_youtube_intelligence.core.monitor import check_channel_new_videos
+        from mcp_youtube_intelligence.storage.sqlite import SQLiteStorage
+        storage = SQLiteStorage(str(tmp_path / "m.db"))
+        await storage.initialize()
+        await storage.upsert_video({"video_id": "old", "title": "Old"})
+        feed = [
+            {"video_id": vid, "title": f"Feed {vid}", "published": "2026-01-01", "link": ""}
+            for vid in ("old", "v1", "v2")
+        ]
+        batch = MagicMock(return_value={
+            "v1": {"video_id": "v1", "title": "Full v1", "duration_seconds": 600, "view_count": None},
+            "v2": {"error": "Video unavailable"},
+        })
+        with patch("mcp_youtube_intelligence.core.monitor.fetch_channel_feed", return_value=feed), \
+                patch("mcp_youtube_intelligence.core.monitor.collector.get_video_metadata_batch", batch):
+            new = await check_channel_new_videos("UC1", storage, yt_dlp="ytd")
+        assert [v["video_id"] for v in new] == ["v1", "v2"]
+        batch.assert_called_once_with(["v1", "v2"], yt_dlp="ytd")
+        v1, v2 = await storage.get_video("v1"), await storage.get_video("v2")
+        assert (v1["title"], v1["duration_seconds"], v1["status"]) == ("Full v1", 600, "pending")
+        assert (v2["title"], v2["channel_id"], v2["status"]) == ("Feed v2", "UC1", "pending")
+        await storage.close()
+
+
+_FEED_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" xmlns="http://www.w3.org/2005/Atom">
+ <entry><yt:videoId>{cid}-v1</yt:videoId><title>First {cid}</title><published>2026-01-01T00:00:00+00:00</published></entry>
+ <entry><yt:videoId>{cid}-v2</yt:videoId><title>Second {cid}</title><published>2026-01-02T00:00:00+00:00</published></entry>
+</feed>"""
+
+
+@pytest.fixture
+def feed_server():
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlsplit
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            srv = self.server
+            cid = parse_qs(urlsplit(self.path).query)["channel_id"][0]
+            with srv.lock:
+                srv.in_flight += 1
+                srv.max_in_flight = max(srv.max_in_flight, srv.in_flight)
+            time.sleep(srv.delay)
+            with srv.lock:
+                srv.in_flight -= 1
+            if cid.startswith("UCmissing"):
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = _FEED_XML.format(cid=cid).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/atom+xml")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    srv.lock, srv.in_flight, srv.max_in_flight, srv.delay = threading.Lock(), 0, 0, 0.1
+    threading.Thread(target=srv.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    url = f"http://127.0.0.1:{srv.server_port}/feeds/videos.xml?channel_id={{channel_id}}"
+    with patch("mcp_youtube_intelligence.core.monitor.FEED_URL", url), \
+            patch("mcp_youtube_intelligence.core.monitor._RSS_RETRY_DELAY", 0), \
+            patch("mcp_youtube_intelligence.core.monitor.collector.get_video_metadata_batch",
+                  side_effect=lambda ids, yt_dlp: {vid: {"error": "offline"} for vid in ids}):
+        yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.mark.asyncio
+class TestSweepChannels:
+    async def _storage(self, tmp_path, channel_ids):
+        from mcp_youtube_intelligence.storage.sqlite import SQLiteStorage
+        storage = SQLiteStorage(str(tmp_path / "s.db"))
+        await storage.initialize()
+        for cid in channel_ids:
+            await storage.upsert_channel({"channel_id": cid, "channel_name": f"N {cid}", "enabled": 1})
+        await storage.upsert_channel({"channel_id": "UCoff", "channel_name": "off", "enabled": 0})
+        return storage
+
+    @pytest.mark.parametrize("use_httpx", [True, False])
+    async def test_bounded_concurrent_sweep(self, tmp_path, feed_server, use_httpx):
+        from mcp_youtube_intelligence.core import monitor
+        if use_httpx:
+            pytest.importorskip("httpx")
+        channel_ids = [f"UC{i}" for i in range(8)]
+        storage = await self._storage(tmp_path, channel_ids)
+        with patch.object(monitor, "_httpx", monitor._httpx if use_httpx else lambda: None):
+            result = await monitor.sweep_channels(storage, concurrency=3)
+        assert result["channels_checked"] == 8
+        assert result["new_video_count"] == 16
+        assert result["errors"] == 0
+        assert [c["channel_id"] for c in result["channels"]] == channel_ids
+        assert all(c["seconds"] >= 0.1 for c in result["channels"])
+        assert 1 < feed_server.max_in_flight <= 3
+        # 8 feeds at 0.1s each, three at a time
+        assert result["duration_seconds"] < 0.8
+        stored = await storage.get_video("UC5-v2")
+        assert (stored["title"], stored["channel_id"], stored["status"]) == ("Second UC5", "UC5", "pending")
+        assert (await storage.get_channel("UC5"))["last_checked_at"]
+
+        again = await monitor.sweep_channels(storage, concurrency=3)
+        assert again["new_video_count"] == 0
+        await storage.close()
+
+    async def test_failed_feed_falls_back_to_ytdlp(self, tmp_path, feed_server):
+        from mcp_youtube_intelligence.core import monitor
+        storage = await self._storage(tmp_path, ["UC1", "UCmissing"])
+        fallback = [{"video_id": "yv1", "title": "From yt-dlp", "published": "", "link": ""}]
+        with patch.object(monitor, "_fetch_channel_ytdlp", return_value=fallback) as ytdlp:
+            result = await monitor.sweep_channels(storage)
+        ytdlp.assert_called_once_with("UCmissing")
+        by_id = {c["channel_id"]: c for c in result["channels"]}
+        assert [v["video_id"] for v in by_id["UCmissing"]["new_videos"]] == ["yv1"]
+        assert len(by_id["UC1"]["new_videos"]) == 2
+        await storage.close()
+
+    async def test_channel_error_does_not_stop_sweep(self, tmp_path, feed_server):
+        from mcp_youtube_intelligence.core import monitor
+        storage = await self._storage(tmp_path, ["UC1", "UC2"])
+        real = monitor.check_channel_new_videos
+
+        async def flaky(channel_id, *args, **kwargs):
+            if channel_id == "UC1":
+                raise RuntimeError("db locked")
+            return await real(channel_id, *args, **kwargs)
+
+        with patch.object(monitor, "check_channel_new_videos", flaky):
+            result = await monitor.sweep_channels(storage)
+        assert result["errors"] == 1
+        assert result["channels"][0] == {**result["channels"][0], "error": "db locked"}
+        assert len(result["channels"][1]["new_videos"]) == 2
+        await storage.close()
@@ -53,21 +53,23 @@ def mock_comments():
     ]
 
 
+def _acquired(meta, tr, comments=None):
+    return {"video_id": "test123", "metadata": meta, "transcript": tr, "comments": comments}
+
+
 @pytest.mark.asyncio
 async def test_generate_report_basic(mock_meta, mock_transcript, mock_segments, mock_entities, mock_comments):
-    with patch("mcp_youtube_intelligence.core.report.collector") as m_collector, \
+    with patch("mcp_youtube_intelligence.core.report.acquire") as m_acquire, \
          patch("mcp_youtube_intelligence.core.report.transcript") as m_transcript, \
          patch("mcp_youtube_intelligence.core.report.segmenter") as m_segmenter, \
          patch("mcp_youtube_intelligence.core.report.entities") as m_entities, \
          patch("mcp_youtube_intelligence.core.report.comments") as m_comments:
 
-        m_collector.get_video_metadata.return_value = mock_meta
-        m_transcript.fetch_transcript.return_value = mock_transcript
+        m_acquire.acquire_video.return_value = _acquired(mock_meta, mock_transcript, mock_comments)
         m_transcript.clean_transcript.return_value = mock_transcript["best"]
         m_transcript.summarize_extractive.return_value = "Test summary."
         m_segmenter.segment_topics.return_value = mock_segments
         m_entities.extract_entities.return_value = mock_entities
-        m_comments.fetch_comments.return_value = mock_comments
         m_comments.summarize_comments.return_value = {
             "count": 2,
             "sentiment_ratio": {"positive": 0.5, "negative": 0.5, "neutral": 0.0},
@@ -91,13 +93,12 @@ async def test_generate_report_basic(mock_meta, mock_transcript, mock_segments,
 
 @pytest.mark.asyncio
 async def test_generate_report_no_comments(mock_meta, mock_transcript, mock_segments, mock_entities):
-    with patch("mcp_youtube_intelligence.core.report.collector") as m_collector, \
+    with patch("mcp_youtube_intelligence.core.report.acquire") as m_acquire, \
          patch("mcp_youtube_intelligence.core.report.transcript") as m_transcript, \
          patch("mcp_youtube_intelligence.core.report.segmenter") as m_segmenter, \
          patch("mcp_youtube_intelligence.core.report.entities") as m_entities:
 
-        m_collector.get_video_metadata.return_value = mock_meta
-        m_transcript.fetch_transcript.return_value = mock_transcript
+        m_acquire.acquire_video.return_value = _acquired(mock_meta, mock_transcript)
         m_transcript.clean_transcript.return_value = mock_transcript["best"]
         m_transcript.summarize_extractive.return_value = "Summary."
         m_segmenter.segment_topics.return_value = mock_segments
@@ -111,11 +112,10 @@ async def test_generate_report_no_comments(mock_meta, mock_transcript, mock_segm
 
 @pytest.mark.asyncio
 async def test_generate_report_no_transcript(mock_meta):
-    with patch("mcp_youtube_intelligence.core.report.collector") as m_collector, \
+    with patch("mcp_youtube_intelligence.core.report.acquire") as m_acquire, \
          patch("mcp_youtube_intelligence.core.report.transcript") as m_transcript:
 
-        m_collector.get_video_metadata.return_value = mock_meta
-        m_transcript.fetch_transcript.return_value = {"best": None, "lang": None, "timed_segments": []}
+        m_acquire.acquire_video.return_value = _acquired(mock_meta, {"best": None, "lang": None, "timed_segments": []})
         m_transcript.clean_transcript.return_value = ""
 
         report = await generate_report("test123")
@@ -125,14 +125,13 @@ async def test_generate_report_no_transcript(mock_meta):
 
 @pytest.mark.asyncio
 async def test_generate_report_comments_fail(mock_meta, mock_transcript, mock_segments, mock_entities):
-    with patch("mcp_youtube_intelligence.core.report.collector") as m_collector, \
+    with patch("mcp_youtube_intelligence.core.report.acquire") as m_acquire, \
          patch("mcp_youtube_intelligence.core.report.transcript") as m_transcript, \
          patch("mcp_youtube_intelligence.core.report.segmenter") as m_segmenter, \
          patch("mcp_youtube_intelligence.core.report.entities") as m_entities, \
          patch("mcp_youtube_intelligence.core.report.comments") as m_comments:
 
-        m_collector.get_video_metadata.return_value = mock_meta
-        m_transcript.fetch_transcript.return_value = mock_transcript
+        m_acquire.acquire_video.return_value = _acquired(mock_meta, mock_transcript)
         m_transcript.clean_transcript.return_value = mock_transcript["best"]
         m_transcript.summarize_extractive.return_value = "Summary."
         m_segmenter.segment_topics.return_value = mock_segments
@@ -143,3 +142,93 @@ async def test_generate_report_comments_fail(mock_meta, mock_transcript, mock_se
 
         assert "Comments unavailable" in report
         assert "Summary" in report  # rest of report still works
+
+
+@pytest.mark.asyncio
+async def test_generate_report_uses_chapters(mock_meta, mock_transcript, mock_entities):
+    meta = {**mock_meta, "chapters": [
+        {"title": "Intro", "start": 0.0, "end": 65.0},
+        {"title": "Deep dive", "start": 65.0, "end": 600.0},
+    ]}
+    timed = [{"start": 0.0, "text": "welcome"}, {"start": 70.0, "text": "the details"}]
+    with patch("mcp_youtube_intelligence.core.report.acquire") as m_acquire, \
+         patch("mcp_youtube_intelligence.core.report.transcript") as m_transcript, \
+         patch("mcp_youtube_intelligence.core.report.entities") as m_entities:
+
+        m_acquire.acquire_video.return_value = _acquired(meta, {**mock_transcript, "timed_segments": timed})
+        m_transcript.clean_transcript.return_value = mock_transcript["best"]
+        m_transcript.summarize_extractive.return_value = "Summary."
+        m_entities.extract_entities.return_value = mock_entities
+
+        report = await generate_report("test123", include_comments=False)
+
+        assert "| 1 | Intro | Intro | 0:00~1:05 |" in report
+        assert "| 2 | Deep dive | Deep dive | 1:05~10:00 |" in report
+
+
+@pytest.mark.asyncio
+async def test_generate_report_acquires_once(mock_meta, mock_transcript, mock_entities, mock_comments):
+    with patch("mcp_youtube_intelligence.core.report.acquire") as m_acquire, \
+         patch("mcp_youtube_intelligence.core.report.collector") as m_collector, \
+         patch("mcp_youtube_intelligence.core.report.transcript") as m_transcript, \
+         patch("mcp_youtube_intelligence.core.report.entities") as m_entities, \
+         patch("mcp_youtube_intelligence.core.report.comments") as m_comments:
+
+        m_acquire.acquire_video.return_value = _acquired(mock_meta, mock_transcript, mock_comments)
+        m_transcript.clean_transcript.return_value = mock_transcript["best"]
+        m_transcript.summarize_extractive.return_value = "Summary."
+        m_entities.extract_entities.return_value = mock_entities
+        m_comments.summarize_comments.return_value = {"count": 2, "sentiment_ratio": {}, "top_comments": []}
+
+        report = await generate_report("test123")
+
+        # Metadata, transcript and comments all from one run
+        m_acquire.acquire_video.assert_called_once_with("test123", max_comments=30, yt_dlp="yt-dlp")
+        m_collector.get_video_metadata.assert_not_called()
+        m_transcript.fetch_transcript.assert_not_called()
+        m_comments.fetch_comments.assert_not_called()
+        m_comments.summarize_comments.assert_called_once_with(mock_comments)
+        assert "Total comments: 2" in report
+
+
+@pytest.mark.asyncio
+async def test_generate_report_comments_fall_back_to_fetch(mock_meta, mock_transcript, mock_entities, mock_comments):
+    with patch("mcp_youtube_intelligence.core.report.acquire") as m_acquire, \
+         patch("mcp_youtube_intelligence.core.report.transcript") as m_transcript, \
+         patch("mcp_youtube_intelligence.core.report.entities") as m_entities, \
+         patch("mcp_youtube_intelligence.core.report.comments") as m_comments:
+
+        # Comments were not extracted with the rest (e.g. no yt_dlp package)
+        m_acquire.acquire_video.return_value = _acquired(mock_meta, mock_transcript)
+        m_transcript.clean_transcript.return_value = mock_transcript["best"]
+        m_transcript.summarize_extractive.return_value = "Summary."
+        m_entities.extract_entities.return_value = mock_entities
+        m_comments.fetch_comments.return_value = mock_comments
+        m_comments.summarize_comments.return_value = {"count": 2, "sentiment_ratio": {}, "top_comments": []}
+
+        report = await generate_report("test123")
+
+        m_comments.fetch_comments.assert_called_once_with("test123", max_comments=30, yt_dlp="yt-dlp")
+        assert "Total comments: 2" in report
+
+
+@pytest.mark.asyncio
+async def test_generate_report_transcript_only_skips_acquisition(mock_meta, mock_transcript, mock_entities):
+    with patch("mcp_youtube_intelligence.core.report.acquire") as m_acquire, \
+         patch("mcp_youtube_intelligence.core.report.collector") as m_collector, \
+         patch("mcp_youtube_intelligence.core.report.transcript") as m_transcript, \
+         patch("mcp_youtube_intelligence.core.report.entities") as m_entities:
+
+        # Metadata comes without a page extraction (e.g. Data API), comments excluded
+        m_acquire.metadata_needs_extraction.return_value = False
+        m_collector.get_video_metadata.return_value = mock_meta
+        m_transcript.fetch_transcript.return_value = mock_transcript
+        m_transcript.clean_transcript.return_value = mock_transcript["best"]
+        m_transcript.summarize_extractive.return_value = "Summary."
+        m_entities.extract_entities.return_value = mock_entities
+
+        report = await generate_report("test123", include_comments=False)
+
+        m_acquire.acquire_video.assert_not_called()
+        m_transcript.fetch_transcript.assert_called_once_with("test123")
+        assert "테스트 영상" in report
@@ -1,6 +1,8 @@
 """Tests for topic segmentation."""
 import pytest
-from mcp_youtube_intelligence.core.segmenter import segment_topics, MIN_SEGMENT_CHARS
+import pytest_asyncio
+from mcp_youtube_intelligence.core.segmenter import cached_segment_topics, segment_topics, MIN_SEGMENT_CHARS
+from mcp_youtube_intelligence.core.transcript import clean_transcript
 
 
 class TestSegmentTopics:
@@ -158,3 +160,173 @@ class TestSegmentTopics:
     def test_min_segment_chars(self):
         """MIN_SEGMENT_CHARS should be 60."""
         assert MIN_SEGMENT_CHARS == 60
+
+
+class TestSplitScores:
+    def test_matches_rebuilt_cosine(self):
+        import random
+        from collections import Counter
+        from mcp_youtube_intelligence.core.segmenter import _cosine, _split_scores
+
+        rng = random.Random(42)
+        bags = [
+            Counter({f"w{rng.randint(0, 20)}": rng.randint(1, 3) for _ in range(rng.randint(0, 6))})
+            for _ in range(40)
+        ]
+        expected = []
+        for i in range(1, len(bags)):
+            left, right = Counter(), Counter()
+            for b in bags[:i]:
+                left.update(b)
+            for b in bags[i:]:
+                right.update(b)
+            expected.append(_cosine(left, right))
+        assert _split_scores(bags) == expected
+
+    def test_empty_side_scores_zero(self):
+        from collections import Counter
+        from mcp_youtube_intelligence.core.segmenter import _split_scores
+
+        assert _split_scores([Counter(), Counter({"a": 1}), Counter({"a": 2})]) == [0.0, 1.0]
+        assert _split_scores([Counter({"a": 1})]) == []
+
+
+class TestChapterSegmentation:
+    CHAPTERS = [
+        {"title": "Intro", "start": 0.0, "end": 60.0},
+        {"title": "Earnings", "start": 60.0, "end": 300.0},
+        {"title": "Empty", "start": 300.0, "end": 320.0},
+        {"title": "Q&A", "start": 320.0, "end": None},
+    ]
+    TIMED = [
+        {"start": 0.0, "text": "hello and welcome"},
+        {"start": 30.5, "text": "today we look at results"},
+        {"start": 60.0, "text": "revenue grew"},
+        {"start": 120.0, "text": "margins expanded"},
+        {"start": 330.0, "text": "first question"},
+    ]
+
+    def test_segments_follow_chapters(self):
+        from mcp_youtube_intelligence.core.segmenter import segment_by_chapters
+        result = segment_by_chapters(self.CHAPTERS, self.TIMED)
+        assert [s["topic"] for s in result] == ["Intro", "Earnings", "Q&A"]
+        assert result[0]["text"] == "hello and welcome today we look at results"
+        assert result[1]["text"] == "revenue grew margins expanded"
+        assert (result[1]["start"], result[1]["end"]) == (60.0, 300.0)
+        assert [s["segment"] for s in result] == [0, 1, 2]
+        assert result[2]["char_count"] == len("first question")
+
+    def test_auto_prefers_chapters(self):
+        result = segment_topics("unrelated text", chapters=self.CHAPTERS, timed_segments=self.TIMED)
+        assert result[0]["chapter"] == "Intro"
+
+    def test_auto_without_chapters_uses_markers(self):
+        text = "Hello world without any markers at all."
+        assert segment_topics(text, chapters=None, timed_segments=self.TIMED) == segment_topics(text, method="markers")
+
+    def test_markers_method_ignores_chapters(self):
+        result = segment_topics("Some text here.", method="markers", chapters=self.CHAPTERS, timed_segments=self.TIMED)
+        assert "chapter" not in result[0]
+
+
+class TestSegmentLocation:
+    TIMED = [
+        {"start": 0.0, "duration": 4.0, "text": "first we talk about chips and wafers."},
+        {"start": 4.0, "duration": 4.0, "text": "memory prices are rising this year."},
+        {"start": 8.0, "duration": 4.0, "text": "next topic is the interest rate path."},
+        {"start": 12.0, "duration": 4.0, "text": "bond yields moved sharply lower."},
+    ]
+
+    def _text(self):
+        return " ".join(s["text"] for s in self.TIMED)
+
+    def test_char_offsets_slice_text(self):
+        text = self._text()
+        for method in ("markers", "texttiling"):
+            for seg in segment_topics(text, method=method):
+                assert text[seg["char_start"]:seg["char_end"]].strip() == seg["text"]
+
+    def test_times_from_timed_segments(self):
+        text = self._text()
+        result = segment_topics(text, method="markers", timed_segments=self.TIMED)
+        assert len(result) == 2
+        assert (result[0]["start"], result[0]["end"]) == (0.0, 8.0)
+        assert (result[1]["start"], result[1]["end"]) == (8.0, 16.0)
+
+    def test_chapters_get_char_offsets(self):
+        text = self._text()
+        chapters = [{"title": "Chips", "start": 0.0, "end": 8.0}, {"title": "Rates", "start": 8.0, "end": None}]
+        result = segment_topics(text, chapters=chapters, timed_segments=self.TIMED)
+        assert [s["chapter"] for s in result] == ["Chips", "Rates"]
+        assert text[result[1]["char_start"]:].startswith("next topic")
+        assert result[0]["char_end"] == result[1]["char_start"]
+        assert result[1]["char_end"] == len(text)
+
+
+@pytest.mark.asyncio
+class TestPersistedSegments:
+    @pytest_asyncio.fixture
+    async def storage(self, tmp_path):
+        from mcp_youtube_intelligence.storage.sqlite import SQLiteStorage
+        s = SQLiteStorage(str(tmp_path / "seg.db"))
+        await s.initialize()
+        yield s
+        await s.close()
+
+    async def test_second_call_reads_stored_segments(self, storage):
+        text = " ".join(s["text"] for s in TestSegmentLocation.TIMED)
+        timed = TestSegmentLocation.TIMED
+        first, cached = await cached_segment_topics("v1", text, storage, timed_segments=timed)
+        assert not cached
+        second, cached = await cached_segment_topics("v1", text, storage, timed_segments=timed)
+        assert cached
+        assert second == first
+
+    async def test_chapter_text_matches_fresh_result(self, storage):
+        # The repeated sentence is cleaned out of the full transcript but kept in each
+        # chapter's captions, so slicing the transcript by offsets gives other text
+        timed = [
+            {"start": 0.0, "duration": 5.0, "text": "Thanks for watching."},
+            {"start": 5.0, "duration": 5.0, "text": "Thanks for watching. Next we cover rates."},
+            {"start": 10.0, "duration": 5.0, "text": "Rates rose."},
+        ]
+        chapters = [{"title": "Intro", "start": 0.0, "end": 5.0}, {"title": "Rates", "start": 5.0, "end": 15.0}]
+        text = clean_transcript(" ".join(s["text"] for s in timed))
+        first, _ = await cached_segment_topics("v1", text, storage, chapters=chapters, timed_segments=timed)
+        second, cached = await cached_segment_topics("v1", text, storage, chapters=chapters, timed_segments=timed)
+        assert cached and second == first
+
+    async def test_recomputed_when_timings_become_available(self, storage):
+        timed = TestSegmentLocation.TIMED
+        text = " ".join(s["text"] for s in timed)
+        untimed, _ = await cached_segment_topics("v1", text, storage)
+        assert "start" not in untimed[0]
+        result, cached = await cached_segment_topics("v1", text, storage, timed_segments=timed)
+        assert not cached
+        assert result[0]["start"] == 0.0
+
+    async def test_texttiling_roundtrip(self, storage):
+        text = " ".join(f"sentence {i} about chips wafers." for i in range(200))
+        first, _ = await cached_segment_topics("v1", text, storage, method="texttiling")
+        second, cached = await cached_segment_topics("v1", text, storage, method="texttiling")
+        assert cached and second == first
+
+    async def test_recomputed_when_transcript_changes(self, storage):
+        await cached_segment_topics("v1", "Some text here.", storage)
+        result, cached = await cached_segment_topics("v1", "Other text now.", storage)
+        assert not cached
+        assert result[0]["text"] == "Other text now."
+
+    async def test_recomputed_when_version_changes(self, storage, monkeypatch):
+        from mcp_youtube_intelligence.core import segmenter
+        await cached_segment_topics("v1", "Some text here.", storage)
+        monkeypatch.setattr(segmenter, "SEGMENTER_VERSION", segmenter.SEGMENTER_VERSION + 1)
+        _, cached = await cached_segment_topics("v1", "Some text here.", storage)
+        assert not cached
+        rows = await storage.get_topic_segments("v1", "auto")
+        assert rows[0]["version"] == segmenter.SEGMENTER_VERSION
+
+    async def test_methods_stored_separately(self, storage):
+        await cached_segment_topics("v1", "Some text here.", storage, method="markers")
+        _, cached = await cached_segment_topics("v1", "Some text here.", storage, method="texttiling")
+        assert not cached
@@ -0,0 +1,123 @@
+"""Tests for sentence reconstruction on unpunctuated transcripts."""
+from mcp_youtube_intelligence.core import sentences
+from mcp_youtube_intelligence.core.document import Document
+from mcp_youtube_intelligence.core.segmenter import segment_topics
+from mcp_youtube_intelligence.core.summarizer import extractive_summary
+from mcp_youtube_intelligence.core.transcript import clean_transcript
+
+
+def _timed(lines: list[str], pause_after: set[int]) -> list[dict]:
+    """Rolling auto-caption segments: 2s apart, 3s durations, +1.5s after *pause_after*."""
+    segs, t = [], 0.0
+    for i, line in enumerate(lines):
+        segs.append({"start": t, "duration": 3.0, "text": line})
+        t += 2.0 + (1.5 if i in pause_after else 0.0)
+    return segs
+
+
+_EN_LINES = [
+    "so the first thing we looked at", "was the supply chain for memory",
+    "prices went up all through the quarter", "the second thing is the data center",
+    "demand from cloud providers", "kept growing every single month",
+]
+
+
+class TestPunctuation:
+    def test_punctuated_text_unchanged(self):
+        text = "First sentence here. Second one follows! Is this third? Yes."
+        assert sentences.split_sentences(text) == [
+            "First sentence here.", "Second one follows!", "Is this third?", "Yes.",
+        ]
+
+    def test_spans_are_trimmed_offsets(self):
+        text = "  Alpha beta.   Gamma delta.  "
+        spans = sentences.sentence_spans(text)
+        assert [text[s:e] for s, e in spans] == ["Alpha beta.", "Gamma delta."]
+
+    def test_empty(self):
+        assert sentences.sentence_spans("") == []
+
+
+class TestKoreanEndings:
+    def test_unpunctuated_korean_split_at_endings(self):
+        text = (
+            "오늘은 인공지능 반도체 시장에 대해 자세히 이야기해 보겠습니다 "
+            "엔비디아의 매출이 데이터센터 수요 덕분에 크게 성장했어요 "
+            "그런데 경쟁사들도 빠르게 추격하고 있죠 "
+            "결국 가격 경쟁이 시작될 가능성이 높다고 봅니다 "
+            "다음 분기 실적 발표를 지켜봐야 할 것 같습니다"
+        )
+        result = sentences.split_sentences(text)
+        assert result[0].endswith("보겠습니다")
+        assert result[1].endswith("성장했어요")
+        assert result[2].endswith("있죠")
+        assert len(result) == 5
+
+    def test_nouns_ending_in_yo_not_split(self):
+        text = ("이 부분이 정말 중요 포인트라서 필요 이상으로 강조하는 바다 같은 넓은 시장 " * 4).strip()
+        assert len(text) > sentences.LONG_SENTENCE_CHARS
+        # No sentence-final endings: only the hard cap applies
+        assert len(sentences.split_sentences(text)) == 1
+
+    def test_short_punctuated_sentence_not_resplit(self):
+        text = "매출이 늘었다 그리고 이익도 늘었다."
+        assert sentences.split_sentences(text) == [text]
+
+
+class TestPauses:
+    def test_pause_gaps_with_overlapping_durations(self):
+        segs = _timed(["a" * 10] * 4, pause_after={1})
+        gaps = sentences.pause_gaps(segs)
+        assert len(gaps) == 3
+        assert gaps[1] > sentences.PAUSE_SECONDS
+        assert gaps[0] < sentences.PAUSE_SECONDS and gaps[2] < sentences.PAUSE_SECONDS
+
+    def test_pause_gaps_with_real_silence(self):
+        segs = [
+            {"start": 0.0, "duration": 1.0, "text": "one"},
+            {"start": 3.0, "duration": 1.0, "text": "two"},
+        ]
+        assert sentences.pause_gaps(segs) == [2.0]
+
+    def test_segment_offsets_skip_removed_segments(self):
+        segs = [{"text": "hello there"}, {"text": "[Music]"}, {"text": "general kenobi"}]
+        text = clean_transcript(" ".join(s["text"] for s in segs))
+        assert sentences.segment_offsets(text, segs) == [0, None, text.index("general")]
+
+    def test_english_split_at_pauses(self):
+        segs = _timed(_EN_LINES, pause_after={i for i in range(len(_EN_LINES)) if i % 3 == 2})
+        text = clean_transcript(" ".join(s["text"] for s in segs))
+        result = sentences.split_sentences(text, segs)
+        assert result[0] == "so the first thing we looked at was the supply chain for memory prices went up all through the quarter"
+        assert result[1] == "the second thing is the data center demand from cloud providers kept growing every single month"
+        assert len(result) == 2
+        # Without timings the unterminated run stays one sentence
+        assert len(sentences.split_sentences(text)) == 1
+
+    def test_hard_cap(self):
+        text = " ".join(["word"] * 500)
+        spans = sentences.sentence_spans(text)
+        assert all(e - s <= sentences.MAX_SENTENCE_CHARS for s, e in spans)
+        assert " ".join(text[s:e] for s, e in spans) == text
+
+
+class TestDownstream:
+    def test_extractive_summary_uses_document(self):
+        segs = _timed(_EN_LINES, pause_after={i for i in range(len(_EN_LINES)) if i % 3 == 2})
+        text = clean_transcript(" ".join(s["text"] for s in segs))
+        doc = Document(text, segs)
+        summary = extractive_summary(text, max_sentences=1, doc=doc)
+        assert summary.rstrip(".") in doc.sentences
+
+    def test_segment_topics_uses_document(self):
+        lines = [
+            "memory chip prices rose", "foundry wafer output grew", "lithography yield improved",
+        ] * 50 + [
+            "mortgage rates kept climbing", "treasury bond yields fell", "inflation data surprised",
+        ] * 50
+        segs = _timed(lines, pause_after={i for i in range(len(lines)) if i % 3 == 2})
+        text = clean_transcript(" ".join(s["text"] for s in segs))
+        result = segment_topics(text, method="markers", doc=Document(text, segs))
+        assert len(result) == 2
+        assert "mortgage" not in result[0]["text"]
+        assert "memory" not in result[1]["text"]
@@ -53,6 +53,159 @@ class TestVideosCRUD:
         results = await storage.search_transcripts("quantum")
         assert len(results) == 0
 
+    async def test_timed_segments_json_roundtrip(self, storage):
+        segs = [{"start": 0.0, "duration": 1.5, "text": "안녕"}]
+        await storage.upsert_video({"video_id": "v1", "timed_segments": segs})
+        result = await storage.get_video("v1")
+        assert result["timed_segments"] == segs
+
+    async def test_chapters_json_roundtrip(self, storage):
+        chapters = [{"title": "Intro", "start": 0.0, "end": 30.0}]
+        await storage.upsert_video({"video_id": "v1", "chapters": chapters})
+        assert (await storage.get_video("v1"))["chapters"] == chapters
+        await storage.upsert_video({"video_id": "v2", "chapters": None})
+        assert (await storage.get_video("v2"))["chapters"] is None
+
+    async def test_migration_adds_missing_columns(self, storage):
+        import aiosqlite
+        await storage.close()
+        async with aiosqlite.connect(storage.db_path) as db:
+            await db.execute("ALTER TABLE videos DROP COLUMN timed_segments")
+            await db.execute("ALTER TABLE videos DROP COLUMN chapters")
+            await db.commit()
+        await storage.initialize()
+        await storage.upsert_video({"video_id": "v1", "timed_segments": [], "chapters": []})
+        assert (await storage.get_video("v1"))["timed_segments"] == []
+
+    async def test_summary_state_roundtrip(self, storage):
+        assert await storage.get_summary_state("v1") is None
+        state = {"offset": 120, "anchor": "abc", "partials": ["p1", "p2"], "summary": "s", "increments": 2}
+        await storage.save_summary_state("v1", state)
+        loaded = await storage.get_summary_state("v1")
+        assert loaded == state
+
+
+@pytest.mark.asyncio
+class TestEntityIndex:
+    async def _seed(self, storage):
+        videos = [
+            ("v1", "UC_A", "2026-10-03T00:00:00+00:00", [("NVIDIA", 5), ("Interest Rate", 2)]),
+            ("v2", "UC_B", "2026-10-10T00:00:00+00:00", [("NVIDIA", 1)]),
+            ("v3", "UC_A", "2026-09-01T00:00:00+00:00", [("NVIDIA", 3), ("Interest Rate", 4)]),
+        ]
+        for vid, ch, date, mentions in videos:
+            await storage.upsert_video({"video_id": vid, "channel_id": ch, "published_at": date, "title": vid})
+            await storage.save_entity_mentions(vid, [
+                {"type": "x", "name": name, "count": count, "first_offset": 0} for name, count in mentions
+            ])
+
+    async def test_all_entities_required(self, storage):
+        await self._seed(storage)
+        results = await storage.find_videos_by_entities(["NVIDIA", "Interest Rate"])
+        assert [r["video_id"] for r in results] == ["v1", "v3"]
+        assert results[0]["mentions"] == {"NVIDIA": 5, "Interest Rate": 2}
+        assert results[0]["total_mentions"] == 7
+
+    async def test_date_and_channel_filters(self, storage):
+        await self._seed(storage)
+        results = await storage.find_videos_by_entities(["NVIDIA"], since="2026-10-01")
+        assert {r["video_id"] for r in results} == {"v1", "v2"}
+        results = await storage.find_videos_by_entities(["NVIDIA"], channel_id="UC_A", until="2026-10-01")
+        assert [r["video_id"] for r in results] == ["v3"]
+
+    async def test_metadata_saved_after_indexing(self, storage):
+        await storage.upsert_video({"video_id": "v1", "transcript_text": "t"})
+        await storage.save_entity_mentions("v1", [{"type": "x", "name": "NVIDIA", "count": 2, "first_offset": 0}])
+        await storage.save_entity_mentions("v2", [{"type": "x", "name": "NVIDIA", "count": 1, "first_offset": 0}])
+        await storage.upsert_video({"video_id": "v1", "channel_id": "UC_A", "published_at": "2026-10-03T00:00:00+00:00"})
+        await storage.upsert_video({"video_id": "v2", "channel_id": "UC_B", "published_at": "2026-10-05T00:00:00+00:00"})
+        results = await storage.find_videos_by_entities(["NVIDIA"], since="2026-10-01", channel_id="UC_A")
+        assert [r["video_id"] for r in results] == ["v1"]
+        results = await storage.find_videos_by_entities(["NVIDIA"], since="2026-10-01")
+        assert [r["video_id"] for r in results] == ["v2", "v1"]
+
+    async def test_reindex_replaces_rows(self, storage):
+        await self._seed(storage)
+        await storage.save_entity_mentions("v1", [{"type": "x", "name": "Tesla", "count": 1, "first_offset": 9}])
+        rows = await storage.get_video_entities("v1")
+        assert [r["entity"] for r in rows] == ["Tesla"]
+        assert rows[0]["first_offset"] == 9
+
+    async def test_empty_query(self, storage):
+        assert await storage.find_videos_by_entities([]) == []
+
+
+@pytest.mark.asyncio
+class TestMinerState:
+    async def test_transcripts_after_cursor(self, storage):
+        await storage.upsert_video({"video_id": "v1", "transcript_text": "one"})
+        await storage.upsert_video({"video_id": "v2", "title": "no transcript"})
+        await storage.upsert_video({"video_id": "v3", "transcript_text": "three"})
+        rows = await storage.get_transcripts_after(0)
+        assert [r["video_id"] for r in rows] == ["v1", "v3"]
+        rows = await storage.get_transcripts_after(rows[0]["transcript_seq"])
+        assert [r["video_id"] for r in rows] == ["v3"]
+
+    async def test_transcript_added_to_existing_row(self, storage):
+        await storage.upsert_video({"video_id": "v1", "title": "metadata only"})
+        await storage.upsert_video({"video_id": "v2", "transcript_text": "two"})
+        cursor = (await storage.get_transcripts_after(0))[-1]["transcript_seq"]
+        await storage.upsert_video({"video_id": "v1", "transcript_text": "one"})
+        rows = await storage.get_transcripts_after(cursor)
+        assert [r["video_id"] for r in rows] == ["v1"]
+        # Re-saving a transcript does not queue the video again
+        await storage.upsert_video({"video_id": "v1", "transcript_text": "one, refetched"})
+        assert await storage.get_transcripts_after(rows[0]["transcript_seq"]) == []
+
+    async def test_migration_keeps_rowid_cursors(self, storage):
+        import aiosqlite
+        await storage.upsert_video({"video_id": "v1", "transcript_text": "one"})
+        await storage.upsert_video({"video_id": "v2", "transcript_text": "two"})
+        await storage.close()
+        async with aiosqlite.connect(storage.db_path) as db:
+            await db.execute("DROP INDEX idx_videos_transcript_seq")
+            await db.execute("ALTER TABLE videos DROP COLUMN transcript_seq")
+            async with db.execute("SELECT rowid FROM videos WHERE video_id = 'v1'") as cur:
+                (v1_rowid,) = await cur.fetchone()
+            await db.commit()
+        await storage.initialize()
+        rows = await storage.get_transcripts_after(v1_rowid)
+        assert [r["video_id"] for r in rows] == ["v2"]
+
+    async def test_state_roundtrip_and_delete(self, storage):
+        assert await storage.get_miner_state("m") is None
+        await storage.save_miner_state("m", 7, b"\x00\x01")
+        saved = await storage.get_miner_state("m")
+        assert saved["cursor"] == 7
+        assert saved["state"] == b"\x00\x01"
+        await storage.delete_miner_state("m")
+        assert await storage.get_miner_state("m") is None
+
+
+@pytest.mark.asyncio
+class TestTopicSegments:
+    SEGMENTS = [
+        {"segment": 0, "char_start": 0, "char_end": 40, "start": 0.0, "end": 12.5, "topic": "chips, memory"},
+        {"segment": 1, "char_start": 40, "char_end": 90, "start": 12.5, "end": 30.0, "topic": "rates",
+         "chapter": "Rates", "confidence": 0.7},
+    ]
+
+    async def test_roundtrip(self, storage):
+        assert await storage.get_topic_segments("v1", "auto") == []
+        await storage.save_topic_segments("v1", "auto", "h1", 1, self.SEGMENTS)
+        rows = await storage.get_topic_segments("v1", "auto")
+        assert [r["segment"] for r in rows] == [0, 1]
+        assert rows[1]["char_start"] == 40 and rows[1]["end_time"] == 30.0
+        assert rows[1]["chapter"] == "Rates" and rows[0]["chapter"] is None
+        assert rows[0]["transcript_hash"] == "h1" and rows[0]["version"] == 1
+
+    async def test_save_replaces_only_that_method(self, storage):
+        await storage.save_topic_segments("v1", "auto", "h1", 1, self.SEGMENTS)
+        await storage.save_topic_segments("v1", "texttiling", "h1", 1, self.SEGMENTS)
+        await storage.save_topic_segments("v1", "auto", "h2", 1, self.SEGMENTS[:1])
+        assert len(await storage.get_topic_segments("v1", "auto")) == 1
+        assert len(await storage.get_topic_segments("v1", "texttiling")) == 2
+
 
 @pytest.mark.asyncio
 class TestChannelsCRUD:
@@ -119,3 +272,94 @@ class TestCommentsCRUD:
     async def test_get_comments_empty(self, storage):
         result = await storage.get_comments("nonexistent")
         assert result == []
+
+    async def test_comment_ids_and_like_updates(self, storage):
+        await storage.save_comments("v1", [
+            {"comment_id": "c1", "author": "A", "text": "Hi", "like_count": 1},
+            {"comment_id": "c2", "author": "B", "text": "Yo", "like_count": 2},
+        ])
+        assert await storage.get_comment_ids("v1") == {"c1", "c2"}
+        await storage.update_comment_likes("v1", {"c1": 50, "missing": 9})
+        result = await storage.get_comments("v1")
+        assert [(c["comment_id"], c["like_count"]) for c in result] == [("c1", 50), ("c2", 2)]
+
+    async def test_comment_sync_state(self, storage):
+        assert await storage.get_comment_sync("v1") is None
+        await storage.save_comment_sync("v1", {"newest_comment_id": "c9", "newest_timestamp": 100, "synced_at": "t1"})
+        await storage.save_comment_sync("v1", {"likes_refreshed_at": "t2"})
+        state = await storage.get_comment_sync("v1")
+        assert state == {
+            "newest_comment_id": "c9", "newest_timestamp": 100, "synced_at": "t1", "likes_refreshed_at": "t2",
+        }
+
+    async def test_sentiment_and_noise_stored(self, storage):
+        await storage.save_comments("v1", [
+            {"comment_id": "c1", "author": "A", "text": "Great!", "like_count": 3, "sentiment": "positive"},
+            {"comment_id": "c2", "author": "B", "text": "sub4sub", "like_count": 1, "sentiment": "neutral", "is_noise": True},
+            {"comment_id": "c3", "author": "C", "text": "Bad", "like_count": 2, "sentiment": "negative"},
+        ])
+        rows = await storage.get_comments("v1")
+        assert [(r["sentiment"], r["is_noise"]) for r in rows] == [("positive", 0), ("negative", 0), ("neutral", 1)]
+        assert await storage.count_comment_sentiments("v1") == {"positive": 1, "negative": 1}
+        assert (await storage.count_comment_sentiments("v1", include_noise=True))["neutral"] == 1
+
+    async def test_sentiment_counts_use_covering_index(self, storage):
+        async with storage.db.execute(
+            "EXPLAIN QUERY PLAN SELECT sentiment, COUNT(*) FROM comments "
+            "WHERE video_id = ? AND is_noise = 0 GROUP BY sentiment", ("v1",),
+        ) as cur:
+            plan = " ".join(row[3] for row in await cur.fetchall())
+        assert "COVERING INDEX idx_comments_video_likes" in plan
+
+    async def test_top_comments_ordered_by_index(self, storage):
+        async with storage.db.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM comments WHERE video_id = ? ORDER BY like_count DESC LIMIT ?",
+            ("v1", 20),
+        ) as cur:
+            plan = " ".join(row[3] for row in await cur.fetchall())
+        assert "INDEX idx_comments_video_likes" in plan
+        assert "TEMP B-TREE" not in plan
+
+    async def test_migration_adds_comment_columns(self, storage):
+        import aiosqlite
+        await storage.close()
+        async with aiosqlite.connect(storage.db_path) as db:
+            await db.execute("DROP INDEX idx_comments_video_likes")
+            await db.execute("ALTER TABLE comments DROP COLUMN sentiment")
+            await db.execute("ALTER TABLE comments DROP COLUMN is_noise")
+            await db.execute("CREATE INDEX idx_comments_video ON comments(video_id)")
+            await db.commit()
+        await storage.initialize()
+        await storage.save_comments("v1", [{"comment_id": "c1", "text": "Hi", "sentiment": "neutral"}])
+        assert (await storage.get_comments("v1"))[0]["sentiment"] == "neutral"
+        async with storage.db.execute("SELECT name FROM sqlite_master WHERE type = 'index'") as cur:
+            names = {row[0] for row in await cur.fetchall()}
+        assert "idx_comments_video_likes" in names and "idx_comments_video" not in names
+
+    async def test_save_returns_new_comments(self, storage):
+        first = await storage.save_comments("v1", [{"comment_id": "c1", "text": "a"}, {"comment_id": "c1", "text": "a"}])
+        second = await storage.save_comments("v1", [{"comment_id": "c1", "text": "a"}, {"comment_id": "c2", "text": "b"}])
+        assert [c["comment_id"] for c in first] == ["c1"]
+        assert [c["comment_id"] for c in second] == ["c2"]
+
+    async def test_comment_stats_accumulate(self, storage):
+        assert await storage.get_comment_stats("v1") is None
+        await storage.save_comments("v1", [
+            {"comment_id": "c1", "author": "A", "text": "great", "like_count": 5, "sentiment": "positive"},
+            {"comment_id": "c2", "author": "B", "text": "bad", "like_count": 9, "sentiment": "negative"},
+        ])
+        await storage.update_comment_stats("v1", {
+            "count": 2, "sentiments": {"positive": 1, "negative": 1},
+            "keywords": {"great": 1, "bad": 1},
+            "top": [{"comment_id": "c1", "like_count": 5}, {"comment_id": "c2", "like_count": 9}],
+        })
+        await storage.update_comment_stats("v1", {"count": 0, "keywords": {"great": 2}})
+        stats = await storage.get_comment_stats("v1", top_n=1)
+        assert stats["count"] == 2
+        assert stats["sentiments"] == {"positive": 1, "negative": 1, "neutral": 0}
+        assert stats["keywords"] == [{"word": "great", "count": 3}, {"word": "bad", "count": 1}]
+        assert [c["comment_id"] for c in stats["top_comments"]] == ["c2"]
+
+        await storage.update_comment_likes("v1", {"c1": 50})
+        stats = await storage.get_comment_stats("v1")
+        assert [c["comment_id"] for c in stats["top_comments"]] == ["c1", "c2"]
@@ -3,7 +3,7 @@ import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from mcp_youtube_intelligence.core.summarizer import (
     extractive_summary, llm_summary, summarize, _adaptive_max_chars, _split_sentences,
-    _clean_music_symbols,
+    _clean_music_symbols, summarize_incremental,
 )
 
 
@@ -211,3 +211,81 @@ class TestSummarize:
             mock_llm.return_value = "LLM summary"
             result = await summarize("text", api_key="sk-test")
             assert result == "LLM summary"
+
+
+_LIVE_SENTENCES = [
+    f"Segment {i} of the stream covers market topic number {i} with several concrete details and figures like {i * 7}%."
+    for i in range(40)
+]
+
+
+class TestIncrementalSummary:
+    @pytest.mark.asyncio
+    async def test_first_call_processes_complete_sentences(self):
+        text = " ".join(_LIVE_SENTENCES[:10]) + " A half spoken sent"
+        state = await summarize_incremental(text, None, provider="extractive")
+        assert state["increments"] == 1
+        assert state["summary"]
+        # Trailing fragment is held back for the next poll
+        assert state["offset"] <= text.index("A half spoken")
+
+    @pytest.mark.asyncio
+    async def test_only_new_tail_is_summarized(self):
+        text1 = " ".join(_LIVE_SENTENCES[:10]) + " "
+        state = await summarize_incremental(text1, None, provider="extractive")
+        text2 = text1 + " ".join(_LIVE_SENTENCES[10:20]) + " "
+        with patch(
+            "mcp_youtube_intelligence.core.summarizer.extractive_summary",
+            wraps=extractive_summary,
+        ) as spy:
+            state2 = await summarize_incremental(text2, state, provider="extractive")
+        first_input = spy.call_args_list[0].args[0]
+        assert "Segment 0 " not in first_input
+        assert "Segment 10 " in first_input
+        assert state2["increments"] == 2
+        assert state2["offset"] > state["offset"]
+
+    @pytest.mark.asyncio
+    async def test_small_tail_waits(self):
+        text1 = " ".join(_LIVE_SENTENCES[:10]) + " "
+        state = await summarize_incremental(text1, None, provider="extractive")
+        state2 = await summarize_incremental(text1 + "Short bit. ", state, provider="extractive")
+        assert state2["increments"] == 1
+        assert state2["new_chars"] == 0
+
+    @pytest.mark.asyncio
+    async def test_final_flushes_fragment(self):
+        text = " ".join(_LIVE_SENTENCES[:10]) + " Trailing words without end"
+        state = await summarize_incremental(text, None, provider="extractive")
+        state = await summarize_incremental(text, state, provider="extractive", final=True)
+        assert state["offset"] == len(text)
+
+    @pytest.mark.asyncio
+    async def test_partials_are_bounded(self):
+        state = None
+        text = ""
+        for i in range(0, 40, 3):
+            text += " ".join(_LIVE_SENTENCES[i:i + 3]) + " "
+            state = await summarize_incremental(text, state, provider="extractive")
+        assert len(state["partials"]) <= 8
+
+    @pytest.mark.asyncio
+    async def test_changed_prefix_restarts(self):
+        text = " ".join(_LIVE_SENTENCES[:10]) + " "
+        state = await summarize_incremental(text, None, provider="extractive")
+        rewritten = " ".join(s.upper() for s in _LIVE_SENTENCES[:12]) + " "
+        state2 = await summarize_incremental(rewritten, state, provider="extractive")
+        assert state2["increments"] == 1
+        assert state2["offset"] > 0
+
+    @pytest.mark.asyncio
+    async def test_llm_backend_used_per_increment(self):
+        config = MagicMock()
+        with patch(
+            "mcp_youtube_intelligence.core.summarizer.llm_summary", new_callable=AsyncMock,
+        ) as mock_llm:
+            mock_llm.return_value = "LLM partial"
+            text = " ".join(_LIVE_SENTENCES[:10]) + " "
+            state = await summarize_incremental(text, None, config=config, provider="openai")
+        assert state["summary"] == "LLM partial"
+        mock_llm.assert_awaited()
@@ -0,0 +1,136 @@
+"""Tests for TextTiling segmentation."""
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from mcp_youtube_intelligence.core import texttiling
+from mcp_youtube_intelligence.core.segmenter import segment_topics
+
+_TOPICS = [
+    "semiconductor chips wafer foundry memory packaging yield lithography",
+    "interest rates inflation reserve bonds treasury yields mortgage",
+    "electric vehicles battery charging lithium range factory",
+]
+
+
+def _topical_text(sentences_per_topic: int = 60, seed: int = 0) -> tuple[str, list[int]]:
+    """Text made of consecutive topics; returns (text, char offsets where topics change)."""
+    rng = random.Random(seed)
+    parts, changes, pos = [], [], 0
+    for t, topic in enumerate(_TOPICS):
+        if t:
+            changes.append(pos)
+        for _ in range(sentences_per_topic):
+            sentence = " ".join(rng.sample(topic.split(), 5)) + "."
+            parts.append(sentence)
+            pos += len(sentence) + 1
+    return " ".join(parts), changes
+
+
+def _reference_scores(ids, w, k):
+    units = [Counter(ids[i:i + w]) for i in range(0, len(ids), w)]
+    scores = []
+    for g in range(1, len(units)):
+        left, right = Counter(), Counter()
+        for u in units[max(0, g - k):g]:
+            left.update(u)
+        for u in units[g:g + k]:
+            right.update(u)
+        dot = sum(left[t] * right[t] for t in left)
+        nl2 = sum(v * v for v in left.values())
+        nr2 = sum(v * v for v in right.values())
+        scores.append(0.0 if not nl2 or not nr2 else dot / (math.sqrt(nl2) * math.sqrt(nr2)))
+    return scores
+
+
+class TestGapScores:
+    def test_python_matches_reference(self):
+        rng = random.Random(1)
+        for _ in range(50):
+            ids = [rng.randint(0, 25) for _ in range(rng.randint(0, 300))]
+            w, k = rng.randint(1, 15), rng.randint(1, 6)
+            assert texttiling.gap_scores(ids, w, k, use_numpy=False) == _reference_scores(ids, w, k)
+
+    def test_numpy_matches_python(self):
+        pytest.importorskip("numpy")
+        rng = random.Random(2)
+        for _ in range(50):
+            ids = [rng.randint(0, 40) for _ in range(rng.randint(0, 400))]
+            w, k = rng.randint(1, 20), rng.randint(1, 8)
+            assert (texttiling.gap_scores(ids, w, k, use_numpy=True)
+                    == texttiling.gap_scores(ids, w, k, use_numpy=False))
+
+    def test_short_input(self):
+        assert texttiling.gap_scores([1, 2, 3], w=5) == []
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            texttiling.gap_scores([1, 2, 3], w=0)
+
+
+class TestDepthScores:
+    def test_valley_depth(self):
+        depths = texttiling.depth_scores([0.9, 0.5, 0.2, 0.6, 0.8])
+        assert depths[2] == pytest.approx((0.9 - 0.2) + (0.8 - 0.2))
+        assert depths[0] == pytest.approx(0.0)
+
+    def test_matches_naive_climb(self):
+        rng = random.Random(3)
+        scores = [rng.random() for _ in range(200)]
+
+        def naive(i):
+            lp = scores[i]
+            j = i
+            while j > 0 and scores[j - 1] > scores[j]:
+                j -= 1
+                lp = scores[j]
+            rp = scores[i]
+            j = i
+            while j < len(scores) - 1 and scores[j + 1] > scores[j]:
+                j += 1
+                rp = scores[j]
+            return lp + rp - 2 * scores[i]
+
+        assert texttiling.depth_scores(scores) == pytest.approx([naive(i) for i in range(len(scores))])
+
+
+class TestSegmentText:
+    def test_boundaries_near_topic_changes(self):
+        text, changes = _topical_text()
+        segments = texttiling.segment_text(text, use_numpy=False)
+        starts = [s["start"] for s in segments[1:]]
+        assert len(starts) == len(changes)
+        for start, change in zip(starts, changes):
+            assert abs(start - change) < 200
+        assert all(s["confidence"] > 0.5 for s in segments[1:])
+        assert segments[0]["confidence"] is None
+
+    def test_segments_cover_text(self):
+        text, _ = _topical_text(seed=5)
+        segments = texttiling.segment_text(text)
+        assert segments[0]["start"] == 0
+        assert segments[-1]["end"] == len(text)
+        for prev, nxt in zip(segments, segments[1:]):
+            assert prev["end"] == nxt["start"]
+            assert text[nxt["start"] - 1] == " " and text[nxt["start"] - 2] == "."
+
+    def test_single_topic(self):
+        text = "This short text has only a few words about a single thing."
+        segments = texttiling.segment_text(text)
+        assert len(segments) == 1
+
+
+class TestSegmentTopicsMethod:
+    def test_texttiling_method(self):
+        text, changes = _topical_text()
+        result = segment_topics(text, method="texttiling")
+        assert len(result) == len(changes) + 1
+        assert [s["segment"] for s in result] == list(range(len(result)))
+        assert result[1]["confidence"] > 0
+        assert result[1]["topic"]
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            segment_topics("text", method="nope")
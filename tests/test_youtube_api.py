@@ -0,0 +1,153 @@
+"""Tests for the Data API videos.list metadata path, against a local server."""
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from mcp_youtube_intelligence.core import collector, youtube_api
+
+
+def _item(vid: str) -> dict:
+    return {
+        "id": vid,
+        "snippet": {
+            "title": f"Title {vid}",
+            "description": "0:00 Intro\n1:30 Main part\n10:00 Outro",
+            "channelId": "UC1",
+            "channelTitle": "Chan",
+            "publishedAt": "2026-01-02T03:04:05Z",
+            "liveBroadcastContent": "none",
+            "thumbnails": {"default": {"url": "d.jpg"}, "high": {"url": "h.jpg"}},
+        },
+        "contentDetails": {"duration": "PT12M30S"},
+        "statistics": {"viewCount": "1000", "likeCount": "50", "commentCount": "7"},
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        srv = self.server
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        srv.calls.append({"path": url.path, "query": query, "port": self.client_address[1]})
+        if srv.status != 200:
+            body = json.dumps({"error": {"errors": [{"reason": "quotaExceeded"}]}}).encode()
+        else:
+            ids = query["id"][0].split(",")
+            body = json.dumps({"items": [_item(v) for v in ids if not v.startswith("gone")]}).encode()
+        self.send_response(srv.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.calls, srv.status = [], 200
+    thread = threading.Thread(target=srv.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    youtube_api.configure("test-key", base_url=f"http://127.0.0.1:{srv.server_port}/youtube/v3")
+    yield srv
+    youtube_api.configure("")
+    srv.shutdown()
+    srv.server_close()
+
+
+class TestParsing:
+    def test_duration(self):
+        assert youtube_api._parse_duration("PT1H2M3S") == 3723
+        assert youtube_api._parse_duration("P1DT1S") == 86401
+        assert youtube_api._parse_duration("P0D") == 0
+        assert youtube_api._parse_duration("") is None
+
+    def test_description_chapters_need_zero_start_and_three_entries(self):
+        assert youtube_api._description_chapters("0:00 A\n1:00 B") is None
+        assert youtube_api._description_chapters("0:30 A\n1:00 B\n2:00 C") is None
+        raw = youtube_api._description_chapters("Intro text\n0:00 A\n(1:00) B\n1:02:03 - C")
+        assert [(c["start_time"], c["title"]) for c in raw] == [(0, "A"), (60, "B"), (3723, "C")]
+
+    def test_maps_to_collector_shape(self):
+        meta = youtube_api._to_metadata(_item("abc"))
+        assert set(meta) == set(collector._to_metadata("abc", {}))
+        assert meta["published_at"] == "2026-01-02T03:04:05+00:00"
+        assert meta["duration_seconds"] == 750
+        assert meta["view_count"] == 1000
+        assert meta["thumbnail_url"] == "h.jpg"
+        assert meta["chapters"][1] == {"title": "Main part", "start": 90.0, "end": 600.0}
+        assert meta["chapters"][-1]["end"] == 750.0
+
+    def test_hidden_likes_and_live(self):
+        item = _item("abc")
+        del item["statistics"]["likeCount"]
+        item["liveStreamingDetails"] = {"actualEndTime": "2026-01-02T05:00:00Z"}
+        meta = youtube_api._to_metadata(item)
+        assert meta["like_count"] is None
+        assert meta["was_live"] and not meta["is_live"]
+
+
+class TestVideosList:
+    def test_inactive_without_key(self):
+        assert not youtube_api.active()
+
+    def test_batches_of_fifty_over_one_connection(self, server):
+        ids = [f"v{i:03d}" for i in range(120)]
+        metas = youtube_api.get_video_metadata_batch(ids)
+        assert list(metas) == ids
+        assert metas["v119"]["title"] == "Title v119"
+        assert [len(c["query"]["id"][0].split(",")) for c in server.calls] == [50, 50, 20]
+        assert all(c["path"] == "/youtube/v3/videos" and c["query"]["key"] == ["test-key"] for c in server.calls)
+        # Keep-alive: every request reused the same client socket
+        assert len({c["port"] for c in server.calls}) == 1
+
+    def test_missing_ids_are_errors(self, server):
+        metas = youtube_api.get_video_metadata_batch(["ok1", "gone1"])
+        assert metas["ok1"]["channel_id"] == "UC1"
+        assert metas["gone1"] == {"error": "Video unavailable"}
+
+    def test_quota_counted_per_request(self, server):
+        before = youtube_api.quota_usage()["units"]
+        youtube_api.get_video_metadata_batch([f"v{i}" for i in range(60)])
+        usage = youtube_api.quota_usage()
+        assert usage["units"] - before == 2
+        assert usage["requests"]["videos.list"] >= 2
+
+    def test_http_error_returns_none(self, server):
+        server.status = 403
+        assert youtube_api.get_video_metadata_batch(["v1"]) is None
+
+
+class TestCollectorIntegration:
+    def test_single_video_uses_api(self, server):
+        with patch.object(collector.subprocess, "run") as run:
+            meta = collector.get_video_metadata("abc")
+        run.assert_not_called()
+        assert meta["title"] == "Title abc"
+
+    def test_unavailable_video_returns_none(self, server):
+        assert collector.get_video_metadata("gone1") is None
+
+    def test_batch_uses_api(self, server):
+        with patch.object(collector, "iter_video_metadata") as ytdlp:
+            metas = collector.get_video_metadata_batch(["a", "b", "a"])
+        ytdlp.assert_not_called()
+        assert list(metas) == ["a", "b"]
+        assert len(server.calls) == 1
+
+    def test_api_failure_falls_back_to_ytdlp(self, server):
+        server.status = 403
+        with patch.object(collector, "iter_video_metadata", return_value=iter([("a", {"video_id": "a"}, None)])) as ytdlp:
+            metas = collector.get_video_metadata_batch(["a"])
+        ytdlp.assert_called_once()
+        assert metas == {"a": {"video_id": "a"}}
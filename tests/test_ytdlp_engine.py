@@ -0,0 +1,129 @@
+"""Tests for the in-process yt-dlp engine."""
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_youtube_intelligence.core import collector, ytdlp_engine
+
+
+class _FakeYDL:
+    created: list["_FakeYDL"] = []
+
+    def __init__(self, params):
+        self.params = params
+        self.thread = threading.get_ident()
+        self.closed = False
+        self.outtmpls = []
+        _FakeYDL.created.append(self)
+
+    def _parse_outtmpl(self):
+        self.params["outtmpl"].setdefault("default", "%(title)s [%(id)s].%(ext)s")
+
+    def close(self):
+        self.closed = True
+
+    def extract_info(self, url, download=True):
+        if "bad" in url:
+            raise RuntimeError("ERROR: Video unavailable")
+        vid = url.rsplit("=", 1)[-1]
+        self.outtmpls.append(self.params.get("outtmpl", {}).get("default"))
+        return {"id": vid, "title": f"T {vid}", "upload_date": "20260101", "duration": 60}
+
+    @staticmethod
+    def sanitize_info(info):
+        return dict(info)
+
+
+@pytest.fixture
+def engine():
+    _FakeYDL.created = []
+    api = MagicMock(YoutubeDL=_FakeYDL)
+    api.parse_options.side_effect = lambda args: MagicMock(ydl_opts={
+        "args": tuple(args), "quiet": False,
+        "outtmpl": {"default": args[args.index("-o") + 1]} if "-o" in args else {},
+    })
+    ytdlp_engine._options.cache_clear()
+    with patch.object(ytdlp_engine, "_api", lambda: api):
+        ytdlp_engine.configure("inprocess", max_workers=1)
+        yield api
+        ytdlp_engine.configure("subprocess")
+    ytdlp_engine._options.cache_clear()
+
+
+class TestConfigure:
+    def test_default_is_subprocess(self):
+        assert not ytdlp_engine.active()
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            ytdlp_engine.configure("threads")
+
+    def test_inprocess_falls_back_without_package(self):
+        with patch.object(ytdlp_engine, "_api", lambda: None):
+            ytdlp_engine.configure("inprocess")
+        assert not ytdlp_engine.active()
+
+    def test_real_options_are_silenced(self):
+        pytest.importorskip("yt_dlp")
+        ytdlp_engine._options.cache_clear()
+        opts = ytdlp_engine._options(("--flat-playlist", "--dump-json", "--playlist-end", "5"))
+        assert opts["extract_flat"] == "in_playlist" and opts["playlistend"] == 5
+        assert opts["quiet"] and not opts["forcejson"]
+
+
+class TestExtract:
+    def test_returns_info_and_reuses_instance(self, engine):
+        first = ytdlp_engine.extract("https://www.youtube.com/watch?v=v1", ("--skip-download",))
+        second = ytdlp_engine.extract("https://www.youtube.com/watch?v=v2", ("--skip-download",))
+        assert (first["title"], second["title"]) == ("T v1", "T v2")
+        assert len(_FakeYDL.created) == 1
+        assert _FakeYDL.created[0].params["quiet"] is True
+        assert _FakeYDL.created[0].thread != threading.get_ident()
+        ytdlp_engine.extract("https://www.youtube.com/watch?v=v3", ("--flat-playlist",))
+        assert len(_FakeYDL.created) == 2
+        assert engine.parse_options.call_count == 2
+
+    def test_output_dir_is_per_call(self, engine):
+        for i in range(20):
+            ytdlp_engine.extract(
+                f"https://www.youtube.com/watch?v=v{i}", ("--write-sub", "-o", f"/tmp/run{i}/%(id)s"),
+            )
+        ytdlp_engine.extract("https://www.youtube.com/watch?v=plain", ("--write-sub",))
+        assert len(_FakeYDL.created) == 1
+        ydl = _FakeYDL.created[0]
+        assert ydl.outtmpls[:2] == ["/tmp/run0/%(id)s", "/tmp/run1/%(id)s"]
+        # A call without -o gets the option set's own template back
+        assert ydl.outtmpls[-1] == "%(title)s [%(id)s].%(ext)s"
+
+    def test_split_output_args(self):
+        shared, output = ytdlp_engine._split_output_args(
+            ("--skip-download", "-o", "/t/%(id)s", "--paths=/p", "--write-sub"),
+        )
+        assert shared == ("--skip-download", "--write-sub")
+        assert output == ("-o", "/t/%(id)s", "--paths=/p")
+
+    def test_instance_cache_is_bounded(self, engine):
+        n = ytdlp_engine.MAX_INSTANCES_PER_THREAD + 3
+        for i in range(n):
+            ytdlp_engine.extract("https://www.youtube.com/watch?v=v1", ("--playlist-end", str(i)))
+        assert len(_FakeYDL.created) == n
+        assert sum(y.closed for y in _FakeYDL.created) == 3
+        assert all(y.closed for y in _FakeYDL.created[:3])
+
+    def test_errors_propagate(self, engine):
+        with pytest.raises(RuntimeError, match="unavailable"):
+            ytdlp_engine.extract("https://www.youtube.com/watch?v=bad")
+
+    def test_collector_uses_engine(self, engine):
+        with patch("mcp_youtube_intelligence.core.collector.subprocess") as mock_sub:
+            meta = collector.get_video_metadata("v1")
+            batch = collector.get_video_metadata_batch(["v1", "bad1", "v2"])
+        mock_sub.run.assert_not_called()
+        mock_sub.Popen.assert_not_called()
+        assert meta["title"] == "T v1" and meta["published_at"].startswith("2026-01-01")
+        assert list(batch) == ["v1", "bad1", "v2"]
+        assert batch["v2"]["title"] == "T v2"
+        assert "unavailable" in batch["bad1"]["error"]